@@ -0,0 +1,104 @@
+"""Benchmark for feature-title duplicate detection.
+
+Builds a registry of ``--records`` random features (each with aliases) and
+checks ``--queries`` candidate titles, half near-copies of existing titles and
+half fresh ones, against it at several similarity thresholds.  Compares the
+pruned :class:`_FeatureTitleIndex` lookup with an exhaustive
+``SequenceMatcher`` scan and reports time and ratio computations.
+
+Usage::
+
+    python benchmarks/bench_feature_title_index.py [--records 150] [--queries 120]
+"""
+
+import argparse
+import random
+import time
+from difflib import SequenceMatcher
+
+from nexus.core.feature_registry_service import (
+    FeatureRegistryRecord,
+    _FeatureTitleIndex,
+    normalize_feature_title,
+)
+
+WORDS = (
+    "slack alerts weekly report reports incident timeline export billing onboarding funnel "
+    "audit log dashboard sso webhook retry digest search filters mobile push dark mode"
+).split()
+
+
+def build_registry(records: int, rng: random.Random) -> list[FeatureRegistryRecord]:
+    def _title() -> str:
+        return " ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 5)))
+
+    return [
+        FeatureRegistryRecord.from_dict(
+            {"project_key": "nexus", "canonical_title": _title(), "aliases": [_title()]}
+        )
+        for _ in range(records)
+    ]
+
+
+def build_queries(existing: list[str], queries: int, rng: random.Random) -> list[str]:
+    def _mutate(value: str) -> str:
+        chars = list(value)
+        for _ in range(rng.randint(0, 3)):
+            chars.insert(rng.randrange(len(chars) + 1), rng.choice("abcdefghijklmnopqrstuvwxyz "))
+        return "".join(chars)
+
+    near = [_mutate(rng.choice(existing)) for _ in range(queries // 2)]
+    fresh = [
+        " ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 5)))
+        for _ in range(queries - len(near))
+    ]
+    return [normalize_feature_title(query) for query in near + fresh]
+
+
+def exhaustive_duplicate(title: str, existing: list[str], threshold: float) -> bool:
+    return any(
+        title == other or SequenceMatcher(None, title, other).ratio() >= threshold
+        for other in existing
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=150)
+    parser.add_argument("--queries", type=int, default=120)
+    parser.add_argument("--seed", type=int, default=29)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    records = build_registry(args.records, rng)
+    existing = [
+        normalized
+        for record in records
+        for value in (record.canonical_title, *record.aliases)
+        if (normalized := normalize_feature_title(value))
+    ]
+    queries = build_queries(existing, args.queries, rng)
+    index = _FeatureTitleIndex.build(records, signature="bench")
+
+    print(f"{len(existing)} titles x {len(queries)} queries")
+    print(f"{'threshold':>9} {'indexed ms':>11} {'ratio checks':>13} {'exhaustive ms':>14}")
+    for threshold in (0.5, 0.75, 0.86, 0.95, 1.0):
+        index.ratio_checks = 0
+        started = time.perf_counter()
+        indexed = [index.is_duplicate(query, threshold) for query in queries]
+        indexed_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        exhaustive = [exhaustive_duplicate(query, existing, threshold) for query in queries]
+        exhaustive_seconds = time.perf_counter() - started
+
+        if indexed != exhaustive:
+            raise SystemExit(f"index disagrees with exhaustive scan at threshold {threshold}")
+        print(
+            f"{threshold:>9} {indexed_seconds * 1000:>11.2f} {index.ratio_checks:>13} "
+            f"{exhaustive_seconds * 1000:>14.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
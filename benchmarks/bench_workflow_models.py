@@ -0,0 +1,93 @@
+"""Memory and load-time benchmark for deserialized workflow models.
+
+Builds ``--workflows`` documents from one definition (the way a processor or
+visualizer holds many active workflows of the same type) and loads them with
+:func:`dict_to_workflow`, once with shared agents/interned step text and once
+with a private ``Agent`` per step, reporting time and retained memory.
+
+Usage::
+
+    python benchmarks/bench_workflow_models.py [--workflows 2000] [--steps 12]
+"""
+
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+from unittest import mock
+
+from nexus.adapters.storage import _workflow_serde
+from nexus.adapters.storage._workflow_serde import dict_to_workflow, workflow_to_dict
+from nexus.core.models import Agent, Workflow, WorkflowStep
+
+
+def build_payloads(workflows: int, steps: int) -> list[str]:
+    agents = [
+        Agent(name=name, display_name=name.title(), description=f"{name} agent", timeout=900)
+        for name in ("triage", "designer", "developer", "reviewer")
+    ]
+    template = Workflow(
+        id="template",
+        name="Full SOP",
+        version="1.0",
+        steps=[
+            WorkflowStep(
+                step_num=n,
+                name=f"step-{n}",
+                agent=agents[n % len(agents)],
+                prompt_template=f"Step {n}: handle {{issue_url}} following the SOP. " * 8,
+            )
+            for n in range(1, steps + 1)
+        ],
+    )
+    document = workflow_to_dict(template)
+    payloads = []
+    for index in range(workflows):
+        document["id"] = f"wf-{index}"
+        payloads.append(json.dumps(document))
+    return payloads
+
+
+def measure(payloads: list[str]) -> tuple[float, int]:
+    documents = [json.loads(payload) for payload in payloads]
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    loaded = [dict_to_workflow(document) for document in documents]
+    elapsed = time.perf_counter() - started
+    retained, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del loaded
+    return elapsed, retained
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workflows", type=int, default=2000)
+    parser.add_argument("--steps", type=int, default=12)
+    args = parser.parse_args()
+
+    payloads = build_payloads(args.workflows, args.steps)
+    shared_time, shared_bytes = measure(payloads)
+    with (
+        mock.patch.object(_workflow_serde, "shared_agent", Agent),
+        mock.patch.object(_workflow_serde, "_shared_text", lambda value: value),
+    ):
+        private_time, private_bytes = measure(payloads)
+
+    print(f"{args.workflows} workflows x {args.steps} steps")
+    print(f"{'mode':<16} {'load ms':>10} {'retained MiB':>14} {'bytes/step':>12}")
+    total_steps = args.workflows * args.steps
+    for label, elapsed, retained in (
+        ("private agents", private_time, private_bytes),
+        ("shared agents", shared_time, shared_bytes),
+    ):
+        print(
+            f"{label:<16} {elapsed * 1000:>10.1f} {retained / 2**20:>14.2f} "
+            f"{retained / total_steps:>12.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""Micro-benchmark for workflow persistence encodings.
+
+Compares the format-1 path (``json.dumps(indent=2)`` of the whole workflow)
+with the format-2 documents written through each available storage codec,
+for a full encode/decode and for a re-save after loading (where untouched
+step outputs are written back without being decoded).
+
+Usage::
+
+    python benchmarks/bench_workflow_serde.py [--steps 20] [--output-kb 16] [--repeat 200]
+"""
+
+import argparse
+import json
+import timeit
+
+from nexus.adapters.storage._workflow_serde import (
+    dict_to_workflow,
+    document_to_workflow,
+    workflow_to_dict,
+    workflow_to_document,
+)
+from nexus.adapters.storage.codecs import available_storage_codecs, get_storage_codec
+from nexus.core.models import Agent, StepStatus, Workflow, WorkflowState, WorkflowStep
+
+
+def build_workflow(steps: int, output_kb: int) -> Workflow:
+    agent = Agent(name="developer", display_name="Developer", description="Implements changes")
+    text = "x" * 1024
+    return Workflow(
+        id="bench-wf",
+        name="Benchmark",
+        version="1.0",
+        state=WorkflowState.RUNNING,
+        steps=[
+            WorkflowStep(
+                step_num=index + 1,
+                name=f"step-{index + 1}",
+                agent=agent,
+                prompt_template="Do the work for {issue_url}",
+                status=StepStatus.COMPLETED,
+                outputs={
+                    "summary": text * output_kb,
+                    "files": [f"src/module_{n}.py" for n in range(20)],
+                    "metrics": {"lines": index * 10, "score": 0.5},
+                },
+            )
+            for index in range(steps)
+        ],
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--steps", type=int, default=20)
+    parser.add_argument("--output-kb", type=int, default=16)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    workflow = build_workflow(args.steps, args.output_kb)
+    results: list[tuple[str, int, float, float, float]] = []
+
+    legacy = json.dumps(workflow_to_dict(workflow), indent=2, default=str).encode("utf-8")
+
+    def legacy_resave() -> None:
+        loaded = dict_to_workflow(json.loads(legacy))
+        loaded.steps[-1].status = StepStatus.RUNNING
+        json.dumps(workflow_to_dict(loaded), indent=2, default=str)
+
+    results.append(
+        (
+            "v1 json indent=2",
+            len(legacy),
+            timeit.timeit(
+                lambda: json.dumps(workflow_to_dict(workflow), indent=2, default=str),
+                number=args.repeat,
+            ),
+            timeit.timeit(lambda: dict_to_workflow(json.loads(legacy)), number=args.repeat),
+            timeit.timeit(legacy_resave, number=args.repeat),
+        )
+    )
+
+    for name in available_storage_codecs():
+        codec = get_storage_codec(name)
+        payload = codec.encode(workflow_to_document(workflow, codec))
+
+        def resave(codec=codec, payload=payload) -> None:
+            loaded = document_to_workflow(codec.decode(payload), codec)
+            loaded.steps[-1].status = StepStatus.RUNNING
+            codec.encode(workflow_to_document(loaded, codec))
+
+        results.append(
+            (
+                f"v2 {name}",
+                len(payload),
+                timeit.timeit(
+                    lambda codec=codec: codec.encode(workflow_to_document(workflow, codec)),
+                    number=args.repeat,
+                ),
+                timeit.timeit(
+                    lambda codec=codec, payload=payload: document_to_workflow(
+                        codec.decode(payload), codec
+                    ),
+                    number=args.repeat,
+                ),
+                timeit.timeit(resave, number=args.repeat),
+            )
+        )
+
+    print(f"{args.steps} steps, ~{args.output_kb} KiB outputs/step, {args.repeat} iterations")
+    print(f"{'encoding':<18} {'bytes':>10} {'save ms':>10} {'load ms':>10} {'resave ms':>10}")
+    for label, size, save, load, resave_time in results:
+        print(
+            f"{label:<18} {size:>10} {save * 1000 / args.repeat:>10.3f} "
+            f"{load * 1000 / args.repeat:>10.3f} {resave_time * 1000 / args.repeat:>10.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
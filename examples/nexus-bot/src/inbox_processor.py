@@ -18,6 +18,7 @@ from nexus.core.config import (
     NEXUS_FEATURE_REGISTRY_DEDUP_SIMILARITY,
     NEXUS_FEATURE_REGISTRY_ENABLED,
     NEXUS_FEATURE_REGISTRY_MAX_ITEMS_PER_PROJECT,
+    NEXUS_PROCESSOR_SCHEDULER,
     NEXUS_STORAGE_BACKEND,
     NEXUS_STORAGE_DSN,
     NEXUS_STATE_DIR,
@@ -139,7 +140,12 @@ from nexus.core.inbox.inbox_task_processor_service import (
 from nexus.core.inbox.inbox_task_processor_service import (
     process_task_payload as _svc_process_task_payload,
 )
-from nexus.core.integrations.inbox_queue import claim_pending_tasks, mark_task_done, mark_task_failed
+from nexus.core.integrations.inbox_queue import (
+    claim_pending_tasks,
+    mark_task_done,
+    mark_task_failed,
+    wait_for_task_notification,
+)
 from nexus.core.integrations.notifications import (
     emit_alert,
     notify_agent_needs_input,
@@ -192,6 +198,9 @@ from nexus.core.process_orchestrator import ProcessOrchestrator
 from nexus.core.processor_loops import (
     run_processor_loop as _run_processor_loop,
 )
+from nexus.core.processor_loops import (
+    run_scheduled_processor_loop as _run_scheduled_processor_loop,
+)
 from nexus.core.processor_runtime_state import (
     ProcessorRuntimeState,
 )
@@ -1454,17 +1463,22 @@ def main():
             require_issue_requester_token=_auth_enabled(),
         ),
         cleanup_stale_worktrees_once=_cleanup_stale_worktrees_once,
+        wait_for_inbox_tasks=wait_for_task_notification,
         drain_postgres_inbox_queue=_drain_postgres_inbox_queue,
         process_filesystem_inbox_once=_process_filesystem_inbox_once,
-        run_processor_loop=_run_processor_loop,
+        run_processor_loop=(
+            _run_scheduled_processor_loop
+            if NEXUS_PROCESSOR_SCHEDULER == "concurrent"
+            else _run_processor_loop
+        ),
         runtime_state=PROCESSOR_RUNTIME_STATE,
         time_module=time,
         setup_event_handlers=setup_event_handlers,
     )
 
 
-def _drain_postgres_inbox_queue(batch_size: int = 25) -> None:
-    _svc_drain_postgres_inbox_queue_once(
+def _drain_postgres_inbox_queue(batch_size: int = 25) -> bool:
+    return _svc_drain_postgres_inbox_queue_once(
         batch_size=batch_size,
         logger=logger,
         claim_pending_tasks=claim_pending_tasks,
@@ -119,6 +119,16 @@ def mock_audit_log():
         yield
 
 
+@pytest.fixture(autouse=True)
+def reset_notification_dispatcher():
+    """Auto-use fixture giving each test fresh notification rate-limit state."""
+    from nexus.core.integrations import notification_dispatcher
+
+    notification_dispatcher.reset_dispatcher()
+    yield
+    notification_dispatcher.reset_dispatcher()
+
+
 @pytest.fixture
 def temp_data_dir(tmp_path, monkeypatch):
     """Create a temporary data directory for tests."""
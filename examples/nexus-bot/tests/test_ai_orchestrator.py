@@ -3,6 +3,7 @@
 import subprocess
 
 from nexus.core.orchestration.ai_orchestrator import AIOrchestrator
+from nexus.core.process_runner import ProcessRunner
 from nexus.plugins.builtin.ai_runtime_plugin import AIProvider, RateLimitedError
 
 
@@ -44,7 +45,7 @@ def test_copilot_refine_description_uses_longer_timeout(monkeypatch):
         captured["timeout"] = kwargs.get("timeout")
         return _FakeCompletedProcess("rewritten")
 
-    monkeypatch.setattr(subprocess, "run", _fake_run)
+    monkeypatch.setattr(ProcessRunner, "run", _fake_run)
 
     result = orchestrator._run_copilot_analysis("input", "refine_description")
 
@@ -62,7 +63,7 @@ def test_copilot_analysis_timeout_respects_config(monkeypatch):
         captured["timeout"] = kwargs.get("timeout")
         return _FakeCompletedProcess('{"project": "nexus", "type": "feature", "issue_name": "abc"}')
 
-    monkeypatch.setattr(subprocess, "run", _fake_run)
+    monkeypatch.setattr(ProcessRunner, "run", _fake_run)
 
     result = orchestrator._run_copilot_analysis("input", "classify")
 
@@ -77,6 +78,6 @@ def test_check_tool_available_requires_successful_version_exit(monkeypatch):
         return _FakeCompletedProcess(stdout="error", returncode=1)
 
     monkeypatch.setattr(subprocess, "run", _fake_run)
-    orchestrator._tool_available.clear()
+    orchestrator._provider_health.clear()
 
     assert orchestrator.check_tool_available(AIProvider.GEMINI) is False
@@ -1,5 +1,7 @@
 """Tests for provider-neutral repository keys in project config."""
 
+import os
+
 import nexus.core.config as config
 import nexus.core.config.repos as config_repos
 
@@ -45,6 +47,42 @@ def test_get_git_repos_auto_discovers_from_workspace(monkeypatch, tmp_path):
     assert sorted(repos) == ["sample-org/backend", "sample-org/mobile-app"]
 
 
+def test_workspace_discovery_reads_git_config_and_caches_until_it_changes(monkeypatch, tmp_path):
+    def _write_repo(name: str, url: str) -> str:
+        git_dir = tmp_path / name / ".git"
+        git_dir.mkdir(parents=True, exist_ok=True)
+        (git_dir / "config").write_text(
+            "[core]\n\tbare = false\n"
+            '[remote "upstream"]\n\turl = git@github.com:other/fork.git\n'
+            f'[remote "origin"]\n\turl = {url}\n\tfetch = +refs/heads/*:refs/remotes/origin/*\n'
+        )
+        return str(git_dir / "config")
+
+    def _no_git(*_args, **_kwargs):
+        raise AssertionError("discovery should not run git")
+
+    monkeypatch.setattr(config_repos.subprocess, "run", _no_git)
+    cache = config_repos.WorkspaceRepoCache()
+    monkeypatch.setattr(config_repos, "_workspace_repo_cache", cache)
+    _write_repo("backend", "git@github.com:acme/backend.git")
+    project_cfg = {"workspace": str(tmp_path)}
+
+    assert config_repos.discover_workspace_repos(project_cfg, "/") == ["acme/backend"]
+    assert config_repos.discover_workspace_repos(project_cfg, "/") == ["acme/backend"]
+    assert cache.stats == {"listings": 1, "config_reads": 1, "git_calls": 0}
+
+    _write_repo("mobile", "https://github.com/acme/mobile.git")
+    assert sorted(config_repos.discover_workspace_repos(project_cfg, "/")) == [
+        "acme/backend",
+        "acme/mobile",
+    ]
+
+    config_path = _write_repo("backend", '"https://gitlab.com/acme/backend-v2.git"')
+    os.utime(config_path, ns=(1, 1))
+    assert "acme/backend-v2" in config_repos.discover_workspace_repos(project_cfg, "/")
+    assert cache.stats["config_reads"] == 3
+
+
 def test_get_repos_supports_git_repo_and_git_repos(monkeypatch):
     monkeypatch.setattr(
         config,
@@ -1,9 +1,17 @@
 from __future__ import annotations
 
+import random
+from difflib import SequenceMatcher
+
 import pytest
 
 import nexus.core.feature_registry_service as feature_registry_module
-from nexus.core.feature_registry_service import FeatureRegistryService
+from nexus.core.feature_registry_service import (
+    FeatureRegistryRecord,
+    FeatureRegistryService,
+    _FeatureTitleIndex,
+    normalize_feature_title,
+)
 
 
 def test_upsert_and_list_filesystem_registry(tmp_path):
@@ -241,3 +249,93 @@ def test_postgres_backend_matches_filesystem_forget_and_manual_override(tmp_path
     assert fs_removed is not None and pg_removed is not None
     assert fs_service.list_features("nexus") == []
     assert pg_service.list_features("nexus") == []
+
+
+def _brute_force_duplicate(normalized_title, normalized_existing, threshold):
+    for existing in normalized_existing:
+        if normalized_title == existing:
+            return True
+        if SequenceMatcher(None, normalized_title, existing).ratio() >= threshold:
+            return True
+    return False
+
+
+def test_title_index_matches_exhaustive_sequence_matcher_decisions():
+    rng = random.Random(29)
+    words = [
+        "slack", "alerts", "weekly", "report", "reports", "incident", "timeline", "export",
+        "billing", "onboarding", "funnel", "audit", "log", "dashboard", "sso", "webhook",
+        "retry", "digest", "search", "filters", "mobile", "push", "dark", "mode",
+    ]  # fmt: skip
+
+    def _title():
+        return " ".join(rng.choice(words) for _ in range(rng.randint(1, 5)))
+
+    def _mutate(value):
+        chars = list(value)
+        for _ in range(rng.randint(0, 3)):
+            chars.insert(rng.randrange(len(chars) + 1), rng.choice("abcdefghijklmnopqrstuvwxyz "))
+        return "".join(chars)
+
+    records = [
+        FeatureRegistryRecord.from_dict(
+            {"project_key": "nexus", "canonical_title": _title(), "aliases": [_title()]}
+        )
+        for _ in range(150)
+    ]
+    existing = []
+    for record in records:
+        for value in [record.canonical_title, *record.aliases]:
+            normalized = normalize_feature_title(value)
+            if normalized:
+                existing.append(normalized)
+    queries = [normalize_feature_title(_mutate(rng.choice(existing))) for _ in range(60)]
+    queries += [normalize_feature_title(_title()) for _ in range(60)]
+
+    index = _FeatureTitleIndex.build(records, signature="test")
+    for threshold in (0.0, 0.5, 0.75, 0.86, 0.95, 1.0):
+        index.ratio_checks = 0
+        indexed = [index.is_duplicate(query, threshold) for query in queries]
+        exhaustive = [_brute_force_duplicate(query, existing, threshold) for query in queries]
+
+        assert indexed == exhaustive, threshold
+        assert index.ratio_checks < len(queries) * len(existing) / 10
+
+
+def test_title_index_is_maintained_on_upsert_and_forget(tmp_path, monkeypatch):
+    service = FeatureRegistryService(
+        enabled=True,
+        backend="filesystem",
+        state_dir=str(tmp_path),
+        dedup_similarity=0.86,
+    )
+    service.upsert_feature(project_key="nexus", canonical_title="Slack alerts")
+    items = [{"title": "Slack alert"}, {"title": "Weekly report"}]
+    kept, _removed = service.filter_ideation_items(project_key="nexus", items=items)
+    assert [item["title"] for item in kept] == ["Weekly report"]
+
+    loads = []
+    real_list_records = service._store.list_records
+    monkeypatch.setattr(
+        service._store,
+        "list_records",
+        lambda key: loads.append(key) or real_list_records(key),
+    )
+
+    service.upsert_feature(project_key="nexus", canonical_title="Weekly reports")
+    kept, _removed = service.filter_ideation_items(project_key="nexus", items=items)
+    assert kept == []
+
+    service.forget_feature(project_key="nexus", feature_ref="Slack alerts")
+    kept, _removed = service.filter_ideation_items(project_key="nexus", items=items)
+    assert [item["title"] for item in kept] == ["Slack alert"]
+    assert loads == []
+
+    # A write from another process changes the store signature and forces a rebuild.
+    other = FeatureRegistryService(enabled=True, backend="filesystem", state_dir=str(tmp_path))
+    other.upsert_feature(project_key="nexus", canonical_title="Slack alerting overhaul")
+    kept, _removed = service.filter_ideation_items(
+        project_key="nexus", items=[{"title": "Slack alerting overhauls"}]
+    )
+    assert kept == []
+    assert loads == ["nexus"]
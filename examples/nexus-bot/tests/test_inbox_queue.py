@@ -84,3 +84,86 @@ def test_claim_pending_tasks_allows_retry_after_failed_prior_row(queue_engine):
 
     claimed = inbox_queue.claim_pending_tasks(limit=10, worker_id="worker-2")
     assert [task.id for task in claimed] == [retry_id]
+
+
+def test_claim_pending_tasks_respects_limit_and_closes_duplicates_in_bulk(queue_engine):
+    ids = [
+        _insert_row(
+            engine=queue_engine,
+            project_key="nexus",
+            workspace="nexus",
+            filename=f"task_{index}.md",
+            status="pending",
+            body=f"body {index}",
+        )
+        for index in range(3)
+    ]
+    done_id = _insert_row(
+        engine=queue_engine,
+        project_key="nexus",
+        workspace="nexus",
+        filename="task_done.md",
+        status="done",
+        body="already processed",
+    )
+    redelivered_id = _insert_row(
+        engine=queue_engine,
+        project_key="nexus",
+        workspace="nexus",
+        filename="task_done.md",
+        status="pending",
+        body="webhook re-delivery",
+    )
+
+    claimed = inbox_queue.claim_pending_tasks(limit=2, worker_id="worker-3")
+    assert [task.id for task in claimed] == ids[:2]
+
+    with inbox_queue.Session(queue_engine) as session:
+        statuses = {
+            row.id: (row.status, row.claimed_by, row.error)
+            for row in session.query(inbox_queue._InboxTaskRow).all()
+        }
+
+    assert statuses[ids[0]][:2] == ("processing", "worker-3")
+    assert statuses[ids[2]][0] == "pending"
+    assert statuses[redelivered_id][0] == "done"
+    assert f"prior row id={done_id} status=done" in str(statuses[redelivered_id][2])
+
+
+def test_inbox_table_declares_claim_and_identity_indexes():
+    if not inbox_queue._SA_AVAILABLE:
+        pytest.skip("sqlalchemy not installed")
+
+    indexes = {
+        index.name: [column.name for column in index.columns]
+        for index in inbox_queue._InboxTaskRow.__table__.indexes
+    }
+    assert indexes["ix_nexus_inbox_tasks_status_id"] == ["status", "id"]
+    assert indexes["ix_nexus_inbox_tasks_identity"] == [
+        "project_key",
+        "workspace",
+        "filename",
+        "id",
+    ]
+
+
+def test_claim_query_uses_one_lateral_join_on_postgres():
+    if not inbox_queue._SA_AVAILABLE:
+        pytest.skip("sqlalchemy not installed")
+    from sqlalchemy.dialects import postgresql
+
+    sql = str(
+        inbox_queue._claim_candidates_query("postgresql", 125).compile(dialect=postgresql.dialect())
+    )
+
+    assert "LEFT OUTER JOIN LATERAL" in sql
+    assert sql.count("LIMIT") == 2
+    assert "FOR UPDATE OF nexus_inbox_tasks SKIP LOCKED" in sql
+
+
+def test_wait_for_task_notification_falls_back_to_sleep_without_postgres(queue_engine, monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(inbox_queue.time, "sleep", sleeps.append)
+
+    assert inbox_queue.wait_for_task_notification(2.5) is False
+    assert sleeps == [2.5]
@@ -75,3 +75,22 @@ def test_emit_alert_dedup_key_suppresses_repeat(monkeypatch):
     assert first is True
     assert second is True
     assert fake.calls == 1
+
+
+def test_alert_dedup_entries_expire_through_heap(monkeypatch):
+    import nexus.core.integrations.notifications as notifications
+
+    now = {"value": 1000.0}
+    monkeypatch.setattr(notifications.time, "time", lambda: now["value"])
+    monkeypatch.setattr(notifications, "_ALERT_DEDUP_CACHE", {})
+    monkeypatch.setattr(notifications, "_ALERT_DEDUP_HEAP", [])
+
+    notifications._record_alert_dedup("old")
+    now["value"] += 50
+    notifications._record_alert_dedup("new")
+    now["value"] += 60
+
+    assert notifications._is_duplicate_alert("new", ttl_seconds=100) is True
+    assert notifications._is_duplicate_alert("old", ttl_seconds=100) is False
+    assert set(notifications._ALERT_DEDUP_CACHE) == {"new"}
+    assert len(notifications._ALERT_DEDUP_HEAP) == 1
@@ -107,3 +107,108 @@ def test_run_processor_loop_runs_completion_before_stuck_detection():
         assert str(exc) == "stop-loop"
 
     assert order[:5] == ["completed", "comments", "stuck", "merge", "cleanup"]
+
+
+def test_run_processor_loop_waits_for_inbox_notifications_on_postgres():
+    waits = []
+    fake_time = _FakeTime()
+
+    def _wait(timeout):
+        waits.append(timeout)
+        fake_time.now += timeout
+        if len(waits) >= 2:
+            raise RuntimeError("stop-loop")
+        return False
+
+    try:
+        run_processor_loop(
+            logger=None,
+            base_dir="/tmp/base",
+            sleep_interval=1,
+            check_interval=60,
+            get_inbox_storage_backend=lambda: "postgres",
+            drain_postgres_inbox_queue=lambda: None,
+            process_filesystem_inbox_once=lambda _base: None,
+            check_stuck_agents=lambda: None,
+            check_agent_comments=lambda: None,
+            check_completed_agents=lambda: None,
+            merge_queue_auto_merge_once=lambda: None,
+            wait_for_inbox_tasks=_wait,
+            time_module=fake_time,
+        )
+    except RuntimeError as exc:
+        assert str(exc) == "stop-loop"
+
+    assert waits == [60.0, 60.0]
+    assert fake_time.sleeps == 0
+
+
+def test_run_processor_loop_redrains_without_waiting_while_backlog_remains():
+    drains = []
+    waits = []
+    fake_time = _FakeTime()
+
+    def _drain():
+        drains.append(fake_time.now)
+        return len(drains) < 3
+
+    def _wait(timeout):
+        waits.append(timeout)
+        raise RuntimeError("stop-loop")
+
+    try:
+        run_processor_loop(
+            logger=None,
+            base_dir="/tmp/base",
+            sleep_interval=1,
+            check_interval=60,
+            get_inbox_storage_backend=lambda: "postgres",
+            drain_postgres_inbox_queue=_drain,
+            process_filesystem_inbox_once=lambda _base: None,
+            check_stuck_agents=lambda: None,
+            check_agent_comments=lambda: None,
+            check_completed_agents=lambda: None,
+            merge_queue_auto_merge_once=lambda: None,
+            wait_for_inbox_tasks=_wait,
+            time_module=fake_time,
+        )
+    except RuntimeError as exc:
+        assert str(exc) == "stop-loop"
+
+    assert len(drains) == 3
+    assert waits == [60.0]
+
+
+def test_drain_postgres_inbox_queue_claims_until_a_partial_batch():
+    from types import SimpleNamespace
+
+    from nexus.core.inbox.inbox_processor_entry_service import drain_postgres_inbox_queue_once
+
+    pending = [
+        SimpleNamespace(
+            id=n, project_key="p", workspace="w", filename=f"{n}.md", markdown_content="x"
+        )
+        for n in range(5)
+    ]
+    done = []
+
+    def _claim(*, limit, worker_id):
+        claimed = pending[:limit]
+        del pending[:limit]
+        return claimed
+
+    def _drain(max_batches):
+        return drain_postgres_inbox_queue_once(
+            batch_size=2,
+            logger=None,
+            claim_pending_tasks=_claim,
+            process_task_payload=lambda **_kw: True,
+            mark_task_done=done.append,
+            mark_task_failed=lambda *_args: None,
+            max_batches=max_batches,
+        )
+
+    assert _drain(max_batches=2) is True
+    assert done == [0, 1, 2, 3]
+    assert _drain(max_batches=2) is False
+    assert done == [0, 1, 2, 3, 4]
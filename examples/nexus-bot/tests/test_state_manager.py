@@ -145,6 +145,28 @@ class TestMergeQueue:
         mock_save.assert_called_once()
         mock_emit.assert_called_once()
 
+    def test_update_merge_candidates_writes_once(self):
+        existing = {
+            "https://example/pr/3": {"pr_url": "https://example/pr/3", "status": "merging"},
+            "https://example/pr/4": {"pr_url": "https://example/pr/4", "status": "merging"},
+        }
+        with patch.object(HostStateManager, "load_merge_queue", return_value=existing):
+            with patch.object(HostStateManager, "save_merge_queue") as mock_save:
+                with patch.object(HostStateManager, "emit_transition") as mock_emit:
+                    updated = HostStateManager.update_merge_candidates(
+                        {
+                            "https://example/pr/3": {"status": "merged"},
+                            "https://example/pr/4": {"status": "blocked", "last_error": "x"},
+                            "https://example/pr/missing": {"status": "merged"},
+                        }
+                    )
+
+        assert [item["status"] for item in updated] == ["merged", "blocked"]
+        mock_save.assert_called_once()
+        saved = mock_save.call_args.args[0]
+        assert saved["https://example/pr/4"]["last_error"] == "x"
+        assert mock_emit.call_count == 2
+
 
 class TestLaunchedAgents:
     """Tests for launched agents tracking."""
@@ -1,8 +1,23 @@
 from __future__ import annotations
 
+import threading
+import time
 from types import SimpleNamespace
 
-from nexus.core.git_sync.workflow_start_sync_service import sync_project_repos_on_workflow_start
+import pytest
+
+from nexus.core.git_sync.workflow_start_sync_service import (
+    RepoSyncManager,
+    reset_repo_sync_manager,
+    sync_project_repos_on_workflow_start,
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_sync_manager():
+    reset_repo_sync_manager()
+    yield
+    reset_repo_sync_manager()
 
 
 def test_sync_service_skips_when_disabled():
@@ -41,8 +56,11 @@ def test_sync_service_fetches_all_resolved_repos(monkeypatch):
 
     assert result["blocked"] is False
     assert len(result["synced"]) == 2
-    assert calls[0][-1] == "develop:refs/remotes/origin/develop"
-    assert calls[1][-1] == "release:refs/remotes/origin/release"
+    assert sorted(cmd[-1] for cmd in calls) == [
+        "develop:refs/remotes/origin/develop",
+        "release:refs/remotes/origin/release",
+    ]
+    assert [entry["repo"] for entry in result["synced"]] == ["acme/backend", "acme/mobile"]
 
 
 def test_sync_service_retries_network_auth_then_continues(monkeypatch):
@@ -215,3 +233,77 @@ def test_sync_service_bootstrap_network_failure_can_block(monkeypatch):
     assert attempts["count"] == 2
     assert result["blocked"] is True
     assert result["failures"][0]["kind"] == "network_auth"
+
+
+def test_sync_service_runs_repos_in_parallel_and_reuses_fresh_fetches(monkeypatch):
+    calls: list[str] = []
+    started = threading.Barrier(2, timeout=5)
+
+    def _fake_run(cmd, **kwargs):
+        calls.append(kwargs["cwd"])
+        started.wait()  # both repos must be fetching at the same time
+        return SimpleNamespace(returncode=0, stdout="", stderr="")
+
+    monkeypatch.setattr("nexus.core.git_sync.workflow_start_sync_service.subprocess.run", _fake_run)
+    clock = {"now": 100.0}
+    manager = RepoSyncManager(clock=lambda: clock["now"])
+    kwargs = {
+        "project_name": "proj",
+        "project_cfg": {"git_sync": {"on_workflow_start": True, "freshness_seconds": 30}},
+        "resolve_git_dirs": lambda _p: {
+            "acme/backend": "/tmp/backend",
+            "acme/mobile": "/tmp/mobile",
+        },
+        "resolve_git_dir": lambda _p: None,
+        "get_repos": lambda _p: [],
+        "get_repo_branch": lambda _project, _repo: "main",
+        "sync_manager": manager,
+    }
+
+    first = sync_project_repos_on_workflow_start(issue_number="1", **kwargs)
+    assert sorted(calls) == ["/tmp/backend", "/tmp/mobile"]
+    assert first["fresh"] == []
+
+    clock["now"] += 10
+    second = sync_project_repos_on_workflow_start(issue_number="2", **kwargs)
+    assert len(calls) == 2
+    assert second["fresh"] == ["acme/backend", "acme/mobile"]
+    assert len(second["synced"]) == 2
+
+    clock["now"] += 30
+    started.reset()
+    sync_project_repos_on_workflow_start(issue_number="3", **kwargs)
+    assert len(calls) == 4
+
+
+def test_sync_manager_shares_in_flight_fetch_between_workflow_starts():
+    manager = RepoSyncManager()
+    release = threading.Event()
+    runs = {"count": 0}
+
+    def _fetch():
+        runs["count"] += 1
+        release.wait(5)
+        return True, "", False
+
+    key = RepoSyncManager.fetch_key("/tmp/backend", "main")
+    results: list[list[tuple[bool, str, bool]]] = []
+    starts = [
+        threading.Thread(
+            target=lambda: results.append(
+                manager.run_all([(key, "/tmp/backend", _fetch)], max_parallel=2)
+            )
+        )
+        for _ in range(2)
+    ]
+    for thread in starts:
+        thread.start()
+    while manager.stats["started"] + manager.stats["joined"] < 2:
+        time.sleep(0.01)
+    release.set()
+    for thread in starts:
+        thread.join(5)
+
+    assert runs["count"] == 1
+    assert manager.stats == {"started": 1, "joined": 1, "fresh": 0}
+    assert results == [[(True, "", False)], [(True, "", False)]]
@@ -2,16 +2,32 @@
 
 from __future__ import annotations
 
+import time
+
+import pytest
+
 from nexus.core.state_manager import HostStateManager
 from nexus.core.workflow_runtime import workflow_watch_service as watch_module
 from nexus.core.workflow_runtime.workflow_watch_service import WorkflowWatchService
 
+_services: list[WorkflowWatchService] = []
+
+
+@pytest.fixture(autouse=True)
+def _flush_services(monkeypatch):
+    yield
+    # Drain pending debounced writes while the storage patches are still active.
+    while _services:
+        _services.pop().flush()
+
 
 def _build_service(monkeypatch) -> WorkflowWatchService:
     monkeypatch.setenv("NEXUS_TELEGRAM_WATCH_ENABLED", "false")
     monkeypatch.setattr(HostStateManager, "load_workflow_watch_subscriptions", lambda: {})
     monkeypatch.setattr(HostStateManager, "save_workflow_watch_subscriptions", lambda _data: None)
-    return WorkflowWatchService()
+    service = WorkflowWatchService()
+    _services.append(service)
+    return service
 
 
 def test_watch_routes_events_by_project_workflow_scope(monkeypatch):
@@ -143,3 +159,69 @@ def test_reconnect_sends_snapshots_to_all_subscribers(monkeypatch):
     assert len(sent_messages) == 2
     assert "Watching workflow #1 (p1)" in sent_messages[0][1]
     assert "Watching workflow #2 (p2)" in sent_messages[1][1]
+
+
+def test_event_routing_uses_issue_index_and_defers_persistence(monkeypatch):
+    monkeypatch.setattr(watch_module, "_PERSIST_DEBOUNCE_SECONDS", 60.0)
+    monkeypatch.setattr(watch_module, "_PERSIST_MAX_DELAY_SECONDS", 60.0)
+    service = _build_service(monkeypatch)
+    writes: list[tuple[dict, set]] = []
+    monkeypatch.setattr(
+        HostStateManager,
+        "update_workflow_watch_subscriptions",
+        lambda changed, removed=(): writes.append((changed, set(removed))),
+    )
+    sent_messages: list[tuple[int, str]] = []
+    service._send_message = lambda chat_id, text: sent_messages.append((chat_id, text))
+
+    for idx in range(50):
+        service.start_watch(chat_id=idx, user_id=idx, project_key="nexus", issue_num=str(idx))
+    service.flush()
+    writes.clear()
+
+    checked: list[str] = []
+    real_matches = service._subscription_matches_event
+
+    def _counting_matches(*, subscription, **kwargs):
+        checked.append(subscription.key)
+        return real_matches(subscription=subscription, **kwargs)
+
+    service._subscription_matches_event = _counting_matches
+    service._handle_event(
+        "step_status_changed",
+        {"issue": "7", "workflow_id": "nexus-7-full", "step_id": "dev", "status": "running"},
+    )
+
+    assert checked == ["7:7"]
+    assert sent_messages == [(7, "▶️ #7 agent · dev → running")]
+    assert writes == []
+
+    service._handle_event(
+        "workflow_completed", {"workflow_id": "nexus-7-full", "status": "success"}
+    )
+    assert sent_messages[-1] == (7, "✅ Workflow #7 completed: success")
+    assert writes == []
+
+    service.flush()
+    assert writes == [({}, {"7:7"})]
+    assert "nexus-7-full" not in service._by_workflow
+    assert "7" not in service._by_issue
+
+
+def test_debounced_flush_persists_only_changed_entries(monkeypatch):
+    monkeypatch.setattr(watch_module, "_PERSIST_DEBOUNCE_SECONDS", 0.0)
+    service = _build_service(monkeypatch)
+    stored = {"1:1": {"chat_id": 1}, "9:9": {"chat_id": 9}}
+    monkeypatch.setattr(HostStateManager, "load_workflow_watch_subscriptions", lambda: stored)
+    saves: list[dict] = []
+    monkeypatch.setattr(HostStateManager, "save_workflow_watch_subscriptions", saves.append)
+
+    service.start_watch(chat_id=2, user_id=2, project_key="nexus", issue_num="5")
+    deadline = time.monotonic() + 5
+    while not saves and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    service.flush()
+    assert len(saves) == 1
+    assert set(saves[0]) == {"1:1", "9:9", "2:2"}
+    assert saves[0]["2:2"]["issue_num"] == "5"
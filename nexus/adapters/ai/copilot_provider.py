@@ -1,6 +1,5 @@
 """CopilotCLI AI provider implementation."""
 
-import asyncio
 import logging
 import shutil
 import subprocess
@@ -9,6 +8,7 @@ from pathlib import Path
 
 from nexus.adapters.ai.base import AIProvider, ExecutionContext
 from nexus.core.models import AgentResult, RateLimitStatus
+from nexus.core.process_runner import get_process_runner
 
 logger = logging.getLogger(__name__)
 
@@ -69,18 +69,15 @@ class CopilotCLIProvider(AIProvider):
 
         cmd = ["gh", "copilot", "suggest", "--target", "shell", context.prompt]
         try:
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                cwd=str(workspace),
-            )
-            stdout, stderr = await asyncio.wait_for(
-                process.communicate(),
+            result = await get_process_runner().run_async(
+                cmd,
+                provider=self.name,
                 timeout=context.timeout or self._timeout,
+                cwd=str(workspace),
             )
+            stdout, stderr = result.stdout, result.stderr
             elapsed = time.time() - start
-            if process.returncode == 0:
+            if result.returncode == 0:
                 return AgentResult(
                     success=True,
                     output=stdout.decode(errors="replace"),
@@ -94,7 +91,7 @@ class CopilotCLIProvider(AIProvider):
                 execution_time=elapsed,
                 provider_used=self.name,
             )
-        except TimeoutError:
+        except subprocess.TimeoutExpired:
             return AgentResult(
                 success=False,
                 output="",
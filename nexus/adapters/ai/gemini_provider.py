@@ -1,13 +1,14 @@
 """GeminiCLI AI provider implementation."""
 
-import asyncio
 import logging
 import shutil
+import subprocess
 import time
 from pathlib import Path
 
 from nexus.adapters.ai.base import AIProvider, ExecutionContext
 from nexus.core.models import AgentResult, RateLimitStatus
+from nexus.core.process_runner import get_process_runner
 
 logger = logging.getLogger(__name__)
 
@@ -58,18 +59,15 @@ class GeminiCLIProvider(AIProvider):
 
         cmd = ["gemini", "--model", self._model, "--prompt", context.prompt]
         try:
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                cwd=str(workspace),
-            )
-            stdout, stderr = await asyncio.wait_for(
-                process.communicate(),
+            result = await get_process_runner().run_async(
+                cmd,
+                provider=self.name,
                 timeout=context.timeout or self._timeout,
+                cwd=str(workspace),
             )
+            stdout, stderr = result.stdout, result.stderr
             elapsed = time.time() - start
-            if process.returncode == 0:
+            if result.returncode == 0:
                 return AgentResult(
                     success=True,
                     output=stdout.decode(errors="replace"),
@@ -83,7 +81,7 @@ class GeminiCLIProvider(AIProvider):
                 execution_time=elapsed,
                 provider_used=self.name,
             )
-        except TimeoutError:
+        except subprocess.TimeoutExpired:
             return AgentResult(
                 success=False,
                 output="",
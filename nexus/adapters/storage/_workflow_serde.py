@@ -3,22 +3,110 @@
 Both :class:`FileStorage` and :class:`PostgreSQLStorageBackend` (and any
 future backends) import from here so the serialization logic lives in one
 place.
+
+:func:`workflow_to_document` / :func:`document_to_workflow` wrap the plain
+dict form for codec-encoded storage (format version 2): non-empty step
+``outputs`` are stored pre-encoded under ``outputs_packed`` and only decoded
+when a caller touches them; untouched outputs are written back as-is.
+Documents without ``format_version`` (version 1) load unchanged.
 """
 
+import sys
+from collections.abc import Callable
 from datetime import datetime
 from typing import Any
 
 from nexus.core.models import (
-    Agent,
     StepStatus,
     Workflow,
     WorkflowState,
     WorkflowStep,
+    shared_agent,
 )
 
+WORKFLOW_FORMAT_VERSION = 2
+
+
+class LazyStepOutputs(dict):
+    """Step ``outputs`` mapping decoded from its packed form on first use.
+
+    Every ``dict`` method decodes the payload before running.  C-level
+    serializers read a dict's storage directly, so :func:`step_to_dict`
+    always hands them a plain ``dict`` copy.
+    """
+
+    __slots__ = ("_packed", "_decode", "codec_name")
+
+    def __init__(
+        self, packed: bytes | str, decode: Callable[[bytes | str], Any], codec_name: str
+    ) -> None:
+        super().__init__()
+        self._packed: bytes | str | None = packed
+        self._decode = decode
+        self.codec_name = codec_name
+
+    @property
+    def packed(self) -> bytes | str | None:
+        """The still-encoded payload, or ``None`` once decoded."""
+        return self._packed
+
+    def _materialize(self) -> None:
+        packed, self._packed = self._packed, None
+        decoded = self._decode(packed)
+        if isinstance(decoded, dict):
+            dict.update(self, decoded)
+
+    def __reduce__(self):
+        return dict, (dict(self.items()),)
+
+
+def _materializing(name: str):
+    method = getattr(dict, name)
+
+    def wrapper(self, *args, **kwargs):
+        if self._packed is not None:
+            self._materialize()
+        return method(self, *args, **kwargs)
+
+    wrapper.__name__ = name
+    return wrapper
+
+
+for _name in (
+    "__contains__",
+    "__delitem__",
+    "__eq__",
+    "__getitem__",
+    "__ior__",
+    "__iter__",
+    "__len__",
+    "__ne__",
+    "__or__",
+    "__repr__",
+    "__reversed__",
+    "__ror__",
+    "__setitem__",
+    "clear",
+    "copy",
+    "get",
+    "items",
+    "keys",
+    "pop",
+    "popitem",
+    "setdefault",
+    "update",
+    "values",
+):
+    setattr(LazyStepOutputs, _name, _materializing(_name))
+del _name
+
 
 def workflow_to_dict(workflow: Workflow) -> dict[str, Any]:
     """Serialize a :class:`Workflow` instance to a plain dict."""
+    return _workflow_fields(workflow, [step_to_dict(step) for step in workflow.steps])
+
+
+def _workflow_fields(workflow: Workflow, steps: list[dict[str, Any]]) -> dict[str, Any]:
     return {
         "id": workflow.id,
         "name": workflow.name,
@@ -30,12 +118,19 @@ def workflow_to_dict(workflow: Workflow) -> dict[str, Any]:
         "updated_at": workflow.updated_at.isoformat(),
         "completed_at": workflow.completed_at.isoformat() if workflow.completed_at else None,
         "metadata": workflow.metadata,
-        "steps": [step_to_dict(step) for step in workflow.steps],
+        "steps": steps,
     }
 
 
 def step_to_dict(step: WorkflowStep) -> dict[str, Any]:
     """Serialize a :class:`WorkflowStep` to a plain dict."""
+    outputs = step.outputs
+    if isinstance(outputs, LazyStepOutputs):
+        outputs = dict(outputs.items())
+    return _step_fields(step, outputs)
+
+
+def _step_fields(step: WorkflowStep, outputs: Any) -> dict[str, Any]:
     return {
         "step_num": step.step_num,
         "name": step.name,
@@ -52,7 +147,7 @@ def step_to_dict(step: WorkflowStep) -> dict[str, Any]:
         "timeout": step.timeout,
         "retry": step.retry,
         "inputs": step.inputs,
-        "outputs": step.outputs,
+        "outputs": outputs,
         "status": step.status.value,
         "started_at": step.started_at.isoformat() if step.started_at else None,
         "completed_at": step.completed_at.isoformat() if step.completed_at else None,
@@ -64,11 +159,17 @@ def step_to_dict(step: WorkflowStep) -> dict[str, Any]:
     }
 
 
+def _shared_text(value: Any) -> Any:
+    # Step names and prompt templates repeat across every workflow built from
+    # the same definition; interning keeps one copy per distinct text.
+    return sys.intern(value) if type(value) is str else value
+
+
 def dict_to_workflow(data: dict[str, Any]) -> Workflow:
     """Deserialize a plain dict to a :class:`Workflow` instance."""
     steps = []
     for step_data in data.get("steps", []):
-        agent = Agent(
+        agent = shared_agent(
             name=step_data["agent"]["name"],
             display_name=step_data["agent"]["display_name"],
             description=step_data["agent"]["description"],
@@ -78,9 +179,9 @@ def dict_to_workflow(data: dict[str, Any]) -> Workflow:
         )
         step = WorkflowStep(
             step_num=step_data["step_num"],
-            name=step_data["name"],
+            name=_shared_text(step_data["name"]),
             agent=agent,
-            prompt_template=step_data["prompt_template"],
+            prompt_template=_shared_text(step_data["prompt_template"]),
             condition=step_data.get("condition"),
             timeout=step_data.get("timeout"),
             retry=step_data.get("retry"),
@@ -120,3 +221,73 @@ def dict_to_workflow(data: dict[str, Any]) -> Workflow:
         ),
         metadata=data.get("metadata", {}),
     )
+
+
+def workflow_to_document(workflow: Workflow, codec: Any) -> dict[str, Any]:
+    """Serialize *workflow* to a format-2 document for *codec* (see module docstring)."""
+    document = _workflow_fields(
+        workflow, [step_to_document(step, codec) for step in workflow.steps]
+    )
+    document["format_version"] = WORKFLOW_FORMAT_VERSION
+    return document
+
+
+def step_to_document(step: WorkflowStep, codec: Any) -> dict[str, Any]:
+    """Serialize one step for a format-2 document, packing its outputs with *codec*."""
+    outputs = step.outputs
+    packed = outputs.packed if isinstance(outputs, LazyStepOutputs) else None
+    if packed is not None and (
+        outputs.codec_name == codec.name or (codec.text and isinstance(packed, str))
+    ):
+        # Untouched since load: write the original encoding back.
+        step_data = _step_fields(step, None)
+    else:
+        step_data = step_to_dict(step)
+        packed = _pack(codec, step_data["outputs"]) if step_data["outputs"] else None
+    if packed is not None:
+        del step_data["outputs"]
+        step_data["outputs_packed"] = packed
+    return step_data
+
+
+def workflow_header(workflow: Workflow) -> dict[str, Any]:
+    """Workflow-level fields of a document (everything but ``steps``)."""
+    header = _workflow_fields(workflow, [])
+    del header["steps"]
+    return header
+
+
+def apply_workflow_patch(
+    document: dict[str, Any],
+    header: dict[str, Any] | None,
+    steps: list[dict[str, Any]],
+) -> dict[str, Any]:
+    """Merge a header and per-step patches (format-2 step documents) into *document*.
+
+    Patched steps replace the snapshot step with the same ``step_num``.
+    """
+    if header:
+        document.update(header)
+    if steps:
+        by_num = {step["step_num"]: step for step in steps}
+        document["steps"] = [
+            by_num.get(step.get("step_num"), step) for step in document.get("steps", [])
+        ]
+    if header or steps:
+        document["format_version"] = WORKFLOW_FORMAT_VERSION
+    return document
+
+
+def document_to_workflow(document: dict[str, Any], codec: Any) -> Workflow:
+    """Deserialize a format-1 or format-2 document; packed outputs stay lazy."""
+    if document.get("format_version", 1) >= 2:
+        for step_data in document.get("steps", []):
+            packed = step_data.pop("outputs_packed", None)
+            if packed is not None:
+                step_data["outputs"] = LazyStepOutputs(packed, codec.decode, codec.name)
+    return dict_to_workflow(document)
+
+
+def _pack(codec: Any, outputs: dict[str, Any]) -> bytes | str:
+    encoded = codec.encode(outputs)
+    return encoded.decode("utf-8") if codec.text else encoded
@@ -1,6 +1,7 @@
 """Base interface for storage backends."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
 from datetime import datetime
 from typing import Any
 
@@ -15,6 +16,19 @@ class StorageBackend(ABC):
         """Persist workflow state."""
         pass
 
+    async def patch_workflow(self, workflow: Workflow, step_nums: Iterable[int]) -> None:
+        """Persist workflow-level fields and only the steps in *step_nums*.
+
+        Callers guarantee every other step is unchanged since the workflow was
+        loaded or last saved.  Backends that support partial updates override
+        this; the default rewrites the whole workflow.
+        """
+        await self.save_workflow(workflow)
+
+    async def update_step(self, workflow: Workflow, step_num: int) -> None:
+        """Persist a single changed step (and the workflow-level fields)."""
+        await self.patch_workflow(workflow, (step_num,))
+
     @abstractmethod
     async def load_workflow(self, workflow_id: str) -> Workflow | None:
         """Load workflow state by ID."""
@@ -0,0 +1,160 @@
+"""Pluggable encoders for persisted storage documents.
+
+Storage backends encode plain ``dict``/``list`` documents through a
+:class:`StorageCodec`:
+
+* ``json`` — stdlib :mod:`json`, always available (compact separators);
+* ``orjson`` — same JSON text, several times faster; used when installed;
+* ``msgpack`` — binary, smallest output; opt-in, requires ``msgpack``.
+
+``auto`` (the default, overridable with ``NEXUS_STORAGE_CODEC``) picks
+``orjson`` when it can be imported and falls back to ``json``.
+"""
+
+import json
+import os
+from datetime import date, datetime
+from enum import Enum
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+def _to_primitive(value: Any) -> Any:
+    """``default`` hook shared by the codecs (mirrors ``json.dump(default=str)``)."""
+    if isinstance(value, dict):
+        return dict(value.items())
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return list(value)
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, str):
+        return str(value)
+    if isinstance(value, bool):
+        return bool(value)
+    if isinstance(value, int):
+        return int(value)
+    if isinstance(value, float):
+        return float(value)
+    return str(value)
+
+
+class StorageCodec:
+    """Encodes documents to bytes and back."""
+
+    name = ""
+    suffix = ".json"
+    text = True
+
+    def encode(self, document: Any) -> bytes:
+        raise NotImplementedError
+
+    def decode(self, payload: bytes | str) -> Any:
+        raise NotImplementedError
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+
+class JsonCodec(StorageCodec):
+    """Stdlib JSON with compact separators."""
+
+    name = "json"
+
+    def encode(self, document: Any) -> bytes:
+        return json.dumps(
+            document, separators=(",", ":"), ensure_ascii=False, default=_to_primitive
+        ).encode("utf-8")
+
+    def decode(self, payload: bytes | str) -> Any:
+        return json.loads(payload)
+
+
+class OrjsonCodec(StorageCodec):
+    """JSON through ``orjson``; output is readable by :class:`JsonCodec`."""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        if orjson is None:
+            raise ValueError("The 'orjson' storage codec requires the orjson package")
+        # Subclasses of dict/list/str go through ``default`` so lazily decoded
+        # mappings are serialized through their public interface.
+        self._options = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_SUBCLASS
+
+    def encode(self, document: Any) -> bytes:
+        return orjson.dumps(document, default=_to_primitive, option=self._options)
+
+    def decode(self, payload: bytes | str) -> Any:
+        return orjson.loads(payload)
+
+
+class MsgpackCodec(StorageCodec):
+    """Binary MessagePack documents (``.msgpack`` files)."""
+
+    name = "msgpack"
+    suffix = ".msgpack"
+    text = False
+
+    def __init__(self) -> None:
+        if msgpack is None:
+            raise ValueError("The 'msgpack' storage codec requires the msgpack package")
+
+    def encode(self, document: Any) -> bytes:
+        return msgpack.packb(document, default=_to_primitive, use_bin_type=True)
+
+    def decode(self, payload: bytes | str) -> Any:
+        if isinstance(payload, str):
+            payload = payload.encode("latin-1")
+        return msgpack.unpackb(payload, raw=False, strict_map_key=False)
+
+
+_CODECS: dict[str, type[StorageCodec]] = {
+    "json": JsonCodec,
+    "orjson": OrjsonCodec,
+    "msgpack": MsgpackCodec,
+}
+
+
+def available_storage_codecs() -> list[str]:
+    """Names of the codecs whose dependencies are installed."""
+    names = ["json"]
+    if orjson is not None:
+        names.append("orjson")
+    if msgpack is not None:
+        names.append("msgpack")
+    return names
+
+
+def get_storage_codec(name: str | StorageCodec | None = None) -> StorageCodec:
+    """Return the codec called *name* (``None`` reads ``NEXUS_STORAGE_CODEC``).
+
+    Raises:
+        ValueError: For unknown names or codecs whose package is not installed.
+    """
+    if isinstance(name, StorageCodec):
+        return name
+    key = str(name or os.getenv("NEXUS_STORAGE_CODEC") or "auto").strip().lower()
+    if key == "auto":
+        key = "orjson" if orjson is not None else "json"
+    codec_cls = _CODECS.get(key)
+    if codec_cls is None:
+        raise ValueError(
+            f"Unknown storage codec {key!r}; expected one of: auto, {', '.join(_CODECS)}"
+        )
+    return codec_cls()
+
+
+def get_text_storage_codec() -> StorageCodec:
+    """Fastest available codec producing JSON text (for text columns and ``.json`` files)."""
+    return OrjsonCodec() if orjson is not None else JsonCodec()
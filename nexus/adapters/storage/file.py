@@ -1,4 +1,4 @@
-"""File-based storage backend (JSON files)."""
+"""File-based storage backend (JSON or MessagePack files)."""
 
 import json
 import logging
@@ -7,8 +7,19 @@ from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Any
 
-from nexus.adapters.storage._workflow_serde import dict_to_workflow, workflow_to_dict
+from nexus.adapters.storage._workflow_serde import (
+    dict_to_workflow,
+    document_to_workflow,
+    workflow_to_dict,
+    workflow_to_document,
+)
 from nexus.adapters.storage.base import StorageBackend
+from nexus.adapters.storage.codecs import (
+    MsgpackCodec,
+    StorageCodec,
+    get_storage_codec,
+    get_text_storage_codec,
+)
 from nexus.core.completion import build_completion_step_dedup_key
 from nexus.core.models import AuditEvent, Workflow, WorkflowState
 
@@ -16,16 +27,22 @@ logger = logging.getLogger(__name__)
 
 
 class FileStorage(StorageBackend):
-    """File-based storage using JSON files."""
+    """File-based storage; workflow files are encoded with a storage codec."""
 
-    def __init__(self, base_path: str | Path):
+    def __init__(self, base_path: str | Path, codec: str | StorageCodec | None = None):
         """
         Initialize file storage.
 
         Args:
             base_path: Base directory for storing workflow data
+            codec: Workflow file codec name (``auto``, ``json``, ``orjson``, ``msgpack``)
+                or instance; defaults to ``NEXUS_STORAGE_CODEC`` / ``auto``.
         """
         self.base_path = Path(base_path)
+        self.codec = get_storage_codec(codec)
+        # Workflow files keep one suffix per encoding family; both are readable.
+        self._text_codec = self.codec if self.codec.text else get_text_storage_codec()
+        self._binary_codec = None if self.codec.text else self.codec
         self.workflows_dir = self.base_path / "workflows"
         self.audit_dir = self.base_path / "audit"
         self.agent_dir = self.base_path / "agents"
@@ -54,34 +71,34 @@ class FileStorage(StorageBackend):
         return resolved
 
     async def save_workflow(self, workflow: Workflow) -> None:
-        """Save workflow to JSON file."""
-        workflow_file = self._safe_path(self.workflows_dir, f"{workflow.id}.json")
-
-        # Convert workflow to dict (handle dataclasses and enums)
-        data = self._workflow_to_dict(workflow)
+        """Save workflow to a file encoded with the configured codec."""
+        workflow_file = self._safe_path(self.workflows_dir, f"{workflow.id}{self.codec.suffix}")
 
         try:
-            with open(workflow_file, "w") as f:
-                json.dump(data, f, indent=2, default=str)
+            payload = self.codec.encode(workflow_to_document(workflow, self.codec))
+            with open(workflow_file, "wb") as f:
+                f.write(payload)
             logger.debug(f"Saved workflow {workflow.id} to {workflow_file}")
         except Exception as e:
             logger.error(f"Failed to save workflow {workflow.id}: {e}")
             raise
+        # Drop a copy left behind in the other encoding (codec switched).
+        for stale in self._workflow_files(workflow.id):
+            if stale != workflow_file:
+                stale.unlink(missing_ok=True)
 
     async def load_workflow(self, workflow_id: str) -> Workflow | None:
-        """Load workflow from JSON file."""
+        """Load workflow from its file (JSON or MessagePack)."""
         try:
-            workflow_file = self._safe_path(self.workflows_dir, f"{workflow_id}.json")
+            workflow_files = self._workflow_files(workflow_id)
         except ValueError:
             return None
 
-        if not workflow_file.exists():
+        if not workflow_files:
             return None
 
         try:
-            with open(workflow_file) as f:
-                data = json.load(f)
-            workflow = self._dict_to_workflow(data)
+            workflow = self._read_workflow_file(workflow_files[0])
             logger.debug(f"Loaded workflow {workflow_id}")
             return workflow
         except Exception as e:
@@ -95,15 +112,13 @@ class FileStorage(StorageBackend):
         workflows = []
 
         for workflow_file in sorted(
-            self.workflows_dir.glob("*.json"), key=lambda p: p.stat().st_mtime, reverse=True
+            self._all_workflow_files(), key=lambda p: p.stat().st_mtime, reverse=True
         ):
             if len(workflows) >= limit:
                 break
 
             try:
-                with open(workflow_file) as f:
-                    data = json.load(f)
-                workflow = self._dict_to_workflow(data)
+                workflow = self._read_workflow_file(workflow_file)
 
                 if state is None or workflow.state == state:
                     workflows.append(workflow)
@@ -115,12 +130,13 @@ class FileStorage(StorageBackend):
     async def delete_workflow(self, workflow_id: str) -> bool:
         """Delete workflow file."""
         try:
-            workflow_file = self._safe_path(self.workflows_dir, f"{workflow_id}.json")
+            workflow_files = self._workflow_files(workflow_id)
         except ValueError:
             return False
 
-        if workflow_file.exists():
+        for workflow_file in workflow_files:
             workflow_file.unlink()
+        if workflow_files:
             logger.info(f"Deleted workflow {workflow_id}")
             return True
         return False
@@ -221,7 +237,7 @@ class FileStorage(StorageBackend):
         cutoff = datetime.now(UTC) - timedelta(days=older_than_days)
         deleted = 0
 
-        for workflow_file in self.workflows_dir.glob("*.json"):
+        for workflow_file in self._all_workflow_files():
             try:
                 mtime = datetime.fromtimestamp(workflow_file.stat().st_mtime)
                 if mtime < cutoff:
@@ -362,6 +378,41 @@ class FileStorage(StorageBackend):
 
     # Helper methods for serialization
 
+    def _workflow_codecs(self) -> list[StorageCodec]:
+        """Codecs to try, the configured one first."""
+        codecs = [self.codec, self._text_codec]
+        if self._binary_codec is None:
+            try:
+                codecs.append(MsgpackCodec())
+            except ValueError:
+                pass
+        else:
+            codecs.append(self._binary_codec)
+        unique: dict[str, StorageCodec] = {}
+        for codec in codecs:
+            unique.setdefault(codec.suffix, codec)
+        return list(unique.values())
+
+    def _workflow_files(self, workflow_id: str) -> list[Path]:
+        """Existing files for *workflow_id*, preferred encoding first."""
+        paths = [
+            self._safe_path(self.workflows_dir, f"{workflow_id}{codec.suffix}")
+            for codec in self._workflow_codecs()
+        ]
+        return [path for path in paths if path.exists()]
+
+    def _all_workflow_files(self) -> list[Path]:
+        files: list[Path] = []
+        for codec in self._workflow_codecs():
+            files.extend(self.workflows_dir.glob(f"*{codec.suffix}"))
+        return files
+
+    def _read_workflow_file(self, path: Path) -> Workflow:
+        codec = next(c for c in self._workflow_codecs() if path.name.endswith(c.suffix))
+        with open(path, "rb") as f:
+            document = codec.decode(f.read())
+        return document_to_workflow(document, codec)
+
     def _workflow_to_dict(self, workflow: Workflow) -> dict[str, Any]:
         """Delegate to shared serde module."""
         return workflow_to_dict(workflow)
@@ -2,8 +2,10 @@
 
 import asyncio
 import logging
+import shutil
+import tempfile
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
 from nexus.adapters.transcription.base import (
     TranscriptionInput,
@@ -14,6 +16,9 @@ from nexus.adapters.transcription.base import (
 
 logger = logging.getLogger(__name__)
 
+# Remote audio up to this size stays in memory; larger downloads spill to disk.
+_SPOOL_MAX_MEMORY = 4 * 1024 * 1024
+
 # Formats accepted by the Whisper API (as of 2024)
 SUPPORTED_FORMATS = frozenset(
     {"mp3", "mp4", "mpeg", "mpga", "m4a", "wav", "webm", "ogg", "ogg_vorbis"}
@@ -73,9 +78,9 @@ class WhisperTranscriptionProvider(TranscriptionProvider):
         """Transcribe *audio_input* using the Whisper API.
 
         Supports:
-        - ``Path`` — file is read from disk
+        - ``Path`` — the open file is streamed to the API
         - ``bytes`` — used directly as in-memory audio
-        - ``str``  — treated as a URL and fetched before sending
+        - ``str``  — treated as a URL and downloaded in chunks before sending
 
         Args:
             audio_input: Input specification.
@@ -87,10 +92,18 @@ class WhisperTranscriptionProvider(TranscriptionProvider):
             ValueError: If the audio format is not supported.
             RuntimeError: On upstream API errors.
         """
+        audio, filename = await self._resolve_source(audio_input)
+        try:
+            return await self._transcribe_resolved(audio_input, audio, filename)
+        finally:
+            if not isinstance(audio, bytes):
+                audio.close()
+
+    async def _transcribe_resolved(
+        self, audio_input: TranscriptionInput, audio: bytes | BinaryIO, filename: str
+    ) -> TranscriptionResult:
         import openai
 
-        audio_bytes, filename = await self._resolve_source(audio_input)
-
         client = openai.AsyncOpenAI(api_key=self._api_key)
 
         kwargs: dict[str, Any] = dict(self._extra_kwargs)
@@ -104,7 +117,7 @@ class WhisperTranscriptionProvider(TranscriptionProvider):
         try:
             response = await client.audio.transcriptions.create(
                 model=self._model,
-                file=(filename, audio_bytes),
+                file=(filename, audio),
                 **kwargs,
             )
         except openai.OpenAIError as exc:
@@ -133,8 +146,15 @@ class WhisperTranscriptionProvider(TranscriptionProvider):
     # Helpers
     # ------------------------------------------------------------------
 
-    async def _resolve_source(self, audio_input: TranscriptionInput) -> tuple[bytes, str]:
-        """Return (bytes, filename) from a Path, bytes, or URL source."""
+    async def _resolve_source(
+        self, audio_input: TranscriptionInput
+    ) -> tuple[bytes | BinaryIO, str]:
+        """Return (bytes or open binary file, filename) from a Path, bytes, or URL source.
+
+        File and URL sources are never read into a single buffer: paths are
+        opened and URL bodies are copied chunk by chunk into a spooled file.
+        The caller closes any returned file object.
+        """
         source = audio_input.source
 
         if isinstance(source, Path):
@@ -143,7 +163,7 @@ class WhisperTranscriptionProvider(TranscriptionProvider):
                 raise ValueError(
                     f"Unsupported audio format {ext!r}. " f"Supported: {sorted(SUPPORTED_FORMATS)}"
                 )
-            return source.read_bytes(), source.name
+            return source.open("rb"), source.name
 
         if isinstance(source, bytes):
             fmt_hint = audio_input.format or "auto"
@@ -177,10 +197,17 @@ class WhisperTranscriptionProvider(TranscriptionProvider):
                 raise ValueError(f"Unable to resolve hostname: {hostname!r}") from exc
             filename = source.split("/")[-1].split("?")[0] or "audio.mp3"
 
-            def _fetch() -> bytes:
+            def _fetch() -> BinaryIO:
                 req = urllib.request.Request(source)  # noqa: S310
-                with urllib.request.urlopen(req, timeout=30) as resp:  # noqa: S310
-                    return resp.read()
+                spool = tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_MEMORY)
+                try:
+                    with urllib.request.urlopen(req, timeout=30) as resp:  # noqa: S310
+                        shutil.copyfileobj(resp, spool)
+                except BaseException:
+                    spool.close()
+                    raise
+                spool.seek(0)
+                return spool  # type: ignore[return-value]
 
             data = await asyncio.to_thread(_fetch)
             return data, filename
@@ -514,7 +514,25 @@ def _get_orchestrator_config():
             "chat_agent_types_resolver": get_chat_agent_types,
             "fallback_enabled": os.getenv("AI_FALLBACK_ENABLED", "true").lower() == "true",
             "rate_limit_ttl": int(os.getenv("AI_RATE_LIMIT_TTL", "3600")),
+            "provider_health_file": os.getenv(
+                "AI_PROVIDER_HEALTH_FILE", f"{NEXUS_STATE_DIR}/provider_health.json"
+            ),
+            "provider_probe_interval": _get_int_env("AI_PROVIDER_PROBE_INTERVAL", 300),
+            "adaptive_routing": os.getenv("AI_ADAPTIVE_ROUTING", "false").lower() == "true",
+            "provider_scoreboard_file": os.getenv(
+                "AI_PROVIDER_SCOREBOARD_FILE", f"{NEXUS_STATE_DIR}/provider_scoreboard.json"
+            ),
             "max_retries": int(os.getenv("AI_MAX_RETRIES", "3")),
+            "analysis_cache_ttl": _get_int_env("AI_ANALYSIS_CACHE_TTL", 900),
+            "analysis_cache_entries": _get_int_env("AI_ANALYSIS_CACHE_ENTRIES", 512),
+            "analysis_cache_dir": os.getenv(
+                "AI_ANALYSIS_CACHE_DIR", f"{NEXUS_STATE_DIR}/analysis_cache"
+            ),
+            "analysis_cache_tasks": os.getenv(
+                "AI_ANALYSIS_CACHE_TASKS",
+                "classify,detect_feature_ideation,detect_intent,generate_name,"
+                "refine_description,route",
+            ),
             "analysis_timeout": _get_int_env("AI_ANALYSIS_TIMEOUT", 120),
             "ai_prompt_max_chars": _get_int_env("AI_PROMPT_MAX_CHARS", 16000),
             "ai_context_summary_max_chars": _get_int_env("AI_CONTEXT_SUMMARY_MAX_CHARS", 1200),
@@ -522,6 +540,10 @@ def _get_orchestrator_config():
             "whisper_model": os.getenv("WHISPER_MODEL", "whisper-1").strip(),
             "whisper_language": os.getenv("WHISPER_LANGUAGE", "").strip().lower(),
             "whisper_languages": os.getenv("WHISPER_LANGUAGES", "").strip().lower(),
+            "whisper_pool_workers": _get_int_env("WHISPER_POOL_WORKERS", 1),
+            "whisper_pool_processes": os.getenv("WHISPER_POOL_PROCESSES", "true").lower()
+            == "true",
+            "whisper_preload": os.getenv("WHISPER_PRELOAD", "false").lower() == "true",
         }
     return _orchestrator_config_cache["value"]
 
@@ -798,6 +820,11 @@ AGENT_RECENT_WINDOW = _get_int_env("AGENT_RECENT_WINDOW", 120)  # seconds
 AGENT_TIMEOUT = _get_int_env("AGENT_TIMEOUT", 3600)  # seconds
 COPILOT_PROVIDER = os.getenv("COPILOT_PROVIDER", os.getenv("COPILOT_CLI_PATH", "copilot"))
 AUTO_CHAIN_CYCLE = _get_int_env("AUTO_CHAIN_CYCLE", 60)  # seconds - frequency of auto-chain polling
+# "serial" (default) runs processor checks one after another in the legacy loop;
+# "concurrent" opts in to running them as independent scheduled jobs.
+NEXUS_PROCESSOR_SCHEDULER = (
+    str(os.getenv("NEXUS_PROCESSOR_SCHEDULER", "serial")).strip().lower() or "serial"
+)
 
 # --- LOGGING CONFIGURATION ---
 LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -1,5 +1,7 @@
 import os
+import re
 import subprocess
+import threading
 import urllib.parse
 from typing import Any, Callable
 
@@ -25,47 +27,163 @@ def repo_slug_from_remote_url(remote_url: str) -> str:
     return value
 
 
-def discover_workspace_repos(project_cfg: dict, base_dir: str) -> list[str]:
-    """Discover repository slugs from local git remotes in workspace."""
-    workspace = project_cfg.get("workspace") if isinstance(project_cfg, dict) else None
-    if not workspace:
-        return []
+_ORIGIN_SECTION_RE = re.compile(r'^\[\s*remote\s+"origin"\s*\]', re.IGNORECASE)
+_SECTION_RE = re.compile(r"^\[")
+_URL_RE = re.compile(r"^url\s*=\s*(?P<value>.*)$", re.IGNORECASE)
+_INCLUDE_RE = re.compile(r"^\[\s*include(if)?\b", re.IGNORECASE)
 
-    workspace_abs = workspace if os.path.isabs(workspace) else os.path.join(base_dir, workspace)
-    if not os.path.isdir(workspace_abs):
-        return []
 
-    candidates = [workspace_abs]
+def read_origin_url_from_git_config(config_path: str) -> str | None:
+    """Return ``remote.origin.url`` from a repository's ``.git/config``.
+
+    Returns ``""`` when the file defines no origin URL and ``None`` when it
+    cannot be answered without git itself (unreadable file or ``[include]``
+    sections).
+    """
     try:
-        for entry in os.scandir(workspace_abs):
-            if entry.is_dir(follow_symlinks=False):
-                candidates.append(entry.path)
+        with open(config_path, encoding="utf-8", errors="replace") as handle:
+            lines = handle.read().splitlines()
+    except OSError:
+        return None
+
+    in_origin = False
+    for raw_line in lines:
+        line = raw_line.strip()
+        if not line or line[0] in "#;":
+            continue
+        if _INCLUDE_RE.match(line):
+            return None
+        if _SECTION_RE.match(line):
+            in_origin = bool(_ORIGIN_SECTION_RE.match(line))
+            continue
+        if not in_origin:
+            continue
+        match = _URL_RE.match(line)
+        if match:
+            value = match.group("value").strip()
+            if len(value) >= 2 and value[0] == value[-1] == '"':
+                value = value[1:-1]
+            return value
+    return ""
+
+
+def _git_origin_url(repo_dir: str) -> str:
+    try:
+        result = subprocess.run(
+            ["git", "-C", repo_dir, "remote", "get-url", "origin"],
+            capture_output=True,
+            text=True,
+            timeout=5,
+            check=False,
+        )
     except Exception:
-        pass
+        return ""
+    if result.returncode != 0:
+        return ""
+    return result.stdout.strip()
 
-    repos: list[str] = []
-    for candidate in candidates:
-        if not os.path.isdir(os.path.join(candidate, ".git")):
-            continue
+
+class WorkspaceRepoCache:
+    """Remembers workspace repo slugs until the files they were read from change.
+
+    * the first-level directory listing of a workspace is reused until the
+      workspace directory's mtime changes (a repo was added or removed);
+    * each repo's slug is reused until its ``.git/config`` (or, without one,
+      its ``.git`` directory) changes size or mtime.
+
+    A lookup therefore costs a few ``stat()`` calls and no subprocesses.
+    """
+
+    def __init__(self) -> None:
+        self._listings: dict[str, tuple[int, list[str]]] = {}
+        self._slugs: dict[str, tuple[tuple[int, int], str]] = {}
+        self._lock = threading.Lock()
+        self.stats = {"listings": 0, "config_reads": 0, "git_calls": 0}
+
+    def discover(self, workspace_abs: str) -> list[str]:
+        repos: list[str] = []
+        for candidate in self._candidates(workspace_abs):
+            git_dir = os.path.join(candidate, ".git")
+            if not os.path.isdir(git_dir):
+                continue
+            slug = self._slug(candidate, git_dir)
+            if slug and slug not in repos:
+                repos.append(slug)
+        return repos
+
+    def clear(self) -> None:
+        with self._lock:
+            self._listings.clear()
+            self._slugs.clear()
+
+    def _candidates(self, workspace_abs: str) -> list[str]:
+        try:
+            mtime = os.stat(workspace_abs).st_mtime_ns
+        except OSError:
+            return []
+        with self._lock:
+            cached = self._listings.get(workspace_abs)
+            if cached is not None and cached[0] == mtime:
+                return cached[1]
+
+        candidates = [workspace_abs]
         try:
-            result = subprocess.run(
-                ["git", "-C", candidate, "remote", "get-url", "origin"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-                check=False,
-            )
+            for entry in os.scandir(workspace_abs):
+                if entry.is_dir(follow_symlinks=False):
+                    candidates.append(entry.path)
         except Exception:
-            continue
+            pass
+        with self._lock:
+            self._listings[workspace_abs] = (mtime, candidates)
+            self.stats["listings"] += 1
+        return candidates
+
+    def _slug(self, repo_dir: str, git_dir: str) -> str:
+        config_path = os.path.join(git_dir, "config")
+        try:
+            stat = os.stat(config_path)
+        except OSError:
+            try:
+                stat = os.stat(git_dir)
+            except OSError:
+                return ""
+            config_path = ""
+        signature = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            cached = self._slugs.get(repo_dir)
+            if cached is not None and cached[0] == signature:
+                return cached[1]
+
+        remote_url = read_origin_url_from_git_config(config_path) if config_path else None
+        with self._lock:
+            self.stats["config_reads" if remote_url is not None else "git_calls"] += 1
+        if remote_url is None:
+            remote_url = _git_origin_url(repo_dir)
+        slug = repo_slug_from_remote_url(remote_url)
+        with self._lock:
+            self._slugs[repo_dir] = (signature, slug)
+        return slug
+
+
+_workspace_repo_cache = WorkspaceRepoCache()
+
+
+def get_workspace_repo_cache() -> WorkspaceRepoCache:
+    """Return the process-wide workspace discovery cache."""
+    return _workspace_repo_cache
 
-        if result.returncode != 0:
-            continue
 
-        slug = repo_slug_from_remote_url(result.stdout.strip())
-        if slug and slug not in repos:
-            repos.append(slug)
+def discover_workspace_repos(project_cfg: dict, base_dir: str) -> list[str]:
+    """Discover repository slugs from local git remotes in workspace."""
+    workspace = project_cfg.get("workspace") if isinstance(project_cfg, dict) else None
+    if not workspace:
+        return []
 
-    return repos
+    workspace_abs = workspace if os.path.isabs(workspace) else os.path.join(base_dir, workspace)
+    if not os.path.isdir(workspace_abs):
+        return []
+
+    return _workspace_repo_cache.discover(os.path.abspath(workspace_abs))
 
 
 def get_repos(
@@ -182,6 +300,14 @@ def get_git_sync_settings(
     if isinstance(timeout, int):
         settings["decision_timeout_seconds"] = timeout
 
+    max_parallel = raw.get("max_parallel")
+    if isinstance(max_parallel, int):
+        settings["max_parallel"] = max_parallel
+
+    freshness = raw.get("freshness_seconds")
+    if isinstance(freshness, int):
+        settings["freshness_seconds"] = freshness
+
     return settings
 
 
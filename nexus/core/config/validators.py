@@ -274,6 +274,7 @@ def validate_project_config(config: dict[str, Any]) -> None:
                 "network_auth_retries",
                 "retry_backoff_seconds",
                 "decision_timeout_seconds",
+                "max_parallel",
             ):
                 value = git_sync.get(key)
                 if value is None:
@@ -282,6 +283,13 @@ def validate_project_config(config: dict[str, Any]) -> None:
                     raise ValueError(
                         f"PROJECT_CONFIG['{project}']['git_sync']['{key}'] must be a positive integer"
                     )
+            freshness_seconds = git_sync.get("freshness_seconds")
+            if freshness_seconds is not None and (
+                not isinstance(freshness_seconds, int) or freshness_seconds < 0
+            ):
+                raise ValueError(
+                    f"PROJECT_CONFIG['{project}']['git_sync']['freshness_seconds'] must be a non-negative integer"
+                )
 
         git_platform = str(proj_config.get("git_platform", "github")).lower().strip()
         if git_platform not in {"github", "gitlab"}:
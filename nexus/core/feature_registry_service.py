@@ -5,7 +5,9 @@ import json
 import logging
 import os
 import re
-from dataclasses import dataclass
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from difflib import SequenceMatcher
 from typing import Any
@@ -80,7 +82,7 @@ class FeatureRegistryRecord:
         }
 
     @staticmethod
-    def from_dict(payload: dict[str, Any]) -> "FeatureRegistryRecord":
+    def from_dict(payload: dict[str, Any]) -> FeatureRegistryRecord:
         aliases = payload.get("aliases")
         if not isinstance(aliases, list):
             aliases = []
@@ -100,6 +102,126 @@ class FeatureRegistryRecord:
         )
 
 
+@dataclass
+class _IndexedTitle:
+    length: int
+    chars: Counter[str]
+    bigrams: frozenset[str]
+
+
+def _title_bigrams(value: str) -> frozenset[str]:
+    padded = f" {value} "
+    return frozenset(padded[idx : idx + 2] for idx in range(len(padded) - 1))
+
+
+@dataclass
+class _FeatureTitleIndex:
+    """Candidate index over a project's normalized canonical titles and aliases.
+
+    Decisions are identical to comparing against every title with
+    ``SequenceMatcher.ratio()``: candidates are pruned only with provable upper
+    bounds on that ratio (length and character-multiset overlap, the same bounds
+    as ``real_quick_ratio``/``quick_ratio``), and bigram overlap merely orders the
+    survivors so the likeliest duplicate is verified first.
+    """
+
+    signature: Any = None
+    records: dict[str, tuple[str, ...]] = field(default_factory=dict)
+    refcounts: Counter[str] = field(default_factory=Counter)
+    entries: dict[str, _IndexedTitle] = field(default_factory=dict)
+    by_length: dict[int, set[str]] = field(default_factory=dict)
+    postings: dict[str, set[str]] = field(default_factory=dict)
+    ratio_checks: int = 0
+
+    @classmethod
+    def build(cls, records: list[FeatureRegistryRecord], signature: Any) -> _FeatureTitleIndex:
+        index = cls(signature=signature)
+        for position, record in enumerate(records):
+            key = record.canonical_title_hash
+            # Legacy files may hold the same hash twice; keep both title sets.
+            index.add_record(record, key=f"{key}#{position}" if key in index.records else key)
+        return index
+
+    def add_record(self, record: FeatureRegistryRecord, *, key: str | None = None) -> None:
+        key = key or record.canonical_title_hash
+        self.remove_record(key)
+        titles: list[str] = []
+        for value in [record.canonical_title, *record.aliases]:
+            normalized = normalize_feature_title(value)
+            if normalized and normalized not in titles:
+                titles.append(normalized)
+        self.records[key] = tuple(titles)
+        for normalized in titles:
+            self.refcounts[normalized] += 1
+            if normalized not in self.entries:
+                self._add_entry(normalized)
+
+    def remove_record(self, title_hash: str) -> None:
+        for normalized in self.records.pop(title_hash, ()):
+            self.refcounts[normalized] -= 1
+            if self.refcounts[normalized] <= 0:
+                del self.refcounts[normalized]
+                self._remove_entry(normalized)
+
+    def _add_entry(self, normalized: str) -> None:
+        indexed = _IndexedTitle(
+            length=len(normalized),
+            chars=Counter(normalized),
+            bigrams=_title_bigrams(normalized),
+        )
+        self.entries[normalized] = indexed
+        self.by_length.setdefault(indexed.length, set()).add(normalized)
+        for gram in indexed.bigrams:
+            self.postings.setdefault(gram, set()).add(normalized)
+
+    def _remove_entry(self, normalized: str) -> None:
+        indexed = self.entries.pop(normalized, None)
+        if indexed is None:
+            return
+        bucket = self.by_length.get(indexed.length)
+        if bucket is not None:
+            bucket.discard(normalized)
+            if not bucket:
+                del self.by_length[indexed.length]
+        for gram in indexed.bigrams:
+            posting = self.postings.get(gram)
+            if posting is not None:
+                posting.discard(normalized)
+                if not posting:
+                    del self.postings[gram]
+
+    def is_duplicate(self, normalized_title: str, threshold: float) -> bool:
+        if not self.entries:
+            return False
+        if normalized_title in self.entries or threshold <= 0.0:
+            return True
+
+        title_length = len(normalized_title)
+        candidates: list[str] = []
+        for length, titles in self.by_length.items():
+            # Upper bound when every character of the shorter string matches.
+            if 2.0 * min(title_length, length) / (title_length + length) >= threshold:
+                candidates.extend(titles)
+        if not candidates:
+            return False
+
+        shared: Counter[str] = Counter()
+        for gram in _title_bigrams(normalized_title):
+            shared.update(self.postings.get(gram, ()))
+        candidates.sort(key=lambda existing: (-shared[existing], existing))
+
+        title_chars = Counter(normalized_title)
+        for existing in candidates:
+            indexed = self.entries[existing]
+            overlap = sum((title_chars & indexed.chars).values())
+            if 2.0 * overlap / (title_length + indexed.length) < threshold:
+                continue
+            self.ratio_checks += 1
+            if SequenceMatcher(None, normalized_title, existing).ratio() >= threshold:
+                return True
+        return False
+
+
 class _FilesystemFeatureRegistryStore:
     def __init__(self, path: str) -> None:
         self._path = path
@@ -190,6 +312,13 @@ class _FilesystemFeatureRegistryStore:
         self._save(data)
         return removed
 
+    def signature(self, project_key: str) -> Any:
+        try:
+            stat = os.stat(self._path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
     def _load(self) -> dict[str, Any]:
         if not os.path.exists(self._path):
             return {"version": 1, "projects": {}}
@@ -349,6 +478,16 @@ class _PostgresFeatureRegistryStore:
                     return record
         return None
 
+    def signature(self, project_key: str) -> Any:
+        with Session(self._engine) as session:
+            count, latest = session.execute(
+                sa.select(
+                    sa.func.count(_FeatureRegistryRow.id),
+                    sa.func.max(_FeatureRegistryRow.updated_at),
+                ).where(_FeatureRegistryRow.project_key == project_key)
+            ).one()
+        return (int(count or 0), latest.isoformat() if latest else "")
+
     @staticmethod
     def _safe_aliases(raw: str) -> list[str]:
         try:
@@ -413,6 +552,8 @@ class FeatureRegistryService:
         self.backend = str(backend or "filesystem").strip().lower()
         self.max_items_per_project = max(10, int(max_items_per_project))
         self.dedup_similarity = min(1.0, max(0.0, float(dedup_similarity)))
+        self._title_indexes: dict[str, _FeatureTitleIndex] = {}
+        self._title_index_lock = threading.Lock()
 
         fs_store = _FilesystemFeatureRegistryStore(
             os.path.join(str(state_dir), "feature_registry.json")
@@ -491,7 +632,20 @@ class FeatureRegistryService:
             canonical_title_hash=dedup_hash,
             manual_override=bool(manual_override),
         )
+        before = self._store_signature(normalized_project)
         saved = self._store.upsert_record(record, self.max_items_per_project)
+        with self._title_index_lock:
+            index = self._title_indexes.get(normalized_project)
+            if index is not None:
+                if index.signature != before or before is None:
+                    self._title_indexes.pop(normalized_project, None)
+                else:
+                    index.add_record(saved)
+                    if len(index.records) > self.max_items_per_project:
+                        # The store trimmed older rows; rebuild on next use.
+                        self._title_indexes.pop(normalized_project, None)
+                    else:
+                        index.signature = self._store_signature(normalized_project)
         return saved.to_dict()
 
     def forget_feature(self, *, project_key: str, feature_ref: str) -> dict[str, Any] | None:
@@ -501,7 +655,23 @@ class FeatureRegistryService:
         ref = str(feature_ref or "").strip()
         if not normalized_project or not ref:
             return None
+        before = self._store_signature(normalized_project)
         removed = self._store.delete_record(normalized_project, ref)
+        if removed is not None:
+            with self._title_index_lock:
+                index = self._title_indexes.get(normalized_project)
+                title_hash = removed.canonical_title_hash
+                if index is not None:
+                    if (
+                        index.signature != before
+                        or before is None
+                        or title_hash not in index.records
+                        or any(key.startswith(f"{title_hash}#") for key in index.records)
+                    ):
+                        self._title_indexes.pop(normalized_project, None)
+                    else:
+                        index.remove_record(title_hash)
+                        index.signature = self._store_signature(normalized_project)
         return removed.to_dict() if removed else None
 
     def list_excluded_titles(self, project_key: str) -> list[str]:
@@ -526,18 +696,7 @@ class FeatureRegistryService:
         )
         threshold = min(1.0, max(0.0, threshold))
 
-        existing_records = self.list_features(project_key)
-        normalized_existing: list[str] = []
-        for record in existing_records:
-            canonical = normalize_feature_title(str(record.get("canonical_title") or ""))
-            if canonical:
-                normalized_existing.append(canonical)
-            aliases = record.get("aliases")
-            if isinstance(aliases, list):
-                for alias in aliases:
-                    normalized_alias = normalize_feature_title(str(alias or ""))
-                    if normalized_alias:
-                        normalized_existing.append(normalized_alias)
+        index = self._title_index(project_key)
 
         kept: list[dict[str, Any]] = []
         removed: list[dict[str, Any]] = []
@@ -549,23 +708,39 @@ class FeatureRegistryService:
                 removed.append(item)
                 continue
 
-            duplicate = False
-            for existing in normalized_existing:
-                if normalized_title == existing:
-                    duplicate = True
-                    break
-                ratio = SequenceMatcher(None, normalized_title, existing).ratio()
-                if ratio >= threshold:
-                    duplicate = True
-                    break
-
-            if duplicate:
+            if index is not None and index.is_duplicate(normalized_title, threshold):
                 removed.append(item)
             else:
                 kept.append(item)
 
         return kept, removed
 
+    def _store_signature(self, project_key: str) -> Any:
+        signature_fn = getattr(self._store, "signature", None)
+        if not callable(signature_fn):
+            return None
+        try:
+            return signature_fn(project_key)
+        except Exception as exc:
+            logger.debug("Feature registry signature unavailable for %s: %s", project_key, exc)
+            return None
+
+    def _title_index(self, project_key: str) -> _FeatureTitleIndex | None:
+        key = str(project_key or "").strip().lower()
+        if not key:
+            return None
+        signature = self._store_signature(key)
+        with self._title_index_lock:
+            index = self._title_indexes.get(key)
+            if index is not None and signature is not None and index.signature == signature:
+                return index
+            index = _FeatureTitleIndex.build(self._store.list_records(key), signature)
+            if signature is not None:
+                self._title_indexes[key] = index
+            else:
+                self._title_indexes.pop(key, None)
+            return index
+
     def ingest_completion(
         self,
         *,
@@ -1,13 +1,31 @@
-"""Workflow-start git sync helpers (worktree-safe fetch)."""
+"""Workflow-start git sync helpers (worktree-safe fetch).
+
+Clones and fetches run through a process-wide :class:`RepoSyncManager`:
+
+* the repos of one workflow start are synced on at most ``git_sync.max_parallel``
+  worker threads, so retries and their backoff sleeps stay off the caller's thread;
+* a clone or fetch already in flight for the same checkout (and branch) — e.g.
+  requested by another issue starting at the same time — is joined, not repeated;
+* a branch fetched successfully within ``git_sync.freshness_seconds`` is not
+  fetched again.
+"""
 
 from __future__ import annotations
 
 import os
 import subprocess
+import threading
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Hashable
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
 from typing import Any
 
+GitCommandResult = tuple[bool, str, bool]
+
+_DEFAULT_MAX_PARALLEL = 4
+_DEFAULT_FRESHNESS_SECONDS = 30
+
 
 def _is_network_or_auth_failure(stderr: str, stdout: str = "") -> bool:
     text = f"{stderr or ''}\n{stdout or ''}".lower()
@@ -109,7 +127,7 @@ def _run_git_command_with_retries(
     logger: Any | None,
     log_context: str,
     sleep_fn: Callable[[float], None],
-) -> tuple[bool, str, bool]:
+) -> GitCommandResult:
     max_attempts = max(1, retries + 1)
     for attempt in range(1, max_attempts + 1):
         result = subprocess.run(
@@ -144,6 +162,125 @@ def _run_git_command_with_retries(
     return False, "git command failed with unknown error", False
 
 
+class RepoSyncManager:
+    """Runs workflow-start git operations in parallel, shared across concurrent starts.
+
+    Args:
+        clock: Monotonic clock used for the freshness window (injectable for tests).
+    """
+
+    def __init__(self, *, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._inflight: dict[Hashable, Future[GitCommandResult]] = {}
+        self._completed_at: dict[Hashable, float] = {}
+        self._dir_locks: dict[str, threading.Lock] = {}
+        self.stats = {"started": 0, "joined": 0, "fresh": 0}
+
+    @staticmethod
+    def fetch_key(repo_dir: str, branch: str) -> Hashable:
+        return ("fetch", os.path.realpath(repo_dir), branch)
+
+    @staticmethod
+    def clone_key(repo_dir: str) -> Hashable:
+        return ("clone", os.path.realpath(repo_dir))
+
+    def is_fresh(self, key: Hashable, freshness_seconds: float) -> bool:
+        """Whether *key* last completed successfully less than *freshness_seconds* ago."""
+        if freshness_seconds <= 0:
+            return False
+        with self._lock:
+            completed_at = self._completed_at.get(key)
+            fresh = completed_at is not None and self._clock() - completed_at < freshness_seconds
+            if fresh:
+                self.stats["fresh"] += 1
+        return fresh
+
+    def run_all(
+        self,
+        operations: list[tuple[Hashable, str, Callable[[], GitCommandResult]]],
+        *,
+        max_parallel: int,
+    ) -> list[GitCommandResult]:
+        """Run ``(key, repo_dir, operation)`` entries and return results in input order.
+
+        Operations on the same checkout directory are serialized so two git
+        processes never write to one repository at the same time.
+        """
+        if not operations:
+            return []
+        workers = max(1, min(int(max_parallel), len(operations)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="nexus-git-sync") as pool:
+            futures = [
+                self._submit(pool, key, repo_dir, operation)
+                for key, repo_dir, operation in operations
+            ]
+            return [future.result() for future in futures]
+
+    def clear(self) -> None:
+        """Forget freshness timestamps (in-flight operations are unaffected)."""
+        with self._lock:
+            self._completed_at.clear()
+
+    def _submit(
+        self,
+        pool: ThreadPoolExecutor,
+        key: Hashable,
+        repo_dir: str,
+        operation: Callable[[], GitCommandResult],
+    ) -> Future[GitCommandResult]:
+        with self._lock:
+            existing = self._inflight.get(key)
+            if existing is not None:
+                self.stats["joined"] += 1
+                return existing
+            dir_lock = self._dir_locks.setdefault(os.path.realpath(repo_dir), threading.Lock())
+            future = pool.submit(self._run, key, dir_lock, operation)
+            self._inflight[key] = future
+            self.stats["started"] += 1
+            return future
+
+    def _run(
+        self,
+        key: Hashable,
+        dir_lock: threading.Lock,
+        operation: Callable[[], GitCommandResult],
+    ) -> GitCommandResult:
+        result: GitCommandResult = (False, "git command did not run", False)
+        try:
+            with dir_lock:
+                result = operation()
+        except Exception as exc:
+            message = str(exc) or exc.__class__.__name__
+            result = (False, message, _is_network_or_auth_failure(message))
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+                if result[0]:
+                    self._completed_at[key] = self._clock()
+        return result
+
+
+_manager: RepoSyncManager | None = None
+_manager_lock = threading.Lock()
+
+
+def get_repo_sync_manager() -> RepoSyncManager:
+    """Return the manager shared by every workflow start in this process."""
+    global _manager
+    with _manager_lock:
+        if _manager is None:
+            _manager = RepoSyncManager()
+        return _manager
+
+
+def reset_repo_sync_manager() -> None:
+    """Drop the process-wide manager (for tests)."""
+    global _manager
+    with _manager_lock:
+        _manager = None
+
+
 def _alert_and_wait_for_decision(
     *,
     issue_number: str,
@@ -204,6 +341,7 @@ def sync_project_repos_on_workflow_start(
     logger: Any | None = None,
     should_block_launch: Callable[[str, str], bool] | None = None,
     sleep_fn: Callable[[float], None] = time.sleep,
+    sync_manager: RepoSyncManager | None = None,
 ) -> dict[str, Any]:
     """Sync configured project repos with worktree-safe fetch before initial launch."""
     cfg = project_cfg if isinstance(project_cfg, dict) else {}
@@ -218,6 +356,9 @@ def sync_project_repos_on_workflow_start(
     decision_timeout_seconds = int(git_sync.get("decision_timeout_seconds", 120) or 120)
     bootstrap_missing_workspace = bool(git_sync.get("bootstrap_missing_workspace", False))
     bootstrap_missing_repos = bool(git_sync.get("bootstrap_missing_repos", False))
+    max_parallel = int(git_sync.get("max_parallel", _DEFAULT_MAX_PARALLEL) or 1)
+    freshness_seconds = int(git_sync.get("freshness_seconds", _DEFAULT_FRESHNESS_SECONDS) or 0)
+    manager = sync_manager or get_repo_sync_manager()
 
     if bootstrap_missing_workspace and callable(ensure_workspace_dir):
         try:
@@ -268,8 +409,9 @@ def sync_project_repos_on_workflow_start(
     blocked = False
 
     if bootstrap_missing_repos and callable(resolve_git_dir_for_repo):
+        clones: list[tuple[str, str, str, str]] = []
         for repo_slug in configured_repos:
-            if blocked or repo_slug in resolved_dirs:
+            if repo_slug in resolved_dirs:
                 continue
             try:
                 repo_dir = resolve_git_dir_for_repo(project_name, repo_slug)
@@ -287,6 +429,7 @@ def sync_project_repos_on_workflow_start(
             repo_dir = str(repo_dir).strip()
             if not repo_dir:
                 continue
+            branch = str(get_repo_branch(project_name, repo_slug) or "main").strip() or "main"
             parent = os.path.dirname(repo_dir.rstrip(os.sep))
             if parent:
                 try:
@@ -295,26 +438,46 @@ def sync_project_repos_on_workflow_start(
                     failures.append(
                         {
                             "repo": repo_slug,
-                            "branch": str(get_repo_branch(project_name, repo_slug) or "main").strip()
-                            or "main",
+                            "branch": branch,
                             "dir": repo_dir,
                             "error": f"could not prepare parent directory: {exc}",
                             "kind": "other",
                         }
                     )
                     continue
-
-            branch = str(get_repo_branch(project_name, repo_slug) or "main").strip() or "main"
-            clone_url = _build_clone_url(repo_slug, cfg)
-            success, error_msg, network_or_auth = _run_git_command_with_retries(
-                cmd=["git", "clone", "--branch", branch, "--single-branch", clone_url, repo_dir],
-                cwd=None,
-                retries=retries,
-                backoff_seconds=backoff_seconds,
-                logger=logger,
-                log_context=f"{repo_slug} bootstrap clone on {branch}",
-                sleep_fn=sleep_fn,
-            )
+            clones.append((repo_slug, branch, repo_dir, _build_clone_url(repo_slug, cfg)))
+
+        clone_results = manager.run_all(
+            [
+                (
+                    RepoSyncManager.clone_key(repo_dir),
+                    repo_dir,
+                    partial(
+                        _run_git_command_with_retries,
+                        cmd=[
+                            "git",
+                            "clone",
+                            "--branch",
+                            branch,
+                            "--single-branch",
+                            clone_url,
+                            repo_dir,
+                        ],
+                        cwd=None,
+                        retries=retries,
+                        backoff_seconds=backoff_seconds,
+                        logger=logger,
+                        log_context=f"{repo_slug} bootstrap clone on {branch}",
+                        sleep_fn=sleep_fn,
+                    ),
+                )
+                for repo_slug, branch, repo_dir, clone_url in clones
+            ],
+            max_parallel=max_parallel,
+        )
+        for (repo_slug, branch, repo_dir, clone_url), (success, error_msg, network_or_auth) in zip(
+            clones, clone_results, strict=True
+        ):
             if success:
                 resolved_dirs[repo_slug] = repo_dir
                 bootstrapped.append(
@@ -348,6 +511,8 @@ def sync_project_repos_on_workflow_start(
                     branch,
                     error_msg,
                 )
+            if blocked:
+                continue
             blocked = _alert_and_wait_for_decision(
                 issue_number=str(issue_number),
                 project_name=str(project_name),
@@ -372,25 +537,48 @@ def sync_project_repos_on_workflow_start(
             "failures": failures,
         }
 
-    for repo_slug, repo_dir in resolved_dirs.items():
-        if blocked:
-            break
-        branch = str(get_repo_branch(project_name, repo_slug) or "main").strip() or "main"
-        success, error_msg, network_or_auth = _run_git_command_with_retries(
-            cmd=[
-                "git",
-                "fetch",
-                "--prune",
-                "origin",
-                f"{branch}:refs/remotes/origin/{branch}",
-            ],
-            cwd=repo_dir,
-            retries=retries,
-            backoff_seconds=backoff_seconds,
-            logger=logger,
-            log_context=f"{repo_slug} fetch on {branch}",
-            sleep_fn=sleep_fn,
-        )
+    fetches: list[tuple[str, str, str]] = []
+    fresh: list[str] = []
+    if not blocked:
+        for repo_slug, repo_dir in resolved_dirs.items():
+            branch = str(get_repo_branch(project_name, repo_slug) or "main").strip() or "main"
+            if manager.is_fresh(RepoSyncManager.fetch_key(repo_dir, branch), freshness_seconds):
+                fresh.append(repo_slug)
+            fetches.append((repo_slug, branch, repo_dir))
+
+    fetch_results = manager.run_all(
+        [
+            (
+                RepoSyncManager.fetch_key(repo_dir, branch),
+                repo_dir,
+                partial(
+                    _run_git_command_with_retries,
+                    cmd=[
+                        "git",
+                        "fetch",
+                        "--prune",
+                        "origin",
+                        f"{branch}:refs/remotes/origin/{branch}",
+                    ],
+                    cwd=repo_dir,
+                    retries=retries,
+                    backoff_seconds=backoff_seconds,
+                    logger=logger,
+                    log_context=f"{repo_slug} fetch on {branch}",
+                    sleep_fn=sleep_fn,
+                ),
+            )
+            for repo_slug, branch, repo_dir in fetches
+            if repo_slug not in fresh
+        ],
+        max_parallel=max_parallel,
+    )
+    outcomes = iter(fetch_results)
+    for repo_slug, branch, repo_dir in fetches:
+        if repo_slug in fresh:
+            success, error_msg, network_or_auth = True, "", False
+        else:
+            success, error_msg, network_or_auth = next(outcomes)
         if success:
             synced.append({"repo": repo_slug, "branch": branch, "dir": repo_dir})
             continue
@@ -421,6 +609,8 @@ def sync_project_repos_on_workflow_start(
                 branch,
                 error_msg,
             )
+        if blocked:
+            continue
         blocked = _alert_and_wait_for_decision(
             issue_number=str(issue_number),
             project_name=str(project_name),
@@ -439,6 +629,7 @@ def sync_project_repos_on_workflow_start(
         "skipped": False,
         "blocked": blocked,
         "synced": synced,
+        "fresh": fresh,
         "bootstrapped": bootstrapped,
         "failures": failures,
     }
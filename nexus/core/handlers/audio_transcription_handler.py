@@ -49,6 +49,17 @@ def _resolve_audio_suffix(*, content_type: str | None, filename: str | None) ->
     return ".ogg"
 
 
+def transcribe_audio_file(audio_path: str, deps: AudioTranscriptionDeps) -> str | None:
+    deps.logger.info("🎧 Transcribing audio with orchestrator...")
+    text = deps.transcribe_audio(audio_path)
+    if text:
+        cleaned = str(text).strip()
+        deps.logger.info("✅ Transcription successful (%s chars)", len(cleaned))
+        return cleaned
+    deps.logger.error("❌ Transcription failed")
+    return None
+
+
 def transcribe_audio_bytes(
     *,
     audio_bytes: bytes,
@@ -61,14 +72,7 @@ def transcribe_audio_bytes(
             temp_path = tmp_file.name
             tmp_file.write(audio_bytes)
 
-        deps.logger.info("🎧 Transcribing audio with orchestrator...")
-        text = deps.transcribe_audio(temp_path)
-        if text:
-            cleaned = str(text).strip()
-            deps.logger.info("✅ Transcription successful (%s chars)", len(cleaned))
-            return cleaned
-        deps.logger.error("❌ Transcription failed")
-        return None
+        return transcribe_audio_file(temp_path, deps)
     finally:
         if temp_path and os.path.exists(temp_path):
             try:
@@ -116,12 +120,8 @@ async def transcribe_telegram_voice(
             temp_path = tmp_file.name
         new_file = await context.bot.get_file(voice_file_id)
         await new_file.download_to_drive(temp_path)
-        with open(temp_path, "rb") as handle:
-            return transcribe_audio_bytes(
-                audio_bytes=handle.read(),
-                suffix=".ogg",
-                deps=deps,
-            )
+        # Hand the downloaded file straight to the transcriber; no re-read or second copy.
+        return transcribe_audio_file(temp_path, deps)
     finally:
         if temp_path and os.path.exists(temp_path):
             try:
@@ -8,23 +8,51 @@ where *event_id* is a caller-supplied identifier — typically a GitHub comment
 ID or a hash of the completion file path/contents.  This prevents reprocessing
 of stale or duplicate signals when ``complete_step_for_issue`` runs, before it
 calls the underlying engine to complete the step.
+
+Entries expire after a configurable TTL and the ledger never holds more than
+``max_entries`` digests.  Recording is O(1):
+
+* Filesystem mode appends one line per key to a journal file next to the
+  legacy ``*.json`` ledger (``-``-prefixed lines are tombstones written by
+  :meth:`IdempotencyLedger.discard`) and compacts it only when dead lines
+  dominate.
+* Database mode stores one row per key and uses ``INSERT ... ON CONFLICT``
+  (a no-op for live keys) so concurrent processes agree on which caller
+  recorded first.
 """
 
+import contextlib
 import hashlib
 import json
 import logging
 import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterator
 from dataclasses import dataclass
+from typing import Any
 
 from nexus.core.inbox.inbox_persistence_service import (
-    load_json_state_file as _load_json_state_file,
-)
-from nexus.core.inbox.inbox_persistence_service import (
-    save_json_state_file as _save_json_state_file,
+    _get_host_state_backend,
+    _run_coro_sync,
 )
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX hosts
+    fcntl = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
+_DEFAULT_TTL_SECONDS = max(0, int(os.getenv("NEXUS_IDEMPOTENCY_TTL_SECONDS", str(30 * 24 * 3600))))
+_DEFAULT_MAX_ENTRIES = max(1, int(os.getenv("NEXUS_IDEMPOTENCY_MAX_ENTRIES", "100000")))
+# Journal lines beyond this multiple of live entries trigger a compaction rewrite.
+_COMPACTION_RATIO = 2
+_COMPACTION_MIN_LINES = 1024
+# Database mode prunes expired/over-cap rows once every N recorded keys.
+_DB_PRUNE_EVERY = 256
+
 
 @dataclass(frozen=True)
 class IdempotencyKey:
@@ -42,7 +70,7 @@ class IdempotencyKey:
 
 
 class IdempotencyLedger:
-    """Backend-aware ledger for deduplicating workflow step completion events.
+    """Backend-aware, bounded ledger for deduplicating step completion events.
 
     Usage::
 
@@ -54,6 +82,19 @@ class IdempotencyLedger:
             return
         # ... process event ...
         ledger.record(key)
+
+    Callers that need an atomic check-and-record across processes should use
+    :meth:`check_and_record`, which returns ``False`` for duplicates, and
+    :meth:`discard` the key again if processing fails.
+
+    Args:
+        ledger_path: Legacy JSON ledger path.  The append-only journal lives
+            next to it with a ``.journal`` suffix.
+        storage_backend: Optional explicit backend override
+            (``filesystem``/``postgres``).
+        state_key: Host-state key of the legacy database blob.
+        ttl_seconds: Entry lifetime; ``0`` disables time-based expiry.
+        max_entries: Hard cap on retained entries (oldest evicted first).
     """
 
     def __init__(
@@ -62,11 +103,27 @@ class IdempotencyLedger:
         *,
         storage_backend: str | None = None,
         state_key: str | None = None,
+        ttl_seconds: int | None = None,
+        max_entries: int | None = None,
     ) -> None:
         self._path = ledger_path
+        self._journal_path = f"{os.path.splitext(self._path)[0]}.journal"
         self._storage_backend = storage_backend
         self._state_key = state_key or os.path.splitext(os.path.basename(self._path).lstrip("."))[0]
-        self._seen: set[str] = set()
+        self._ttl_seconds = max(
+            0, int(_DEFAULT_TTL_SECONDS if ttl_seconds is None else ttl_seconds)
+        )
+        self._max_entries = max(
+            1, int(_DEFAULT_MAX_ENTRIES if max_entries is None else max_entries)
+        )
+        self._lock = threading.RLock()
+        # digest -> recorded_at (epoch seconds), kept in recording order.
+        self._seen: OrderedDict[str, float] = OrderedDict()
+        self._journal_lines = 0
+        self._journal_offset = 0
+        self._journal_inode: int | None = None
+        self._db_backend: Any = None
+        self._db_records_since_prune = 0
         self._load()
 
     # ------------------------------------------------------------------
@@ -74,18 +131,78 @@ class IdempotencyLedger:
     # ------------------------------------------------------------------
 
     def is_duplicate(self, key: IdempotencyKey) -> bool:
-        """Return ``True`` if *key* has already been recorded."""
-        return key.as_string() in self._seen
+        """Return ``True`` if *key* has already been recorded and not expired."""
+        digest = key.as_string()
+        with self._lock:
+            now = time.time()
+            self._evict(now)
+            if digest in self._seen:
+                return True
+            if self._db_backend is not None:
+                return self._db_has(digest)
+            # Another process may have appended since our last read.
+            self._refresh_from_journal()
+            self._evict(now)
+            return digest in self._seen
 
     def record(self, key: IdempotencyKey) -> None:
-        """Mark *key* as processed and persist the ledger."""
+        """Mark *key* as processed and persist it."""
+        self.check_and_record(key)
+
+    def check_and_record(self, key: IdempotencyKey) -> bool:
+        """Record *key* unless already present.
+
+        Returns:
+            ``True`` when this call recorded the key, ``False`` for duplicates.
+        """
+        digest = key.as_string()
+        with self._lock:
+            now = time.time()
+            self._evict(now)
+            if self._db_backend is not None:
+                inserted = self._db_record(digest)
+                self._remember(digest, now)
+                return inserted
+            return self._journal_record(digest, now)
+
+    def discard(self, key: IdempotencyKey) -> None:
+        """Forget *key* so a later delivery of the same event is processed again."""
         digest = key.as_string()
-        if digest not in self._seen:
-            self._seen.add(digest)
-            self._save()
+        with self._lock:
+            self._seen.pop(digest, None)
+            if self._db_backend is not None:
+                self._db_discard(digest)
+            else:
+                self._journal_discard(digest)
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._evict(time.time())
+            return len(self._seen)
 
     # ------------------------------------------------------------------
-    # Persistence helpers
+    # In-memory index
+    # ------------------------------------------------------------------
+
+    def _remember(self, digest: str, recorded_at: float) -> None:
+        self._seen[digest] = recorded_at
+        self._seen.move_to_end(digest)
+        while len(self._seen) > self._max_entries:
+            self._seen.popitem(last=False)
+
+    def _evict(self, now: float) -> None:
+        """Drop expired entries from the front of the recording-ordered map."""
+        if self._ttl_seconds <= 0:
+            return
+        cutoff = now - self._ttl_seconds
+        while self._seen:
+            oldest_digest, recorded_at = next(iter(self._seen.items()))
+            if recorded_at > cutoff:
+                break
+            self._seen.pop(oldest_digest, None)
+
+    # ------------------------------------------------------------------
+    # Filesystem journal
     # ------------------------------------------------------------------
 
     def _is_database_backend(self) -> bool:
@@ -114,63 +231,250 @@ class IdempotencyLedger:
             logger.warning("IdempotencyLedger: failed to load %s: %s", self._path, exc)
         return set()
 
-    def _load(self) -> None:
-        if not self._is_database_backend():
-            self._seen = self._load_legacy_file_seen()
+    def _refresh_from_journal(self) -> None:
+        """Apply journal lines appended since the last read (or reload after compaction)."""
+        try:
+            stat = os.stat(self._journal_path)
+        except FileNotFoundError:
+            return
+        except OSError as exc:
+            logger.warning("IdempotencyLedger: failed to stat %s: %s", self._journal_path, exc)
+            return
+
+        if self._journal_inode is not None and stat.st_ino != self._journal_inode:
+            # Compacted by another process: the rewritten file is authoritative.
+            self._seen.clear()
+            self._journal_lines = 0
+            self._journal_offset = 0
+        elif stat.st_size < self._journal_offset:
+            self._journal_offset = 0
+        if stat.st_size == self._journal_offset and stat.st_ino == self._journal_inode:
+            return
+
+        try:
+            with open(self._journal_path, "rb") as fh:
+                fh.seek(self._journal_offset)
+                chunk = fh.read()
+        except OSError as exc:
+            logger.warning("IdempotencyLedger: failed to read %s: %s", self._journal_path, exc)
             return
 
-        payload = _load_json_state_file(
-            path=self._path,
-            logger=logger,
-            warn_only=True,
-            storage_backend=self._storage_backend,
-            state_key=self._state_key,
-            migrate_local_on_empty=False,
+        # Only consume complete lines; a concurrent writer may be mid-append.
+        complete_len = chunk.rfind(b"\n") + 1
+        for raw_line in chunk[:complete_len].splitlines():
+            parts = raw_line.decode("utf-8", errors="replace").split()
+            if not parts:
+                continue
+            try:
+                recorded_at = float(parts[1]) if len(parts) > 1 else time.time()
+            except ValueError:
+                recorded_at = time.time()
+            self._journal_lines += 1
+            if parts[0].startswith("-"):
+                self._seen.pop(parts[0][1:], None)
+            else:
+                self._remember(parts[0], recorded_at)
+        self._journal_offset += complete_len
+        self._journal_inode = stat.st_ino
+
+    @contextlib.contextmanager
+    def _journal_lock(self) -> Iterator[None]:
+        """Hold the cross-process lock guarding journal appends and compaction.
+
+        The lock lives on a separate ``<journal>.lock`` file: compaction
+        replaces the journal itself, so a lock taken on the journal's own fd
+        could end up on an orphaned inode.
+        """
+        parent = os.path.dirname(self._journal_path)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
+        with open(f"{self._journal_path}.lock", "ab") as lock_fh:
+            if fcntl is not None:
+                fcntl.flock(lock_fh.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_fh.fileno(), fcntl.LOCK_UN)
+
+    def _journal_record(self, digest: str, now: float) -> bool:
+        try:
+            with self._journal_lock():
+                self._refresh_from_journal()
+                self._evict(now)
+                if digest in self._seen:
+                    return False
+                with open(self._journal_path, "ab") as fh:
+                    fh.write(f"{digest} {now:.3f}\n".encode())
+                    fh.flush()
+                    os.fsync(fh.fileno())
+                    self._journal_offset = fh.tell()
+                    self._journal_inode = os.fstat(fh.fileno()).st_ino
+                self._remember(digest, now)
+                self._journal_lines += 1
+                if self._needs_compaction():
+                    self._compact_journal()
+        except Exception as exc:
+            logger.warning("IdempotencyLedger: failed to append %s: %s", self._journal_path, exc)
+            if digest in self._seen:
+                return False
+            self._remember(digest, now)
+        return True
+
+    def _journal_discard(self, digest: str) -> None:
+        try:
+            with self._journal_lock():
+                self._refresh_from_journal()
+                self._seen.pop(digest, None)
+                with open(self._journal_path, "ab") as fh:
+                    fh.write(f"-{digest} {time.time():.3f}\n".encode())
+                    fh.flush()
+                    os.fsync(fh.fileno())
+                    self._journal_offset = fh.tell()
+                    self._journal_inode = os.fstat(fh.fileno()).st_ino
+                self._journal_lines += 1
+        except Exception as exc:
+            logger.warning("IdempotencyLedger: failed to append %s: %s", self._journal_path, exc)
+
+    def _needs_compaction(self) -> bool:
+        return self._journal_lines >= max(
+            _COMPACTION_MIN_LINES, _COMPACTION_RATIO * len(self._seen)
         )
-        seen_values = payload.get("seen", []) if isinstance(payload, dict) else []
-        if isinstance(seen_values, list):
-            self._seen = {str(item) for item in seen_values if str(item).strip()}
-            if self._seen:
-                return
 
-        legacy_seen = self._load_legacy_file_seen()
-        if legacy_seen:
-            self._seen = legacy_seen
-            _save_json_state_file(
-                path=self._path,
-                data={"seen": sorted(self._seen)},
-                logger=logger,
-                warn_only=True,
-                storage_backend=self._storage_backend,
-                state_key=self._state_key,
-            )
+    def _compact_journal(self) -> None:
+        """Rewrite the journal with live entries only (caller holds the file lock)."""
+        tmp_path = f"{self._journal_path}.tmp"
+        with open(tmp_path, "wb") as fh:
+            for digest, recorded_at in self._seen.items():
+                fh.write(f"{digest} {recorded_at:.3f}\n".encode())
+            fh.flush()
+            os.fsync(fh.fileno())
+            size = fh.tell()
+        os.replace(tmp_path, self._journal_path)
+        stat = os.stat(self._journal_path)
+        self._journal_lines = len(self._seen)
+        self._journal_offset = size
+        self._journal_inode = stat.st_ino
+
+    def _migrate_legacy_file_to_journal(self, legacy_seen: set[str]) -> None:
+        now = time.time()
+        for digest in sorted(legacy_seen):
+            self._remember(digest, now)
+        try:
+            with self._journal_lock():
+                self._compact_journal()
+            os.remove(self._path)
             logger.info(
-                "Bootstrapped idempotency ledger host-state key '%s' from %s",
-                self._state_key,
+                "Migrated %d idempotency entries from %s to journal %s",
+                len(legacy_seen),
                 self._path,
+                self._journal_path,
             )
+        except Exception as exc:
+            logger.warning("IdempotencyLedger: failed to migrate %s: %s", self._path, exc)
 
-    def _save(self) -> None:
-        if self._is_database_backend():
-            _save_json_state_file(
-                path=self._path,
-                data={"seen": sorted(self._seen)},
-                logger=logger,
-                warn_only=True,
-                storage_backend=self._storage_backend,
-                state_key=self._state_key,
+    # ------------------------------------------------------------------
+    # Database rows
+    # ------------------------------------------------------------------
+
+    def _resolve_db_backend(self) -> Any:
+        backend = _get_host_state_backend(logger)
+        if backend is None:
+            return None
+        if not callable(getattr(backend, "record_idempotency_key", None)):
+            logger.warning(
+                "IdempotencyLedger: %s has no per-key idempotency storage; using journal file",
+                type(backend).__name__,
             )
-            return
+            return None
+        return backend
+
+    def _db_has(self, digest: str) -> bool:
+        try:
+            found = bool(_run_coro_sync(lambda: self._db_backend.has_idempotency_key(digest)))
+        except Exception as exc:
+            logger.warning("IdempotencyLedger: database lookup failed: %s", exc)
+            return False
+        if found:
+            self._remember(digest, time.time())
+        return found
 
+    def _db_record(self, digest: str) -> bool:
         try:
-            parent = os.path.dirname(self._path)
-            if parent:
-                os.makedirs(parent, exist_ok=True)
-            tmp_path = f"{self._path}.tmp"
-            with open(tmp_path, "w", encoding="utf-8") as fh:
-                json.dump(sorted(self._seen), fh)
-                fh.flush()
-                os.fsync(fh.fileno())
-            os.replace(tmp_path, self._path)
+            inserted = bool(
+                _run_coro_sync(
+                    lambda: self._db_backend.record_idempotency_key(digest, self._ttl_seconds)
+                )
+            )
         except Exception as exc:
-            logger.warning("IdempotencyLedger: failed to save %s: %s", self._path, exc)
+            logger.warning("IdempotencyLedger: database record failed: %s", exc)
+            return digest not in self._seen
+        self._db_records_since_prune += 1
+        if self._db_records_since_prune >= _DB_PRUNE_EVERY:
+            self._db_records_since_prune = 0
+            try:
+                _run_coro_sync(lambda: self._db_backend.prune_idempotency_keys(self._max_entries))
+            except Exception as exc:
+                logger.warning("IdempotencyLedger: database prune failed: %s", exc)
+        return inserted
+
+    def _db_discard(self, digest: str) -> None:
+        delete = getattr(self._db_backend, "delete_idempotency_key", None)
+        if not callable(delete):
+            return
+        try:
+            _run_coro_sync(lambda: delete(digest))
+        except Exception as exc:
+            logger.warning("IdempotencyLedger: database delete failed: %s", exc)
+
+    def _migrate_legacy_blob_to_rows(self) -> None:
+        """Move digests from the legacy host-state blob / local file into per-key rows."""
+        payload = _run_coro_sync(lambda: self._db_backend.load_host_state(self._state_key))
+        seen_values = payload.get("seen", []) if isinstance(payload, dict) else []
+        legacy_seen = (
+            {str(item) for item in seen_values if str(item).strip()}
+            if isinstance(seen_values, list)
+            else set()
+        )
+        from_blob = bool(legacy_seen)
+        if not legacy_seen:
+            legacy_seen = self._load_legacy_file_seen()
+        if not legacy_seen:
+            return
+
+        digests = sorted(legacy_seen)
+        _run_coro_sync(
+            lambda: self._db_backend.import_idempotency_keys(digests, self._ttl_seconds),
+            timeout_seconds=60,
+        )
+        if from_blob:
+            _run_coro_sync(
+                lambda: self._db_backend.save_host_state(
+                    self._state_key, {"seen": [], "migrated_to_rows": True}
+                )
+            )
+        logger.info(
+            "Migrated %d idempotency entries from host-state key '%s' to per-key rows",
+            len(digests),
+            self._state_key,
+        )
+
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
+
+    def _load(self) -> None:
+        if self._is_database_backend():
+            self._db_backend = self._resolve_db_backend()
+            if self._db_backend is not None:
+                try:
+                    self._migrate_legacy_blob_to_rows()
+                except Exception as exc:
+                    logger.warning("IdempotencyLedger: legacy migration failed: %s", exc)
+                return
+
+        self._refresh_from_journal()
+        legacy_seen = self._load_legacy_file_seen()
+        if legacy_seen:
+            self._migrate_legacy_file_to_journal(legacy_seen)
+        self._evict(time.time())
@@ -15,6 +15,7 @@ def run_inbox_processor_main(
     check_completed_agents,
     merge_queue_auto_merge_once,
     cleanup_stale_worktrees_once=None,
+    wait_for_inbox_tasks=None,
     drain_postgres_inbox_queue,
     process_filesystem_inbox_once,
     run_processor_loop,
@@ -45,6 +46,7 @@ def run_inbox_processor_main(
         check_completed_agents=check_completed_agents,
         merge_queue_auto_merge_once=merge_queue_auto_merge_once,
         cleanup_stale_worktrees_once=cleanup_stale_worktrees_once,
+        wait_for_inbox_tasks=wait_for_inbox_tasks,
         runtime_state=runtime_state,
         time_module=time_module,
     )
@@ -58,32 +60,40 @@ def drain_postgres_inbox_queue_once(
     process_task_payload,
     mark_task_done,
     mark_task_failed,
-) -> None:
-    worker_id = f"{os.uname().nodename}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
-    try:
-        tasks = claim_pending_tasks(limit=batch_size, worker_id=worker_id)
-    except Exception as exc:
-        logger.error("Failed to claim Postgres inbox tasks: %s", exc)
-        return
-
-    if not tasks:
-        return
+    max_batches: int = 20,
+) -> bool:
+    """Claim and process inbox tasks until a claim returns less than a full batch.
 
-    for task in tasks:
+    Returns ``True`` when *max_batches* full batches were processed and more
+    tasks may still be waiting, so the caller should drain again right away.
+    """
+    worker_id = f"{os.uname().nodename}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+    for _ in range(max(1, int(max_batches))):
         try:
-            processed_ok = process_task_payload(
-                project_key=str(task.project_key),
-                workspace=str(task.workspace),
-                filename=str(task.filename),
-                content=str(task.markdown_content),
-            )
-            if not processed_ok:
-                mark_task_failed(task.id, "Task processing failed (see processor logs)")
-                continue
-            mark_task_done(task.id)
+            tasks = claim_pending_tasks(limit=batch_size, worker_id=worker_id)
         except Exception as exc:
-            logger.error(
-                "Failed processing Postgres inbox task id=%s: %s", task.id, exc, exc_info=True
-            )
-            with contextlib.suppress(Exception):
-                mark_task_failed(task.id, str(exc))
+            logger.error("Failed to claim Postgres inbox tasks: %s", exc)
+            return False
+
+        for task in tasks:
+            try:
+                processed_ok = process_task_payload(
+                    project_key=str(task.project_key),
+                    workspace=str(task.workspace),
+                    filename=str(task.filename),
+                    content=str(task.markdown_content),
+                )
+                if not processed_ok:
+                    mark_task_failed(task.id, "Task processing failed (see processor logs)")
+                    continue
+                mark_task_done(task.id)
+            except Exception as exc:
+                logger.error(
+                    "Failed processing Postgres inbox task id=%s: %s", task.id, exc, exc_info=True
+                )
+                with contextlib.suppress(Exception):
+                    mark_task_failed(task.id, str(exc))
+
+        if len(tasks) < batch_size:
+            return False
+    return True
@@ -5,8 +5,11 @@ Used by the example Telegram bot when ``NEXUS_INBOX_BACKEND=postgres``.
 
 from __future__ import annotations
 
+import contextlib
 import logging
 import os
+import select
+import time
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from typing import Any
@@ -30,6 +33,7 @@ _DEDUP_WINDOW_SECONDS = max(0, int(os.getenv("NEXUS_INBOX_DEDUPE_WINDOW_SECONDS"
 _DONE_DEDUP_WINDOW_SECONDS = max(
     0, int(os.getenv("NEXUS_INBOX_DONE_DEDUPE_WINDOW_SECONDS", "86400"))
 )
+_NOTIFY_CHANNEL = "nexus_inbox_tasks"
 
 
 def _require_sqlalchemy() -> None:
@@ -56,6 +60,18 @@ if _SA_AVAILABLE:
 
     class _InboxTaskRow(_InboxBase):
         __tablename__ = "nexus_inbox_tasks"
+        __table_args__ = (
+            # Claim scan: pending rows in id order.
+            sa.Index("ix_nexus_inbox_tasks_status_id", "status", "id"),
+            # Duplicate lookups by task identity (enqueue and claim).
+            sa.Index(
+                "ix_nexus_inbox_tasks_identity",
+                "project_key",
+                "workspace",
+                "filename",
+                "id",
+            ),
+        )
 
         id: sa.orm.Mapped[int] = sa.orm.mapped_column(
             sa.Integer, primary_key=True, autoincrement=True
@@ -92,6 +108,7 @@ class InboxQueueTask:
 
 
 _ENGINE = None
+_LISTEN_CONNECTION: Any = None
 
 
 def _get_engine():
@@ -107,6 +124,9 @@ def _get_engine():
 
     _ENGINE = sa.create_engine(dsn, pool_size=5)
     _InboxBase.metadata.create_all(_ENGINE)
+    # create_all skips existing tables, so add indexes introduced after the table.
+    for index in _InboxTaskRow.__table__.indexes:
+        index.create(_ENGINE, checkfirst=True)
     logger.info("Postgres inbox queue initialized")
     return _ENGINE
 
@@ -199,58 +219,108 @@ def enqueue_task(
             created_at=now,
         )
         session.add(row)
+        session.flush()
+        if engine.dialect.name == "postgresql":
+            # Delivered on commit; wakes processors blocked in wait_for_task_notification.
+            session.execute(
+                sa.text("SELECT pg_notify(:channel, :payload)"),
+                {"channel": _NOTIFY_CHANNEL, "payload": str(row.id)},
+            )
         session.commit()
         session.refresh(row)
         return int(row.id)
 
 
+def _claim_candidates_query(dialect_name: str, scan_limit: int):
+    """Select up to *scan_limit* pending rows (locked) with each row's oldest prior row.
+
+    On PostgreSQL the prior row comes from one ``LEFT JOIN LATERAL (... LIMIT 1)``
+    served by the identity index.  Dialects without ``LATERAL`` (SQLite in
+    tests) fall back to correlated scalar subqueries.
+    """
+    table = _InboxTaskRow.__table__
+    prior = table.alias("prior")
+    prior_row = (
+        sa.select(prior.c.id.label("prior_id"), prior.c.status.label("prior_status"))
+        .where(prior.c.project_key == table.c.project_key)
+        .where(prior.c.workspace == table.c.workspace)
+        .where(prior.c.filename == table.c.filename)
+        .where(prior.c.id < table.c.id)
+        .where(prior.c.status.in_(("pending", "processing", "done")))
+        .order_by(prior.c.id.asc())
+        .limit(1)
+    )
+    row_columns = (
+        table.c.id,
+        table.c.project_key,
+        table.c.workspace,
+        table.c.filename,
+        table.c.markdown_content,
+    )
+    if dialect_name == "postgresql":
+        lateral = prior_row.lateral("prior_row")
+        query = sa.select(*row_columns, lateral.c.prior_id, lateral.c.prior_status).select_from(
+            table.outerjoin(lateral, sa.true())
+        )
+    else:
+        correlated = prior_row.correlate(table)
+        query = sa.select(
+            *row_columns,
+            correlated.with_only_columns(prior.c.id).scalar_subquery().label("prior_id"),
+            correlated.with_only_columns(prior.c.status).scalar_subquery().label("prior_status"),
+        )
+    return (
+        query.where(table.c.status == "pending")
+        .order_by(table.c.id.asc())
+        .limit(scan_limit)
+        .with_for_update(skip_locked=True, of=table)
+    )
+
+
 def claim_pending_tasks(*, limit: int, worker_id: str) -> list[InboxQueueTask]:
-    """Claim pending tasks and return them for processing."""
+    """Claim pending tasks and return them for processing.
+
+    Locks up to ``5 × limit`` pending rows with ``FOR UPDATE SKIP LOCKED`` and
+    resolves, in the same statement, the oldest prior non-failed row sharing
+    each row's ``(project_key, workspace, filename)``.  Rows with such a prior
+    row are closed as duplicates and the remainder are claimed, using one
+    bulk update per outcome instead of a lookup per row.
+    """
     engine = _get_engine()
-    claimed: list[InboxQueueTask] = []
     now = datetime.now(tz=UTC)
     claim_limit = max(1, int(limit))
     # Scan a wider window so we can suppress duplicate rows and still return up to claim_limit tasks.
     scan_limit = max(claim_limit, claim_limit * 5)
 
+    table = _InboxTaskRow.__table__
+    candidates = _claim_candidates_query(engine.dialect.name, scan_limit)
+
+    claimed: list[InboxQueueTask] = []
+    duplicates: list[dict[str, Any]] = []
     with Session(engine) as session:
-        query = (
-            session.query(_InboxTaskRow)
-            .filter(_InboxTaskRow.status == "pending")
-            .order_by(_InboxTaskRow.id.asc())
-            .limit(scan_limit)
-            .with_for_update(skip_locked=True)
-        )
-        rows = query.all()
+        rows = session.execute(candidates).all()
         if not rows:
             session.commit()
             return []
 
-        for r_item in rows:
-            row: Any = r_item
-            prior_nonfailed = (
-                session.query(_InboxTaskRow.id, _InboxTaskRow.status)
-                .filter(_InboxTaskRow.project_key == row.project_key)
-                .filter(_InboxTaskRow.workspace == row.workspace)
-                .filter(_InboxTaskRow.filename == row.filename)
-                .filter(_InboxTaskRow.id < row.id)
-                .filter(_InboxTaskRow.status.in_(("pending", "processing", "done")))
-                .order_by(_InboxTaskRow.id.asc())
-                .first()
-            )
-            if prior_nonfailed:
-                prior_id, prior_status = prior_nonfailed
-                row.status = "done"
-                row.processed_at = now
-                row.error = (
-                    "Duplicate queue row suppressed; "
-                    f"prior row id={int(prior_id)} status={str(prior_status)}"
-                )[:2000]
+        for row in rows:
+            if row.prior_id is not None:
+                duplicates.append(
+                    {
+                        "id": int(row.id),
+                        "status": "done",
+                        "processed_at": now,
+                        "error": (
+                            "Duplicate queue row suppressed; "
+                            f"prior row id={int(row.prior_id)} status={str(row.prior_status)}"
+                        )[:2000],
+                    }
+                )
                 logger.warning(
                     "Duplicate pending inbox row suppressed at claim time: "
                     "id=%s duplicate_of=%s project=%s workspace=%s filename=%s",
                     row.id,
-                    prior_id,
+                    row.prior_id,
                     row.project_key,
                     row.workspace,
                     row.filename,
@@ -260,10 +330,6 @@ def claim_pending_tasks(*, limit: int, worker_id: str) -> list[InboxQueueTask]:
             if len(claimed) >= claim_limit:
                 continue
 
-            row.status = "processing"
-            row.claimed_by = worker_id
-            row.claimed_at = now
-            row.error = None
             claimed.append(
                 InboxQueueTask(
                     id=int(row.id),
@@ -273,11 +339,62 @@ def claim_pending_tasks(*, limit: int, worker_id: str) -> list[InboxQueueTask]:
                     markdown_content=row.markdown_content,
                 )
             )
+
+        if duplicates:
+            session.execute(sa.update(_InboxTaskRow), duplicates)
+        if claimed:
+            session.execute(
+                sa.update(table)
+                .where(table.c.id.in_([task.id for task in claimed]))
+                .values(status="processing", claimed_by=worker_id, claimed_at=now, error=None)
+            )
         session.commit()
 
     return claimed
 
 
+def wait_for_task_notification(timeout: float) -> bool:
+    """Block until an enqueue ``NOTIFY`` arrives or *timeout* seconds elapse.
+
+    Uses a dedicated ``LISTEN`` connection on PostgreSQL.  Other dialects, or
+    a listener that cannot be established, fall back to sleeping for
+    *timeout* so callers keep their polling cadence.
+
+    Returns:
+        ``True`` when woken by a notification, ``False`` on timeout.
+    """
+    global _LISTEN_CONNECTION
+    wait_seconds = max(0.0, float(timeout))
+    try:
+        engine = _get_engine()
+        if engine.dialect.name != "postgresql":
+            time.sleep(wait_seconds)
+            return False
+        if _LISTEN_CONNECTION is None:
+            _LISTEN_CONNECTION = engine.raw_connection()
+            dbapi_conn = _LISTEN_CONNECTION.driver_connection
+            dbapi_conn.autocommit = True
+            with dbapi_conn.cursor() as cursor:
+                cursor.execute(f"LISTEN {_NOTIFY_CHANNEL}")
+        dbapi_conn = _LISTEN_CONNECTION.driver_connection
+        if not dbapi_conn.notifies:
+            ready, _, _ = select.select([dbapi_conn], [], [], wait_seconds)
+            if not ready:
+                return False
+            dbapi_conn.poll()
+        woke = bool(dbapi_conn.notifies)
+        dbapi_conn.notifies.clear()
+        return woke
+    except Exception as exc:
+        logger.warning("Inbox queue LISTEN failed; falling back to polling: %s", exc)
+        if _LISTEN_CONNECTION is not None:
+            with contextlib.suppress(Exception):
+                _LISTEN_CONNECTION.invalidate()
+            _LISTEN_CONNECTION = None
+        time.sleep(wait_seconds)
+        return False
+
+
 def mark_task_done(task_id: int) -> None:
     """Mark a claimed task as done."""
     engine = _get_engine()
@@ -0,0 +1,324 @@
+"""Outbound notification dispatcher: per-chat rate shaping and burst coalescing.
+
+Sits between :func:`~nexus.core.integrations.notifications.send_notification` /
+``emit_alert`` (including alerts delivered through the EventBus Telegram
+handler) and the channel plugins.  A message for a chat with spare
+capacity is delivered immediately (and its real result returned); once the
+chat's token bucket (or the global bot bucket) is exhausted, further messages
+for that chat are queued and delivered as one digest after the coalescing
+window, as soon as capacity is available again (messages carrying buttons are
+queued individually instead, so their buttons are never lost).  This keeps incident bursts
+under Telegram's per-chat (~1 msg/s) and per-bot (~30 msg/s) limits instead of
+collecting 429s.
+"""
+
+from __future__ import annotations
+
+import atexit
+import heapq
+import itertools
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Telegram rejects messages longer than 4096 characters.
+_MAX_DIGEST_CHARS = 4000
+_DIGEST_HEADER_CHARS = 32
+
+Deliver = Callable[[str, "dict[str, Any] | None"], bool]
+
+
+class TokenBucket:
+    """Classic token bucket: *rate* tokens per second, holding at most *capacity*."""
+
+    def __init__(
+        self, rate: float, capacity: float, *, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self.rate = max(0.001, float(rate))
+        self.capacity = max(1.0, float(capacity))
+        self._clock = clock
+        self._tokens = self.capacity
+        self._updated = clock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_take(self) -> bool:
+        self._refill()
+        if self._tokens >= 1.0:
+            self._tokens -= 1.0
+            return True
+        return False
+
+    def give_back(self) -> None:
+        """Return a token taken by :meth:`try_take` that ended up unused."""
+        self._tokens = min(self.capacity, self._tokens + 1.0)
+
+    def seconds_until_available(self) -> float:
+        self._refill()
+        return 0.0 if self._tokens >= 1.0 else (1.0 - self._tokens) / self.rate
+
+
+@dataclass
+class _PendingBatch:
+    chat_id: str
+    deliver: Deliver
+    first_queued_at: float
+    items: list[tuple[str, dict[str, Any] | None]] = field(default_factory=list)
+
+
+class NotificationDispatcher:
+    """Rate-shape and coalesce outbound chat messages.
+
+    Args:
+        per_chat_rate: Sustained messages per second per chat.
+        per_chat_burst: Messages a chat may receive back-to-back before shaping.
+        global_rate: Sustained messages per second across all chats.
+        coalesce_window: Seconds to gather queued messages into one digest.
+        clock: Monotonic clock (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        *,
+        per_chat_rate: float = 1.0,
+        per_chat_burst: float = 3.0,
+        global_rate: float = 25.0,
+        coalesce_window: float = 2.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._per_chat_rate = per_chat_rate
+        self._per_chat_burst = per_chat_burst
+        self._coalesce_window = max(0.0, float(coalesce_window))
+        self._clock = clock
+        self._global = TokenBucket(global_rate, max(1.0, global_rate), clock=clock)
+        self._chat_buckets: dict[str, TokenBucket] = {}
+        self._pending: dict[tuple[str, str], _PendingBatch] = {}
+        self._due: list[tuple[float, tuple[str, str]]] = []
+        self._solo_ids = itertools.count()
+        self._cond = threading.Condition()
+        self._worker: threading.Thread | None = None
+        self._closed = False
+        self.stats = {"sent": 0, "queued": 0, "digests": 0, "failed": 0}
+
+    def dispatch(
+        self,
+        chat_id: str,
+        text: str,
+        deliver: Deliver,
+        *,
+        reply_markup: dict[str, Any] | None = None,
+        batch_key: str = "",
+    ) -> bool:
+        """Deliver *text* now if the chat has capacity, otherwise queue it.
+
+        *deliver* is called as ``deliver(text, reply_markup)`` and must return
+        whether the channel accepted the message.  *batch_key* separates
+        messages that must not be merged (e.g. different parse modes).  A
+        message with *reply_markup* is never merged into a digest: it is queued
+        on its own and sent alone when its turn comes, so its buttons survive.
+
+        Returns the delivery result, or ``True`` once a message is queued.
+        """
+        key = (str(chat_id), batch_key)
+        with self._cond:
+            if reply_markup is not None:
+                key = (key[0], f"{batch_key}#solo-{next(self._solo_ids)}")
+            bucket = self._chat_bucket(key[0])
+            if key not in self._pending and bucket.try_take():
+                if self._global.try_take():
+                    immediate = True
+                else:
+                    bucket.give_back()
+                    immediate = False
+            else:
+                immediate = False
+
+            if not immediate:
+                batch = self._pending.get(key)
+                if batch is None:
+                    batch = _PendingBatch(
+                        chat_id=key[0], deliver=deliver, first_queued_at=self._clock()
+                    )
+                    self._pending[key] = batch
+                    heapq.heappush(self._due, (self._due_at(batch), key))
+                batch.items.append((text, reply_markup))
+                self.stats["queued"] += 1
+                self._ensure_worker()
+                self._cond.notify_all()
+                return True
+
+        return self._deliver(deliver, text, reply_markup)
+
+    def flush(self, timeout: float = 10.0) -> None:
+        """Deliver every queued batch, waiting for rate capacity up to *timeout*."""
+        deadline = self._clock() + timeout
+        while True:
+            with self._cond:
+                if not self._pending:
+                    return
+                key = next(iter(self._pending))
+                wait = self._capacity_wait(key[0])
+                if wait <= 0 or self._clock() >= deadline:
+                    batch = self._take_batch_locked(key)
+                else:
+                    batch = None
+            if batch is None:
+                time.sleep(min(wait, max(0.0, deadline - self._clock())))
+                continue
+            self._deliver_batch(batch)
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _chat_bucket(self, chat_id: str) -> TokenBucket:
+        bucket = self._chat_buckets.get(chat_id)
+        if bucket is None:
+            bucket = TokenBucket(self._per_chat_rate, self._per_chat_burst, clock=self._clock)
+            self._chat_buckets[chat_id] = bucket
+        return bucket
+
+    def _capacity_wait(self, chat_id: str) -> float:
+        return max(
+            self._chat_bucket(chat_id).seconds_until_available(),
+            self._global.seconds_until_available(),
+        )
+
+    def _due_at(self, batch: _PendingBatch) -> float:
+        return max(
+            batch.first_queued_at + self._coalesce_window,
+            self._clock() + self._capacity_wait(batch.chat_id),
+        )
+
+    def _take_batch_locked(self, key: tuple[str, str]) -> _PendingBatch | None:
+        batch = self._pending.pop(key, None)
+        if batch is not None:
+            self._chat_bucket(key[0]).try_take()
+            self._global.try_take()
+        return batch
+
+    def _ensure_worker(self) -> None:
+        if self._worker is not None and self._worker.is_alive():
+            return
+        self._worker = threading.Thread(
+            target=self._run, daemon=True, name="nexus-notification-dispatcher"
+        )
+        self._worker.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._closed and not self._due:
+                    if not self._cond.wait(timeout=30.0) and not self._due:
+                        self._worker = None
+                        return
+                if self._closed:
+                    return
+                due_at, key = self._due[0]
+                now = self._clock()
+                if due_at > now:
+                    self._cond.wait(timeout=due_at - now)
+                    continue
+                heapq.heappop(self._due)
+                batch = self._pending.get(key)
+                if batch is None:
+                    continue
+                wait = self._capacity_wait(key[0])
+                if wait > 0:
+                    heapq.heappush(self._due, (now + wait, key))
+                    continue
+                batch = self._take_batch_locked(key)
+            if batch is not None:
+                self._deliver_batch(batch)
+
+    def _deliver_batch(self, batch: _PendingBatch) -> None:
+        digests = _build_digests(batch.items)
+        if len(batch.items) > 1:
+            self.stats["digests"] += len(digests)
+        for text, reply_markup in digests:
+            self._deliver(batch.deliver, text, reply_markup)
+
+    def _deliver(self, deliver: Deliver, text: str, reply_markup: dict[str, Any] | None) -> bool:
+        try:
+            ok = bool(deliver(text, reply_markup))
+        except Exception as exc:
+            logger.warning("Notification delivery failed: %s", exc)
+            ok = False
+        self.stats["sent" if ok else "failed"] += 1
+        return ok
+
+
+def _build_digests(
+    items: list[tuple[str, dict[str, Any] | None]],
+) -> list[tuple[str, dict[str, Any] | None]]:
+    """Merge queued messages into as few digests as fit Telegram's size limit.
+
+    Digests are split on message boundaries, so no alert is dropped and no
+    Markdown entity is cut in half.  A single message that is already too long
+    on its own is passed through unchanged for the channel plugin to handle.
+    Messages with buttons are always batched alone (see ``dispatch``), so a
+    merged digest never carries buttons.
+    """
+    if len(items) == 1:
+        return [items[0]]
+    groups: list[list[tuple[str, dict[str, Any] | None]]] = [[]]
+    size = 0
+    for text, markup in items:
+        # Reserve room for the "📬 N notifications" header and the separator.
+        added = len(text) + 2
+        if groups[-1] and size + added > _MAX_DIGEST_CHARS - _DIGEST_HEADER_CHARS:
+            groups.append([])
+            size = 0
+        groups[-1].append((text, markup))
+        size += added
+
+    digests: list[tuple[str, dict[str, Any] | None]] = []
+    for group in groups:
+        if len(group) == 1:
+            digests.append(group[0])
+            continue
+        text = f"📬 {len(group)} notifications\n\n" + "\n\n".join(t for t, _m in group)
+        digests.append((text, None))
+    return digests
+
+
+_dispatcher: NotificationDispatcher | None = None
+_dispatcher_lock = threading.Lock()
+
+
+def get_dispatcher() -> NotificationDispatcher:
+    """Return the process-wide dispatcher configured from ``NEXUS_NOTIFY_*`` env vars."""
+    global _dispatcher
+    with _dispatcher_lock:
+        if _dispatcher is None:
+            _dispatcher = NotificationDispatcher(
+                per_chat_rate=float(os.getenv("NEXUS_NOTIFY_CHAT_RATE_PER_SECOND", "1")),
+                per_chat_burst=float(os.getenv("NEXUS_NOTIFY_CHAT_BURST", "3")),
+                global_rate=float(os.getenv("NEXUS_NOTIFY_GLOBAL_RATE_PER_SECOND", "25")),
+                coalesce_window=float(os.getenv("NEXUS_NOTIFY_COALESCE_SECONDS", "2")),
+            )
+            atexit.register(_dispatcher.flush, 5.0)
+        return _dispatcher
+
+
+def reset_dispatcher() -> None:
+    """Drop the shared dispatcher (pending messages are discarded); used by tests."""
+    global _dispatcher
+    with _dispatcher_lock:
+        if _dispatcher is not None:
+            _dispatcher.close()
+        _dispatcher = None
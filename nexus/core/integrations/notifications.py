@@ -4,6 +4,7 @@ Provides rich Telegram notifications with interactive buttons for quick actions.
 """
 
 import asyncio
+import heapq
 import logging
 import os
 import re
@@ -13,6 +14,7 @@ from typing import Any, Sequence
 
 from nexus.adapters.git.utils import build_issue_url
 from nexus.core.config import TELEGRAM_CHAT_ID, TELEGRAM_TOKEN, get_repo, PROJECT_CONFIG
+from nexus.core.integrations.notification_dispatcher import get_dispatcher
 from nexus.core.orchestration.plugin_runtime import get_profiled_plugin
 
 logger = logging.getLogger(__name__)
@@ -22,6 +24,9 @@ _EVENTBUS_LOOP: asyncio.AbstractEventLoop | None = None
 _EVENTBUS_LOOP_THREAD: threading.Thread | None = None
 _ALERT_DEDUP_LOCK = threading.Lock()
 _ALERT_DEDUP_CACHE: dict[str, float] = {}
+# Min-heap of (recorded_at, key); entries whose timestamp no longer matches the
+# cache are stale and skipped, so expiry is amortised O(log n) per alert.
+_ALERT_DEDUP_HEAP: list[tuple[float, str]] = []
 _ALERT_DEDUP_TTL_SECONDS = max(
     0,
     int(os.getenv("NEXUS_ALERT_DEDUP_TTL_SECONDS", "120")),
@@ -33,9 +38,10 @@ def _is_duplicate_alert(dedup_key: str, *, ttl_seconds: int) -> bool:
         return False
     now = time.time()
     with _ALERT_DEDUP_LOCK:
-        expired = [key for key, ts in _ALERT_DEDUP_CACHE.items() if now - ts > ttl_seconds]
-        for key in expired:
-            _ALERT_DEDUP_CACHE.pop(key, None)
+        while _ALERT_DEDUP_HEAP and now - _ALERT_DEDUP_HEAP[0][0] > ttl_seconds:
+            ts, key = heapq.heappop(_ALERT_DEDUP_HEAP)
+            if _ALERT_DEDUP_CACHE.get(key) == ts:
+                _ALERT_DEDUP_CACHE.pop(key, None)
         seen_at = _ALERT_DEDUP_CACHE.get(dedup_key)
         if seen_at is None:
             return False
@@ -45,8 +51,10 @@ def _is_duplicate_alert(dedup_key: str, *, ttl_seconds: int) -> bool:
 def _record_alert_dedup(dedup_key: str) -> None:
     if not dedup_key:
         return
+    now = time.time()
     with _ALERT_DEDUP_LOCK:
-        _ALERT_DEDUP_CACHE[dedup_key] = time.time()
+        _ALERT_DEDUP_CACHE[dedup_key] = now
+        heapq.heappush(_ALERT_DEDUP_HEAP, (now, dedup_key))
 
 
 def _run_eventbus_loop(loop: asyncio.AbstractEventLoop) -> None:
@@ -360,12 +368,21 @@ def send_notification(
             logger.error("Telegram notification plugin missing send_message_sync")
             return False
 
-        return bool(
-            plugin.send_message_sync(
-                message=message,
-                parse_mode=parse_mode,
-                reply_markup=reply_markup,
+        def _deliver(text: str, markup: dict | None) -> bool:
+            return bool(
+                plugin.send_message_sync(
+                    message=text,
+                    parse_mode=parse_mode,
+                    reply_markup=markup,
+                )
             )
+
+        return get_dispatcher().dispatch(
+            str(TELEGRAM_CHAT_ID),
+            message,
+            _deliver,
+            reply_markup=reply_markup,
+            batch_key=f"notification:{parse_mode}",
         )
     except Exception as e:
         logger.error(f"Failed to send notification: {e}")
@@ -963,18 +980,25 @@ def emit_alert(
                     "error": "❌",
                     "critical": "🚨",
                 }.get(str(severity or "info").lower(), "ℹ️")
-                ok = bool(
-                    plugin.send_message_sync(
-                        f"{icon} {normalized}",
-                        parse_mode="Markdown",
-                        reply_markup=fallback_markup,
-                    )
+                ok = get_dispatcher().dispatch(
+                    str(TELEGRAM_CHAT_ID),
+                    f"{icon} {normalized}",
+                    lambda text, markup: bool(
+                        plugin.send_message_sync(text, parse_mode="Markdown", reply_markup=markup)
+                    ),
+                    reply_markup=fallback_markup,
+                    batch_key="alert:Markdown",
                 )
                 if ok:
                     _record_alert_dedup(resolved_dedup_key)
                 return ok
             if hasattr(plugin, "send_alert_sync"):
-                ok = bool(plugin.send_alert_sync(normalized, severity=severity))
+                ok = get_dispatcher().dispatch(
+                    str(TELEGRAM_CHAT_ID),
+                    normalized,
+                    lambda text, _markup: bool(plugin.send_alert_sync(text, severity=severity)),
+                    batch_key=f"alert:{severity}",
+                )
                 if ok:
                     _record_alert_dedup(resolved_dedup_key)
                 return ok
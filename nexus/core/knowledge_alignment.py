@@ -2,9 +2,20 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
+import logging
+import math
 import os
 import re
-from dataclasses import dataclass
+import tempfile
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+logger = logging.getLogger(__name__)
 
 _WORD_RE = re.compile(r"[a-z0-9][a-z0-9_-]{1,}")
 _HEADING_RE = re.compile(r"^\s{0,3}#{1,6}\s+(.+?)\s*$")
@@ -40,6 +51,9 @@ _STOP_WORDS = frozenset(
 _SOURCE_DIRS = ("docs",)
 _SOURCE_FILE_PREFIXES = ("readme", "adr-")
 _SOURCE_SUFFIXES = (".md", ".mdx")
+_INDEX_VERSION = 1
+_BM25_K1 = 1.2
+_BM25_B = 0.75
 
 
 @dataclass(frozen=True)
@@ -70,8 +84,82 @@ class AlignmentResult:
         return [artifact.path_or_url for artifact in self.matched_artifacts]
 
 
+@dataclass
+class _RepoIndex:
+    """Inverted index over one repository's docs/ADRs.
+
+    ``files`` maps a repo-relative path to its fingerprint (``mtime_ns``/``size``),
+    title, token count and term frequencies; ``postings`` maps a token to the
+    paths containing it and is derived from ``files`` (never persisted).
+    """
+
+    base: str
+    files: dict[str, dict[str, Any]] = field(default_factory=dict)
+    postings: dict[str, dict[str, int]] = field(default_factory=dict)
+    total_length: int = 0
+    doc_count: int = 0
+    dirty: bool = False
+    next_refresh: float = 0.0
+
+    def add(self, relative: str, entry: dict[str, Any]) -> None:
+        self.remove(relative)
+        self.files[relative] = entry
+        length = int(entry.get("length") or 0)
+        if length <= 0:
+            return
+        self.total_length += length
+        self.doc_count += 1
+        for token, count in entry["tf"].items():
+            self.postings.setdefault(token, {})[relative] = int(count)
+
+    def remove(self, relative: str) -> None:
+        entry = self.files.pop(relative, None)
+        if entry is None:
+            return
+        length = int(entry.get("length") or 0)
+        if length <= 0:
+            return
+        self.total_length -= length
+        self.doc_count -= 1
+        for token in entry["tf"]:
+            posting = self.postings.get(token)
+            if posting is None:
+                continue
+            posting.pop(relative, None)
+            if not posting:
+                del self.postings[token]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"version": _INDEX_VERSION, "base": self.base, "files": self.files}
+
+
 class KnowledgeAlignmentService:
-    """Evaluate task text alignment against local documentation and ADRs."""
+    """Evaluate task text alignment against local documentation and ADRs.
+
+    Each repository gets an inverted index that is refreshed incrementally: files
+    are re-read only when their mtime/size fingerprint changes, and scoring is
+    BM25 over the postings of the query terms.  When *index_dir* is set the index
+    is persisted there so new processes start warm.
+
+    Args:
+        index_dir: Optional directory for persisted indexes.
+        refresh_interval: Minimum seconds between walks of a repository's docs
+            tree; evaluations in between reuse the index as is.
+        clock: Monotonic clock (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        index_dir: str | None = None,
+        *,
+        refresh_interval: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._index_dir = str(index_dir or "").strip() or None
+        self.refresh_interval = max(0.0, float(refresh_interval))
+        self._clock = clock
+        self._indexes: dict[str, _RepoIndex] = {}
+        self._lock = threading.Lock()
 
     def evaluate(
         self,
@@ -81,8 +169,16 @@ class KnowledgeAlignmentService:
         max_hits: int = 3,
     ) -> AlignmentResult:
         query_tokens = _tokenize(f"{request_text or ''} {workflow_type or ''}")
-        artifacts = self._index_repo(repo_path)
-        if not query_tokens or not artifacts:
+        # Score under the lock: another thread's incremental refresh mutates the
+        # postings in place.
+        with self._lock:
+            index = self._index_repo_locked(repo_path)
+            if query_tokens and index.doc_count:
+                top = _score_bm25(index, query_tokens)[: max(1, max_hits)]
+                titles = {relative: str(index.files[relative]["title"]) for _, relative, _ in top}
+            else:
+                top = []
+        if not top:
             initial_gaps = sorted(query_tokens)[:8]
             return AlignmentResult(
                 alignment_score=0.0,
@@ -91,29 +187,16 @@ class KnowledgeAlignmentService:
                 recommended_next_actions=_build_recommendations(0.0, query_tokens, initial_gaps),
             )
 
-        scored: list[tuple[float, dict[str, object], set[str]]] = []
-        covered: set[str] = set()
-        for artifact in artifacts:
-            artifact_tokens = artifact["tokens"]
-            overlap = query_tokens & artifact_tokens
-            if not overlap:
-                continue
-            coverage = len(overlap) / max(1, len(query_tokens))
-            concentration = len(overlap) / max(1, len(artifact_tokens))
-            score = round((coverage * 0.8) + (concentration * 0.2), 4)
-            scored.append((score, artifact, overlap))
-
-        scored.sort(key=lambda item: item[0], reverse=True)
-        top = scored[: max(1, max_hits)]
         matched = [
             AlignmentArtifact(
                 source="repo",
-                title=str(artifact["title"]),
-                path_or_url=str(artifact["path"]),
+                title=titles[relative],
+                path_or_url=relative,
                 rationale=_build_rationale(overlap),
             )
-            for _, artifact, overlap in top
+            for _, relative, overlap in top
         ]
+        covered: set[str] = set()
         for _, _, overlap in top:
             covered.update(overlap)
 
@@ -126,56 +209,172 @@ class KnowledgeAlignmentService:
             recommended_next_actions=_build_recommendations(score, query_tokens, gaps),
         )
 
-    def _index_repo(self, repo_path: str) -> list[dict[str, object]]:
+    def _index_repo_locked(self, repo_path: str) -> _RepoIndex:
+        """Return the refreshed index for *repo_path*; the caller holds ``self._lock``."""
         base = os.path.abspath(repo_path or ".")
-        paths: list[str] = []
-        for root_name in _SOURCE_DIRS:
-            root = os.path.join(base, root_name)
-            if not os.path.isdir(root):
+        index = self._indexes.get(base)
+        if index is None:
+            index = self._load_index(base) or _RepoIndex(base=base)
+            self._indexes[base] = index
+
+        now = self._clock()
+        if now < index.next_refresh:
+            return index
+        index.next_refresh = now + self.refresh_interval
+
+        current = _discover_sources(base)
+        for relative in [path for path in index.files if path not in current]:
+            index.remove(relative)
+            index.dirty = True
+
+        for relative, (abs_path, stat) in current.items():
+            entry = index.files.get(relative)
+            if (
+                entry is not None
+                and entry.get("mtime_ns") == stat.st_mtime_ns
+                and entry.get("size") == stat.st_size
+            ):
                 continue
-            for dirpath, _dirnames, filenames in os.walk(root):
-                for filename in filenames:
-                    lower = filename.lower()
-                    if not lower.endswith(_SOURCE_SUFFIXES):
-                        continue
-                    paths.append(os.path.join(dirpath, filename))
+            index.add(relative, _build_entry(abs_path, stat))
+            index.dirty = True
+
+        if index.dirty:
+            self._save_index(index)
+            index.dirty = False
+        return index
 
+    def _index_path(self, base: str) -> str | None:
+        if not self._index_dir:
+            return None
+        digest = hashlib.sha256(base.encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self._index_dir, f"{digest}.json")
+
+    def _load_index(self, base: str) -> _RepoIndex | None:
+        path = self._index_path(base)
+        if not path or not os.path.exists(path):
+            return None
         try:
-            base_files = os.listdir(base)
+            with open(path, encoding="utf-8") as handle:
+                payload = json.load(handle)
+        except (OSError, ValueError) as exc:
+            logger.warning("Ignoring unreadable knowledge index %s: %s", path, exc)
+            return None
+        if (
+            not isinstance(payload, dict)
+            or payload.get("version") != _INDEX_VERSION
+            or payload.get("base") != base
+            or not isinstance(payload.get("files"), dict)
+        ):
+            return None
+        index = _RepoIndex(base=base)
+        for relative, entry in payload["files"].items():
+            if isinstance(entry, dict) and isinstance(entry.get("tf"), dict):
+                index.add(str(relative), entry)
+        return index
+
+    def _save_index(self, index: _RepoIndex) -> None:
+        path = self._index_path(index.base)
+        if not path:
+            return
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(index.to_dict(), handle, separators=(",", ":"))
+            os.replace(tmp_path, path)
+        except OSError as exc:
+            logger.warning("Could not persist knowledge index %s: %s", path, exc)
+
+
+def _discover_sources(base: str) -> dict[str, tuple[str, os.stat_result]]:
+    """Return ``{relative_path: (abs_path, stat)}`` for every indexable doc."""
+    sources: dict[str, tuple[str, os.stat_result]] = {}
+
+    def _add(entry: os.DirEntry[str]) -> None:
+        try:
+            stat = entry.stat()
         except OSError:
-            base_files = []
-        for filename in base_files:
-            lower = filename.lower()
-            if not lower.endswith(_SOURCE_SUFFIXES):
-                continue
-            if lower.startswith(_SOURCE_FILE_PREFIXES):
-                paths.append(os.path.join(base, filename))
-
-        indexed: list[dict[str, object]] = []
-        seen: set[str] = set()
-        for path in paths:
-            abs_path = os.path.abspath(path)
-            if abs_path in seen:
-                continue
-            seen.add(abs_path)
-            text = _read_text(abs_path)
-            if not text:
-                continue
-            headings = _extract_headings(text)
-            title = headings[0] if headings else os.path.basename(abs_path)
-            excerpt = " ".join(text.split())[:500]
-            relative = os.path.relpath(abs_path, base)
-            tokens = _tokenize(" ".join([title, " ".join(headings), excerpt]))
-            if not tokens:
+            return
+        abs_path = os.path.abspath(entry.path)
+        sources.setdefault(os.path.relpath(abs_path, base), (abs_path, stat))
+
+    for root_name in _SOURCE_DIRS:
+        pending = [os.path.join(base, root_name)]
+        while pending:
+            try:
+                with os.scandir(pending.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif entry.name.lower().endswith(_SOURCE_SUFFIXES) and entry.is_file():
+                            _add(entry)
+            except OSError:
                 continue
-            indexed.append(
-                {
-                    "path": relative,
-                    "title": title,
-                    "tokens": tokens,
-                }
-            )
-        return indexed
+
+    try:
+        with os.scandir(base) as entries:
+            for entry in entries:
+                lower = entry.name.lower()
+                if (
+                    lower.endswith(_SOURCE_SUFFIXES)
+                    and lower.startswith(_SOURCE_FILE_PREFIXES)
+                    and entry.is_file()
+                ):
+                    _add(entry)
+    except OSError:
+        pass
+    return sources
+
+
+def _build_entry(abs_path: str, stat: os.stat_result) -> dict[str, Any]:
+    entry: dict[str, Any] = {
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "title": os.path.basename(abs_path),
+        "length": 0,
+        "tf": {},
+    }
+    text = _read_text(abs_path)
+    if not text:
+        return entry
+    headings = _extract_headings(text)
+    title = headings[0] if headings else os.path.basename(abs_path)
+    excerpt = " ".join(text.split())[:500]
+    counts: dict[str, int] = {}
+    for token in _tokenize_terms(" ".join([title, " ".join(headings), excerpt])):
+        counts[token] = counts.get(token, 0) + 1
+    entry.update(title=title, length=sum(counts.values()), tf=counts)
+    return entry
+
+
+def _score_bm25(index: _RepoIndex, query_tokens: set[str]) -> list[tuple[float, str, set[str]]]:
+    """Rank artifacts with BM25 over the query terms' postings.
+
+    Scores are normalised by the sum of the query terms' IDF (the score of a
+    single average-length document containing every term once), clamped to
+    ``[0, 1]`` so unmatched rare terms lower the confidence.
+    """
+    doc_count = index.doc_count
+    avg_length = index.total_length / max(1, doc_count)
+    scores: dict[str, float] = {}
+    overlaps: dict[str, set[str]] = {}
+    norm = 0.0
+    for token in query_tokens:
+        posting = index.postings.get(token, {})
+        idf = math.log(1.0 + (doc_count - len(posting) + 0.5) / (len(posting) + 0.5))
+        norm += idf
+        for relative, tf in posting.items():
+            length = int(index.files[relative]["length"])
+            denom = tf + _BM25_K1 * (1.0 - _BM25_B + _BM25_B * length / max(avg_length, 1e-9))
+            scores[relative] = scores.get(relative, 0.0) + idf * tf * (_BM25_K1 + 1.0) / denom
+            overlaps.setdefault(relative, set()).add(token)
+
+    ranked = [
+        (round(min(1.0, value / norm), 4) if norm > 0 else 0.0, relative, overlaps[relative])
+        for relative, value in scores.items()
+    ]
+    ranked.sort(key=lambda item: (-item[0], item[1]))
+    return ranked
 
 
 def _read_text(path: str) -> str:
@@ -195,9 +394,16 @@ def _extract_headings(text: str) -> list[str]:
     return headings
 
 
+def _tokenize_terms(text: str) -> list[str]:
+    return [
+        token
+        for token in _WORD_RE.findall(text.lower())
+        if token not in _STOP_WORDS and len(token) >= 3
+    ]
+
+
 def _tokenize(text: str) -> set[str]:
-    tokens = {token.lower() for token in _WORD_RE.findall(text.lower())}
-    return {token for token in tokens if token not in _STOP_WORDS and len(token) >= 3}
+    return set(_tokenize_terms(text))
 
 
 def _build_rationale(overlap: set[str]) -> str:
@@ -0,0 +1,95 @@
+"""Lightweight in-process latency histograms for runtime instrumentation."""
+
+import bisect
+import threading
+
+# Upper bounds in seconds; observations above the last bound land in ``+Inf``.
+DEFAULT_LATENCY_BUCKETS: tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    120.0,
+    300.0,
+)
+
+
+class LatencyHistogram:
+    """Thread-safe fixed-bucket histogram of durations in seconds.
+
+    Buckets are cumulative-friendly (Prometheus ``le`` semantics) and
+    percentiles are estimated from the bucket upper bounds, so memory stays
+    constant regardless of how many observations are recorded.
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS) -> None:
+        self._bounds = tuple(sorted(float(b) for b in buckets))
+        self._counts = [0] * (len(self._bounds) + 1)
+        self._count = 0
+        self._sum = 0.0
+        self._min: float | None = None
+        self._max: float | None = None
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float) -> None:
+        """Record a single duration."""
+        value = max(0.0, float(seconds))
+        index = bisect.bisect_left(self._bounds, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._count += 1
+            self._sum += value
+            self._min = value if self._min is None else min(self._min, value)
+            self._max = value if self._max is None else max(self._max, value)
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    def percentile(self, fraction: float) -> float | None:
+        """Estimate the *fraction* quantile (``0.95`` → p95) from bucket bounds."""
+        with self._lock:
+            return self._percentile_locked(fraction)
+
+    def _percentile_locked(self, fraction: float) -> float | None:
+        if self._count == 0:
+            return None
+        target = max(1, int(round(min(max(fraction, 0.0), 1.0) * self._count)))
+        seen = 0
+        for index, bucket_count in enumerate(self._counts):
+            seen += bucket_count
+            if seen >= target:
+                if index < len(self._bounds):
+                    return min(self._bounds[index], self._max or self._bounds[index])
+                return self._max
+        return self._max
+
+    def snapshot(self) -> dict[str, object]:
+        """Return a JSON-serializable summary of the histogram."""
+        with self._lock:
+            buckets: dict[str, int] = {}
+            cumulative = 0
+            for bound, bucket_count in zip(self._bounds, self._counts, strict=False):
+                cumulative += bucket_count
+                buckets[f"{bound:g}"] = cumulative
+            buckets["+Inf"] = self._count
+            return {
+                "count": self._count,
+                "sum": round(self._sum, 6),
+                "min": self._min,
+                "max": self._max,
+                "mean": (self._sum / self._count) if self._count else None,
+                "p50": self._percentile_locked(0.50),
+                "p95": self._percentile_locked(0.95),
+                "p99": self._percentile_locked(0.99),
+                "buckets": buckets,
+            }
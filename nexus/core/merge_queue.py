@@ -1,17 +1,96 @@
 """Merge queue enqueue/worker logic extracted from inbox_processor."""
 
+from __future__ import annotations
+
 import asyncio
 import logging
 import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any
 from urllib.parse import urlparse
 
 from nexus.adapters.git.utils import build_issue_url
+from nexus.core.latency_metrics import LatencyHistogram
 
 logger = logging.getLogger(__name__)
 
 _last_merge_queue_run_at = 0.0
 _MERGE_QUEUE_RUN_INTERVAL = max(30, int(os.getenv("NEXUS_MERGE_QUEUE_INTERVAL_SECONDS", "60")))
+_MERGE_QUEUE_MAX_WORKERS = max(1, int(os.getenv("NEXUS_MERGE_QUEUE_MAX_WORKERS", "4")))
+
+_BLOCKING_ERROR_MARKERS = (
+    "review",
+    "check",
+    "required",
+    "conflict",
+    "pipeline",
+    "not mergeable",
+    "unsupported",
+    "missing_repo",
+    "requester token",
+)
+
+
+class _MergeQueueMetrics:
+    """Process-wide merge outcome counters and latency histograms."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._outcomes: dict[str, int] = {}
+            self._cycles = 0
+            self._last_cycle: dict[str, Any] = {}
+            self._merge_latency = LatencyHistogram()
+            self._cycle_duration = LatencyHistogram()
+
+    def record_merge(self, status: str, seconds: float) -> None:
+        self._merge_latency.observe(seconds)
+        with self._lock:
+            self._outcomes[status] = self._outcomes.get(status, 0) + 1
+
+    def record_cycle(self, *, candidates: int, repos: int, seconds: float) -> None:
+        self._cycle_duration.observe(seconds)
+        with self._lock:
+            self._cycles += 1
+            self._last_cycle = {
+                "candidates": candidates,
+                "repos": repos,
+                "duration_seconds": round(seconds, 6),
+                "finished_at": time.time(),
+            }
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            outcomes = dict(self._outcomes)
+            cycles = self._cycles
+            last_cycle = dict(self._last_cycle)
+        return {
+            "cycles": cycles,
+            "outcomes": outcomes,
+            "last_cycle": last_cycle,
+            "merge_latency_seconds": self._merge_latency.snapshot(),
+            "cycle_duration_seconds": self._cycle_duration.snapshot(),
+        }
+
+
+_METRICS = _MergeQueueMetrics()
+
+# Merge outcomes whose queue update could not be written yet, keyed by PR URL.
+# They are retried at the start of the next cycle; until then the PRs are kept
+# out of the pending list so an already-merged PR is not attempted again.
+_UNPERSISTED_RESULTS: dict[str, dict[str, Any]] = {}
+_UNPERSISTED_LOCK = threading.Lock()
+
+
+def get_merge_queue_metrics() -> dict[str, Any]:
+    """Return merge outcome counts plus merge/cycle latency histograms."""
+    return _METRICS.snapshot()
 
 
 def _project_config() -> dict:
@@ -232,125 +311,225 @@ def merge_queue_auto_merge_once_with_token_resolver(
     if not isinstance(queue, dict) or not queue:
         return
 
+    unpersisted = _persist_results(state_manager, {})
     pending = [
         item
         for item in queue.values()
         if isinstance(item, dict)
+        and item.get("pr_url") not in unpersisted
         and str(item.get("status", "")).lower() == "pending_auto_merge"
         and (
             str(item.get("review_mode", "")).lower() == "auto" or bool(item.get("manual_override"))
         )
     ]
+    if not pending:
+        return
     pending.sort(key=lambda item: float(item.get("created_at", 0.0)))
 
+    # FIFO lanes per repository: repos merge in parallel, PRs within a repo in order.
+    lanes: dict[str, list[_MergeCandidate]] = {}
     for item in pending:
+        candidate = _MergeCandidate.from_item(item)
+        lanes.setdefault(candidate.repo_name or candidate.pr_url, []).append(candidate)
+
+    started = time.monotonic()
+    outcomes: list[_MergeOutcome] = []
+
+    def _run_lane(lane: list[_MergeCandidate]) -> list[_MergeOutcome]:
+        return [
+            _attempt_merge(
+                candidate,
+                resolve_issue_token=resolve_issue_token,
+                require_issue_requester_token=require_issue_requester_token,
+            )
+            for candidate in lane
+        ]
+
+    if len(lanes) == 1:
+        outcomes.extend(_run_lane(next(iter(lanes.values()))))
+    else:
+        with ThreadPoolExecutor(
+            max_workers=min(_MERGE_QUEUE_MAX_WORKERS, len(lanes)),
+            thread_name_prefix="nexus-merge-queue",
+        ) as executor:
+            for lane_outcomes in executor.map(_run_lane, lanes.values()):
+                outcomes.extend(lane_outcomes)
+
+    _persist_results(
+        state_manager, {outcome.candidate.pr_url: outcome.changes for outcome in outcomes}
+    )
+
+    for outcome in outcomes:
+        if outcome.alert:
+            _emit_alert(
+                outcome.alert,
+                severity=outcome.severity,
+                source="merge_queue",
+                issue_number=outcome.candidate.issue_num or None,
+                project_key=outcome.candidate.project_name or None,
+            )
+
+    _METRICS.record_cycle(
+        candidates=len(outcomes),
+        repos=len(lanes),
+        seconds=time.monotonic() - started,
+    )
+
+
+def _persist_results(state_manager, updates: dict[str, dict[str, Any]]) -> set[str]:
+    """Write *updates* plus earlier unpersisted results; return PR URLs still unwritten.
+
+    Tries one batched write first and falls back to per-candidate writes, so
+    a single bad entry cannot lose the whole cycle's outcomes.
+    """
+    with _UNPERSISTED_LOCK:
+        pending = {**_UNPERSISTED_RESULTS, **updates}
+        _UNPERSISTED_RESULTS.clear()
+    if not pending:
+        return set()
+    try:
+        state_manager.update_merge_candidates(pending)
+        return set()
+    except Exception as exc:
+        logger.error(
+            "Could not persist %d merge queue results in one write, retrying per candidate: %s",
+            len(pending),
+            exc,
+        )
+
+    failed: dict[str, dict[str, Any]] = {}
+    for pr_url, changes in pending.items():
+        try:
+            state_manager.update_merge_candidate(pr_url, **changes)
+        except Exception as exc:
+            logger.error("Could not persist merge queue result for %s: %s", pr_url, exc)
+            failed[pr_url] = changes
+    with _UNPERSISTED_LOCK:
+        for pr_url, changes in failed.items():
+            _UNPERSISTED_RESULTS.setdefault(pr_url, changes)
+        return set(_UNPERSISTED_RESULTS)
+
+
+@dataclass
+class _MergeCandidate:
+    pr_url: str
+    issue_num: str
+    project_name: str
+    repo_name: str
+    platform_type: str
+    pr_number: str | None
+
+    @classmethod
+    def from_item(cls, item: dict) -> _MergeCandidate:
         pr_url = str(item.get("pr_url") or "").strip()
-        issue_num = str(item.get("issue") or "").strip()
         project_name = str(item.get("project") or "").strip()
         repo_name = str(item.get("repo") or "").strip()
         platform_type = str(_get_project_platform(project_name) or "github").strip().lower()
+        parsed = (
+            _parse_gitlab_mr_url(pr_url)
+            if platform_type == "gitlab"
+            else _parse_github_pr_url(pr_url)
+        )
         pr_number: str | None = None
+        if parsed:
+            parsed_repo, pr_number = parsed
+            if not repo_name:
+                repo_name = parsed_repo
+        return cls(
+            pr_url=pr_url,
+            issue_num=str(item.get("issue") or "").strip(),
+            project_name=project_name,
+            repo_name=repo_name,
+            platform_type=platform_type,
+            pr_number=pr_number,
+        )
 
-        if platform_type == "gitlab":
-            parsed_gl = _parse_gitlab_mr_url(pr_url)
-            if parsed_gl:
-                parsed_repo, pr_number = parsed_gl
-                if not repo_name:
-                    repo_name = parsed_repo
-        else:
-            parsed_gh = _parse_github_pr_url(pr_url)
-            if parsed_gh:
-                parsed_repo, pr_number = parsed_gh
-                if not repo_name:
-                    repo_name = parsed_repo
-
-        if not pr_number:
-            state_manager.update_merge_candidate(
-                pr_url,
-                status="blocked",
-                last_error="unsupported_pr_url",
-            )
-            continue
 
-        state_manager.update_merge_candidate(pr_url, status="merging", last_error="")
-        try:
-            if not repo_name:
-                raise RuntimeError("missing_repo")
-            token_override = (
-                resolve_issue_token(str(project_name), str(repo_name), str(issue_num))
-                if callable(resolve_issue_token)
-                else None
-            )
-            if require_issue_requester_token and not token_override:
-                raise PermissionError(
-                    f"No requester token available for {project_name}/{repo_name} issue #{issue_num}"
-                )
-            platform = _get_git_platform(
-                repo_name,
-                project_name=project_name or None,
-                token_override=token_override,
-            )
-            merge_output = asyncio.run(
-                platform.merge_pull_request(
-                    pr_number,
-                    squash=True,
-                    delete_branch=True,
-                    auto=True,
-                )
-            )
-        except Exception as exc:
-            error_text = str(exc).strip()[:500]
-            lowered = error_text.lower()
-            status = (
-                "blocked"
-                if any(
-                    token in lowered
-                    for token in (
-                        "review",
-                        "check",
-                        "required",
-                        "conflict",
-                        "pipeline",
-                        "not mergeable",
-                        "unsupported",
-                        "missing_repo",
-                        "requester token",
-                    )
-                )
-                else "failed"
-            )
-            state_manager.update_merge_candidate(
-                pr_url,
-                status=status,
-                last_error=error_text or "merge_error",
-                merge_command=f"{platform_type}:merge_pull_request {pr_number}",
+@dataclass
+class _MergeOutcome:
+    candidate: _MergeCandidate
+    changes: dict[str, Any]
+    alert: str = ""
+    severity: str = "info"
+
+
+def _attempt_merge(
+    candidate: _MergeCandidate,
+    *,
+    resolve_issue_token=None,
+    require_issue_requester_token: bool = False,
+) -> _MergeOutcome:
+    """Merge one candidate and describe the resulting queue-entry changes."""
+    if not candidate.pr_number:
+        _METRICS.record_merge("blocked", 0.0)
+        return _MergeOutcome(
+            candidate=candidate,
+            changes={"status": "blocked", "last_error": "unsupported_pr_url"},
+        )
+
+    pr_number = candidate.pr_number
+    project_name = candidate.project_name
+    repo_name = candidate.repo_name
+    issue_num = candidate.issue_num
+    merge_command = f"{candidate.platform_type}:merge_pull_request {pr_number}"
+    started = time.monotonic()
+    try:
+        if not repo_name:
+            raise RuntimeError("missing_repo")
+        token_override = (
+            resolve_issue_token(str(project_name), str(repo_name), str(issue_num))
+            if callable(resolve_issue_token)
+            else None
+        )
+        if require_issue_requester_token and not token_override:
+            raise PermissionError(
+                f"No requester token available for {project_name}/{repo_name} issue #{issue_num}"
             )
-            _emit_alert(
-                (
-                    f"⚠️ Merge queue could not merge PR for issue #{issue_num}: {pr_url}\n"
-                    f"Status: {status}\n"
-                    f"Reason: {error_text or 'merge_error'}"
-                ),
-                severity="warning",
-                source="merge_queue",
-                issue_number=issue_num or None,
-                project_key=project_name or None,
+        platform = _get_git_platform(
+            repo_name,
+            project_name=project_name or None,
+            token_override=token_override,
+        )
+        merge_output = asyncio.run(
+            platform.merge_pull_request(
+                pr_number,
+                squash=True,
+                delete_branch=True,
+                auto=True,
             )
-            continue
-
-        state_manager.update_merge_candidate(
-            pr_url,
-            status="merged",
-            last_error="",
-            manual_override=False,
-            merged_at=time.time(),
-            merge_command=f"{platform_type}:merge_pull_request {pr_number}",
-            merge_result=(merge_output or "")[:500],
         )
-        _emit_alert(
-            f"✅ Merge queue merged PR for issue #{issue_num}: {pr_url}",
-            severity="info",
-            source="merge_queue",
-            issue_number=issue_num or None,
-            project_key=project_name or None,
+    except Exception as exc:
+        error_text = str(exc).strip()[:500]
+        lowered = error_text.lower()
+        status = (
+            "blocked" if any(token in lowered for token in _BLOCKING_ERROR_MARKERS) else "failed"
+        )
+        _METRICS.record_merge(status, time.monotonic() - started)
+        return _MergeOutcome(
+            candidate=candidate,
+            changes={
+                "status": status,
+                "last_error": error_text or "merge_error",
+                "merge_command": merge_command,
+            },
+            alert=(
+                f"⚠️ Merge queue could not merge PR for issue #{issue_num}: {candidate.pr_url}\n"
+                f"Status: {status}\n"
+                f"Reason: {error_text or 'merge_error'}"
+            ),
+            severity="warning",
         )
+
+    _METRICS.record_merge("merged", time.monotonic() - started)
+    return _MergeOutcome(
+        candidate=candidate,
+        changes={
+            "status": "merged",
+            "last_error": "",
+            "manual_override": False,
+            "merged_at": time.time(),
+            "merge_command": merge_command,
+            "merge_result": (merge_output or "")[:500],
+        },
+        alert=f"✅ Merge queue merged PR for issue #{issue_num}: {candidate.pr_url}",
+    )
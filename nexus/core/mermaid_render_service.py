@@ -1,14 +1,32 @@
-"""Mermaid diagram rendering service for the /visualize command."""
+"""Mermaid diagram rendering service for the /visualize command.
+
+PNG rendering goes through :class:`MermaidRenderService`, which keys results by
+a content hash of the diagram source (memory LRU plus an optional disk tier),
+collapses concurrent requests for the same diagram, caps the number of
+simultaneous renders, and keeps one long-lived headless browser (driven through
+the installed ``@mermaid-js/mermaid-cli`` package) warm across requests.  When
+the warm renderer cannot be started the service falls back to spawning ``mmdc``
+per diagram.
+"""
 
 from __future__ import annotations
 
 import asyncio
+import base64
 import contextlib
+import hashlib
+import json
 import logging
 import os
+import shutil
 import tempfile
+import time
+from collections import OrderedDict
+from pathlib import Path
 from typing import Any
 
+from nexus.core.latency_metrics import LatencyHistogram
+
 logger = logging.getLogger(__name__)
 
 # Status → background fill colour (GitHub dark-mode palette)
@@ -24,6 +42,59 @@ _STATUS_COLOURS: dict[str, str] = {
 }
 
 _MMDC_TIMEOUT = 15  # seconds
+_MMDC_THEME = "dark"
+# Bump when rendering options change so stale cached PNGs are not served.
+_CACHE_VERSION = "1"
+
+_WORKER_START_TIMEOUT = 30  # seconds (first browser launch)
+_WORKER_MAX_START_FAILURES = 3
+_WORKER_STREAM_LIMIT = 32 * 1024 * 1024  # base64 PNG lines can be large
+
+# Long-lived renderer: launches one browser, then answers JSON-line requests
+# ``{"id", "diagram", "theme"}`` on stdin with ``{"id", "png"|"error"}`` on stdout.
+_WORKER_SCRIPT = r"""
+import { createRequire } from 'node:module';
+import { readFileSync } from 'node:fs';
+import { createInterface } from 'node:readline';
+import { pathToFileURL } from 'node:url';
+
+const send = (msg) => process.stdout.write(JSON.stringify(msg) + '\n');
+let browser;
+let renderMermaid;
+try {
+  const root = createRequire(process.env.NEXUS_MERMAID_NODE_MODULES + '/');
+  const cliPath = root.resolve('@mermaid-js/mermaid-cli');
+  ({ renderMermaid } = await import(pathToFileURL(cliPath).href));
+  const puppeteerPath = createRequire(cliPath).resolve('puppeteer');
+  const puppeteer = (await import(pathToFileURL(puppeteerPath).href)).default;
+  const configPath = process.env.NEXUS_MERMAID_PUPPETEER_CONFIG;
+  const launchOptions = configPath ? JSON.parse(readFileSync(configPath, 'utf8')) : {};
+  browser = await puppeteer.launch({ headless: 'new', ...launchOptions });
+} catch (err) {
+  send({ ready: false, error: String((err && err.message) || err) });
+  process.exit(1);
+}
+send({ ready: true });
+
+const lines = createInterface({ input: process.stdin });
+lines.on('line', async (line) => {
+  let id = null;
+  try {
+    const request = JSON.parse(line);
+    id = request.id;
+    const { data } = await renderMermaid(browser, request.diagram, 'png', {
+      mermaidConfig: { theme: request.theme },
+    });
+    send({ id, png: Buffer.from(data).toString('base64') });
+  } catch (err) {
+    send({ id, error: String((err && err.message) || err) });
+  }
+});
+lines.on('close', async () => {
+  await browser.close().catch(() => {});
+  process.exit(0);
+});
+"""
 
 
 def build_mermaid_diagram(steps: list[dict[str, Any]], issue_num: str) -> str:
@@ -81,11 +152,387 @@ def build_mermaid_diagram(steps: list[dict[str, Any]], issue_num: str) -> str:
     return "\n".join(lines)
 
 
-async def render_mermaid_to_png(diagram_text: str) -> bytes | None:
-    """Render a Mermaid diagram string to PNG bytes using mmdc CLI.
+class _WorkerUnavailableError(Exception):
+    """The warm renderer could not serve a request; use the ``mmdc`` CLI instead."""
+
+
+def _find_mermaid_node_modules() -> str | None:
+    """Locate the ``node_modules`` directory that holds ``@mermaid-js/mermaid-cli``."""
+    configured = os.getenv("NEXUS_MERMAID_NODE_MODULES", "").strip()
+    if configured:
+        return configured
+    mmdc = shutil.which("mmdc")
+    if not mmdc:
+        return None
+    for parent in Path(mmdc).resolve().parents:
+        if parent.name == "node_modules" and (parent / "@mermaid-js" / "mermaid-cli").is_dir():
+            return str(parent)
+    return None
+
+
+def _default_worker_command() -> tuple[list[str], dict[str, str]] | None:
+    node = shutil.which("node")
+    node_modules = _find_mermaid_node_modules()
+    if not node or not node_modules:
+        return None
+    env = dict(os.environ, NEXUS_MERMAID_NODE_MODULES=node_modules)
+    return [node, "--input-type=module", "-e", _WORKER_SCRIPT], env
+
+
+class _WarmRenderer:
+    """One long-lived renderer process shared by all requests on an event loop."""
+
+    def __init__(self, command: list[str], env: dict[str, str] | None, timeout: float) -> None:
+        self._command = command
+        self._env = env
+        self._timeout = timeout
+        self._proc: asyncio.subprocess.Process | None = None
+        self._reader: asyncio.Task[None] | None = None
+        self._pending: dict[int, asyncio.Future[dict[str, Any]]] = {}
+        self._next_id = 0
+        self._start_lock = asyncio.Lock()
+        self._start_failures = 0
+        self.disabled = False
+        self.starts = 0
+
+    async def render(self, diagram_text: str, theme: str) -> bytes | None:
+        """Render via the warm process; ``None`` means the diagram itself failed."""
+        proc = await self._ensure_started()
+        self._next_id += 1
+        request_id = self._next_id
+        future: asyncio.Future[dict[str, Any]] = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        try:
+            line = json.dumps({"id": request_id, "diagram": diagram_text, "theme": theme})
+            assert proc.stdin is not None
+            proc.stdin.write(line.encode("utf-8") + b"\n")
+            await proc.stdin.drain()
+            reply = await asyncio.wait_for(future, timeout=self._timeout)
+        except TimeoutError:
+            logger.warning("Warm Mermaid renderer timed out rendering diagram")
+            return None
+        except (BrokenPipeError, ConnectionResetError) as exc:
+            raise _WorkerUnavailableError(str(exc)) from exc
+        finally:
+            self._pending.pop(request_id, None)
+
+        if "png" in reply:
+            return base64.b64decode(reply["png"])
+        logger.warning("Warm Mermaid renderer failed: %s", reply.get("error"))
+        return None
+
+    async def _ensure_started(self) -> asyncio.subprocess.Process:
+        if self.disabled:
+            raise _WorkerUnavailableError("warm renderer disabled")
+        if self._proc is not None and self._proc.returncode is None:
+            return self._proc
+        async with self._start_lock:
+            if self._proc is not None and self._proc.returncode is None:
+                return self._proc
+            try:
+                proc = await self._spawn()
+            except _WorkerUnavailableError as exc:
+                self._start_failures += 1
+                if self._start_failures >= _WORKER_MAX_START_FAILURES:
+                    self.disabled = True
+                    logger.info("Warm Mermaid renderer disabled, using mmdc per diagram: %s", exc)
+                raise
+            self._start_failures = 0
+            self.starts += 1
+            self._proc = proc
+            self._reader = asyncio.create_task(self._read_replies(proc))
+            return proc
+
+    async def _spawn(self) -> asyncio.subprocess.Process:
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *self._command,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+                env=self._env,
+                limit=_WORKER_STREAM_LIMIT,
+            )
+        except OSError as exc:
+            self.disabled = True
+            raise _WorkerUnavailableError(str(exc)) from exc
+
+        assert proc.stdout is not None
+        try:
+            first = await asyncio.wait_for(proc.stdout.readline(), timeout=_WORKER_START_TIMEOUT)
+            hello = json.loads(first or b"{}")
+        except (TimeoutError, ValueError) as exc:
+            hello = {"error": str(exc) or type(exc).__name__}
+        if not hello.get("ready"):
+            with contextlib.suppress(ProcessLookupError):
+                proc.kill()
+            await proc.wait()
+            raise _WorkerUnavailableError(
+                str(hello.get("error") or "renderer exited during startup")
+            )
+        return proc
+
+    async def _read_replies(self, proc: asyncio.subprocess.Process) -> None:
+        assert proc.stdout is not None
+        try:
+            while line := await proc.stdout.readline():
+                try:
+                    reply = json.loads(line)
+                except ValueError:
+                    continue
+                future = self._pending.get(reply.get("id"))
+                if future is not None and not future.done():
+                    future.set_result(reply)
+        finally:
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(_WorkerUnavailableError("renderer process exited"))
+            if self._proc is proc:
+                self._proc = None
+
+    async def close(self) -> None:
+        proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        if proc.stdin is not None:
+            proc.stdin.close()
+        try:
+            await asyncio.wait_for(proc.wait(), timeout=5)
+        except TimeoutError:
+            with contextlib.suppress(ProcessLookupError):
+                proc.kill()
+            await proc.wait()
+        if self._reader is not None:
+            with contextlib.suppress(Exception):
+                await self._reader
+
+    def kill(self) -> None:
+        """Best-effort synchronous stop (used when the owning event loop is gone)."""
+        if self._proc is not None and self._proc.returncode is None:
+            with contextlib.suppress(ProcessLookupError):
+                self._proc.kill()
+        self._proc = None
+
+
+class MermaidRenderService:
+    """Render Mermaid diagrams to PNG with caching and a bounded, warm renderer.
+
+    Args:
+        max_entries: PNGs kept in the in-memory LRU.
+        max_bytes: Total PNG bytes kept in the in-memory LRU.
+        cache_dir: Optional directory for the on-disk cache tier.
+        max_concurrency: Maximum renders (browser pages / ``mmdc`` processes)
+            in flight at once.
+        warm_renderer: Keep a long-lived renderer process instead of spawning
+            ``mmdc`` for every diagram.
+        worker_command: Override the warm renderer command (tests); defaults to
+            ``node`` driving the installed ``@mermaid-js/mermaid-cli`` package.
+        timeout: Per-diagram render timeout in seconds.
+    """
 
-    Returns None if mmdc is unavailable or rendering fails; callers should
-    fall back to sending the raw diagram as a code block.
+    def __init__(
+        self,
+        *,
+        max_entries: int = 256,
+        max_bytes: int = 32 * 1024 * 1024,
+        cache_dir: str | None = None,
+        max_concurrency: int = 2,
+        warm_renderer: bool = True,
+        worker_command: list[str] | None = None,
+        timeout: float = _MMDC_TIMEOUT,
+    ) -> None:
+        self._max_entries = max(0, int(max_entries))
+        self._max_bytes = max(0, int(max_bytes))
+        self._cache_dir = Path(cache_dir) if cache_dir else None
+        self._max_concurrency = max(1, int(max_concurrency))
+        self._warm_enabled = warm_renderer
+        self._worker_command = worker_command
+        self._timeout = timeout
+        self._memory: OrderedDict[str, bytes] = OrderedDict()
+        self._memory_bytes = 0
+        self._cli_missing = False
+        # Event-loop bound state, rebuilt if the service is used from a new loop.
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+        self._inflight: dict[str, asyncio.Future[bytes | None]] = {}
+        self._warm: _WarmRenderer | None = None
+        self._render_seconds = LatencyHistogram()
+        self.stats = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "coalesced": 0,
+            "renders": 0,
+            "warm_renders": 0,
+            "cli_renders": 0,
+            "failures": 0,
+        }
+
+    @staticmethod
+    def cache_key(diagram_text: str, theme: str = _MMDC_THEME) -> str:
+        payload = f"{_CACHE_VERSION}\0{theme}\0{diagram_text}".encode()
+        return hashlib.sha256(payload).hexdigest()
+
+    async def render(self, diagram_text: str) -> bytes | None:
+        """Return PNG bytes for *diagram_text*, or ``None`` if rendering fails."""
+        loop = self._bind_loop()
+        key = self.cache_key(diagram_text)
+        cached = self._memory_get(key)
+        if cached is not None:
+            self.stats["memory_hits"] += 1
+            return cached
+
+        pending = self._inflight.get(key)
+        if pending is not None:
+            self.stats["coalesced"] += 1
+            return await asyncio.shield(pending)
+
+        future: asyncio.Future[bytes | None] = loop.create_future()
+        self._inflight[key] = future
+        png: bytes | None = None
+        try:
+            png = await asyncio.to_thread(self._disk_get, key)
+            if png is not None:
+                self.stats["disk_hits"] += 1
+            else:
+                png = await self._render_uncached(diagram_text)
+                if png is not None:
+                    await asyncio.to_thread(self._disk_put, key, png)
+            if png is not None:
+                self._memory_put(key, png)
+            return png
+        finally:
+            self._inflight.pop(key, None)
+            if not future.done():
+                future.set_result(png)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return cache counters and the render latency histogram."""
+        return {
+            **self.stats,
+            "memory_entries": len(self._memory),
+            "memory_bytes": self._memory_bytes,
+            "warm_renderer_starts": self._warm.starts if self._warm else 0,
+            "render_seconds": self._render_seconds.snapshot(),
+        }
+
+    async def close(self) -> None:
+        """Stop the warm renderer process (cached PNGs are kept)."""
+        if self._warm is not None:
+            await self._warm.close()
+
+    # ------------------------------------------------------------------
+    # Rendering
+    # ------------------------------------------------------------------
+
+    def _bind_loop(self) -> asyncio.AbstractEventLoop:
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            if self._warm is not None:
+                self._warm.kill()
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+            self._inflight = {}
+            self._warm = None
+            if self._warm_enabled:
+                if self._worker_command is not None:
+                    command: tuple[list[str], dict[str, str] | None] | None = (
+                        self._worker_command,
+                        None,
+                    )
+                else:
+                    command = _default_worker_command()
+                if command is not None:
+                    self._warm = _WarmRenderer(command[0], command[1], self._timeout)
+        return loop
+
+    async def _render_uncached(self, diagram_text: str) -> bytes | None:
+        assert self._semaphore is not None
+        async with self._semaphore:
+            started = time.monotonic()
+            png = await self._render_with_backends(diagram_text)
+            self._render_seconds.observe(time.monotonic() - started)
+        self.stats["renders" if png is not None else "failures"] += 1
+        return png
+
+    async def _render_with_backends(self, diagram_text: str) -> bytes | None:
+        if self._warm is not None and not self._warm.disabled:
+            try:
+                png = await self._warm.render(diagram_text, _MMDC_THEME)
+            except _WorkerUnavailableError as exc:
+                logger.debug("Warm Mermaid renderer unavailable: %s", exc)
+            else:
+                if png is not None:
+                    self.stats["warm_renders"] += 1
+                return png
+        if self._cli_missing:
+            return None
+        png = await _render_with_cli(diagram_text, timeout=self._timeout)
+        if png is _MMDC_MISSING:
+            self._cli_missing = True
+            return None
+        if png is not None:
+            self.stats["cli_renders"] += 1
+        return png
+
+    # ------------------------------------------------------------------
+    # Cache tiers
+    # ------------------------------------------------------------------
+
+    def _memory_get(self, key: str) -> bytes | None:
+        png = self._memory.get(key)
+        if png is not None:
+            self._memory.move_to_end(key)
+        return png
+
+    def _memory_put(self, key: str, png: bytes) -> None:
+        if self._max_entries == 0 or len(png) > self._max_bytes:
+            return
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_bytes -= len(previous)
+        self._memory[key] = png
+        self._memory_bytes += len(png)
+        while len(self._memory) > self._max_entries or self._memory_bytes > self._max_bytes:
+            _old_key, old_png = self._memory.popitem(last=False)
+            self._memory_bytes -= len(old_png)
+
+    def _disk_path(self, key: str) -> Path | None:
+        if self._cache_dir is None:
+            return None
+        return self._cache_dir / key[:2] / f"{key}.png"
+
+    def _disk_get(self, key: str) -> bytes | None:
+        path = self._disk_path(key)
+        if path is None:
+            return None
+        try:
+            png = path.read_bytes()
+        except OSError:
+            return None
+        return png or None
+
+    def _disk_put(self, key: str, png: bytes) -> None:
+        path = self._disk_path(key)
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(png)
+            os.replace(tmp, path)
+        except OSError as exc:
+            logger.debug("Could not write Mermaid PNG cache entry %s: %s", path, exc)
+
+
+_MMDC_MISSING: Any = object()
+
+
+async def _render_with_cli(diagram_text: str, *, timeout: float = _MMDC_TIMEOUT) -> Any:
+    """Render one diagram with a fresh ``mmdc`` process.
+
+    Returns PNG bytes, ``None`` on failure, or ``_MMDC_MISSING`` when ``mmdc``
+    is not installed.
     """
     tmp_in: str | None = None
     tmp_out: str | None = None
@@ -99,20 +546,17 @@ async def render_mermaid_to_png(diagram_text: str) -> bytes | None:
         with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f_out:
             tmp_out = f_out.name
 
+        args = ["mmdc", "-i", tmp_in, "-o", tmp_out, "-t", _MMDC_THEME, "--quiet"]
+        puppeteer_config = os.getenv("NEXUS_MERMAID_PUPPETEER_CONFIG", "").strip()
+        if puppeteer_config:
+            args.extend(["-p", puppeteer_config])
         proc = await asyncio.create_subprocess_exec(
-            "mmdc",
-            "-i",
-            tmp_in,
-            "-o",
-            tmp_out,
-            "-t",
-            "dark",
-            "--quiet",
+            *args,
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE,
         )
         try:
-            await asyncio.wait_for(proc.communicate(), timeout=_MMDC_TIMEOUT)
+            await asyncio.wait_for(proc.communicate(), timeout=timeout)
         except TimeoutError:
             proc.kill()
             try:
@@ -135,7 +579,7 @@ async def render_mermaid_to_png(diagram_text: str) -> bytes | None:
 
     except FileNotFoundError:
         logger.info("mmdc not found; falling back to text diagram")
-        return None
+        return _MMDC_MISSING
     except Exception as exc:
         logger.warning("Unexpected error rendering Mermaid diagram: %s", exc)
         return None
@@ -144,3 +588,30 @@ async def render_mermaid_to_png(diagram_text: str) -> bytes | None:
             if tmp and os.path.exists(tmp):
                 with contextlib.suppress(OSError):
                     os.unlink(tmp)
+
+
+_renderer: MermaidRenderService | None = None
+
+
+def get_mermaid_renderer() -> MermaidRenderService:
+    """Return the process-wide renderer configured from ``NEXUS_MERMAID_*`` env vars."""
+    global _renderer
+    if _renderer is None:
+        _renderer = MermaidRenderService(
+            max_entries=int(os.getenv("NEXUS_MERMAID_CACHE_ENTRIES", "256")),
+            cache_dir=os.getenv("NEXUS_MERMAID_CACHE_DIR", "").strip() or None,
+            max_concurrency=int(os.getenv("NEXUS_MERMAID_MAX_CONCURRENCY", "2")),
+            warm_renderer=os.getenv("NEXUS_MERMAID_WARM_RENDERER", "true").strip().lower()
+            not in {"0", "false", "no", "off"},
+        )
+    return _renderer
+
+
+async def render_mermaid_to_png(diagram_text: str) -> bytes | None:
+    """Render a Mermaid diagram string to PNG bytes.
+
+    Results are cached by diagram content.  Returns None if no renderer is
+    available or rendering fails; callers should fall back to sending the raw
+    diagram as a code block.
+    """
+    return await get_mermaid_renderer().render(diagram_text)
@@ -1,6 +1,8 @@
 """Core data models for Nexus workflows."""
 
+import sys
 import uuid
+import weakref
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import Enum
@@ -75,9 +77,13 @@ class ApprovalGate:
         )
 
 
-@dataclass
+@dataclass(slots=True, weakref_slot=True)
 class Agent:
-    """AI agent definition."""
+    """AI agent definition.
+
+    Instances returned by :func:`shared_agent` are referenced by many steps
+    and workflows; treat agents as read-only once attached to a step.
+    """
 
     name: str
     display_name: str
@@ -94,7 +100,48 @@ class Agent:
         return hash(self.name)
 
 
-@dataclass
+_SHARED_AGENTS: "weakref.WeakValueDictionary[tuple[Any, ...], Agent]" = (
+    weakref.WeakValueDictionary()
+)
+
+
+def shared_agent(
+    name: str,
+    display_name: str,
+    description: str,
+    provider_preference: str | None = None,
+    timeout: int = 600,
+    max_retries: int = 3,
+    allowed_tools: list[str] | None = None,
+) -> Agent:
+    """Return an :class:`Agent` with these fields, reusing a live instance when possible.
+
+    Workflows built from the same definition repeat a handful of agents across
+    every step; sharing them keeps one object per distinct agent in memory.
+    """
+    tools = tuple(allowed_tools or ())
+    key = (name, display_name, description, provider_preference, timeout, max_retries, tools)
+    try:
+        agent = _SHARED_AGENTS.get(key)
+    except TypeError:  # unhashable field values: fall back to a private instance
+        return Agent(
+            name, display_name, description, provider_preference, timeout, max_retries, list(tools)
+        )
+    if agent is None:
+        agent = Agent(
+            sys.intern(name) if isinstance(name, str) else name,
+            display_name,
+            description,
+            provider_preference,
+            timeout,
+            max_retries,
+            list(tools),
+        )
+        _SHARED_AGENTS[key] = agent
+    return agent
+
+
+@dataclass(slots=True)
 class WorkflowStep:
     """Single step in a workflow execution."""
 
@@ -149,7 +196,7 @@ class WorkflowStep:
         return list(set(restrictions))  # Deduplicate
 
 
-@dataclass
+@dataclass(slots=True, weakref_slot=True)
 class Workflow:
     """Complete workflow definition and state."""
 
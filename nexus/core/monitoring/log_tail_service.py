@@ -0,0 +1,269 @@
+"""Shared, offset-based log followers for the chat ``/tail`` command.
+
+One :class:`IssueLogFollower` per issue reads the last lines of the latest log
+by seeking from the end of the file, then only reads bytes appended after its
+offset (a ``stat()`` per poll, no read when the file did not grow).  Every chat
+session tailing the same issue subscribes to that follower and receives the
+new lines as deltas; when a newer log appears for the issue (next agent run)
+or the file is truncated, subscribers are reset to the new file's tail.
+"""
+
+import asyncio
+import logging
+import os
+from collections import deque
+from collections.abc import Callable, Hashable
+
+logger = logging.getLogger(__name__)
+
+_READ_CHUNK = 64 * 1024
+# Most bytes one poll reads; a larger burst is skipped to its last part, since
+# subscribers only ever show the final MAX_TAIL_LINES lines anyway.
+_MAX_POLL_READ = 16 * _READ_CHUNK
+# Upper bound on lines a follower keeps; /tail accepts at most 200.
+MAX_TAIL_LINES = 200
+
+
+def read_last_lines(path: str, max_lines: int) -> tuple[list[str], int]:
+    """Return the last *max_lines* complete lines of *path* and the offset after them.
+
+    Reads backwards in fixed-size chunks so the cost depends on the size of the
+    tail, not of the file.
+    """
+    with open(path, "rb") as handle:
+        handle.seek(0, os.SEEK_END)
+        end = handle.tell()
+        position = end
+        data = b""
+        while position > 0 and data.count(b"\n") <= max_lines:
+            step = min(_READ_CHUNK, position)
+            position -= step
+            handle.seek(position)
+            data = handle.read(step) + data
+    # A trailing line without its newline is still being written; the follower
+    # picks it up once it is complete.
+    complete = data[: data.rfind(b"\n") + 1]
+    lines = complete.decode("utf-8", "replace").splitlines()
+    return lines[-max_lines:] if max_lines > 0 else [], end - (len(data) - len(complete))
+
+
+class LogTailSubscription:
+    """Per-session window over a follower's lines."""
+
+    def __init__(self, follower: "IssueLogFollower", max_lines: int) -> None:
+        self._follower = follower
+        self.max_lines = max(1, int(max_lines))
+        self.lines: deque[str] = deque(maxlen=self.max_lines)
+        self.log_name: str | None = None
+        self._changed = asyncio.Event()
+        self.closed = False
+
+    def push(self, lines: list[str], *, log_name: str | None, reset: bool = False) -> None:
+        if reset:
+            self.lines.clear()
+            self.log_name = log_name
+        self.lines.extend(lines)
+        if lines or reset:
+            self._changed.set()
+
+    async def wait_for_update(self, timeout: float) -> bool:
+        """Wait up to *timeout* seconds for new lines; return whether any arrived."""
+        try:
+            await asyncio.wait_for(self._changed.wait(), timeout)
+        except TimeoutError:
+            return False
+        self._changed.clear()
+        return True
+
+    def render(self) -> list[str]:
+        prefix = f"[{self.log_name}] " if self.log_name else ""
+        return [f"{prefix}{line}" for line in self.lines]
+
+    def close(self) -> None:
+        if not self.closed:
+            self.closed = True
+            self._follower.unsubscribe(self)
+
+
+class IssueLogFollower:
+    """Follows the latest log for one issue and fans new lines out to subscribers.
+
+    Args:
+        resolve_path: Returns the issue's current latest log path (or ``None``).
+        poll_interval: Seconds between ``stat()`` checks of the followed file.
+        resolve_interval: Seconds between re-resolving which file to follow.
+        on_idle: Called once the last subscriber leaves.
+    """
+
+    def __init__(
+        self,
+        resolve_path: Callable[[], str | None],
+        *,
+        poll_interval: float = 1.0,
+        resolve_interval: float = 5.0,
+        on_idle: Callable[["IssueLogFollower"], None] | None = None,
+    ) -> None:
+        self.resolve_path = resolve_path
+        self.poll_interval = max(0.05, float(poll_interval))
+        self.resolve_interval = max(self.poll_interval, float(resolve_interval))
+        self._on_idle = on_idle
+        self.path: str | None = None
+        self._offset = 0
+        self._inode: int | None = None
+        self._partial = b""
+        self._resyncing = False
+        self._history: deque[str] = deque(maxlen=MAX_TAIL_LINES)
+        self._subscribers: list[LogTailSubscription] = []
+        self._task: asyncio.Task | None = None
+        self.stats = {"polls": 0, "bytes_read": 0, "switches": 0}
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def subscribe(self, max_lines: int) -> LogTailSubscription:
+        subscription = LogTailSubscription(self, max_lines)
+        if self.path is None:
+            self.refresh(resolve=True)
+        subscription.push(list(self._history), log_name=self._log_name(), reset=True)
+        self._subscribers.append(subscription)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        return subscription
+
+    def unsubscribe(self, subscription: LogTailSubscription) -> None:
+        if subscription in self._subscribers:
+            self._subscribers.remove(subscription)
+        if not self._subscribers:
+            if self._task is not None and self._task is not asyncio.current_task():
+                self._task.cancel()
+            self._task = None
+            if self._on_idle is not None:
+                self._on_idle(self)
+
+    def refresh(self, *, resolve: bool = False) -> None:
+        """Switch files if a newer log exists, then read any appended bytes."""
+        self.stats["polls"] += 1
+        if resolve:
+            try:
+                latest = self.resolve_path()
+            except Exception as exc:
+                logger.warning("Failed to resolve tail log path: %s", exc)
+                latest = self.path
+            if latest and latest != self.path:
+                self._switch_to(latest)
+                return
+        if self.path is None:
+            return
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return
+        if stat.st_ino != self._inode or stat.st_size < self._offset:
+            # Rotated or truncated in place: start over from the new tail.
+            self._switch_to(self.path)
+            return
+        if stat.st_size == self._offset:
+            return
+        if stat.st_size - self._offset > _MAX_POLL_READ:
+            self._offset = stat.st_size - _MAX_POLL_READ
+            self._partial = b""
+            self._resyncing = True
+        try:
+            with open(self.path, "rb") as handle:
+                handle.seek(self._offset)
+                data = handle.read(stat.st_size - self._offset)
+        except OSError as exc:
+            logger.warning("Failed to read appended log bytes from %s: %s", self.path, exc)
+            return
+        self._offset += len(data)
+        self.stats["bytes_read"] += len(data)
+        buffer = self._partial + data
+        if self._resyncing:
+            # After skipping part of a burst, drop bytes up to the next line start.
+            cut = buffer.find(b"\n")
+            if cut < 0:
+                self._partial = b""
+                return
+            buffer = buffer[cut + 1 :]
+            self._resyncing = False
+        complete, newline, self._partial = buffer.rpartition(b"\n")
+        if not newline:
+            return
+        lines = complete.decode("utf-8", "replace").splitlines()
+        self._history.extend(lines)
+        for subscription in list(self._subscribers):
+            subscription.push(lines, log_name=self._log_name())
+
+    def _switch_to(self, path: str) -> None:
+        try:
+            lines, end = read_last_lines(path, MAX_TAIL_LINES)
+            inode = os.stat(path).st_ino
+        except OSError as exc:
+            logger.warning("Failed to open tail log %s: %s", path, exc)
+            return
+        if self.path is not None:
+            self.stats["switches"] += 1
+        self.path, self._offset, self._inode, self._partial = path, end, inode, b""
+        self._resyncing = False
+        self._history.clear()
+        self._history.extend(lines)
+        for subscription in list(self._subscribers):
+            subscription.push(lines, log_name=self._log_name(), reset=True)
+
+    def _log_name(self) -> str | None:
+        return os.path.basename(self.path) if self.path else None
+
+    async def _run(self) -> None:
+        elapsed = 0.0
+        try:
+            while self._subscribers:
+                await asyncio.sleep(self.poll_interval)
+                elapsed += self.poll_interval
+                resolve = elapsed >= self.resolve_interval
+                if resolve:
+                    elapsed = 0.0
+                self.refresh(resolve=resolve)
+        except asyncio.CancelledError:
+            pass
+
+
+class LogTailHub:
+    """Registry of issue followers shared by all chat tail sessions."""
+
+    def __init__(self, *, poll_interval: float = 1.0, resolve_interval: float = 5.0) -> None:
+        self.poll_interval = poll_interval
+        self.resolve_interval = resolve_interval
+        self._followers: dict[Hashable, IssueLogFollower] = {}
+
+    def subscribe(
+        self, key: Hashable, resolve_path: Callable[[], str | None], *, max_lines: int
+    ) -> LogTailSubscription:
+        follower = self._followers.get(key)
+        if follower is None:
+            follower = IssueLogFollower(
+                resolve_path,
+                poll_interval=self.poll_interval,
+                resolve_interval=self.resolve_interval,
+                on_idle=lambda idle, key=key: self._drop(key, idle),
+            )
+            self._followers[key] = follower
+        return follower.subscribe(max_lines)
+
+    def follower(self, key: Hashable) -> IssueLogFollower | None:
+        return self._followers.get(key)
+
+    def _drop(self, key: Hashable, follower: IssueLogFollower) -> None:
+        if self._followers.get(key) is follower:
+            del self._followers[key]
+
+
+_hub: LogTailHub | None = None
+
+
+def get_log_tail_hub() -> LogTailHub:
+    """Return the hub shared by every tail session in this process."""
+    global _hub
+    if _hub is None:
+        _hub = LogTailHub()
+    return _hub
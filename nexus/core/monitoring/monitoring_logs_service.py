@@ -7,6 +7,7 @@ import time
 from typing import Any
 
 from nexus.adapters.notifications.base import Button
+from nexus.core.monitoring.log_tail_service import get_log_tail_hub
 from nexus.core.utils.log_utils import log_unauthorized_access
 
 
@@ -237,42 +238,20 @@ async def handle_tail(ctx: Any, deps: Any) -> None:
     if not task_file and inbox_backend != "postgres":
         task_file = deps.find_task_file_by_issue(issue_num)
 
-    def _read_tail_lines() -> list[str]:
+    def _resolve_tail_path() -> str | None:
         issue_logs = deps.find_issue_log_files(issue_num, task_file=task_file)
         if issue_logs:
             issue_logs.sort(key=os.path.getmtime, reverse=True)
-            latest = issue_logs[0]
-            try:
-                with open(latest, encoding="utf-8") as handle:
-                    tail_lines = handle.readlines()[-max_lines:]
-                if not tail_lines:
-                    non_empty = [lf for lf in issue_logs if os.path.getsize(lf) > 0]
-                    if non_empty:
-                        latest = non_empty[0]
-                        with open(latest, encoding="utf-8") as handle:
-                            tail_lines = handle.readlines()[-max_lines:]
-                return [f"[{os.path.basename(latest)}] {line.rstrip()}" for line in tail_lines]
-            except Exception as exc:
-                deps.logger.error(f"Error reading log file: {exc}", exc_info=True)
-
-        lines_local = deps.read_latest_log_tail(task_file, max_lines=max_lines)
-        if lines_local:
-            return lines_local
+            non_empty = [lf for lf in issue_logs if os.path.getsize(lf) > 0]
+            return (non_empty or issue_logs)[0]
         logs_dir = deps.get_project_logs_dir(project_key)
-        if logs_dir:
+        if logs_dir and os.path.isdir(logs_dir):
             log_files = [
                 os.path.join(logs_dir, f) for f in os.listdir(logs_dir) if f.endswith(".log")
             ]
             if log_files:
-                log_files.sort(key=os.path.getmtime, reverse=True)
-                latest = log_files[0]
-                try:
-                    with open(latest, encoding="utf-8") as handle:
-                        tail_lines = handle.readlines()[-max_lines:]
-                    return [f"[{os.path.basename(latest)}] {line.rstrip()}" for line in tail_lines]
-                except Exception as exc:
-                    deps.logger.error(f"Error reading log file: {exc}", exc_info=True)
-        return []
+                return max(log_files, key=os.path.getmtime)
+        return None
 
     session_key = (ctx.chat_id, int(ctx.user_id))
     existing_task = deps.active_tail_tasks.get(session_key)
@@ -288,11 +267,16 @@ async def handle_tail(ctx: Any, deps: Any) -> None:
     async def _run_tail_follow() -> None:
         deadline = time.time() + follow_seconds
         previous_text = ""
+        # Sessions tailing the same issue share one follower that reads only
+        # appended bytes; this loop just renders its window of delta lines.
+        subscription = get_log_tail_hub().subscribe(
+            (project_key, issue_num, task_file), _resolve_tail_path, max_lines=max_lines
+        )
         try:
             while True:
                 if deps.active_tail_sessions.get(session_key) != session_token:
                     break
-                lines = _read_tail_lines()
+                lines = subscription.render()
                 text = (
                     f"📋 Live log tail (#{issue_num}, {max_lines} lines):\n" + "\n".join(lines)
                     if lines
@@ -308,10 +292,15 @@ async def handle_tail(ctx: Any, deps: Any) -> None:
                         deps.logger.warning(
                             f"Failed to update tail message for issue #{issue_num}: {exc}"
                         )
-                if time.time() >= deadline:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    break
+                # Throttle chat edits; wake early only when new lines arrived.
+                await asyncio.sleep(min(refresh_seconds, remaining))
+                if not await subscription.wait_for_update(max(0.0, deadline - time.time())):
                     break
-                await asyncio.sleep(refresh_seconds)
         finally:
+            subscription.close()
             if deps.active_tail_sessions.get(session_key) == session_token:
                 deps.active_tail_sessions.pop(session_key, None)
             existing = deps.active_tail_tasks.get(session_key)
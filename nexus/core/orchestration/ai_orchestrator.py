@@ -1,5 +1,8 @@
 """Compatibility wrapper for AI orchestrator backed by nexus-arc plugin."""
 
+import logging
+import time
+from collections import OrderedDict
 from collections.abc import Mapping
 from typing import Any
 
@@ -8,7 +11,12 @@ from nexus.plugins.builtin.ai_runtime_plugin import (
 )
 from .plugin_runtime import clear_cached_plugin, get_profiled_plugin
 
+logger = logging.getLogger(__name__)
+
 _orchestrator: AIOrchestrator | None = None
+# Launches whose outcome was already recorded: (issue, pid, launch timestamp).
+_recorded_outcomes: OrderedDict[tuple[str, int, float], None] = OrderedDict()
+_MAX_RECORDED_OUTCOMES = 4096
 
 
 def _resolve_tasks_logs_dir(workspace: str, project: str | None = None) -> str:
@@ -51,13 +59,24 @@ def get_orchestrator(config: Any | None = None) -> AIOrchestrator:
                 "chat_agent_types_resolver",
                 "fallback_enabled",
                 "rate_limit_ttl",
+                "provider_health_file",
+                "provider_probe_interval",
+                "adaptive_routing",
+                "provider_scoreboard_file",
                 "max_retries",
+                "analysis_cache_ttl",
+                "analysis_cache_entries",
+                "analysis_cache_dir",
+                "analysis_cache_tasks",
                 "analysis_timeout",
                 "refine_description_timeout",
                 "transcription_timeout",
                 "whisper_model",
                 "whisper_language",
                 "whisper_languages",
+                "whisper_pool_workers",
+                "whisper_pool_processes",
+                "whisper_preload",
             )
             for key in keys:
                 val = config.get(key)
@@ -83,3 +102,42 @@ def reset_orchestrator() -> None:
     global _orchestrator
     _orchestrator = None
     clear_cached_plugin("ai:orchestrator")
+
+
+def record_agent_outcome(
+    issue_number: str, *, success: bool, agent_type: str | None = None
+) -> None:
+    """Feed the result of the agent launched for *issue_number* into adaptive routing.
+
+    The provider, agent type and launch time come from the launched-agents
+    tracker; each launch is counted at most once per process.
+    """
+    try:
+        from nexus.core.state_manager import HostStateManager
+
+        launched = HostStateManager.load_launched_agents(recent_only=False) or {}
+        entry = launched.get(str(issue_number))
+        if not isinstance(entry, dict):
+            return
+        tool = str(entry.get("tool") or "").strip().lower()
+        launched_at = float(entry.get("timestamp") or 0)
+        launched_agent = str(entry.get("agent_type") or "").strip().lstrip("@").lower()
+        expected_agent = str(agent_type or "").strip().lstrip("@").lower()
+        if not tool or launched_at <= 0:
+            return
+        if expected_agent and launched_agent and expected_agent != launched_agent:
+            return
+        marker = (str(issue_number), int(entry.get("pid") or 0), launched_at)
+        if marker in _recorded_outcomes:
+            return
+        _recorded_outcomes[marker] = None
+        while len(_recorded_outcomes) > _MAX_RECORDED_OUTCOMES:
+            _recorded_outcomes.popitem(last=False)
+        get_orchestrator().record_agent_outcome(
+            tool,
+            launched_agent or expected_agent or "*",
+            success=success,
+            duration_seconds=time.time() - launched_at,
+        )
+    except Exception as exc:
+        logger.debug("Could not record agent outcome for issue #%s: %s", issue_number, exc)
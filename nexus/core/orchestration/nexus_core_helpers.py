@@ -672,9 +672,14 @@ async def complete_step_for_issue(
         **_WORKFLOW_STATE_PLUGIN_BASE_KWARGS,
         cache_key=_WORKFLOW_STATE_PLUGIN_CACHE_KEY,
     )
-    return await workflow_plugin.complete_step_for_issue(
+    workflow = await workflow_plugin.complete_step_for_issue(
         issue_number=str(issue_number),
         completed_agent_type=completed_agent_type,
         outputs=outputs,
         event_id=event_id,
     )
+    if workflow is not None:
+        from nexus.core.orchestration.ai_orchestrator import record_agent_outcome
+
+        record_agent_outcome(str(issue_number), success=True, agent_type=completed_agent_type)
+    return workflow
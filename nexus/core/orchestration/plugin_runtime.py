@@ -1,6 +1,5 @@
 """Shared plugin runtime utilities for Nexus app modules."""
 
-import importlib
 import logging
 from collections.abc import Callable
 from typing import Any
@@ -11,6 +10,7 @@ logger = logging.getLogger(__name__)
 
 try:
     from nexus.plugins import PluginKind, PluginRegistry
+    from nexus.plugins.manifest import BUILTIN_PLUGIN_MANIFEST, register_manifest
 except Exception:
     PluginKind = None
     PluginRegistry = None
@@ -90,29 +90,13 @@ _PLUGIN_PROFILES: dict[str, dict[str, Any]] = {
     },
 }
 
-_BUILTIN_REGISTER_MODULES = (
-    "nexus.plugins.builtin.ai_runtime_plugin",
-    "nexus.plugins.builtin.agent_launch_policy_plugin",
-    "nexus.plugins.builtin.github_issue_plugin",
-    "nexus.plugins.builtin.github_issue_cli_plugin",
-    "nexus.plugins.builtin.gitlab_issue_plugin",
-    "nexus.plugins.builtin.gitlab_issue_cli_plugin",
-    "nexus.plugins.builtin.telegram_notification_plugin",
-    "nexus.plugins.builtin.telegram_interactive_plugin",
-    "nexus.plugins.builtin.telegram_event_handler_plugin",
-    "nexus.plugins.builtin.discord_interactive_plugin",
-    "nexus.plugins.builtin.discord_event_handler_plugin",
-    "nexus.plugins.builtin.json_state_plugin",
-    "nexus.plugins.builtin.runtime_ops_plugin",
-    "nexus.plugins.builtin.workflow_policy_plugin",
-    "nexus.plugins.builtin.workflow_monitor_policy_plugin",
-    "nexus.plugins.builtin.git_webhook_policy_plugin",
-    "nexus.plugins.builtin.workflow_state_engine_plugin",
-)
-
 
 def _get_registry():
-    """Initialize plugin registry once and register built-in plugins."""
+    """Initialize plugin registry once from the built-in manifest and entry points.
+
+    Only names are registered here; each plugin module is imported the first
+    time that plugin is created.
+    """
     global _registry, _registry_initialized
 
     if _registry_initialized:
@@ -128,11 +112,8 @@ def _get_registry():
 
     try:
         registry = PluginRegistry()
-        for module_name in _BUILTIN_REGISTER_MODULES:
-            module = importlib.import_module(module_name)
-            register = getattr(module, "register_plugins", None)
-            if callable(register):
-                register(registry)
+        register_manifest(registry, BUILTIN_PLUGIN_MANIFEST)
+        registry.register_entrypoint_factories()
         _registry = registry
     except Exception as exc:
         logger.error("Plugin registry initialization failed: %s", exc)
@@ -0,0 +1,560 @@
+"""Host-wide admission control and supervision for AI CLI child processes.
+
+Every analysis call and agent launch goes through one :class:`ProcessRunner`,
+which caps how many CLIs run at once (globally and per provider), admits
+waiters in priority order so chat analysis overtakes batch agent launches,
+samples each child's RSS and CPU time from ``/proc`` and kills the whole
+process group when a command overruns its timeout.
+"""
+
+import asyncio
+import bisect
+import itertools
+import logging
+import os
+import signal
+import subprocess
+import threading
+import time
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+from nexus.core.latency_metrics import LatencyHistogram
+
+logger = logging.getLogger(__name__)
+
+# Lower values are admitted first.
+PRIORITY_INTERACTIVE = 0
+PRIORITY_ANALYSIS = 10
+PRIORITY_AGENT = 20
+
+_CLOCK_TICKS = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+class ProcessAdmissionError(Exception):
+    """Raised when no execution slot frees up within the admission timeout."""
+
+
+@dataclass
+class ProcessUsage:
+    """Resource usage sampled for one child process."""
+
+    pid: int
+    provider: str
+    priority: int
+    started_at: float
+    peak_rss_bytes: int = 0
+    cpu_seconds: float = 0.0
+    samples: int = 0
+
+
+class ProcessResult(subprocess.CompletedProcess):
+    """``CompletedProcess`` plus admission wait and sampled resource usage."""
+
+    def __init__(
+        self,
+        args: Any,
+        returncode: int,
+        stdout: Any = None,
+        stderr: Any = None,
+        *,
+        queue_seconds: float = 0.0,
+        usage: ProcessUsage | None = None,
+    ) -> None:
+        super().__init__(args, returncode, stdout, stderr)
+        self.queue_seconds = queue_seconds
+        self.usage = usage
+
+
+@dataclass(eq=False)
+class _Slot:
+    provider: str
+    priority: int
+    seq: int
+    granted: bool = False
+    requested_at: float = field(default_factory=time.monotonic)
+    queue_seconds: float = 0.0
+
+
+@dataclass(eq=False)
+class _Tracked:
+    process: Any
+    usage: ProcessUsage
+    slot: _Slot | None
+
+
+def read_process_usage(pid: int) -> tuple[int, float] | None:
+    """Return ``(rss_bytes, cpu_seconds)`` for *pid* from ``/proc``, or ``None``."""
+    try:
+        with open(f"/proc/{pid}/stat", encoding="utf-8") as fh:
+            stat = fh.read()
+        with open(f"/proc/{pid}/statm", encoding="utf-8") as fh:
+            rss_pages = int(fh.read().split()[1])
+    except (OSError, ValueError, IndexError):
+        return None
+    # Fields after the parenthesised command name start at field 3 (state).
+    fields = stat[stat.rfind(")") + 2 :].split()
+    try:
+        ticks = sum(int(value) for value in fields[11:15])  # utime stime cutime cstime
+    except (ValueError, IndexError):
+        return None
+    return rss_pages * _PAGE_SIZE, ticks / _CLOCK_TICKS
+
+
+class ProcessRunner:
+    """Runs and supervises CLI child processes under shared concurrency caps.
+
+    Args:
+        max_concurrent: Host-wide cap on running children (``0`` = unlimited).
+        provider_limits: Optional per-provider caps, e.g. ``{"codex": 1}``.
+        interactive_reserve: Slots of ``max_concurrent`` that only
+            :data:`PRIORITY_INTERACTIVE` work may use.
+        admission_timeout: Default seconds an agent launch waits for a slot.
+        sample_interval: Seconds between ``/proc`` usage samples.
+        kill_grace: Seconds between ``SIGTERM`` and ``SIGKILL`` on timeout.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_concurrent: int = 0,
+        provider_limits: Mapping[str, int] | None = None,
+        interactive_reserve: int = 1,
+        admission_timeout: float | None = 600.0,
+        sample_interval: float = 2.0,
+        kill_grace: float = 5.0,
+    ) -> None:
+        self.max_concurrent = max(0, int(max_concurrent))
+        self.provider_limits = {
+            str(name).strip().lower(): int(limit)
+            for name, limit in (provider_limits or {}).items()
+            if int(limit) > 0
+        }
+        self.interactive_reserve = max(0, int(interactive_reserve))
+        self.admission_timeout = admission_timeout
+        self.sample_interval = max(0.05, float(sample_interval))
+        self.kill_grace = max(0.0, float(kill_grace))
+        self._cond = threading.Condition()
+        self._seq = itertools.count()
+        self._waiters: list[tuple[int, int, _Slot]] = []
+        self._active: dict[str, int] = {}
+        self._active_total = 0
+        self._tracked: dict[int, _Tracked] = {}
+        self._sampler: threading.Thread | None = None
+        self._queue_wait = LatencyHistogram()
+        self.stats = {
+            "admitted": 0,
+            "rejected": 0,
+            "launched": 0,
+            "completed": 0,
+            "timeouts": 0,
+            "peak_rss_bytes": 0,
+        }
+
+    # ------------------------------------------------------------------
+    # Admission
+    # ------------------------------------------------------------------
+
+    def acquire(
+        self,
+        provider: str,
+        *,
+        priority: int,
+        timeout: float | None = None,
+        abandoned: threading.Event | None = None,
+    ) -> _Slot:
+        """Block until a slot for *provider* is free; higher priorities go first.
+
+        Raises:
+            ProcessAdmissionError: If no slot frees up within *timeout* seconds,
+                or the waiter gave up by setting *abandoned*.
+        """
+        slot = _Slot(str(provider or "").strip().lower(), int(priority), next(self._seq))
+        deadline = None if timeout is None else time.monotonic() + max(0.0, timeout)
+        with self._cond:
+            bisect.insort(self._waiters, (slot.priority, slot.seq, slot), key=lambda w: w[:2])
+            try:
+                while True:
+                    self._reap_locked()
+                    if abandoned is not None and abandoned.is_set():
+                        raise ProcessAdmissionError("Slot request abandoned by its caller")
+                    if self._grantable_locked(slot):
+                        break
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        self.stats["rejected"] += 1
+                        raise ProcessAdmissionError(
+                            f"No {slot.provider or 'CLI'} execution slot within {timeout}s "
+                            f"({self._active_total} running)"
+                        )
+                    wait = self.sample_interval if remaining is None else remaining
+                    self._cond.wait(timeout=min(wait, self.sample_interval))
+            finally:
+                self._waiters = [entry for entry in self._waiters if entry[2] is not slot]
+                self._cond.notify_all()
+            slot.granted = True
+            slot.queue_seconds = time.monotonic() - slot.requested_at
+            self._active[slot.provider] = self._active.get(slot.provider, 0) + 1
+            self._active_total += 1
+            self.stats["admitted"] += 1
+        self._queue_wait.observe(slot.queue_seconds)
+        return slot
+
+    def release(self, slot: _Slot) -> None:
+        with self._cond:
+            if not slot.granted:
+                return
+            slot.granted = False
+            self._active[slot.provider] = max(0, self._active.get(slot.provider, 0) - 1)
+            self._active_total = max(0, self._active_total - 1)
+            self._cond.notify_all()
+
+    @contextmanager
+    def slot(
+        self, provider: str, *, priority: int, timeout: float | None = None
+    ) -> Iterator[_Slot]:
+        acquired = self.acquire(provider, priority=priority, timeout=timeout)
+        try:
+            yield acquired
+        finally:
+            self.release(acquired)
+
+    def _fits_locked(self, slot: _Slot) -> bool:
+        limit = self.max_concurrent
+        if limit and slot.priority > PRIORITY_INTERACTIVE:
+            limit = max(1, limit - self.interactive_reserve)
+        if limit and self._active_total >= limit:
+            return False
+        provider_limit = self.provider_limits.get(slot.provider)
+        return not (provider_limit and self._active.get(slot.provider, 0) >= provider_limit)
+
+    def _grantable_locked(self, slot: _Slot) -> bool:
+        if not self._fits_locked(slot):
+            return False
+        # A better-ranked waiter that could also run right now goes first.
+        for _priority, _seq, other in self._waiters:
+            if other is slot:
+                return True
+            if self._fits_locked(other):
+                return False
+        return True
+
+    # ------------------------------------------------------------------
+    # Execution
+    # ------------------------------------------------------------------
+
+    def run(
+        self,
+        command: Sequence[str],
+        *,
+        provider: str | None = None,
+        priority: int = PRIORITY_ANALYSIS,
+        timeout: float | None = None,
+        env: Mapping[str, str] | None = None,
+        cwd: str | None = None,
+    ) -> ProcessResult:
+        """Run *command* to completion and capture its text output.
+
+        The admission wait counts against *timeout*.  On timeout the child's
+        process group is terminated (then killed) and
+        :class:`subprocess.TimeoutExpired` is raised.
+        """
+        cmd = list(command)
+        provider_name = provider or os.path.basename(str(cmd[0] if cmd else ""))
+        started = time.monotonic()
+        slot = self.acquire(provider_name, priority=priority, timeout=timeout)
+        try:
+            process = subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                env=dict(env) if env is not None else None,
+                cwd=cwd,
+                start_new_session=True,
+            )
+            tracked = self._track(process, slot=None, provider=provider_name, priority=priority)
+            remaining = (
+                None if timeout is None else max(0.1, timeout - (time.monotonic() - started))
+            )
+            try:
+                stdout, stderr = process.communicate(timeout=remaining)
+            except subprocess.TimeoutExpired as exc:
+                self.stats["timeouts"] += 1
+                self.terminate(process)
+                stdout, stderr = process.communicate()
+                raise subprocess.TimeoutExpired(cmd, timeout or 0, stdout, stderr) from exc
+            finally:
+                self._untrack(process)
+        finally:
+            self.release(slot)
+        return ProcessResult(
+            cmd,
+            process.returncode,
+            stdout,
+            stderr,
+            queue_seconds=slot.queue_seconds,
+            usage=tracked.usage,
+        )
+
+    async def run_async(
+        self,
+        command: Sequence[str],
+        *,
+        provider: str | None = None,
+        priority: int = PRIORITY_AGENT,
+        timeout: float | None = None,
+        env: Mapping[str, str] | None = None,
+        cwd: str | None = None,
+    ) -> ProcessResult:
+        """Async :meth:`run`; stdout/stderr are returned as bytes."""
+        cmd = list(command)
+        provider_name = provider or os.path.basename(str(cmd[0] if cmd else ""))
+        started = time.monotonic()
+        slot = await self._acquire_async(provider_name, priority=priority, timeout=timeout)
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                env=dict(env) if env is not None else None,
+                cwd=cwd,
+                start_new_session=True,
+            )
+            tracked = self._track(process, slot=None, provider=provider_name, priority=priority)
+            remaining = (
+                None if timeout is None else max(0.1, timeout - (time.monotonic() - started))
+            )
+            try:
+                stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=remaining)
+            except asyncio.CancelledError:
+                await asyncio.to_thread(self.terminate, process)
+                raise
+            except TimeoutError as exc:
+                self.stats["timeouts"] += 1
+                await asyncio.to_thread(self.terminate, process)
+                raise subprocess.TimeoutExpired(cmd, timeout or 0) from exc
+            finally:
+                self._untrack(process)
+        finally:
+            self.release(slot)
+        return ProcessResult(
+            cmd,
+            process.returncode,
+            stdout,
+            stderr,
+            queue_seconds=slot.queue_seconds,
+            usage=tracked.usage,
+        )
+
+    async def _acquire_async(self, provider: str, *, priority: int, timeout: float | None) -> _Slot:
+        """:meth:`acquire` off the event loop, without leaking the slot on cancellation."""
+        abandoned = threading.Event()
+        acquiring = asyncio.ensure_future(
+            asyncio.to_thread(
+                self.acquire, provider, priority=priority, timeout=timeout, abandoned=abandoned
+            )
+        )
+        try:
+            return await asyncio.shield(acquiring)
+        except asyncio.CancelledError:
+            # The worker thread cannot be interrupted: tell it to stop waiting
+            # and hand back a slot it may have been granted in the meantime.
+            abandoned.set()
+            with self._cond:
+                self._cond.notify_all()
+            acquiring.add_done_callback(self._release_abandoned)
+            raise
+
+    def _release_abandoned(self, acquiring: "asyncio.Future[_Slot]") -> None:
+        if not acquiring.cancelled() and acquiring.exception() is None:
+            self.release(acquiring.result())
+
+    def launch(
+        self,
+        spawn: Callable[[], Any],
+        *,
+        provider: str,
+        priority: int = PRIORITY_AGENT,
+        admission_timeout: float | None = None,
+    ) -> Any:
+        """Admit and start a long-running child via *spawn* (which returns a ``Popen``).
+
+        The slot is held until the child exits; exits are noticed by the
+        sampler thread and by waiting admissions.
+        """
+        timeout = self.admission_timeout if admission_timeout is None else admission_timeout
+        slot = self.acquire(provider, priority=priority, timeout=timeout)
+        try:
+            process = spawn()
+        except BaseException:
+            self.release(slot)
+            raise
+        self.stats["launched"] += 1
+        self._track(process, slot=slot, provider=slot.provider, priority=priority)
+        return process
+
+    def terminate(self, process: Any) -> None:
+        """SIGTERM the child's process group, then SIGKILL it after ``kill_grace``."""
+        pid = getattr(process, "pid", None)
+        if not isinstance(pid, int):
+            return
+        own_group = _process_group(pid) == pid
+        for sig, grace in ((signal.SIGTERM, self.kill_grace), (signal.SIGKILL, 0.0)):
+            try:
+                if own_group:
+                    os.killpg(pid, sig)
+                else:
+                    os.kill(pid, sig)
+            except (ProcessLookupError, PermissionError):
+                return
+            deadline = time.monotonic() + grace
+            while time.monotonic() < deadline:
+                if _has_exited(process):
+                    return
+                time.sleep(0.05)
+
+    # ------------------------------------------------------------------
+    # Sampling
+    # ------------------------------------------------------------------
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return admission counters, running children and their sampled usage."""
+        with self._cond:
+            self._reap_locked()
+            running = [asdict(tracked.usage) for tracked in self._tracked.values()]
+            return {
+                **self.stats,
+                "running": self._active_total,
+                "running_by_provider": {k: v for k, v in self._active.items() if v},
+                "waiting": len(self._waiters),
+                "max_concurrent": self.max_concurrent,
+                "provider_limits": dict(self.provider_limits),
+                "processes": running,
+                "queue_wait_seconds": self._queue_wait.snapshot(),
+            }
+
+    def _track(self, process: Any, *, slot: _Slot | None, provider: str, priority: int) -> _Tracked:
+        pid = getattr(process, "pid", None)
+        usage = ProcessUsage(
+            pid=pid if isinstance(pid, int) else -1,
+            provider=provider,
+            priority=priority,
+            started_at=time.time(),
+        )
+        tracked = _Tracked(process=process, usage=usage, slot=slot)
+        if not isinstance(pid, int):
+            if slot is not None:
+                self.release(slot)
+            return tracked
+        with self._cond:
+            self._tracked[pid] = tracked
+            if self._sampler is None or not self._sampler.is_alive():
+                self._sampler = threading.Thread(
+                    target=self._sample_loop, daemon=True, name="nexus-process-sampler"
+                )
+                self._sampler.start()
+        self._sample(tracked)
+        return tracked
+
+    def _untrack(self, process: Any) -> None:
+        pid = getattr(process, "pid", None)
+        with self._cond:
+            tracked = self._tracked.pop(pid, None) if isinstance(pid, int) else None
+            if tracked is not None:
+                self._finish_locked(tracked)
+
+    def _finish_locked(self, tracked: _Tracked) -> None:
+        self.stats["completed"] += 1
+        self.stats["peak_rss_bytes"] = max(
+            self.stats["peak_rss_bytes"], tracked.usage.peak_rss_bytes
+        )
+        if tracked.slot is not None:
+            self.release(tracked.slot)
+            tracked.slot = None
+
+    def _reap_locked(self) -> None:
+        for pid, tracked in list(self._tracked.items()):
+            if tracked.slot is not None and _has_exited(tracked.process):
+                self._tracked.pop(pid, None)
+                self._finish_locked(tracked)
+
+    def _sample(self, tracked: _Tracked) -> None:
+        sample = read_process_usage(tracked.usage.pid)
+        if sample is None:
+            return
+        rss_bytes, cpu_seconds = sample
+        usage = tracked.usage
+        usage.peak_rss_bytes = max(usage.peak_rss_bytes, rss_bytes)
+        usage.cpu_seconds = max(usage.cpu_seconds, cpu_seconds)
+        usage.samples += 1
+
+    def _sample_loop(self) -> None:
+        while True:
+            with self._cond:
+                self._reap_locked()
+                if not self._tracked:
+                    self._sampler = None
+                    return
+                tracked = list(self._tracked.values())
+            for entry in tracked:
+                self._sample(entry)
+            with self._cond:
+                self._cond.wait(timeout=self.sample_interval)
+
+
+def _has_exited(process: Any) -> bool:
+    try:
+        return process.poll() is not None
+    except Exception:
+        return True
+
+
+def _process_group(pid: int) -> int | None:
+    try:
+        return os.getpgid(pid)
+    except (OSError, AttributeError):
+        return None
+
+
+def parse_provider_limits(raw: str) -> dict[str, int]:
+    """Parse ``"codex=1,copilot=2"`` into ``{"codex": 1, "copilot": 2}``."""
+    limits: dict[str, int] = {}
+    for part in str(raw or "").split(","):
+        name, sep, value = part.partition("=")
+        if not sep or not name.strip():
+            continue
+        try:
+            limits[name.strip().lower()] = int(value.strip())
+        except ValueError:
+            logger.warning("Ignoring invalid provider concurrency limit: %r", part)
+    return limits
+
+
+_runner: ProcessRunner | None = None
+_runner_lock = threading.Lock()
+
+
+def get_process_runner() -> ProcessRunner:
+    """Return the process-wide runner configured from ``NEXUS_CLI_*`` env vars."""
+    global _runner
+    with _runner_lock:
+        if _runner is None:
+            _runner = ProcessRunner(
+                max_concurrent=int(os.getenv("NEXUS_CLI_MAX_CONCURRENT", "0") or 0),
+                provider_limits=parse_provider_limits(os.getenv("NEXUS_CLI_PROVIDER_LIMITS", "")),
+                interactive_reserve=int(os.getenv("NEXUS_CLI_INTERACTIVE_RESERVE", "1") or 1),
+                admission_timeout=float(os.getenv("NEXUS_CLI_ADMISSION_TIMEOUT", "600") or 600),
+                sample_interval=float(os.getenv("NEXUS_CLI_SAMPLE_INTERVAL", "2") or 2),
+            )
+        return _runner
+
+
+def reset_process_runner() -> None:
+    """Drop the process-wide runner (for tests)."""
+    global _runner
+    with _runner_lock:
+        _runner = None
@@ -0,0 +1,162 @@
+"""Short-lived snapshot of the host process table.
+
+Issue-linked agent checks run for every tracked issue on every processor
+cycle.  Instead of forking ``pgrep`` per issue, callers share one snapshot of
+``(pid, command line)`` pairs that is refreshed at most once per ``ttl``
+seconds: on Linux by reading ``/proc/<pid>/cmdline`` directly, elsewhere with a
+single ``ps`` invocation.
+"""
+
+import logging
+import os
+import shutil
+import subprocess
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ProcessSnapshot:
+    """Command lines of every visible process at one point in time."""
+
+    generation: int
+    taken_at: float
+    processes: tuple[tuple[int, str], ...]
+
+
+def read_proc_commands(proc_root: str = "/proc") -> list[tuple[int, str]]:
+    """Return ``(pid, command line)`` for every process listed under *proc_root*."""
+    own_pid = os.getpid()
+    processes: list[tuple[int, str]] = []
+    for entry in os.scandir(proc_root):
+        if not entry.name.isdigit():
+            continue
+        pid = int(entry.name)
+        if pid == own_pid:
+            continue
+        try:
+            with open(os.path.join(entry.path, "cmdline"), "rb") as fh:
+                raw = fh.read()
+        except OSError:
+            # Process exited between the directory scan and the read.
+            continue
+        command = raw.replace(b"\0", b" ").decode("utf-8", "replace").strip()
+        if command:
+            processes.append((pid, command))
+    # Ascending PID order, matching pgrep/ps output.
+    processes.sort()
+    return processes
+
+
+def read_ps_commands(ps_path: str, timeout: float = 5.0) -> list[tuple[int, str]]:
+    """Return ``(pid, command line)`` pairs from one ``ps`` call (non-Linux hosts)."""
+    result = subprocess.run(
+        [ps_path, "-axww", "-o", "pid=,command="],
+        text=True,
+        capture_output=True,
+        timeout=timeout,
+        check=False,
+    )
+    own_pid = os.getpid()
+    processes: list[tuple[int, str]] = []
+    for line in result.stdout.splitlines():
+        parts = line.strip().split(None, 1)
+        if len(parts) != 2 or not parts[0].isdigit():
+            continue
+        pid = int(parts[0])
+        if pid != own_pid:
+            processes.append((pid, parts[1].strip()))
+    return processes
+
+
+class ProcessTable:
+    """TTL-cached process table shared by every issue lookup in the process.
+
+    Args:
+        ttl: Seconds a snapshot is reused before the table is read again.
+        proc_root: ``/proc`` mount point (injectable for tests).
+        clock: Monotonic clock (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: float = 2.0,
+        proc_root: str = "/proc",
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl = max(0.0, float(ttl))
+        self.proc_root = proc_root
+        self._clock = clock
+        self._ps_path = shutil.which("ps")
+        self._snapshot: ProcessSnapshot | None = None
+        self._generation = 0
+        self._lock = threading.Lock()
+        self.stats = {"refreshes": 0, "reuses": 0, "errors": 0}
+
+    @property
+    def source(self) -> str | None:
+        """``"proc"``, ``"ps"`` or ``None`` when the host offers neither."""
+        if os.path.isdir(os.path.join(self.proc_root, "self")):
+            return "proc"
+        if self._ps_path:
+            return "ps"
+        return None
+
+    @property
+    def available(self) -> bool:
+        return self.source is not None
+
+    def snapshot(self) -> ProcessSnapshot:
+        """Return the current snapshot, reading the process table when it is stale."""
+        with self._lock:
+            now = self._clock()
+            current = self._snapshot
+            if current is not None and now - current.taken_at < self.ttl:
+                self.stats["reuses"] += 1
+                return current
+            processes: list[tuple[int, str]] = []
+            try:
+                source = self.source
+                if source == "proc":
+                    processes = read_proc_commands(self.proc_root)
+                elif source == "ps" and self._ps_path:
+                    processes = read_ps_commands(self._ps_path)
+            except Exception as exc:
+                self.stats["errors"] += 1
+                logger.error("Failed to read the process table: %s", exc)
+            self._generation += 1
+            self._snapshot = ProcessSnapshot(
+                generation=self._generation, taken_at=now, processes=tuple(processes)
+            )
+            self.stats["refreshes"] += 1
+            return self._snapshot
+
+    def invalidate(self) -> None:
+        """Force the next lookup to re-read the table (e.g. after killing a process)."""
+        with self._lock:
+            self._snapshot = None
+
+
+_table: ProcessTable | None = None
+_table_lock = threading.Lock()
+
+
+def get_process_table() -> ProcessTable:
+    """Return the process-wide table; ``NEXUS_PROCESS_SNAPSHOT_TTL`` sets its TTL."""
+    global _table
+    with _table_lock:
+        if _table is None:
+            _table = ProcessTable(ttl=float(os.getenv("NEXUS_PROCESS_SNAPSHOT_TTL", "2") or 2))
+        return _table
+
+
+def reset_process_table() -> None:
+    """Drop the process-wide table (for tests)."""
+    global _table
+    with _table_lock:
+        _table = None
@@ -4,6 +4,8 @@ import time
 from collections.abc import Callable
 from typing import Any
 
+from nexus.core.processor_scheduler import ProcessorScheduler, ScheduledJob
+
 
 def run_processor_loop(
     *,
@@ -12,24 +14,33 @@ def run_processor_loop(
     sleep_interval: int | float,
     check_interval: int | float,
     get_inbox_storage_backend: Callable[[], str],
-    drain_postgres_inbox_queue: Callable[[], None],
+    drain_postgres_inbox_queue: Callable[[], bool | None],
     process_filesystem_inbox_once: Callable[[str], None],
     check_stuck_agents: Callable[[], None],
     check_agent_comments: Callable[[], None],
     check_completed_agents: Callable[[], None],
     merge_queue_auto_merge_once: Callable[[], None],
     cleanup_stale_worktrees_once: Callable[[], None] | None = None,
+    wait_for_inbox_tasks: Callable[[float], bool] | None = None,
     runtime_state=None,
     time_module: Any = time,
 ) -> None:
-    """Run the main processor polling loop forever."""
+    """Run the main processor polling loop forever.
+
+    With the postgres inbox backend and *wait_for_inbox_tasks* set, the loop
+    blocks on enqueue notifications until the next periodic check is due
+    instead of sleeping *sleep_interval* between drains.  When the drain
+    reports a remaining backlog (a truthy return) the loop drains again
+    without waiting.
+    """
     last_check = time_module.time()
 
     while True:
         inbox_backend = get_inbox_storage_backend()
+        backlog = False
 
         if inbox_backend == "postgres":
-            drain_postgres_inbox_queue()
+            backlog = bool(drain_postgres_inbox_queue())
         else:
             process_filesystem_inbox_once(base_dir)
 
@@ -43,4 +54,145 @@ def run_processor_loop(
                 cleanup_stale_worktrees_once()
             last_check = current_time
 
-        time_module.sleep(sleep_interval)
+        if backlog:
+            continue
+        if inbox_backend == "postgres" and callable(wait_for_inbox_tasks):
+            until_next_check = check_interval - (time_module.time() - last_check)
+            wait_for_inbox_tasks(max(float(sleep_interval), until_next_check))
+        else:
+            time_module.sleep(sleep_interval)
+
+
+def build_processor_jobs(
+    *,
+    base_dir: str,
+    sleep_interval: int | float,
+    check_interval: int | float,
+    get_inbox_storage_backend: Callable[[], str],
+    drain_postgres_inbox_queue: Callable[[], bool | None],
+    process_filesystem_inbox_once: Callable[[str], None],
+    check_stuck_agents: Callable[[], None],
+    check_agent_comments: Callable[[], None],
+    check_completed_agents: Callable[[], None],
+    merge_queue_auto_merge_once: Callable[[], None],
+    cleanup_stale_worktrees_once: Callable[[], None] | None = None,
+    job_overrides: dict[str, dict[str, Any]] | None = None,
+) -> list[ScheduledJob]:
+    """Build the processor's scheduled jobs.
+
+    Completion processing and stuck-agent detection share one job so stuck
+    detection always sees the latest completions; every other check runs
+    independently.  *job_overrides* maps job names to ``ScheduledJob`` field
+    overrides (``interval``, ``deadline``, ``max_concurrency``).
+    """
+
+    def _drain_inbox() -> None:
+        if get_inbox_storage_backend() == "postgres":
+            drain_postgres_inbox_queue()
+        else:
+            process_filesystem_inbox_once(base_dir)
+
+    def _agent_lifecycle() -> None:
+        check_completed_agents()
+        check_stuck_agents()
+
+    jobs = [
+        ScheduledJob("inbox", _drain_inbox, float(sleep_interval), deadline=float(check_interval)),
+        ScheduledJob(
+            "agent_lifecycle",
+            _agent_lifecycle,
+            float(check_interval),
+            deadline=float(check_interval),
+            run_immediately=False,
+        ),
+        ScheduledJob(
+            "agent_comments",
+            check_agent_comments,
+            float(check_interval),
+            deadline=float(check_interval),
+            run_immediately=False,
+        ),
+        ScheduledJob(
+            "merge_queue",
+            merge_queue_auto_merge_once,
+            float(check_interval),
+            deadline=float(check_interval),
+            run_immediately=False,
+        ),
+    ]
+    if callable(cleanup_stale_worktrees_once):
+        jobs.append(
+            ScheduledJob(
+                "worktree_cleanup",
+                cleanup_stale_worktrees_once,
+                float(check_interval),
+                deadline=float(check_interval),
+                run_immediately=False,
+            )
+        )
+    for job in jobs:
+        for key, value in (job_overrides or {}).get(job.name, {}).items():
+            if key in {"interval", "deadline", "max_concurrency"}:
+                setattr(job, key, value)
+    return jobs
+
+
+def run_scheduled_processor_loop(
+    *,
+    logger,
+    base_dir: str,
+    sleep_interval: int | float,
+    check_interval: int | float,
+    get_inbox_storage_backend: Callable[[], str],
+    drain_postgres_inbox_queue: Callable[[], bool | None],
+    process_filesystem_inbox_once: Callable[[str], None],
+    check_stuck_agents: Callable[[], None],
+    check_agent_comments: Callable[[], None],
+    check_completed_agents: Callable[[], None],
+    merge_queue_auto_merge_once: Callable[[], None],
+    cleanup_stale_worktrees_once: Callable[[], None] | None = None,
+    wait_for_inbox_tasks: Callable[[float], bool] | None = None,
+    job_overrides: dict[str, dict[str, Any]] | None = None,
+    runtime_state=None,
+    time_module: Any = time,
+    scheduler: ProcessorScheduler | None = None,
+) -> None:
+    """Run the processor checks as independent concurrent jobs forever.
+
+    Drop-in alternative to :func:`run_processor_loop`: each check gets its own
+    interval, deadline and concurrency budget on a shared worker pool, so a
+    slow comment poll no longer delays completion chaining.
+    """
+    if scheduler is None:
+        scheduler = ProcessorScheduler(
+            build_processor_jobs(
+                base_dir=base_dir,
+                sleep_interval=sleep_interval,
+                check_interval=check_interval,
+                get_inbox_storage_backend=get_inbox_storage_backend,
+                drain_postgres_inbox_queue=drain_postgres_inbox_queue,
+                process_filesystem_inbox_once=process_filesystem_inbox_once,
+                check_stuck_agents=check_stuck_agents,
+                check_agent_comments=check_agent_comments,
+                check_completed_agents=check_completed_agents,
+                merge_queue_auto_merge_once=merge_queue_auto_merge_once,
+                cleanup_stale_worktrees_once=cleanup_stale_worktrees_once,
+                job_overrides=job_overrides,
+            ),
+            time_module=time_module,
+        )
+    if runtime_state is not None and hasattr(runtime_state, "scheduler_stats"):
+        runtime_state.scheduler_stats = scheduler.stats
+
+    try:
+        while True:
+            delay = scheduler.run_pending()
+            if get_inbox_storage_backend() == "postgres" and callable(wait_for_inbox_tasks):
+                if wait_for_inbox_tasks(delay):
+                    scheduler.trigger("inbox")
+            else:
+                time_module.sleep(delay)
+    finally:
+        if logger is not None:
+            logger.info("Processor scheduler stopping; job stats: %s", scheduler.stats())
+        scheduler.shutdown(wait=False)
@@ -1,5 +1,6 @@
 """Explicit runtime state container for inbox processor mutable globals."""
 
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -13,3 +14,5 @@ class ProcessorRuntimeState:
     auto_chained_agents: dict[str, Any] = field(default_factory=dict)
     polling_failure_counts: dict[str, int] = field(default_factory=dict)
     orphan_recovery_last_attempt: dict[str, float] = field(default_factory=dict)
+    # Bound to ProcessorScheduler.stats when the concurrent scheduler is active.
+    scheduler_stats: Callable[[], dict[str, Any]] | None = None
@@ -0,0 +1,225 @@
+"""Interval job scheduler for the processor polling loop.
+
+Each :class:`ScheduledJob` has its own interval, soft deadline and
+concurrency budget.  Due jobs are submitted to a shared worker pool so a slow
+I/O-bound job (e.g. comment polling against the Git API) no longer delays
+unrelated jobs such as completion processing.  A job that is still running
+when it becomes due again is skipped rather than stacked.
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+
+from nexus.core.latency_metrics import LatencyHistogram
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ScheduledJob:
+    """A periodic job run by :class:`ProcessorScheduler`.
+
+    Attributes:
+        name: Unique job name used in logs and stats.
+        func: Zero-argument callable executed on a worker thread.
+        interval: Seconds between scheduled starts.
+        deadline: Soft per-run budget in seconds; overruns are logged and
+            counted (threads cannot be interrupted safely).
+        max_concurrency: Maximum simultaneous runs; due runs beyond the
+            budget are skipped.
+        run_immediately: Run on the first scheduler tick instead of after
+            one full *interval*.
+    """
+
+    name: str
+    func: Callable[[], Any]
+    interval: float
+    deadline: float | None = None
+    max_concurrency: int = 1
+    run_immediately: bool = True
+
+
+@dataclass
+class _JobState:
+    job: ScheduledJob
+    next_due: float
+    running: int = 0
+    runs: int = 0
+    failures: int = 0
+    skipped_overlaps: int = 0
+    deadline_misses: int = 0
+    last_error: str | None = None
+    # Start times of in-flight runs that have not yet been reported as overdue.
+    in_flight: dict[int, float] = field(default_factory=dict)
+    duration: LatencyHistogram = field(default_factory=LatencyHistogram)
+    lag: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+
+class ProcessorScheduler:
+    """Run :class:`ScheduledJob` instances concurrently on a bounded worker pool.
+
+    Args:
+        jobs: Jobs to schedule; names must be unique.
+        max_workers: Worker pool size (defaults to the sum of job budgets).
+        time_module: Object providing ``time()``/``sleep()`` (injectable for tests).
+        executor: Optional pre-built executor (tests may pass a synchronous one).
+    """
+
+    def __init__(
+        self,
+        jobs: list[ScheduledJob],
+        *,
+        max_workers: int | None = None,
+        time_module: Any = time,
+        executor: Any = None,
+    ) -> None:
+        names = [job.name for job in jobs]
+        if len(names) != len(set(names)):
+            raise ValueError(f"Duplicate scheduled job names: {names}")
+        self._time = time_module
+        now = self._time.time()
+        self._states: dict[str, _JobState] = {
+            job.name: _JobState(
+                job=job,
+                next_due=now if job.run_immediately else now + float(job.interval),
+            )
+            for job in jobs
+        }
+        self._lock = threading.Lock()
+        workers = max_workers or max(1, sum(max(1, job.max_concurrency) for job in jobs))
+        self._executor = executor or ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="nexus-processor"
+        )
+
+    # ------------------------------------------------------------------
+    # Scheduling
+    # ------------------------------------------------------------------
+
+    def trigger(self, name: str) -> None:
+        """Make job *name* due immediately (e.g. after an inbox notification)."""
+        with self._lock:
+            state = self._states.get(name)
+            if state is not None:
+                state.next_due = min(state.next_due, self._time.time())
+
+    def run_pending(self) -> float:
+        """Submit all due jobs and return seconds until the next job is due."""
+        now = self._time.time()
+        to_submit: list[tuple[_JobState, float]] = []
+        with self._lock:
+            for state in self._states.values():
+                self._warn_overdue_locked(state, now)
+                if state.next_due > now:
+                    continue
+                scheduled_for = state.next_due
+                interval = max(0.0, float(state.job.interval))
+                # Advance past ``now`` so a long stall does not trigger catch-up bursts.
+                state.next_due = scheduled_for + interval
+                if state.next_due <= now:
+                    state.next_due = now + interval
+                if state.running >= max(1, state.job.max_concurrency):
+                    state.skipped_overlaps += 1
+                    logger.debug(
+                        "Skipping overlapping run of processor job %s (%d running)",
+                        state.job.name,
+                        state.running,
+                    )
+                    continue
+                state.running += 1
+                to_submit.append((state, scheduled_for))
+
+        for state, scheduled_for in to_submit:
+            try:
+                self._executor.submit(self._run_job, state, scheduled_for)
+            except RuntimeError as exc:  # executor shut down
+                with self._lock:
+                    state.running -= 1
+                logger.warning("Could not submit processor job %s: %s", state.job.name, exc)
+
+        return self.seconds_until_next_due()
+
+    def seconds_until_next_due(self) -> float:
+        now = self._time.time()
+        with self._lock:
+            if not self._states:
+                return 1.0
+            next_due = min(state.next_due for state in self._states.values())
+        return max(0.0, next_due - now)
+
+    def _warn_overdue_locked(self, state: _JobState, now: float) -> None:
+        deadline = state.job.deadline
+        if deadline is None:
+            return
+        for run_id, started in list(state.in_flight.items()):
+            if now - started > float(deadline):
+                state.in_flight.pop(run_id, None)
+                logger.warning(
+                    "Processor job %s still running after %.1fs (deadline %.1fs)",
+                    state.job.name,
+                    now - started,
+                    float(deadline),
+                )
+
+    def _run_job(self, state: _JobState, scheduled_for: float) -> None:
+        job = state.job
+        started = self._time.time()
+        run_id = threading.get_ident()
+        state.lag.observe(started - scheduled_for)
+        with self._lock:
+            state.in_flight[run_id] = started
+        try:
+            job.func()
+        except Exception as exc:
+            with self._lock:
+                state.failures += 1
+                state.last_error = str(exc)
+            logger.error("Processor job %s failed: %s", job.name, exc, exc_info=True)
+        finally:
+            elapsed = self._time.time() - started
+            state.duration.observe(elapsed)
+            with self._lock:
+                state.in_flight.pop(run_id, None)
+                state.running -= 1
+                state.runs += 1
+                missed = job.deadline is not None and elapsed > float(job.deadline)
+                if missed:
+                    state.deadline_misses += 1
+            if missed:
+                logger.warning(
+                    "Processor job %s exceeded its %.1fs deadline (took %.1fs)",
+                    job.name,
+                    float(job.deadline or 0),
+                    elapsed,
+                )
+
+    # ------------------------------------------------------------------
+    # Lifecycle / introspection
+    # ------------------------------------------------------------------
+
+    def shutdown(self, *, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Return per-job counters plus duration and lag histogram snapshots."""
+        with self._lock:
+            return {
+                name: {
+                    "interval": state.job.interval,
+                    "deadline": state.job.deadline,
+                    "max_concurrency": state.job.max_concurrency,
+                    "running": state.running,
+                    "runs": state.runs,
+                    "failures": state.failures,
+                    "skipped_overlaps": state.skipped_overlaps,
+                    "deadline_misses": state.deadline_misses,
+                    "last_error": state.last_error,
+                    "duration_seconds": state.duration.snapshot(),
+                    "lag_seconds": state.lag.snapshot(),
+                }
+                for name, state in self._states.items()
+            }
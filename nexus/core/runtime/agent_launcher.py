@@ -30,6 +30,7 @@ from nexus.core.auth.access_domain import (
 from nexus.core.auth.credential_store import get_issue_requester, get_issue_requester_by_url
 from nexus.core.config import (
     BASE_DIR,
+    LAUNCHED_AGENTS_FILE,
     NEXUS_WEBHOOK_INTERNAL_URL,
     ORCHESTRATOR_CONFIG,
     NEXUS_STORAGE_BACKEND,
@@ -61,6 +62,7 @@ from nexus.core.project.repo_utils import (
 from nexus.core.project.repo_utils import (
     project_repos_from_config as _project_repos,
 )
+from nexus.core.runtime.task_log_index import get_task_log_index
 from nexus.core.runtime_mode import is_postgres_backend
 from nexus.core.state_manager import HostStateManager
 from nexus.plugins.builtin.ai_runtime_plugin import ToolUnavailableError
@@ -411,15 +413,18 @@ def _persist_issue_excluded_tools(issue_num: str, tools: list[str]) -> None:
     if not merged:
         return
 
-    launched_agents = HostStateManager.load_launched_agents(recent_only=False)
-    previous_entry = launched_agents.get(str(issue_num), {})
-    if not isinstance(previous_entry, dict):
-        previous_entry = {}
+    with HostStateManager.state_lock(LAUNCHED_AGENTS_FILE):
+        launched_agents = HostStateManager.load_launched_agents(recent_only=False)
+        previous_entry = launched_agents.get(str(issue_num), {})
+        if not isinstance(previous_entry, dict):
+            previous_entry = {}
 
-    entry = dict(previous_entry)
-    entry["exclude_tools"] = _merge_excluded_tools(previous_entry.get("exclude_tools", []), merged)
-    launched_agents[str(issue_num)] = entry
-    HostStateManager.save_launched_agents(launched_agents)
+        entry = dict(previous_entry)
+        entry["exclude_tools"] = _merge_excluded_tools(
+            previous_entry.get("exclude_tools", []), merged
+        )
+        launched_agents[str(issue_num)] = entry
+        HostStateManager.save_launched_agents(launched_agents)
 
 
 def _read_tail(path: str, max_chars: int = 4000) -> str:
@@ -470,11 +475,9 @@ def _find_latest_agent_log(workspace_dir: str, project_key: str | None, issue_nu
     """Find the most recent log file for a specific issue and tool."""
     project = str(project_key or "nexus")
     log_dir = get_tasks_logs_dir(workspace_dir, project)
-    pattern = os.path.join(log_dir, f"{tool_name}_{issue_num}_*.log")
-    candidates = glob.glob(pattern)
-    if not candidates:
-        return ""
-    return max(candidates, key=os.path.getmtime)
+    index = get_task_log_index()
+    index.register_directories([log_dir])
+    return index.latest(str(issue_num), tool=tool_name, directory=log_dir) or ""
 
 
 def _normalize_agent_reference(value: object) -> str:
@@ -975,25 +978,28 @@ def _start_agent_quota_watchdog(
                 )
                 if pid_new:
                     new_tool = str(getattr(tool_new, "value", tool_new))
-                    launched_agents = HostStateManager.load_launched_agents(recent_only=False)
-                    prev = launched_agents.get(str(issue_num), {})
-                    if not isinstance(prev, dict):
-                        prev = {}
-                    requester_nexus_id = str(prev.get("requester_nexus_id") or "").strip() or None
-                    launched_agents[str(issue_num)] = {
-                        **prev,
-                        "timestamp": time.time(),
-                        "pid": int(pid_new or 0),
-                        "requester_nexus_id": requester_nexus_id,
-                        "tier": tier_name,
-                        "mode": mode,
-                        "tool": new_tool,
-                        "agent_type": agent_type,
-                        "exclude_tools": _merge_excluded_tools(
-                            prev.get("exclude_tools", []), merged_exclusions
-                        ),
-                    }
-                    HostStateManager.save_launched_agents(launched_agents)
+                    with HostStateManager.state_lock(LAUNCHED_AGENTS_FILE):
+                        launched_agents = HostStateManager.load_launched_agents(recent_only=False)
+                        prev = launched_agents.get(str(issue_num), {})
+                        if not isinstance(prev, dict):
+                            prev = {}
+                        requester_nexus_id = (
+                            str(prev.get("requester_nexus_id") or "").strip() or None
+                        )
+                        launched_agents[str(issue_num)] = {
+                            **prev,
+                            "timestamp": time.time(),
+                            "pid": int(pid_new or 0),
+                            "requester_nexus_id": requester_nexus_id,
+                            "tier": tier_name,
+                            "mode": mode,
+                            "tool": new_tool,
+                            "agent_type": agent_type,
+                            "exclude_tools": _merge_excluded_tools(
+                                prev.get("exclude_tools", []), merged_exclusions
+                            ),
+                        }
+                        HostStateManager.save_launched_agents(launched_agents)
                     record_agent_launch(issue_num, agent_type=agent_type, pid=int(pid_new or 0))
                     AuditStore.audit_log(
                         int(issue_num),
@@ -2205,31 +2211,32 @@ def invoke_ai_agent(
                         if until > time.time():
                             dynamic_exclusions.append(tool)
 
-                launched_agents = HostStateManager.load_launched_agents(recent_only=False)
-                previous_entry = launched_agents.get(str(issue_num), {})
-                if not isinstance(previous_entry, dict):
-                    previous_entry = {}
-
-                entry = dict(previous_entry)
-                entry.update(
-                    {
-                        "timestamp": time.time(),
-                        "pid": pid,
-                        "project": project_name,
-                        "requester_nexus_id": effective_requester_nexus_id,
-                        "tier": tier_name,
-                        "mode": mode,
-                        "tool": tool_name,
-                        "agent_type": agent_type,
-                        "exclude_tools": _merge_excluded_tools(
-                            previous_entry.get("exclude_tools", []),
-                            list(exclude_tools) if exclude_tools else [],
-                            dynamic_exclusions,
-                        ),
-                    }
-                )
-                launched_agents[str(issue_num)] = entry
-                HostStateManager.save_launched_agents(launched_agents)
+                with HostStateManager.state_lock(LAUNCHED_AGENTS_FILE):
+                    launched_agents = HostStateManager.load_launched_agents(recent_only=False)
+                    previous_entry = launched_agents.get(str(issue_num), {})
+                    if not isinstance(previous_entry, dict):
+                        previous_entry = {}
+
+                    entry = dict(previous_entry)
+                    entry.update(
+                        {
+                            "timestamp": time.time(),
+                            "pid": pid,
+                            "project": project_name,
+                            "requester_nexus_id": effective_requester_nexus_id,
+                            "tier": tier_name,
+                            "mode": mode,
+                            "tool": tool_name,
+                            "agent_type": agent_type,
+                            "exclude_tools": _merge_excluded_tools(
+                                previous_entry.get("exclude_tools", []),
+                                list(exclude_tools) if exclude_tools else [],
+                                dynamic_exclusions,
+                            ),
+                        }
+                    )
+                    launched_agents[str(issue_num)] = entry
+                    HostStateManager.save_launched_agents(launched_agents)
 
                 record_agent_launch(issue_num, agent_type=agent_type, pid=pid)
 
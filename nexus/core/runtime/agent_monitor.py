@@ -107,4 +107,7 @@ class AgentMonitor:
     @staticmethod
     def mark_failed(issue_num: str, agent_name: str, reason: str) -> None:
         """Mark an agent as permanently failed."""
+        from nexus.core.orchestration.ai_orchestrator import record_agent_outcome
+
         AuditStore.audit_log(int(issue_num), "AGENT_FAILED", reason)
+        record_agent_outcome(str(issue_num), success=False, agent_type=agent_name)
@@ -9,7 +9,6 @@ Bridges ProcessOrchestrator (nexus-arc) with the concrete nexus host:
 """
 
 import asyncio
-import glob
 import json
 import logging
 import os
@@ -481,7 +480,7 @@ class NexusAgentRuntime(AgentRuntime):
                 entry["retry_fuse"] = fuse
                 entry["retry_fuse_trip_times"] = trip_times
                 launched[issue_key] = entry
-                HostStateManager.save_launched_agents(launched)
+                HostStateManager.merge_launched_agents({issue_key: entry})
 
                 if not alerted:
                     try:
@@ -565,7 +564,7 @@ class NexusAgentRuntime(AgentRuntime):
                     entry["retry_fuse"] = fuse
                     entry["retry_fuse_trip_times"] = trip_times
                     launched[issue_key] = entry
-                    HostStateManager.save_launched_agents(launched)
+                    HostStateManager.merge_launched_agents({issue_key: entry})
 
                 logger.error(
                     "Retry fuse tripped for issue #%s agent %s (%d attempts in window, %d trips in hard window)",
@@ -578,7 +577,7 @@ class NexusAgentRuntime(AgentRuntime):
 
             entry["retry_fuse"] = fuse
             launched[issue_key] = entry
-            HostStateManager.save_launched_agents(launched)
+            HostStateManager.merge_launched_agents({issue_key: entry})
         except Exception as exc:
             logger.debug(
                 "Retry fuse bookkeeping failed for issue #%s (%s); falling back to monitor retry logic",
@@ -1196,6 +1195,9 @@ class NexusAgentRuntime(AgentRuntime):
         return bool(AgentMonitor.kill_agent(pid, ""))
 
     def notify_timeout(self, issue_number: str, agent_type: str, will_retry: bool) -> None:
+        from nexus.core.orchestration.ai_orchestrator import record_agent_outcome
+
+        record_agent_outcome(str(issue_number), success=False, agent_type=agent_type)
         normalized = str(agent_type or "").strip().lstrip("@").strip().lower()
         if not normalized or normalized in {"unknown", "none", "n/a"}:
             logger.warning(
@@ -1215,22 +1217,9 @@ class NexusAgentRuntime(AgentRuntime):
     def get_latest_issue_log(self, issue_number: str) -> str | None:
         """Return latest task session log path for an issue, if present."""
         try:
-            from nexus.core.config import BASE_DIR, get_nexus_dir_name
-
-            nexus_dir_name = get_nexus_dir_name()
-            pattern = os.path.join(
-                BASE_DIR,
-                "**",
-                nexus_dir_name,
-                "tasks",
-                "*",
-                "logs",
-                f"*_{issue_number}_*.log",
-            )
-            matches = glob.glob(pattern, recursive=True)
-            if not matches:
-                return None
-            return max(matches, key=os.path.getmtime)
+            from nexus.core.runtime.task_log_index import get_task_log_index
+
+            return get_task_log_index().latest(str(issue_number))
         except Exception:
             return None
 
@@ -0,0 +1,295 @@
+"""Index of agent task logs by issue number.
+
+Agent logs are written as ``<tool>_<issue>_<YYYYmmdd_HHMMSS>.log`` into
+``<workspace>/<nexus_dir>/tasks/<project>/logs``.  Instead of globbing
+``BASE_DIR/**`` (which walks every checked-out repo, ``node_modules`` and
+``.git`` included) each lookup consults a set of known log directories:
+
+* directories are registered when an agent launch prepares its log path and
+  persisted to a small host-wide registry file so every Nexus process sees them;
+* a directory is re-listed only when its mtime changes (a new log was created);
+* the files of the requested issue are re-``stat``-ed to keep size/mtime current.
+
+The first time a host runs without a registry, the legacy recursive globs run
+once to seed it.
+"""
+
+import glob
+import logging
+import os
+import re
+import threading
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from nexus.core.shared_json_file import SharedJsonFile
+
+logger = logging.getLogger(__name__)
+
+_LOG_NAME_RE = re.compile(r"^(?P<tool>.+?)_(?P<issue>\d+)_\d{8}_\d{6}.*\.log$")
+
+
+@dataclass(frozen=True)
+class TaskLogEntry:
+    """One indexed agent log file."""
+
+    path: str
+    issue: str
+    tool: str
+    mtime: float
+    size: int
+
+
+def parse_task_log_name(path: str) -> tuple[str, str] | None:
+    """Return ``(tool, issue)`` for an agent log file name, or ``None``."""
+    match = _LOG_NAME_RE.match(os.path.basename(path))
+    if not match:
+        return None
+    return match.group("tool"), match.group("issue")
+
+
+class TaskLogIndex:
+    """Issue → log files map over a registered set of log directories.
+
+    Args:
+        registry_path: Optional JSON file listing known log directories, shared
+            by every process on the host.
+        refresh_interval: Minimum seconds between directory mtime checks.
+        clock: Monotonic clock (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        registry_path: str | None = None,
+        *,
+        refresh_interval: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.refresh_interval = max(0.0, float(refresh_interval))
+        self._clock = clock
+        self._registry = SharedJsonFile(registry_path) if registry_path else None
+        self._dir_mtimes: dict[str, int] = {}
+        self._dir_files: dict[str, set[str]] = {}
+        self._by_issue: dict[str, dict[str, TaskLogEntry]] = {}
+        self._next_refresh = 0.0
+        self._lock = threading.RLock()
+        self.stats = {"lookups": 0, "dir_scans": 0, "seeded_dirs": 0}
+        self._load_registry(force=True)
+
+    @property
+    def has_registry(self) -> bool:
+        """Whether a persisted registry already exists on disk."""
+        return self._registry is not None and os.path.exists(self._registry.path)
+
+    @property
+    def directories(self) -> list[str]:
+        with self._lock:
+            return sorted(self._dir_mtimes)
+
+    def register_directories(self, directories: Iterable[str]) -> None:
+        """Add log directories to the index and the shared registry."""
+        new_dirs: list[str] = []
+        with self._lock:
+            for directory in directories:
+                directory = os.path.abspath(directory)
+                if directory not in self._dir_mtimes:
+                    self._dir_mtimes[directory] = -1
+                    self._dir_files[directory] = set()
+                    new_dirs.append(directory)
+            if new_dirs:
+                self._next_refresh = 0.0
+        if self._registry is not None and (new_dirs or not self.has_registry):
+
+            def _add(data: dict[str, Any]) -> None:
+                known = set(data.get("directories") or [])
+                data["directories"] = sorted(known.union(new_dirs))
+
+            self._registry.update(_add)
+
+    def record(self, log_path: str) -> None:
+        """Index a log file created by an agent launch (and register its directory)."""
+        log_path = os.path.abspath(log_path)
+        directory = os.path.dirname(log_path)
+        self.register_directories([directory])
+        with self._lock:
+            self._index_file(directory, log_path)
+
+    def issue_logs(
+        self, issue_number: str, *, tool: str | None = None, directory: str | None = None
+    ) -> list[TaskLogEntry]:
+        """Return the issue's log files, newest first."""
+        issue = str(issue_number).strip().lstrip("#")
+        wanted_dir = os.path.abspath(directory) if directory else None
+        with self._lock:
+            self.stats["lookups"] += 1
+            self._refresh()
+            entries = self._by_issue.get(issue, {})
+            for path in list(entries):
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    self._drop_file(path)
+                    continue
+                entry = entries[path]
+                if stat.st_mtime != entry.mtime or stat.st_size != entry.size:
+                    entries[path] = TaskLogEntry(
+                        path, entry.issue, entry.tool, stat.st_mtime, stat.st_size
+                    )
+            selected = [
+                entry
+                for entry in entries.values()
+                if (not tool or tool == "*" or entry.tool == tool)
+                and (wanted_dir is None or os.path.dirname(entry.path) == wanted_dir)
+            ]
+        return sorted(selected, key=lambda entry: entry.mtime, reverse=True)
+
+    def latest(
+        self, issue_number: str, *, tool: str | None = None, directory: str | None = None
+    ) -> str | None:
+        """Return the most recently modified log path for the issue, if any."""
+        entries = self.issue_logs(issue_number, tool=tool, directory=directory)
+        return entries[0].path if entries else None
+
+    def all_logs(self) -> list[TaskLogEntry]:
+        """Return every indexed log (across all issues), newest first."""
+        with self._lock:
+            self._refresh()
+            entries = [entry for files in self._by_issue.values() for entry in files.values()]
+        return sorted(entries, key=lambda entry: entry.mtime, reverse=True)
+
+    def seed_from_paths(self, paths: Iterable[str]) -> None:
+        """Register the directories holding *paths* (used for the one-off bootstrap)."""
+        directories = {os.path.dirname(os.path.abspath(path)) for path in paths}
+        self.stats["seeded_dirs"] += len(directories)
+        self.register_directories(sorted(directories))
+
+    # ------------------------------------------------------------------
+    # Internals (callers hold ``self._lock``)
+    # ------------------------------------------------------------------
+
+    def _load_registry(self, *, force: bool = False) -> None:
+        if self._registry is None:
+            return
+        data = self._registry.read_if_changed(force=force)
+        if not data:
+            return
+        with self._lock:
+            for directory in data.get("directories") or []:
+                if isinstance(directory, str) and directory not in self._dir_mtimes:
+                    self._dir_mtimes[directory] = -1
+                    self._dir_files[directory] = set()
+
+    def _refresh(self) -> None:
+        now = self._clock()
+        if now < self._next_refresh:
+            return
+        self._next_refresh = now + self.refresh_interval
+        self._load_registry()
+        for directory, seen_mtime in list(self._dir_mtimes.items()):
+            try:
+                mtime = os.stat(directory).st_mtime_ns
+            except OSError:
+                mtime = -2
+            if mtime == seen_mtime:
+                continue
+            self._dir_mtimes[directory] = mtime
+            self._rescan(directory)
+
+    def _rescan(self, directory: str) -> None:
+        self.stats["dir_scans"] += 1
+        present: set[str] = set()
+        try:
+            with os.scandir(directory) as it:
+                for item in it:
+                    if item.name.endswith(".log") and item.is_file():
+                        present.add(item.path)
+        except OSError:
+            pass
+        for path in self._dir_files.get(directory, set()) - present:
+            self._drop_file(path)
+        for path in present - self._dir_files.get(directory, set()):
+            self._index_file(directory, path)
+
+    def _index_file(self, directory: str, path: str) -> None:
+        parsed = parse_task_log_name(path)
+        if parsed is None:
+            return
+        tool, issue = parsed
+        try:
+            stat = os.stat(path)
+            mtime, size = stat.st_mtime, stat.st_size
+        except OSError:
+            mtime, size = time.time(), 0
+        self._dir_files.setdefault(directory, set()).add(path)
+        self._by_issue.setdefault(issue, {})[path] = TaskLogEntry(path, issue, tool, mtime, size)
+
+    def _drop_file(self, path: str) -> None:
+        self._dir_files.get(os.path.dirname(path), set()).discard(path)
+        parsed = parse_task_log_name(path)
+        if parsed is not None:
+            self._by_issue.get(parsed[1], {}).pop(path, None)
+
+
+def legacy_task_log_paths(base_dir: str, nexus_dir_name: str) -> list[str]:
+    """Recursive workspace scan used once to seed an empty registry."""
+    patterns = (
+        os.path.join(base_dir, "**", nexus_dir_name, "tasks", "*", "logs", "**", "*_*.log"),
+        os.path.join(
+            base_dir,
+            "**",
+            nexus_dir_name,
+            "worktrees",
+            "*",
+            nexus_dir_name,
+            "tasks",
+            "*",
+            "logs",
+            "**",
+            "*_*.log",
+        ),
+    )
+    paths: list[str] = []
+    for pattern in patterns:
+        paths.extend(glob.glob(pattern, recursive=True))
+    return paths
+
+
+_index: TaskLogIndex | None = None
+_index_lock = threading.Lock()
+
+
+def get_task_log_index() -> TaskLogIndex:
+    """Return the process-wide index backed by ``$NEXUS_STATE_DIR/task_log_dirs.json``."""
+    global _index
+    with _index_lock:
+        if _index is None:
+            from nexus.core.config import BASE_DIR, NEXUS_STATE_DIR, get_nexus_dir_name
+
+            index = TaskLogIndex(os.path.join(NEXUS_STATE_DIR, "task_log_dirs.json"))
+            if not index.has_registry:
+                started = time.monotonic()
+                index.seed_from_paths(legacy_task_log_paths(BASE_DIR, get_nexus_dir_name()))
+                logger.info(
+                    "Seeded task log index with %d directories in %.2fs",
+                    len(index.directories),
+                    time.monotonic() - started,
+                )
+            _index = index
+        return _index
+
+
+def record_task_log(log_path: str) -> None:
+    """Index a freshly prepared agent log path; never raises."""
+    try:
+        get_task_log_index().record(log_path)
+    except Exception as exc:
+        logger.debug("Could not index task log %s: %s", log_path, exc)
+
+
+def reset_task_log_index() -> None:
+    """Drop the process-wide index (for tests)."""
+    global _index
+    with _index_lock:
+        _index = None
@@ -0,0 +1,88 @@
+"""Small JSON documents shared by every Nexus process on one host."""
+
+import json
+import logging
+import os
+import time
+from collections.abc import Callable
+from typing import Any
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX hosts
+    fcntl = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+
+class SharedJsonFile:
+    """A JSON object updated under an ``flock`` and replaced atomically.
+
+    Readers poll :meth:`read_if_changed`, which costs one ``stat()`` per
+    *refresh_interval* and only parses the file when its ``(mtime, size)``
+    changed.
+    """
+
+    def __init__(self, path: str, *, refresh_interval: float = 1.0) -> None:
+        self.path = path
+        self._refresh_interval = float(refresh_interval)
+        self._signature: tuple[int, int] | None = None
+        self._next_refresh = 0.0
+
+    def read_if_changed(self, *, force: bool = False) -> dict[str, Any] | None:
+        """Return the document if it changed since the last read/write, else ``None``."""
+        now = time.monotonic()
+        if not force and now < self._next_refresh:
+            return None
+        self._next_refresh = now + self._refresh_interval
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        signature = (stat.st_mtime_ns, stat.st_size)
+        if signature == self._signature:
+            return None
+        data = self._read()
+        if data is None:
+            return None
+        self._signature = signature
+        return data
+
+    def update(self, mutate: Callable[[dict[str, Any]], None]) -> dict[str, Any] | None:
+        """Apply *mutate* to the latest on-disk document and write it back.
+
+        Returns the written document, or ``None`` if the file could not be updated.
+        """
+        try:
+            parent = os.path.dirname(self.path)
+            if parent:
+                os.makedirs(parent, exist_ok=True)
+            with open(f"{self.path}.lock", "a", encoding="utf-8") as lock_fh:
+                if fcntl is not None:
+                    fcntl.flock(lock_fh.fileno(), fcntl.LOCK_EX)
+                try:
+                    data = self._read() or {}
+                    mutate(data)
+                    tmp_path = f"{self.path}.tmp"
+                    with open(tmp_path, "w", encoding="utf-8") as fh:
+                        json.dump(data, fh, indent=2, sort_keys=True)
+                    os.replace(tmp_path, self.path)
+                    stat = os.stat(self.path)
+                    self._signature = (stat.st_mtime_ns, stat.st_size)
+                    return data
+                finally:
+                    if fcntl is not None:
+                        fcntl.flock(lock_fh.fileno(), fcntl.LOCK_UN)
+        except OSError as exc:
+            logger.warning("Could not update shared state file %s: %s", self.path, exc)
+            return None
+
+    def _read(self) -> dict[str, Any] | None:
+        try:
+            with open(self.path, encoding="utf-8") as fh:
+                data = json.load(fh)
+        except (OSError, ValueError) as exc:
+            if not isinstance(exc, FileNotFoundError):
+                logger.debug("Could not read shared state file %s: %s", self.path, exc)
+            return None
+        return data if isinstance(data, dict) else None
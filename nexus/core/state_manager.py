@@ -9,13 +9,19 @@ Workflow and approval state is managed by :mod:`integrations.workflow_state_fact
 """
 
 import asyncio
+import contextlib
 import logging
 import os
 import threading
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Iterator
 from typing import Any
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX hosts
+    fcntl = None  # type: ignore[assignment]
+
 from nexus.core.config import (
     AGENT_RECENT_WINDOW,
     LAUNCHED_AGENTS_FILE,
@@ -30,6 +36,12 @@ logger = logging.getLogger(__name__)
 MERGE_QUEUE_FILE = f"{NEXUS_STATE_DIR}/merge_queue.json"
 WORKFLOW_WATCH_SUBSCRIPTIONS_FILE = f"{NEXUS_STATE_DIR}/workflow_watch_subscriptions.json"
 
+# Per-state-file locks: an RLock serializes threads of this process (processor
+# jobs run concurrently) and an ``flock`` on ``<path>.lock`` serializes processes.
+_STATE_LOCKS: dict[str, threading.RLock] = {}
+_STATE_LOCKS_GUARD = threading.Lock()
+_STATE_LOCK_DEPTH = threading.local()
+
 # Optional SocketIO emitter injected at startup by webhook_server.py.
 # Signature: (event_name: str, data: dict) -> None
 _socketio_emitter: Callable[[str, Any], None] | None = None
@@ -146,6 +158,38 @@ class HostStateManager:
             },
         )
 
+    @staticmethod
+    @contextlib.contextmanager
+    def state_lock(path: str) -> Iterator[None]:
+        """Hold the lock for state file *path* around a load → modify → save cycle.
+
+        Reentrant within a thread.  The cross-process ``flock`` is only taken
+        for filesystem-backed host state.
+        """
+        with _STATE_LOCKS_GUARD:
+            lock = _STATE_LOCKS.setdefault(path, threading.RLock())
+        with lock:
+            depths = _STATE_LOCK_DEPTH.__dict__.setdefault("depths", {})
+            outermost = not depths.get(path)
+            depths[path] = depths.get(path, 0) + 1
+            lock_fh = None
+            try:
+                if outermost and fcntl is not None and _get_host_state_backend() != "postgres":
+                    try:
+                        parent = os.path.dirname(path)
+                        if parent:
+                            os.makedirs(parent, exist_ok=True)
+                        lock_fh = open(f"{path}.lock", "a", encoding="utf-8")
+                        fcntl.flock(lock_fh.fileno(), fcntl.LOCK_EX)
+                    except OSError as exc:
+                        logger.warning("Could not lock host state file %s: %s", path, exc)
+                yield
+            finally:
+                depths[path] -= 1
+                if lock_fh is not None:
+                    fcntl.flock(lock_fh.fileno(), fcntl.LOCK_UN)
+                    lock_fh.close()
+
     @staticmethod
     def _load_json_state(path: str, default, ensure_logs: bool = False):
         """Load JSON state — routes to postgres or filesystem based on config."""
@@ -225,6 +269,23 @@ class HostStateManager:
             context="launched agents",
         )
 
+    @staticmethod
+    def merge_launched_agents(
+        changed: dict[str, dict], removed: Iterable[str] = ()
+    ) -> dict[str, dict]:
+        """Apply per-key changes to the latest persisted launched-agents map.
+
+        Reads, merges and saves under :meth:`state_lock`, so concurrent writers
+        only replace the keys they changed.  Returns the saved map.
+        """
+        with HostStateManager.state_lock(LAUNCHED_AGENTS_FILE):
+            data = HostStateManager.load_launched_agents(recent_only=False)
+            for key in removed:
+                data.pop(str(key), None)
+            data.update(changed)
+            HostStateManager.save_launched_agents(data)
+        return data
+
     @staticmethod
     def get_last_tier_for_issue(issue_num: str) -> str | None:
         """Get the last known workflow tier for an issue from launched_agents.
@@ -258,16 +319,17 @@ class HostStateManager:
         issue_num: str, agent_name: str, pid: int, nexus_id: str | None = None
     ) -> None:
         """Register a newly launched agent."""
-        data = HostStateManager.load_launched_agents()
-        key = HostStateManager._launched_agent_key(issue_num, agent_name, nexus_id=nexus_id)
-        data[key] = {
-            "issue": issue_num,
-            "agent": agent_name,
-            "pid": pid,
-            "nexus_id": nexus_id,
-            "timestamp": time.time(),
-        }
-        HostStateManager.save_launched_agents(data)
+        with HostStateManager.state_lock(LAUNCHED_AGENTS_FILE):
+            data = HostStateManager.load_launched_agents()
+            key = HostStateManager._launched_agent_key(issue_num, agent_name, nexus_id=nexus_id)
+            data[key] = {
+                "issue": issue_num,
+                "agent": agent_name,
+                "pid": pid,
+                "nexus_id": nexus_id,
+                "timestamp": time.time(),
+            }
+            HostStateManager.save_launched_agents(data)
         logger.info(f"Registered launched agent: {agent_name} (PID: {pid}) for issue #{issue_num}")
         HostStateManager.emit_transition(
             "agent_registered",
@@ -338,6 +400,21 @@ class HostStateManager:
             context="workflow watch subscriptions",
         )
 
+    @staticmethod
+    def update_workflow_watch_subscriptions(
+        changed: dict[str, dict], removed: Iterable[str] = ()
+    ) -> None:
+        """Merge changed/removed watch subscriptions into the persisted map."""
+        removed_keys = [str(key) for key in removed]
+        if not changed and not removed_keys:
+            return
+        with HostStateManager.state_lock(WORKFLOW_WATCH_SUBSCRIPTIONS_FILE):
+            data = HostStateManager.load_workflow_watch_subscriptions()
+            for key in removed_keys:
+                data.pop(key, None)
+            data.update(changed)
+            HostStateManager.save_workflow_watch_subscriptions(data)
+
     @staticmethod
     def enqueue_merge_candidate(
         *,
@@ -357,25 +434,26 @@ class HostStateManager:
         if normalized_mode not in {"manual", "auto"}:
             normalized_mode = "manual"
 
-        now = time.time()
-        queue = HostStateManager.load_merge_queue()
-        current = queue.get(pr_key, {}) if isinstance(queue.get(pr_key), dict) else {}
-
-        item = {
-            "pr_url": pr_key,
-            "issue": str(issue_num),
-            "project": str(project),
-            "repo": str(repo or ""),
-            "review_mode": normalized_mode,
-            "status": (
-                "pending_auto_merge" if normalized_mode == "auto" else "pending_manual_review"
-            ),
-            "source": str(source or "workflow_complete"),
-            "created_at": float(current.get("created_at", now)),
-            "updated_at": now,
-        }
-        queue[pr_key] = item
-        HostStateManager.save_merge_queue(queue)
+        with HostStateManager.state_lock(MERGE_QUEUE_FILE):
+            now = time.time()
+            queue = HostStateManager.load_merge_queue()
+            current = queue.get(pr_key, {}) if isinstance(queue.get(pr_key), dict) else {}
+
+            item = {
+                "pr_url": pr_key,
+                "issue": str(issue_num),
+                "project": str(project),
+                "repo": str(repo or ""),
+                "review_mode": normalized_mode,
+                "status": (
+                    "pending_auto_merge" if normalized_mode == "auto" else "pending_manual_review"
+                ),
+                "source": str(source or "workflow_complete"),
+                "created_at": float(current.get("created_at", now)),
+                "updated_at": now,
+            }
+            queue[pr_key] = item
+            HostStateManager.save_merge_queue(queue)
         HostStateManager.emit_transition("merge_queue_updated", item)
         return item
 
@@ -386,38 +464,69 @@ class HostStateManager:
         if not pr_key:
             return None
 
-        queue = HostStateManager.load_merge_queue()
-        current = queue.get(pr_key)
-        if not isinstance(current, dict):
-            return None
-
-        updated = dict(current)
-        updated.update({k: v for k, v in changes.items() if v is not None})
-        updated["updated_at"] = time.time()
-        queue[pr_key] = updated
-        HostStateManager.save_merge_queue(queue)
+        with HostStateManager.state_lock(MERGE_QUEUE_FILE):
+            queue = HostStateManager.load_merge_queue()
+            current = queue.get(pr_key)
+            if not isinstance(current, dict):
+                return None
+
+            updated = dict(current)
+            updated.update({k: v for k, v in changes.items() if v is not None})
+            updated["updated_at"] = time.time()
+            queue[pr_key] = updated
+            HostStateManager.save_merge_queue(queue)
         HostStateManager.emit_transition("merge_queue_updated", updated)
         return updated
 
+    @staticmethod
+    def update_merge_candidates(updates: dict[str, dict[str, Any]]) -> list[dict[str, Any]]:
+        """Apply several merge-queue entry updates with a single load/save cycle."""
+        if not updates:
+            return []
+
+        with HostStateManager.state_lock(MERGE_QUEUE_FILE):
+            queue = HostStateManager.load_merge_queue()
+            now = time.time()
+            updated_items: list[dict[str, Any]] = []
+            for pr_url, changes in updates.items():
+                pr_key = str(pr_url or "").strip()
+                current = queue.get(pr_key)
+                if not pr_key or not isinstance(current, dict):
+                    continue
+                updated = dict(current)
+                updated.update({k: v for k, v in changes.items() if v is not None})
+                updated["updated_at"] = now
+                queue[pr_key] = updated
+                updated_items.append(updated)
+            if updated_items:
+                HostStateManager.save_merge_queue(queue)
+
+        if updated_items:
+            for updated in updated_items:
+                HostStateManager.emit_transition("merge_queue_updated", updated)
+        return updated_items
+
     @staticmethod
     def add_tracked_issue(issue_num: int, project: str, description: str) -> None:
         """Add an issue to tracking."""
-        data = HostStateManager.load_tracked_issues()
-        data[str(issue_num)] = {
-            "project": project,
-            "description": description,
-            "created_at": time.time(),
-            "status": "active",
-        }
-        HostStateManager.save_tracked_issues(data)
+        with HostStateManager.state_lock(TRACKED_ISSUES_FILE):
+            data = HostStateManager.load_tracked_issues()
+            data[str(issue_num)] = {
+                "project": project,
+                "description": description,
+                "created_at": time.time(),
+                "status": "active",
+            }
+            HostStateManager.save_tracked_issues(data)
         logger.info(f"Added tracked issue: #{issue_num} ({project})")
 
     @staticmethod
     def remove_tracked_issue(issue_num: int) -> None:
         """Remove an issue from tracking."""
-        data = HostStateManager.load_tracked_issues()
-        data.pop(str(issue_num), None)
-        HostStateManager.save_tracked_issues(data)
+        with HostStateManager.state_lock(TRACKED_ISSUES_FILE):
+            data = HostStateManager.load_tracked_issues()
+            data.pop(str(issue_num), None)
+            HostStateManager.save_tracked_issues(data)
         logger.info(f"Removed tracked issue: #{issue_num}")
 
     @staticmethod
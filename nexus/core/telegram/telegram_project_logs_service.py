@@ -5,6 +5,7 @@ import re
 from nexus.core.project.catalog import (
     get_single_project_key as _shared_get_single_project_key,
 )
+from nexus.core.runtime.task_log_index import get_task_log_index
 
 
 def resolve_project_root_from_task_path(task_file: str) -> str:
@@ -137,32 +138,9 @@ def find_issue_log_files(
     if matches:
         return matches
 
-    matches.extend(
-        glob.glob(
-            os.path.join(
-                base_dir, "**", nexus_dir_name, "tasks", "*", "logs", "**", f"*_{issue_num}_*.log"
-            ),
-            recursive=True,
-        )
-    )
-    matches.extend(
-        glob.glob(
-            os.path.join(
-                base_dir,
-                "**",
-                nexus_dir_name,
-                "worktrees",
-                "*",
-                nexus_dir_name,
-                "tasks",
-                "*",
-                "logs",
-                "**",
-                f"*_{issue_num}_*.log",
-            ),
-            recursive=True,
-        )
-    )
+    # Workspace-wide lookup goes through the task log index instead of
+    # globbing base_dir/**/<nexus_dir>/... on every call.
+    matches.extend(entry.path for entry in get_task_log_index().issue_logs(issue_num))
 
     unique: list[str] = []
     seen: set[str] = set()
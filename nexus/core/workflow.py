@@ -34,6 +34,7 @@ from nexus.core.workflow_engine.audit_event_service import (
 )
 from nexus.core.workflow_engine.completion_service import apply_step_completion_result
 from nexus.core.workflow_engine.condition_eval import evaluate_condition
+from nexus.core.workflow_engine.step_change_tracker import StepChangeTracker
 from nexus.core.workflow_engine.transition_service import advance_after_success
 from nexus.core.workflow_engine.transition_service import (
     reset_step_for_goto as reset_step_for_goto_impl,
@@ -59,6 +60,9 @@ OnWorkflowComplete = Callable[[Workflow, dict], Awaitable[None]]
 _MAX_LOOP_ITERATIONS = max(
     1, int(os.getenv("NEXUS_MAX_LOOP_ITERATIONS", "20"))
 )  # Maximum times a step can be re-activated by a goto before aborting
+_TERMINAL_WORKFLOW_STATES = frozenset(
+    {WorkflowState.COMPLETED, WorkflowState.FAILED, WorkflowState.CANCELLED}
+)
 _DEFAULT_BACKOFF_BASE = 1.0  # Default base delay (seconds) used when step.initial_delay is unset
 
 
@@ -91,6 +95,7 @@ class WorkflowEngine:
         self._on_step_transition = on_step_transition
         self._on_workflow_complete = on_workflow_complete
         self._event_bus = event_bus
+        self._step_changes = StepChangeTracker()
 
     async def create_workflow(self, workflow: Workflow) -> Workflow:
         """Create and persist a new workflow."""
@@ -101,7 +106,7 @@ class WorkflowEngine:
         # Apply workflow-level approval gates to steps
         workflow.apply_approval_gates()
 
-        await self.storage.save_workflow(workflow)
+        await self._save_workflow(workflow)
         await self._audit(workflow.id, "WORKFLOW_CREATED", {"name": workflow.name})
 
         logger.info(f"Created workflow {workflow.id}: {workflow.name}")
@@ -117,7 +122,7 @@ class WorkflowEngine:
 
     async def start_workflow(self, workflow_id: str) -> Workflow:
         """Start workflow execution."""
-        workflow = await self.storage.load_workflow(workflow_id)
+        workflow = await self._load_workflow(workflow_id)
         if not workflow:
             raise ValueError(f"Workflow {workflow_id} not found")
 
@@ -142,7 +147,7 @@ class WorkflowEngine:
                 )
             )
 
-        await self.storage.save_workflow(workflow)
+        await self._save_workflow(workflow)
         await self._audit(workflow_id, "WORKFLOW_STARTED", {})
         await self._emit(WorkflowStarted(workflow_id=workflow_id))
 
@@ -151,7 +156,7 @@ class WorkflowEngine:
 
     async def pause_workflow(self, workflow_id: str) -> Workflow:
         """Pause workflow execution."""
-        workflow = await self.storage.load_workflow(workflow_id)
+        workflow = await self._load_workflow(workflow_id)
         if not workflow:
             raise ValueError(f"Workflow {workflow_id} not found")
 
@@ -161,7 +166,7 @@ class WorkflowEngine:
         workflow.state = WorkflowState.PAUSED
         workflow.updated_at = datetime.now(UTC)
 
-        await self.storage.save_workflow(workflow)
+        await self._save_workflow(workflow)
         await self._audit(workflow_id, "WORKFLOW_PAUSED", {})
         await self._emit(WorkflowPaused(workflow_id=workflow_id))
 
@@ -170,7 +175,7 @@ class WorkflowEngine:
 
     async def resume_workflow(self, workflow_id: str) -> Workflow:
         """Resume paused workflow."""
-        workflow = await self.storage.load_workflow(workflow_id)
+        workflow = await self._load_workflow(workflow_id)
         if not workflow:
             raise ValueError(f"Workflow {workflow_id} not found")
 
@@ -180,7 +185,7 @@ class WorkflowEngine:
         workflow.state = WorkflowState.RUNNING
         workflow.updated_at = datetime.now(UTC)
 
-        await self.storage.save_workflow(workflow)
+        await self._save_workflow(workflow)
         await self._audit(workflow_id, "WORKFLOW_RESUMED", {})
 
         logger.info(f"Resumed workflow {workflow_id}")
@@ -188,7 +193,7 @@ class WorkflowEngine:
 
     async def cancel_workflow(self, workflow_id: str) -> Workflow:
         """Cancel workflow execution."""
-        workflow = await self.storage.load_workflow(workflow_id)
+        workflow = await self._load_workflow(workflow_id)
         if not workflow:
             raise ValueError(f"Workflow {workflow_id} not found")
 
@@ -199,7 +204,7 @@ class WorkflowEngine:
         workflow.updated_at = datetime.now(UTC)
         workflow.completed_at = datetime.now(UTC)
 
-        await self.storage.save_workflow(workflow)
+        await self._save_workflow(workflow)
         await self._audit(workflow_id, "WORKFLOW_CANCELLED", {})
         await self._emit(WorkflowCancelled(workflow_id=workflow_id))
 
@@ -210,7 +215,7 @@ class WorkflowEngine:
         self, workflow_id: str, step_num: int, outputs: dict, error: str | None = None
     ) -> Workflow:
         """Mark a step as completed and advance workflow."""
-        workflow = await self.storage.load_workflow(workflow_id)
+        workflow = await self._load_workflow(workflow_id)
         if not workflow:
             raise ValueError(f"Workflow {workflow_id} not found")
 
@@ -225,7 +230,7 @@ class WorkflowEngine:
             outputs=outputs,
             error=error,
             default_backoff_base=_DEFAULT_BACKOFF_BASE,
-            save_workflow=self.storage.save_workflow,
+            save_workflow=self._save_workflow,
             audit=self._audit,
             emit=self._emit,
         )
@@ -242,7 +247,7 @@ class WorkflowEngine:
                     step_num=step_num,
                     step_name=step.name,
                     outputs=outputs,
-                    save_workflow=self.storage.save_workflow,
+                    save_workflow=self._save_workflow,
                     audit=self._audit,
                     emit=self._emit,
                     on_workflow_complete=self._on_workflow_complete,
@@ -275,7 +280,7 @@ class WorkflowEngine:
                 logger.error(transition_outcome.goto_reset_error)
                 workflow.state = WorkflowState.FAILED
                 workflow.completed_at = datetime.now(UTC)
-                await self.storage.save_workflow(workflow)
+                await self._save_workflow(workflow)
                 return workflow
 
             if workflow.state == WorkflowState.COMPLETED and activated_step is None:
@@ -311,7 +316,7 @@ class WorkflowEngine:
             outputs=outputs,
             error=error,
             activated_step=activated_step,
-            save_workflow=self.storage.save_workflow,
+            save_workflow=self._save_workflow,
             audit=self._audit,
             on_step_transition=self._on_step_transition,
             on_workflow_complete=self._on_workflow_complete,
@@ -464,6 +469,25 @@ class WorkflowEngine:
 
         return runnable
 
+    async def _load_workflow(self, workflow_id: str) -> Workflow | None:
+        """Load a workflow the engine is about to mutate and remember its step state."""
+        workflow = await self.storage.load_workflow(workflow_id)
+        if workflow is not None:
+            self._step_changes.remember(workflow)
+        return workflow
+
+    async def _save_workflow(self, workflow: Workflow) -> None:
+        """Persist *workflow*, writing only the steps changed since it was loaded."""
+        changed = self._step_changes.changed_steps(workflow)
+        if changed is None:
+            await self.storage.save_workflow(workflow)
+        else:
+            await self.storage.patch_workflow(workflow, changed)
+        if workflow.state in _TERMINAL_WORKFLOW_STATES:
+            self._step_changes.forget(workflow.id)
+        else:
+            self._step_changes.remember(workflow)
+
     async def _audit(self, workflow_id: str, event_type: str, data: dict) -> None:
         """Add audit event."""
         event = AuditEvent(
@@ -1,12 +1,86 @@
+import ast
 import logging
+from collections.abc import Iterator, Mapping
+from functools import lru_cache
+from types import CodeType
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# YAML-style literals available to every condition unless the context shadows them.
+_LITERALS: dict[str, Any] = {"true": True, "false": False, "null": None}
+_EVAL_GLOBALS: dict[str, Any] = {"__builtins__": {}}
+
+# Constructs that have no place in a routing predicate and only widen what a
+# workflow author can reach from inside the (builtin-free) evaluation scope.
+_FORBIDDEN_NODES: tuple[type[ast.AST], ...] = (
+    ast.Lambda,
+    ast.NamedExpr,
+    ast.Await,
+    ast.Yield,
+    ast.YieldFrom,
+)
+
+
+class ConditionSyntaxError(ValueError):
+    """Raised when a workflow condition cannot be compiled or uses unsupported syntax."""
+
+
+class _ConditionScope(Mapping[str, Any]):
+    """Read-only view of a step context with YAML literal fallbacks (no copying)."""
+
+    __slots__ = ("_context",)
+
+    def __init__(self, context: Mapping[str, Any]) -> None:
+        self._context = context
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self._context[key]
+        except KeyError:
+            return _LITERALS[key]
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._context
+        yield from (key for key in _LITERALS if key not in self._context)
+
+    def __len__(self) -> int:
+        return len(self._context) + sum(1 for key in _LITERALS if key not in self._context)
+
+
+def _validate(tree: ast.Expression, condition: str) -> None:
+    for node in ast.walk(tree):
+        if isinstance(node, _FORBIDDEN_NODES):
+            raise ConditionSyntaxError(
+                f"unsupported {type(node).__name__.lower()} in condition '{condition}'"
+            )
+        name = None
+        if isinstance(node, ast.Attribute):
+            name = node.attr
+        elif isinstance(node, ast.Name):
+            name = node.id
+        if name and name.startswith("__"):
+            raise ConditionSyntaxError(f"dunder access '{name}' in condition '{condition}'")
+
+
+@lru_cache(maxsize=1024)
+def compile_condition(condition: str) -> CodeType:
+    """Compile and validate *condition* once; later calls return the cached code object.
+
+    Raises:
+        ConditionSyntaxError: If the expression is malformed or uses unsupported syntax.
+    """
+    try:
+        tree = ast.parse(condition.strip(), "<condition>", "eval")
+    except SyntaxError as exc:
+        raise ConditionSyntaxError(f"malformed condition '{condition}': {exc}") from exc
+    _validate(tree, condition)
+    return compile(tree, "<condition>", "eval")
+
 
 def evaluate_condition(
     condition: str | None,
-    context: dict[str, Any],
+    context: Mapping[str, Any],
     *,
     default_on_error: bool = True,
 ) -> bool:
@@ -14,11 +88,8 @@ def evaluate_condition(
     if not condition:
         return True
     try:
-        eval_locals = dict(context)
-        eval_locals.setdefault("true", True)
-        eval_locals.setdefault("false", False)
-        eval_locals.setdefault("null", None)
-        result = eval(condition, {"__builtins__": {}}, eval_locals)  # noqa: S307
+        code = compile_condition(condition)
+        result = eval(code, _EVAL_GLOBALS, _ConditionScope(context))  # noqa: S307
         return bool(result)
     except Exception as exc:
         logger.warning(
@@ -0,0 +1,72 @@
+"""Track which workflow steps changed since the engine last loaded or saved them."""
+
+import weakref
+from typing import Any
+
+from nexus.core.models import Workflow, WorkflowStep
+
+
+def _step_state(step: WorkflowStep) -> tuple[Any, ...]:
+    # Runtime fields the engine mutates; ``outputs`` is compared by identity
+    # (the engine replaces the mapping, it never edits it in place).
+    return (
+        step.step_num,
+        step.name,
+        step.status,
+        step.started_at,
+        step.completed_at,
+        step.error,
+        step.retry_count,
+        step.iteration,
+        step.outputs,
+    )
+
+
+class StepChangeTracker:
+    """Remembers per-step state of loaded workflows to compute partial saves.
+
+    Entries are keyed by workflow id and tied to the exact ``Workflow`` object
+    they were taken from, so a different instance always gets a full save.
+    The tracker only holds a weak reference to that object and drops the
+    entry once the workflow is garbage collected.
+    """
+
+    def __init__(self) -> None:
+        self._baselines: dict[str, tuple[weakref.ref[Workflow], dict[int, tuple[Any, ...]]]] = {}
+
+    def remember(self, workflow: Workflow) -> None:
+        workflow_id = workflow.id
+
+        def _drop(ref: weakref.ref[Workflow]) -> None:
+            baseline = self._baselines.get(workflow_id)
+            if baseline is not None and baseline[0] is ref:
+                del self._baselines[workflow_id]
+
+        self._baselines[workflow_id] = (
+            weakref.ref(workflow, _drop),
+            {step.step_num: _step_state(step) for step in workflow.steps},
+        )
+
+    def forget(self, workflow_id: str) -> None:
+        self._baselines.pop(workflow_id, None)
+
+    def changed_steps(self, workflow: Workflow) -> list[int] | None:
+        """Step numbers changed since :meth:`remember`, or ``None`` if unknown."""
+        baseline = self._baselines.get(workflow.id)
+        if baseline is None or baseline[0]() is not workflow:
+            return None
+        states = baseline[1]
+        if len(states) != len(workflow.steps):
+            return None
+        changed: list[int] = []
+        for step in workflow.steps:
+            before = states.get(step.step_num)
+            if before is None:
+                return None
+            current = _step_state(step)
+            if current[:-1] != before[:-1] or current[-1] is not before[-1]:
+                changed.append(step.step_num)
+        return changed
+
+    def __len__(self) -> int:
+        return len(self._baselines)
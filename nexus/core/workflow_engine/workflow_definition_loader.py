@@ -4,7 +4,8 @@ from typing import Any, Callable
 
 import yaml
 
-from nexus.core.models import Agent, WorkflowStep
+from nexus.core.models import WorkflowStep, shared_agent
+from nexus.core.workflow_engine.condition_eval import ConditionSyntaxError, compile_condition
 
 
 def parse_require_human_merge_approval(data: dict[str, Any]) -> bool:
@@ -323,6 +324,20 @@ def resolve_workflow_steps_list(
     return []
 
 
+def _compile_step_conditions(idx: int, condition: Any, routes: Any) -> None:
+    """Compile a step's condition and route clauses so malformed ones fail at load time."""
+    expressions = [condition] if condition else []
+    if isinstance(routes, list):
+        expressions.extend(
+            route.get("when") for route in routes if isinstance(route, dict) and route.get("when")
+        )
+    for expression in expressions:
+        try:
+            compile_condition(str(expression))
+        except ConditionSyntaxError as exc:
+            raise ValueError(f"Step {idx}: {exc}") from exc
+
+
 def build_workflow_steps(
     *,
     data: dict[str, Any],
@@ -374,7 +389,7 @@ def build_workflow_steps(
             # Copy to avoid mutating original lists from yaml parser
             combined_tools = list(combined_tools) + ["vcs:add_comment"]
             
-        agent = Agent(
+        agent = shared_agent(
             name=agent_type,
             display_name=step_data.get("name", agent_type),
             description=step_desc or f"Step {idx}",
@@ -398,6 +413,7 @@ def build_workflow_steps(
             parallel_with = []
 
         step_routes = step_data.get("routes", [])
+        _compile_step_conditions(idx, step_data.get("condition"), step_routes)
         steps.append(
             WorkflowStep(
                 step_num=idx,
@@ -469,8 +485,8 @@ def build_dry_run_report_fields(
             condition = step.get("condition")
             if condition:
                 try:
-                    compile(condition, "<condition>", "eval")
-                except SyntaxError as exc:
+                    compile_condition(condition)
+                except ConditionSyntaxError as exc:
                     errors.append(
                         f"Step '{step_label}': malformed condition expression "
                         f"'{condition}' — {exc}"
@@ -490,7 +506,7 @@ def build_dry_run_report_fields(
             continue
 
         try:
-            result = eval(condition, {"__builtins__": {}}, {})  # noqa: S307
+            result = eval(compile_condition(condition), {"__builtins__": {}}, {})  # noqa: S307
             status = "RUN " if result else "SKIP"
         except NameError:
             status = "RUN "
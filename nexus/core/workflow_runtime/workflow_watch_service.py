@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import atexit
 import hashlib
 import logging
 import os
@@ -24,6 +25,10 @@ logger = logging.getLogger(__name__)
 
 _DEFAULT_NAMESPACE = "/visualizer"
 _DEFAULT_THROTTLE_SECONDS = 2.0
+# Subscription changes are flushed once quiet for the debounce window, and at
+# the latest after the max delay while events keep arriving.
+_PERSIST_DEBOUNCE_SECONDS = 1.0
+_PERSIST_MAX_DELAY_SECONDS = 5.0
 _VISUALIZER_TOKEN_HEADER = "X-Nexus-Visualizer-Token"
 
 
@@ -51,6 +56,16 @@ class WorkflowWatchService:
     def __init__(self) -> None:
         self._lock = threading.RLock()
         self._subscriptions: dict[str, WatchSubscription] = {}
+        # Routing indexes: issue number / workflow id -> subscription keys.
+        self._by_issue: dict[str, set[str]] = {}
+        self._by_workflow: dict[str, set[str]] = {}
+        # Pending persistence (guarded by ``_lock``, flushed by ``_persist_worker``).
+        self._persist_cond = threading.Condition(self._lock)
+        self._dirty_keys: set[str] = set()
+        self._removed_keys: set[str] = set()
+        self._dirty_since = 0.0
+        self._last_change_at = 0.0
+        self._persist_worker: threading.Thread | None = None
         self._loop: asyncio.AbstractEventLoop | None = None
         self._sender: Any = None
         self._snapshot_fetcher: Callable[[str, str], dict[str, Any]] | None = None
@@ -107,8 +122,7 @@ class WorkflowWatchService:
         )
         with self._lock:
             replaced = sub.key in self._subscriptions
-            self._subscriptions[sub.key] = sub
-            self._save_subscriptions()
+            self._put_subscription(sub)
         self.ensure_started()
         self._send_initial_snapshot(sub)
         return {"ok": True, "replaced": replaced, "subscription": asdict(sub)}
@@ -132,9 +146,8 @@ class WorkflowWatchService:
                 return 0
             if issue_num and current.issue_num != str(issue_num):
                 return 0
-            self._subscriptions.pop(key, None)
+            self._drop_subscription(key)
             removed = 1
-            self._save_subscriptions()
         return removed
 
     def set_mermaid(self, *, chat_id: int, user_id: int, enabled: bool) -> bool:
@@ -146,8 +159,7 @@ class WorkflowWatchService:
                 return False
             current.mermaid_enabled = bool(enabled)
             current.updated_at = time.time()
-            self._subscriptions[key] = current
-            self._save_subscriptions()
+            self._mark_dirty(key)
         return True
 
     def get_status(self, *, chat_id: int, user_id: int) -> dict[str, Any] | None:
@@ -217,11 +229,115 @@ class WorkflowWatchService:
             if not sub.issue_num:
                 continue
             loaded[key] = sub
-        self._subscriptions = loaded
+        with self._lock:
+            self._subscriptions = {}
+            self._by_issue.clear()
+            self._by_workflow.clear()
+            for key, sub in loaded.items():
+                self._subscriptions[key] = sub
+                self._index_add(key, sub)
+
+    # ------------------------------------------------------------------
+    # Subscription index (callers hold ``_lock``)
+    # ------------------------------------------------------------------
 
-    def _save_subscriptions(self) -> None:
-        payload = {key: asdict(value) for key, value in self._subscriptions.items()}
-        HostStateManager.save_workflow_watch_subscriptions(payload)
+    def _index_add(self, key: str, sub: WatchSubscription) -> None:
+        self._by_issue.setdefault(sub.issue_num, set()).add(key)
+        if sub.workflow_id:
+            self._by_workflow.setdefault(sub.workflow_id, set()).add(key)
+
+    def _index_remove(self, key: str, sub: WatchSubscription) -> None:
+        for index, value in ((self._by_issue, sub.issue_num), (self._by_workflow, sub.workflow_id)):
+            keys = index.get(value)
+            if keys is None:
+                continue
+            keys.discard(key)
+            if not keys:
+                del index[value]
+
+    def _put_subscription(self, sub: WatchSubscription) -> None:
+        previous = self._subscriptions.get(sub.key)
+        if previous is not None:
+            self._index_remove(sub.key, previous)
+        self._subscriptions[sub.key] = sub
+        self._index_add(sub.key, sub)
+        self._mark_dirty(sub.key)
+
+    def _drop_subscription(self, key: str) -> None:
+        sub = self._subscriptions.pop(key, None)
+        if sub is None:
+            return
+        self._index_remove(key, sub)
+        self._dirty_keys.discard(key)
+        self._removed_keys.add(key)
+        self._schedule_persist()
+
+    # ------------------------------------------------------------------
+    # Debounced persistence
+    # ------------------------------------------------------------------
+
+    def _mark_dirty(self, key: str) -> None:
+        self._removed_keys.discard(key)
+        self._dirty_keys.add(key)
+        self._schedule_persist()
+
+    def _schedule_persist(self) -> None:
+        now = time.monotonic()
+        if not self._dirty_since:
+            self._dirty_since = now
+        self._last_change_at = now
+        if self._persist_worker is None or not self._persist_worker.is_alive():
+            self._persist_worker = threading.Thread(
+                target=self._persist_loop,
+                daemon=True,
+                name="telegram-watch-persist",
+            )
+            self._persist_worker.start()
+        self._persist_cond.notify_all()
+
+    def _persist_loop(self) -> None:
+        while True:
+            with self._persist_cond:
+                while not (self._dirty_keys or self._removed_keys):
+                    if not self._persist_cond.wait(timeout=60.0):
+                        if not (self._dirty_keys or self._removed_keys):
+                            self._persist_worker = None
+                            return
+                while True:
+                    deadline = min(
+                        self._last_change_at + _PERSIST_DEBOUNCE_SECONDS,
+                        self._dirty_since + _PERSIST_MAX_DELAY_SECONDS,
+                    )
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._persist_cond.wait(timeout=remaining)
+            self.flush()
+
+    def flush(self) -> None:
+        """Persist pending subscription changes now (only changed/removed entries)."""
+        with self._lock:
+            changed = {
+                key: asdict(self._subscriptions[key])
+                for key in self._dirty_keys
+                if key in self._subscriptions
+            }
+            removed = set(self._removed_keys)
+            self._dirty_keys.clear()
+            self._removed_keys.clear()
+            self._dirty_since = 0.0
+        if not changed and not removed:
+            return
+        try:
+            HostStateManager.update_workflow_watch_subscriptions(changed, removed)
+        except Exception as exc:
+            logger.warning("Failed to persist workflow watch subscriptions: %s", exc)
+            with self._lock:
+                for key in changed:
+                    if key in self._subscriptions and key not in self._removed_keys:
+                        self._dirty_keys.add(key)
+                self._removed_keys.update(removed - set(self._subscriptions))
+                self._schedule_persist()
 
     def _socket_url(self) -> str:
         default_url = NEXUS_WEBHOOK_INTERNAL_URL or f"http://127.0.0.1:{WEBHOOK_PORT}"
@@ -322,19 +438,26 @@ class WorkflowWatchService:
 
     def _handle_event(self, event_type: str, payload: dict[str, Any]) -> None:
         issue = str((payload or {}).get("issue", "")).strip()
-        if not issue:
-            return
         workflow_id = str((payload or {}).get("workflow_id", "")).strip()
+        if not issue and not workflow_id:
+            return
 
         now = time.time()
         remove_keys: list[str] = []
         to_send: list[tuple[int, str]] = []
 
         with self._lock:
-            for key, sub in self._subscriptions.items():
+            if issue:
+                candidate_keys = sorted(self._by_issue.get(issue, ()))
+            else:
+                candidate_keys = sorted(self._by_workflow.get(workflow_id, ()))
+            for key in candidate_keys:
+                sub = self._subscriptions.get(key)
+                if sub is None:
+                    continue
                 if not self._subscription_matches_event(
                     subscription=sub,
-                    issue=issue,
+                    issue=issue or sub.issue_num,
                     workflow_id=workflow_id,
                     payload=payload,
                 ):
@@ -358,17 +481,15 @@ class WorkflowWatchService:
                 sub.updated_at = now
                 if workflow_id and not sub.workflow_id:
                     sub.workflow_id = workflow_id
-                self._subscriptions[key] = sub
+                    self._by_workflow.setdefault(workflow_id, set()).add(key)
+                self._mark_dirty(key)
                 to_send.append((sub.chat_id, message))
 
                 if event_type == "workflow_completed":
                     remove_keys.append(key)
 
             for key in remove_keys:
-                self._subscriptions.pop(key, None)
-
-            if to_send or remove_keys:
-                self._save_subscriptions()
+                self._drop_subscription(key)
 
         for chat_id, message in to_send:
             self._send_message(chat_id, message)
@@ -464,4 +585,5 @@ def get_workflow_watch_service() -> WorkflowWatchService:
         with _service_lock:
             if _service_singleton is None:
                 _service_singleton = WorkflowWatchService()
+                atexit.register(_service_singleton.flush)
     return _service_singleton
@@ -21,6 +21,7 @@ import yaml
 
 from nexus.core.models import Workflow
 from nexus.core.workflow import WorkflowDefinition
+from nexus.core.workflow_engine.condition_eval import ConditionSyntaxError, compile_condition
 
 logger = logging.getLogger(__name__)
 
@@ -289,8 +290,8 @@ class YamlWorkflowLoader:
             condition = step.get("condition")
             if condition:
                 try:
-                    compile(str(condition), "<condition>", "eval")
-                except SyntaxError as exc:
+                    compile_condition(str(condition))
+                except ConditionSyntaxError as exc:
                     errors.append(
                         f"Step '{label}': malformed 'condition' expression "
                         f"'{condition}' — {exc}"
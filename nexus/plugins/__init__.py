@@ -1,24 +1,8 @@
 """Plugin interfaces and registry for Nexus Core."""
 
+from typing import Any
+
 from nexus.plugins.base import PluginKind, PluginSpec, make_plugin_spec
-from nexus.plugins.builtin import (
-    AgentLaunchPolicyPlugin,
-    AIOrchestrator,
-    AIProvider,
-    GitHubIssuePlugin,
-    GitHubIssueCLIPlugin,
-    GitLabIssuePlugin,
-    GitLabIssueCLIPlugin,
-    JsonStateStorePlugin,
-    RateLimitedError,
-    RuntimeOpsPlugin,
-    TelegramInteractivePlugin,
-    TelegramNotificationPlugin,
-    ToolUnavailableError,
-    WorkflowMonitorPolicyPlugin,
-    WorkflowPolicyPlugin,
-    WorkflowStateEnginePlugin,
-)
 from nexus.plugins.registry import (
     PluginNotFoundError,
     PluginRegistrationError,
@@ -49,3 +33,33 @@ __all__ = [
     "PluginRegistrationError",
     "PluginNotFoundError",
 ]
+
+_BUILTIN_EXPORTS = frozenset(
+    {
+        "AIOrchestrator",
+        "AIProvider",
+        "AgentLaunchPolicyPlugin",
+        "RateLimitedError",
+        "ToolUnavailableError",
+        "GitHubIssuePlugin",
+        "GitHubIssueCLIPlugin",
+        "GitLabIssuePlugin",
+        "GitLabIssueCLIPlugin",
+        "JsonStateStorePlugin",
+        "RuntimeOpsPlugin",
+        "TelegramInteractivePlugin",
+        "TelegramNotificationPlugin",
+        "WorkflowMonitorPolicyPlugin",
+        "WorkflowPolicyPlugin",
+        "WorkflowStateEnginePlugin",
+    }
+)
+
+
+def __getattr__(name: str) -> Any:
+    # Built-in plugin classes are imported on first use (see nexus.plugins.builtin).
+    if name in _BUILTIN_EXPORTS:
+        from nexus.plugins import builtin
+
+        return getattr(builtin, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,116 +1,63 @@
-"""Built-in plugin implementations shipped with nexus-arc."""
+"""Built-in plugin implementations shipped with nexus-arc.
 
-from nexus.plugins.builtin.agent_launch_policy_plugin import (
-    AgentLaunchPolicyPlugin,
-)
-from nexus.plugins.builtin.agent_launch_policy_plugin import (
-    register_plugins as register_agent_launch_policy_plugins,
-)
-from nexus.plugins.builtin.ai_runtime_plugin import (
-    AIOrchestrator,
-    AIProvider,
-    RateLimitedError,
-    ToolUnavailableError,
-)
-from nexus.plugins.builtin.ai_runtime_plugin import (
-    register_plugins as register_ai_runtime_plugins,
-)
-from nexus.plugins.builtin.base_chat_event_handler import (
-    BaseChatEventHandler,
-)
-from nexus.plugins.builtin.discord_event_handler_plugin import (
-    DiscordEventHandler,
-)
-from nexus.plugins.builtin.discord_event_handler_plugin import (
-    register_plugins as register_discord_event_handler_plugins,
-)
-from nexus.plugins.builtin.discord_interactive_plugin import (
-    DiscordInteractivePlugin,
-)
-from nexus.plugins.builtin.discord_interactive_plugin import (
-    register_plugins as register_discord_interactive_plugins,
-)
-from nexus.plugins.builtin.git_webhook_policy_plugin import (
-    GitWebhookPolicyPlugin,
-)
-from nexus.plugins.builtin.git_webhook_policy_plugin import (
-    register_plugins as register_git_webhook_policy_plugins,
-)
-from nexus.plugins.builtin.github_issue_cli_plugin import (
-    GitHubIssueCLIPlugin,
-)
-from nexus.plugins.builtin.github_issue_cli_plugin import (
-    register_plugins as register_github_issue_cli_plugins,
-)
-from nexus.plugins.builtin.github_issue_plugin import (
-    GitHubIssuePlugin,
-)
-from nexus.plugins.builtin.github_issue_plugin import (
-    register_plugins as register_github_issue_api_plugins,
-)
-from nexus.plugins.builtin.gitlab_issue_cli_plugin import (
-    GitLabIssueCLIPlugin,
-)
-from nexus.plugins.builtin.gitlab_issue_cli_plugin import (
-    register_plugins as register_gitlab_issue_cli_plugins,
-)
-from nexus.plugins.builtin.gitlab_issue_plugin import (
-    GitLabIssuePlugin,
-)
-from nexus.plugins.builtin.gitlab_issue_plugin import (
-    register_plugins as register_gitlab_issue_api_plugins,
-)
-from nexus.plugins.builtin.json_state_plugin import (
-    JsonStateStorePlugin,
-)
-from nexus.plugins.builtin.json_state_plugin import (
-    register_plugins as register_json_state_plugins,
-)
-from nexus.plugins.builtin.runtime_ops_plugin import (
-    RuntimeOpsPlugin,
-)
-from nexus.plugins.builtin.runtime_ops_plugin import (
-    register_plugins as register_runtime_ops_plugins,
-)
-from nexus.plugins.builtin.telegram_event_handler_plugin import (
-    TelegramEventHandler,
-)
-from nexus.plugins.builtin.telegram_event_handler_plugin import (
-    register_plugins as register_telegram_event_handler_plugins,
-)
-from nexus.plugins.builtin.telegram_interactive_plugin import (
-    TelegramInteractivePlugin,
-)
-from nexus.plugins.builtin.telegram_interactive_plugin import (
-    register_plugins as register_telegram_interactive_plugins,
-)
-from nexus.plugins.builtin.telegram_notification_plugin import (
-    TelegramNotificationPlugin,
-)
-from nexus.plugins.builtin.telegram_notification_plugin import (
-    register_plugins as register_telegram_notification_plugins,
-)
-from nexus.plugins.builtin.workflow_monitor_policy_plugin import (
-    WorkflowMonitorPolicyPlugin,
-)
-from nexus.plugins.builtin.workflow_monitor_policy_plugin import (
-    WorkflowMonitorPolicyPlugin as GithubWorkflowPolicyPlugin,
-)
-from nexus.plugins.builtin.workflow_monitor_policy_plugin import (
-    register_plugins as register_workflow_monitor_policy_plugins,
-)
-from nexus.plugins.builtin.workflow_policy_plugin import (
-    WorkflowPolicyPlugin,
-)
-from nexus.plugins.builtin.workflow_policy_plugin import (
-    register_plugins as register_workflow_policy_plugins,
-)
-from nexus.plugins.builtin.workflow_state_engine_plugin import (
-    WorkflowStateEnginePlugin,
-)
-from nexus.plugins.builtin.workflow_state_engine_plugin import (
-    register_plugins as register_workflow_state_engine_plugins,
-)
+Exports are resolved on first attribute access so that importing this package
+(or ``nexus.plugins``) does not import every plugin and its dependencies.
+"""
+
+import importlib
+from typing import Any
+
+# exported name -> (submodule, attribute)
+_EXPORTS: dict[str, tuple[str, str]] = {
+    "AgentLaunchPolicyPlugin": ("agent_launch_policy_plugin", "AgentLaunchPolicyPlugin"),
+    "register_agent_launch_policy_plugins": ("agent_launch_policy_plugin", "register_plugins"),
+    "AIOrchestrator": ("ai_runtime_plugin", "AIOrchestrator"),
+    "AIProvider": ("ai_runtime_plugin", "AIProvider"),
+    "RateLimitedError": ("ai_runtime_plugin", "RateLimitedError"),
+    "ToolUnavailableError": ("ai_runtime_plugin", "ToolUnavailableError"),
+    "register_ai_runtime_plugins": ("ai_runtime_plugin", "register_plugins"),
+    "BaseChatEventHandler": ("base_chat_event_handler", "BaseChatEventHandler"),
+    "DiscordEventHandler": ("discord_event_handler_plugin", "DiscordEventHandler"),
+    "register_discord_event_handler_plugins": ("discord_event_handler_plugin", "register_plugins"),
+    "DiscordInteractivePlugin": ("discord_interactive_plugin", "DiscordInteractivePlugin"),
+    "register_discord_interactive_plugins": ("discord_interactive_plugin", "register_plugins"),
+    "GitWebhookPolicyPlugin": ("git_webhook_policy_plugin", "GitWebhookPolicyPlugin"),
+    "register_git_webhook_policy_plugins": ("git_webhook_policy_plugin", "register_plugins"),
+    "GitHubIssueCLIPlugin": ("github_issue_cli_plugin", "GitHubIssueCLIPlugin"),
+    "register_github_issue_cli_plugins": ("github_issue_cli_plugin", "register_plugins"),
+    "GitHubIssuePlugin": ("github_issue_plugin", "GitHubIssuePlugin"),
+    "register_github_issue_api_plugins": ("github_issue_plugin", "register_plugins"),
+    "GitLabIssueCLIPlugin": ("gitlab_issue_cli_plugin", "GitLabIssueCLIPlugin"),
+    "register_gitlab_issue_cli_plugins": ("gitlab_issue_cli_plugin", "register_plugins"),
+    "GitLabIssuePlugin": ("gitlab_issue_plugin", "GitLabIssuePlugin"),
+    "register_gitlab_issue_api_plugins": ("gitlab_issue_plugin", "register_plugins"),
+    "JsonStateStorePlugin": ("json_state_plugin", "JsonStateStorePlugin"),
+    "register_json_state_plugins": ("json_state_plugin", "register_plugins"),
+    "RuntimeOpsPlugin": ("runtime_ops_plugin", "RuntimeOpsPlugin"),
+    "register_runtime_ops_plugins": ("runtime_ops_plugin", "register_plugins"),
+    "TelegramEventHandler": ("telegram_event_handler_plugin", "TelegramEventHandler"),
+    "register_telegram_event_handler_plugins": (
+        "telegram_event_handler_plugin",
+        "register_plugins",
+    ),
+    "TelegramInteractivePlugin": ("telegram_interactive_plugin", "TelegramInteractivePlugin"),
+    "register_telegram_interactive_plugins": ("telegram_interactive_plugin", "register_plugins"),
+    "TelegramNotificationPlugin": ("telegram_notification_plugin", "TelegramNotificationPlugin"),
+    "register_telegram_notification_plugins": ("telegram_notification_plugin", "register_plugins"),
+    "WorkflowMonitorPolicyPlugin": (
+        "workflow_monitor_policy_plugin",
+        "WorkflowMonitorPolicyPlugin",
+    ),
+    "GithubWorkflowPolicyPlugin": ("workflow_monitor_policy_plugin", "WorkflowMonitorPolicyPlugin"),
+    "register_workflow_monitor_policy_plugins": (
+        "workflow_monitor_policy_plugin",
+        "register_plugins",
+    ),
+    "WorkflowPolicyPlugin": ("workflow_policy_plugin", "WorkflowPolicyPlugin"),
+    "register_workflow_policy_plugins": ("workflow_policy_plugin", "register_plugins"),
+    "WorkflowStateEnginePlugin": ("workflow_state_engine_plugin", "WorkflowStateEnginePlugin"),
+    "register_workflow_state_engine_plugins": ("workflow_state_engine_plugin", "register_plugins"),
+}
 
 __all__ = [
     "AIOrchestrator",
@@ -153,3 +100,17 @@ __all__ = [
     "register_git_webhook_policy_plugins",
     "register_workflow_monitor_policy_plugins",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name, attribute = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_EXPORTS))
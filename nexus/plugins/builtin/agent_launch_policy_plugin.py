@@ -17,7 +17,9 @@ class AgentLaunchPolicyPlugin:
 
     def __init__(self, config: dict | None = None):
         self.config = config or {}
-        self._alignment_service = KnowledgeAlignmentService()
+        self._alignment_service = KnowledgeAlignmentService(
+            index_dir=self._resolve_knowledge_index_dir()
+        )
         self.prompt_max_chars = int(
             self.config.get("ai_prompt_max_chars")
             or os.getenv("AI_PROMPT_MAX_CHARS", "16000")
@@ -199,6 +201,20 @@ class AgentLaunchPolicyPlugin:
             return configured
         return {}
 
+    def _resolve_knowledge_index_dir(self) -> str | None:
+        """Return where per-repo knowledge indexes persist (``None`` keeps them in memory)."""
+        configured = self.config.get("knowledge_index_dir") or os.getenv(
+            "NEXUS_KNOWLEDGE_INDEX_DIR"
+        )
+        if configured:
+            return str(configured)
+        try:
+            from nexus.core.config import NEXUS_STATE_DIR
+        except Exception as exc:
+            logger.debug("Knowledge index will not be persisted: %s", exc)
+            return None
+        return os.path.join(str(NEXUS_STATE_DIR), "knowledge_index")
+
     def _build_alignment_context(
         self, *, task_content: str, workflow_type: str, repo_path: str
     ) -> str:
@@ -0,0 +1,194 @@
+"""TTL-bounded cache of analysis results (triage, naming, refinement, ...).
+
+Webhook re-deliveries and refinement retries send the same inbox text through
+the same task again; each repeat costs a full CLI LLM call.  Results are keyed
+by task, a fingerprint of the whitespace-normalised text, the provider/model
+chain and the prompt-shaping arguments, kept in a small in-memory LRU and
+optionally mirrored to ``<cache_dir>/<key[:2]>/<key>.json`` so other processes
+and restarts can reuse them.  Only provider answers are cached, never the
+built-in defaults returned when every provider failed.
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Mapping, Sequence
+from typing import Any
+
+from nexus.core.prompt_budget import prompt_prefix_fingerprint
+
+logger = logging.getLogger(__name__)
+
+# Bump when the key derivation or the stored layout changes.
+_CACHE_VERSION = "1"
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_analysis_text(text: str) -> str:
+    """Collapse whitespace so re-wrapped or re-indented copies share a key."""
+    return _WHITESPACE_RE.sub(" ", str(text or "")).strip()
+
+
+class AnalysisCache:
+    """In-memory LRU of analysis results with TTL and an optional disk tier.
+
+    Args:
+        ttl_seconds: Lifetime of an entry; ``0`` disables the cache.
+        max_entries: Upper bound on in-memory entries.
+        cache_dir: Optional directory for the persistent tier.
+        clock: Wall clock (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float = 900.0,
+        max_entries: int = 512,
+        cache_dir: str | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.ttl_seconds = max(0.0, float(ttl_seconds))
+        self.max_entries = max(1, int(max_entries))
+        self.cache_dir = cache_dir or None
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {
+            "hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "stores": 0,
+            "evictions": 0,
+            "expired": 0,
+        }
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0
+
+    @staticmethod
+    def make_key(
+        task: str,
+        text: str,
+        providers: Sequence[str],
+        context: Mapping[str, Any] | None = None,
+    ) -> str:
+        normalized = normalize_analysis_text(text)
+        context_blob = json.dumps(dict(context or {}), sort_keys=True, default=str)
+        parts = [
+            _CACHE_VERSION,
+            str(task or ""),
+            prompt_prefix_fingerprint(normalized, prefix_chars=len(normalized)),
+            str(len(normalized)),
+            ">".join(providers),
+            prompt_prefix_fingerprint(context_blob, prefix_chars=len(context_blob)),
+        ]
+        return prompt_prefix_fingerprint("\0".join(parts), prefix_chars=1 << 20)
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Return a fresh copy of the cached result for *key*, or ``None``."""
+        if not self.enabled:
+            return None
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, payload = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    self.stats["hits"] += 1
+                    return json.loads(payload)
+                del self._entries[key]
+                self.stats["expired"] += 1
+        disk = self._disk_get(key, now)
+        with self._lock:
+            if disk is None:
+                self.stats["misses"] += 1
+                return None
+            expires_at, payload = disk
+            self._store_locked(key, expires_at, payload)
+            self.stats["disk_hits"] += 1
+        return json.loads(payload)
+
+    def put(self, key: str, result: Mapping[str, Any]) -> None:
+        if not self.enabled:
+            return
+        try:
+            payload = json.dumps(dict(result), sort_keys=True)
+        except (TypeError, ValueError):
+            logger.debug("Analysis result for %s is not JSON-serialisable; not cached", key)
+            return
+        expires_at = self._clock() + self.ttl_seconds
+        with self._lock:
+            self._store_locked(key, expires_at, payload)
+            self.stats["stores"] += 1
+        self._disk_put(key, expires_at, payload)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self.stats["hits"] + self.stats["disk_hits"] + self.stats["misses"]
+            hits = self.stats["hits"] + self.stats["disk_hits"]
+            return {
+                **self.stats,
+                "entries": len(self._entries),
+                "hit_rate": (hits / lookups) if lookups else None,
+                "ttl_seconds": self.ttl_seconds,
+                "disk": bool(self.cache_dir),
+            }
+
+    def _store_locked(self, key: str, expires_at: float, payload: str) -> None:
+        self._entries[key] = (expires_at, payload)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats["evictions"] += 1
+
+    # ------------------------------------------------------------------
+    # Disk tier
+    # ------------------------------------------------------------------
+
+    def _disk_path(self, key: str) -> str:
+        return os.path.join(str(self.cache_dir), key[:2], f"{key}.json")
+
+    def _disk_get(self, key: str, now: float) -> tuple[float, str] | None:
+        if not self.cache_dir:
+            return None
+        path = self._disk_path(key)
+        try:
+            with open(path, encoding="utf-8") as fh:
+                stored = json.load(fh)
+            expires_at = float(stored["expires_at"])
+            payload = json.dumps(stored["result"], sort_keys=True)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as exc:
+            logger.debug("Ignoring unreadable analysis cache file %s: %s", path, exc)
+            return None
+        if expires_at <= now:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+        return expires_at, payload
+
+    def _disk_put(self, key: str, expires_at: float, payload: str) -> None:
+        if not self.cache_dir:
+            return
+        path = self._disk_path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as fh:
+                fh.write(f'{{"expires_at": {expires_at!r}, "result": {payload}}}')
+            os.replace(tmp_path, path)
+        except OSError as exc:
+            logger.warning("Could not write analysis cache file %s: %s", path, exc)
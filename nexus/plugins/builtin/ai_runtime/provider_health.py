@@ -0,0 +1,310 @@
+"""Provider health registry: availability and rate-limit windows for AI CLIs.
+
+Launch-time tool selection only reads this registry's in-memory map.  CLI
+``--version`` probes run on a background thread once an entry is older than the
+probe interval, and a cold entry is probed inline only once per host.  When a
+state file is configured, availability and rate-limit windows are shared
+through it, so the bot, webhook server and processor see the same cooldowns.
+Entries are merged by ``updated_at`` and the file is re-read only when its
+``(mtime, size)`` changes.
+"""
+
+import logging
+import os
+import subprocess
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from nexus.core.shared_json_file import SharedJsonFile
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ProviderHealth:
+    """Last known health of one provider CLI."""
+
+    available: bool | None = None
+    checked_at: float = 0.0
+    rate_limited_until: float = 0.0
+    retries: int = 0
+    updated_at: float = 0.0
+
+
+class ProviderHealthRegistry:
+    """In-memory provider health map with background probing and optional file sharing.
+
+    Args:
+        path: Optional JSON state file shared by every process on the host.
+        probe_interval: Seconds before an availability result is re-probed.
+        probe_timeout: Timeout for one ``<cli> --version`` probe.
+        clock: Wall clock (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        *,
+        path: str | None = None,
+        probe_interval: float = 300.0,
+        probe_timeout: float = 5.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.path = path or None
+        self.probe_interval = max(1.0, float(probe_interval))
+        self.probe_timeout = float(probe_timeout)
+        self._clock = clock
+        self._entries: dict[str, ProviderHealth] = {}
+        self._probe_commands: dict[str, list[str]] = {}
+        self._queued: set[str] = set()
+        self._probing: set[str] = set()
+        self._lock = threading.Condition()
+        self._worker: threading.Thread | None = None
+        self._closed = False
+        self._file = SharedJsonFile(self.path) if self.path else None
+        self.stats = {"probes": 0, "inline_probes": 0, "background_probes": 0, "reloads": 0}
+        self._maybe_reload(force=True)
+
+    # ------------------------------------------------------------------
+    # Hot-path lookups
+    # ------------------------------------------------------------------
+
+    def register_probe(self, name: str, command: list[str]) -> None:
+        with self._lock:
+            self._probe_commands[name] = list(command)
+
+    def get(self, name: str) -> ProviderHealth:
+        """Return a copy of the current entry for *name* (empty if unknown)."""
+        self._maybe_reload()
+        with self._lock:
+            entry = self._entries.get(name)
+            return ProviderHealth(**asdict(entry)) if entry else ProviderHealth()
+
+    def is_available(self, name: str) -> bool:
+        """Return cached availability; only a never-seen provider is probed inline."""
+        self._maybe_reload()
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is not None and entry.rate_limited_until > now:
+                return False
+            known = entry is not None and entry.available is not None
+            if known and now - entry.checked_at >= self.probe_interval:
+                self._schedule_locked(name)
+            if known:
+                return bool(entry.available)
+        self.stats["inline_probes"] += 1
+        return self.probe(name)
+
+    def rate_limits(self) -> dict[str, dict[str, Any]]:
+        """Return active cooldowns as ``{name: {"until": ts, "retries": n}}``."""
+        self._maybe_reload()
+        now = self._clock()
+        with self._lock:
+            return {
+                name: {"until": entry.rate_limited_until, "retries": entry.retries}
+                for name, entry in self._entries.items()
+                if entry.rate_limited_until > now
+            }
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+
+    def probe(self, name: str) -> bool:
+        """Run the version probe for *name* now and record the result."""
+        with self._lock:
+            command = self._probe_commands.get(name)
+        if not command:
+            return False
+        self.stats["probes"] += 1
+        try:
+            result = subprocess.run(
+                command, capture_output=True, timeout=self.probe_timeout, check=False
+            )
+            available = result.returncode == 0
+            if available:
+                logger.info("✅ %s available", name.upper())
+            else:
+                logger.warning(
+                    "⚠️  %s unavailable: version check failed (exit=%s)",
+                    name.upper(),
+                    result.returncode,
+                )
+        except Exception as exc:
+            available = False
+            logger.warning("⚠️  %s unavailable: %s", name.upper(), exc)
+        self._update(name, available=available, checked_at=self._clock())
+        return available
+
+    def record_rate_limit(self, name: str, ttl: float, retries: int = 1) -> None:
+        self._update(name, rate_limited_until=self._clock() + float(ttl), retries=int(retries))
+
+    def record_failure(self, name: str, max_retries: int) -> bool:
+        """Count a failure; return True when *name* is now marked unavailable."""
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(name)
+            rate_limited = entry is not None and entry.rate_limited_until > now
+            retries = (entry.retries + 1) if rate_limited and entry else 0
+        if not rate_limited:
+            self._update(name, available=False, checked_at=now)
+            return True
+        if retries >= max_retries:
+            self._update(name, available=False, checked_at=now, retries=retries)
+            return True
+        self._update(name, retries=retries)
+        return False
+
+    def clear(self, name: str | None = None) -> None:
+        """Forget cached health for *name* (or every provider) in this process."""
+        with self._lock:
+            if name is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(name, None)
+
+    def _update(self, name: str, **changes: Any) -> None:
+        with self._lock:
+            entry = self._entries.setdefault(name, ProviderHealth())
+            for key, value in changes.items():
+                setattr(entry, key, value)
+            entry.updated_at = self._clock()
+            snapshot = ProviderHealth(**asdict(entry))
+        self._persist(name, snapshot)
+
+    # ------------------------------------------------------------------
+    # Background probing
+    # ------------------------------------------------------------------
+
+    def _schedule_locked(self, name: str) -> None:
+        if name not in self._probe_commands or name in self._probing:
+            return
+        self._queued.add(name)
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(
+                target=self._probe_loop, daemon=True, name="nexus-provider-health"
+            )
+            self._worker.start()
+        self._lock.notify_all()
+
+    def _probe_loop(self) -> None:
+        while True:
+            with self._lock:
+                while not self._closed and not self._queued:
+                    self._lock.wait(timeout=self._seconds_until_next_probe_locked())
+                    self._queue_stale_locked()
+                if self._closed:
+                    return
+                name = self._queued.pop()
+                self._probing.add(name)
+            self.stats["background_probes"] += 1
+            try:
+                self.probe(name)
+            finally:
+                with self._lock:
+                    self._probing.discard(name)
+
+    def _seconds_until_next_probe_locked(self) -> float:
+        now = self._clock()
+        due = [
+            entry.checked_at + self.probe_interval - now
+            for name, entry in self._entries.items()
+            if name in self._probe_commands
+        ]
+        return max(1.0, min(due, default=self.probe_interval))
+
+    def _queue_stale_locked(self) -> None:
+        """Re-probe entries before they go stale so lookups never wait on a probe."""
+        now = self._clock()
+        for name, entry in self._entries.items():
+            if (
+                name in self._probe_commands
+                and name not in self._probing
+                and now - entry.checked_at >= self.probe_interval
+            ):
+                self._queued.add(name)
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            self._lock.notify_all()
+
+    # ------------------------------------------------------------------
+    # Shared state file
+    # ------------------------------------------------------------------
+
+    def _maybe_reload(self, *, force: bool = False) -> None:
+        if self._file is None:
+            return
+        data = self._file.read_if_changed(force=force)
+        if data is not None:
+            self.stats["reloads"] += 1
+            with self._lock:
+                self._merge_locked(data)
+
+    def _merge_locked(self, data: Any) -> None:
+        providers = data.get("providers") if isinstance(data, dict) else None
+        if not isinstance(providers, dict):
+            return
+        for name, raw in providers.items():
+            entry = _entry_from_dict(raw)
+            if entry is None:
+                continue
+            current = self._entries.get(name)
+            if current is None or entry.updated_at > current.updated_at:
+                self._entries[name] = entry
+
+    def _persist(self, name: str, entry: ProviderHealth) -> None:
+        if self._file is None:
+            return
+
+        def _apply(data: dict[str, Any]) -> None:
+            providers = data.get("providers")
+            if not isinstance(providers, dict):
+                providers = data["providers"] = {}
+            stored = _entry_from_dict(providers.get(name))
+            if stored is None or stored.updated_at <= entry.updated_at:
+                providers[name] = asdict(entry)
+
+        written = self._file.update(_apply)
+        if written is not None:
+            with self._lock:
+                self._merge_locked(written)
+
+
+def _entry_from_dict(raw: Any) -> ProviderHealth | None:
+    if not isinstance(raw, dict):
+        return None
+    try:
+        available = raw.get("available")
+        return ProviderHealth(
+            available=None if available is None else bool(available),
+            checked_at=float(raw.get("checked_at") or 0.0),
+            rate_limited_until=float(raw.get("rate_limited_until") or 0.0),
+            retries=int(raw.get("retries") or 0),
+            updated_at=float(raw.get("updated_at") or 0.0),
+        )
+    except (TypeError, ValueError):
+        return None
+
+
+_shared_registries: dict[str, ProviderHealthRegistry] = {}
+_shared_lock = threading.Lock()
+
+
+def get_provider_health_registry(
+    path: str | None, *, probe_interval: float = 300.0
+) -> ProviderHealthRegistry:
+    """Return the process-wide registry for *path*, or a private one when unset."""
+    if not path:
+        return ProviderHealthRegistry(probe_interval=probe_interval)
+    key = os.path.abspath(path)
+    with _shared_lock:
+        registry = _shared_registries.get(key)
+        if registry is None:
+            registry = ProviderHealthRegistry(path=key, probe_interval=probe_interval)
+            _shared_registries[key] = registry
+        return registry
@@ -7,6 +7,9 @@ import time
 from collections.abc import Mapping
 from typing import Any, Callable, TextIO
 
+from nexus.core.process_runner import get_process_runner
+from nexus.core.runtime.task_log_index import record_task_log
+
 _BLOCKED_GIT_CLI_BIN_DIR: str | None = None
 _CLI_AUTH_MODES = {"account"}
 _PROVIDER_API_KEY_ENV: dict[str, tuple[str, ...]] = {
@@ -132,7 +135,10 @@ def _prepare_log_path(
     log_dir = get_tasks_logs_dir(workspace_dir, log_subdir)
     os.makedirs(log_dir, exist_ok=True)
     log_suffix = f"{issue_num}_{timestamp}" if issue_num else timestamp
-    return os.path.join(log_dir, f"{prefix}_{log_suffix}.log")
+    log_path = os.path.join(log_dir, f"{prefix}_{log_suffix}.log")
+    if issue_num:
+        record_task_log(log_path)
+    return log_path
 
 
 def _stream_process_output(
@@ -251,15 +257,18 @@ def _launch_process_with_log(
         if env:
             merged_env.update(env)
         merged_env = apply_git_transport_env_policy(merged_env)
-        process = subprocess.Popen(
-            cmd,
-            cwd=workspace_dir,
-            stdin=subprocess.DEVNULL,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            env=merged_env,
-            text=True,
-            bufsize=1,
+        process = get_process_runner().launch(
+            lambda: subprocess.Popen(
+                cmd,
+                cwd=workspace_dir,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                env=merged_env,
+                text=True,
+                bufsize=1,
+            ),
+            provider=output_label,
         )
         logger.info(
             "[agent:%s] launch pid=%s cwd=%s log=%s cmd=%s",
@@ -5,6 +5,7 @@ from nexus.plugins.builtin.ai_runtime.provider_invokers.agent_invokers import (
     prepare_provider_cli_env,
 )
 from nexus.plugins.builtin.ai_runtime.provider_invokers.subprocess_utils import (
+    analysis_priority,
     run_cli_prompt,
     wrap_timeout_error,
 )
@@ -36,7 +37,14 @@ def run_gemini_analysis_cli(
         cmd = [gemini_cli_path, "-p", prompt]
         if gemini_model:
             cmd.extend(["--model", gemini_model])
-        result = run_cli_prompt(cmd, timeout=timeout, env=provider_env, cwd=cwd)
+        result = run_cli_prompt(
+            cmd,
+            timeout=timeout,
+            env=provider_env,
+            cwd=cwd,
+            provider="gemini",
+            priority=analysis_priority(task),
+        )
         if result.returncode != 0:
             stderr = result.stderr or ""
             if "rate limit" in stderr.lower() or "quota" in stderr.lower():
@@ -72,7 +80,14 @@ def run_copilot_analysis_cli(
         cmd = [copilot_cli_path, "-p", prompt]
         if copilot_model and copilot_supports_model:
             cmd.extend(["--model", copilot_model])
-        result = run_cli_prompt(cmd, timeout=timeout, env=env, cwd=cwd)
+        result = run_cli_prompt(
+            cmd,
+            timeout=timeout,
+            env=env,
+            cwd=cwd,
+            provider="copilot",
+            priority=analysis_priority(task),
+        )
         if result.returncode != 0:
             raise Exception(f"Copilot error: {result.stderr}")
         return parse_analysis_result(result.stdout or "", task)
@@ -109,7 +124,14 @@ def run_codex_analysis_cli(
     cmd.append(prompt)
 
     try:
-        result = run_cli_prompt(cmd, timeout=timeout, env=provider_env, cwd=cwd)
+        result = run_cli_prompt(
+            cmd,
+            timeout=timeout,
+            env=provider_env,
+            cwd=cwd,
+            provider="codex",
+            priority=analysis_priority(task),
+        )
         if result.returncode != 0:
             stderr = result.stderr or ""
             stdout = result.stdout or ""
@@ -150,7 +172,14 @@ def run_claude_analysis_cli(
     cmd.append(prompt)
 
     try:
-        result = run_cli_prompt(cmd, timeout=timeout, env=provider_env, cwd=cwd)
+        result = run_cli_prompt(
+            cmd,
+            timeout=timeout,
+            env=provider_env,
+            cwd=cwd,
+            provider="claude",
+            priority=analysis_priority(task),
+        )
         if result.returncode != 0:
             stderr = result.stderr or ""
             stdout = result.stdout or ""
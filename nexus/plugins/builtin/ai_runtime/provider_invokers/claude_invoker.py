@@ -8,6 +8,7 @@ from nexus.plugins.builtin.ai_runtime.provider_invokers.agent_invokers import (
     prepare_provider_cli_env,
 )
 from nexus.plugins.builtin.ai_runtime.provider_invokers.subprocess_utils import (
+    analysis_priority,
     run_cli_prompt,
     wrap_timeout_error,
 )
@@ -106,7 +107,9 @@ def run_claude_analysis_cli(
     prompt = build_analysis_prompt(text, task, **kwargs)
     try:
         cmd = [claude_cli_path, "-p", prompt]
-        result = run_cli_prompt(cmd, timeout=timeout)
+        result = run_cli_prompt(
+            cmd, timeout=timeout, provider="claude", priority=analysis_priority(task)
+        )
         if result.returncode != 0:
             stderr = result.stderr or ""
             stdout = result.stdout or ""
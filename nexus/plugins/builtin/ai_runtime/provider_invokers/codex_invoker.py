@@ -3,6 +3,9 @@ import subprocess
 import time
 from typing import Any, Callable
 
+from nexus.core.process_runner import get_process_runner
+from nexus.core.runtime.task_log_index import record_task_log
+
 from .agent_invokers import _monitor_process_lifecycle, _redact_command_for_logs
 from .agent_invokers import (
     _start_output_tee,
@@ -181,6 +184,8 @@ def invoke_codex_cli(
     os.makedirs(log_dir, exist_ok=True)
     log_suffix = f"{issue_num}_{timestamp}" if issue_num else timestamp
     log_path = os.path.join(log_dir, f"codex_{log_suffix}.log")
+    if issue_num:
+        record_task_log(log_path)
 
     logger.info("🤖 Launching Codex CLI agent")
     logger.info("   Workspace: %s", workspace_dir)
@@ -216,15 +221,18 @@ def invoke_codex_cli(
                 agent_prompt=agent_prompt,
                 sandbox_mode=sandbox_mode,
             )
-            process = subprocess.Popen(
-                cmd,
-                cwd=workspace_dir,
-                stdin=subprocess.DEVNULL,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                env=merged_env,
-                text=True,
-                bufsize=1,
+            process = get_process_runner().launch(
+                lambda cmd=cmd: subprocess.Popen(
+                    cmd,
+                    cwd=workspace_dir,
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    env=merged_env,
+                    text=True,
+                    bufsize=1,
+                ),
+                provider="codex",
             )
             logger.info(
                 "[agent:%s] launch pid=%s cwd=%s log=%s cmd=%s",
@@ -7,6 +7,7 @@ from nexus.plugins.builtin.ai_runtime.provider_invokers.agent_invokers import (
     _launch_process_with_log,
 )
 from nexus.plugins.builtin.ai_runtime.provider_invokers.subprocess_utils import (
+    analysis_priority,
     run_cli_prompt,
     wrap_timeout_error,
 )
@@ -107,7 +108,9 @@ def run_ollama_analysis_cli(
             cmd.append("llama3")
         cmd.append(prompt)
 
-        result = run_cli_prompt(cmd, timeout=timeout)
+        result = run_cli_prompt(
+            cmd, timeout=timeout, provider="ollama", priority=analysis_priority(task)
+        )
         if result.returncode != 0:
             stderr = result.stderr or ""
             raise Exception(f"Ollama error: {stderr}")
@@ -155,7 +158,7 @@ def run_ollama_transcription_cli(
             cmd.append("llama3")  # Fallback
         cmd.append(prompt)
 
-        result = run_cli_prompt(cmd, timeout=timeout)
+        result = run_cli_prompt(cmd, timeout=timeout, provider="ollama")
         if result.returncode != 0:
             stderr = result.stderr or ""
             raise Exception(f"Ollama transcription error: {stderr}")
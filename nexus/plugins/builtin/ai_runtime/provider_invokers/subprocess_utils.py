@@ -1,5 +1,20 @@
 import subprocess
 
+from nexus.core.process_runner import (
+    PRIORITY_ANALYSIS,
+    PRIORITY_INTERACTIVE,
+    get_process_runner,
+)
+
+# Analysis tasks answering a user message right now; they jump the CLI admission queue.
+_INTERACTIVE_TASKS = frozenset({"chat", "detect_intent"})
+
+
+def analysis_priority(task: str | None) -> int:
+    return (
+        PRIORITY_INTERACTIVE if str(task or "").strip() in _INTERACTIVE_TASKS else PRIORITY_ANALYSIS
+    )
+
 
 def run_cli_prompt(
     command: list[str],
@@ -7,11 +22,13 @@ def run_cli_prompt(
     timeout: int,
     env: dict[str, str] | None = None,
     cwd: str | None = None,
+    provider: str | None = None,
+    priority: int = PRIORITY_ANALYSIS,
 ) -> subprocess.CompletedProcess[str]:
-    return subprocess.run(
+    return get_process_runner().run(
         command,
-        capture_output=True,
-        text=True,
+        provider=provider,
+        priority=priority,
         timeout=timeout,
         env=env,
         cwd=cwd,
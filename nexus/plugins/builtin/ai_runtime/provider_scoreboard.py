@@ -0,0 +1,226 @@
+"""Rolling per-(provider, agent_type) completion statistics for adaptive routing.
+
+Each finished agent run updates exponentially weighted moving averages of
+success rate and of completion/failure latency.  Candidates are ranked by
+expected time to a successful completion::
+
+    expected = success_latency + (1 - p) / p * failure_latency
+
+so a provider that is fast but often times out can rank behind a slower,
+reliable one.  Statistics for ``(provider, "*")`` aggregate every agent type and
+back the ranking while a specific agent type has too few samples.
+"""
+
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from nexus.core.shared_json_file import SharedJsonFile
+
+logger = logging.getLogger(__name__)
+
+# Success-rate floor so a provider that only ever failed still gets a finite score.
+_MIN_SUCCESS_RATE = 0.05
+
+
+@dataclass
+class RouteStats:
+    """EWMA statistics for one provider/agent-type pair."""
+
+    samples: int = 0
+    successes: int = 0
+    failures: int = 0
+    success_rate: float = 1.0
+    success_seconds: float | None = None
+    failure_seconds: float | None = None
+    updated_at: float = 0.0
+
+    def expected_seconds(self) -> float | None:
+        latency = self.success_seconds
+        if latency is None:
+            latency = self.failure_seconds
+        if latency is None:
+            return None
+        p = max(_MIN_SUCCESS_RATE, self.success_rate)
+        failure_latency = self.failure_seconds if self.failure_seconds is not None else latency
+        return latency + (1.0 - p) / p * failure_latency
+
+
+def _ewma(previous: float | None, value: float, alpha: float) -> float:
+    return value if previous is None else (alpha * value + (1.0 - alpha) * previous)
+
+
+def _route_key(provider: str, agent_type: str) -> str:
+    return f"{provider}:{agent_type}"
+
+
+class ProviderScoreboard:
+    """Provider/agent-type outcome statistics, optionally shared through a host file.
+
+    Args:
+        path: Optional JSON state file shared by every process on the host.
+        alpha: EWMA smoothing factor (weight of the newest observation).
+        min_samples: Observations required before a pair influences ordering.
+        clock: Wall clock (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        *,
+        path: str | None = None,
+        alpha: float = 0.3,
+        min_samples: int = 3,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.alpha = min(1.0, max(0.01, float(alpha)))
+        self.min_samples = max(1, int(min_samples))
+        self._clock = clock
+        self._routes: dict[str, RouteStats] = {}
+        self._lock = threading.Lock()
+        self._file = SharedJsonFile(path) if path else None
+        self._maybe_reload(force=True)
+
+    def record(
+        self, provider: str, agent_type: str, *, success: bool, duration_seconds: float
+    ) -> None:
+        """Fold one finished run into the stats for the pair and the provider aggregate."""
+        provider = str(provider or "").strip().lower()
+        agent_type = str(agent_type or "").strip().lower() or "*"
+        if not provider:
+            return
+        keys = {_route_key(provider, agent_type), _route_key(provider, "*")}
+        duration = max(0.0, float(duration_seconds))
+
+        def _apply(routes: dict[str, RouteStats]) -> None:
+            for key in keys:
+                stats = routes.setdefault(key, RouteStats())
+                stats.samples += 1
+                stats.success_rate = (
+                    (1.0 if success else 0.0)
+                    if stats.samples == 1
+                    else _ewma(stats.success_rate, 1.0 if success else 0.0, self.alpha)
+                )
+                if success:
+                    stats.successes += 1
+                    stats.success_seconds = _ewma(stats.success_seconds, duration, self.alpha)
+                else:
+                    stats.failures += 1
+                    stats.failure_seconds = _ewma(stats.failure_seconds, duration, self.alpha)
+                stats.updated_at = self._clock()
+
+        if self._file is None:
+            with self._lock:
+                _apply(self._routes)
+            return
+
+        def _apply_to_document(data: dict[str, Any]) -> None:
+            routes = _routes_from_dict(data.get("routes"))
+            _apply(routes)
+            data["routes"] = {key: asdict(stats) for key, stats in routes.items()}
+
+        written = self._file.update(_apply_to_document)
+        if written is not None:
+            with self._lock:
+                self._routes = _routes_from_dict(written.get("routes"))
+
+    def expected_seconds(self, provider: str, agent_type: str | None) -> float | None:
+        """Expected time to success for the pair, or ``None`` without enough samples."""
+        self._maybe_reload()
+        provider = str(provider or "").strip().lower()
+        agent_type = str(agent_type or "").strip().lower() or "*"
+        with self._lock:
+            for key in (_route_key(provider, agent_type), _route_key(provider, "*")):
+                stats = self._routes.get(key)
+                if stats is not None and stats.samples >= self.min_samples:
+                    return stats.expected_seconds()
+        return None
+
+    def rank(self, providers: Sequence[str], agent_type: str | None) -> list[str]:
+        """Reorder *providers* by expected completion time.
+
+        Providers without enough samples keep their original positions, so
+        unexplored providers stay where static preferences put them.
+        """
+        scores = {provider: self.expected_seconds(provider, agent_type) for provider in providers}
+        scored = sorted(
+            (provider for provider in providers if scores[provider] is not None),
+            key=lambda provider: scores[provider],
+        )
+        ranked = iter(scored)
+        return [
+            next(ranked) if scores[provider] is not None else provider for provider in providers
+        ]
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Return every tracked pair with its derived expected completion time."""
+        self._maybe_reload()
+        with self._lock:
+            return {
+                key: {
+                    **asdict(stats),
+                    "expected_seconds": stats.expected_seconds(),
+                    "ranked": stats.samples >= self.min_samples,
+                }
+                for key, stats in sorted(self._routes.items())
+            }
+
+    def _maybe_reload(self, *, force: bool = False) -> None:
+        if self._file is None:
+            return
+        data = self._file.read_if_changed(force=force)
+        if data is not None:
+            with self._lock:
+                self._routes = _routes_from_dict(data.get("routes"))
+
+
+def _routes_from_dict(raw: Any) -> dict[str, RouteStats]:
+    routes: dict[str, RouteStats] = {}
+    if not isinstance(raw, dict):
+        return routes
+    for key, value in raw.items():
+        if not isinstance(value, dict):
+            continue
+        try:
+            routes[str(key)] = RouteStats(
+                samples=int(value.get("samples") or 0),
+                successes=int(value.get("successes") or 0),
+                failures=int(value.get("failures") or 0),
+                success_rate=float(value.get("success_rate", 1.0)),
+                success_seconds=(
+                    None
+                    if value.get("success_seconds") is None
+                    else float(value["success_seconds"])
+                ),
+                failure_seconds=(
+                    None
+                    if value.get("failure_seconds") is None
+                    else float(value["failure_seconds"])
+                ),
+                updated_at=float(value.get("updated_at") or 0.0),
+            )
+        except (TypeError, ValueError):
+            logger.debug("Skipping malformed provider scoreboard entry %s", key)
+    return routes
+
+
+_shared_scoreboards: dict[str, ProviderScoreboard] = {}
+_shared_lock = threading.Lock()
+
+
+def get_provider_scoreboard(
+    path: str | None, *, alpha: float = 0.3, min_samples: int = 3
+) -> ProviderScoreboard:
+    """Return the process-wide scoreboard for *path*, or a private one when unset."""
+    if not path:
+        return ProviderScoreboard(alpha=alpha, min_samples=min_samples)
+    key = os.path.abspath(path)
+    with _shared_lock:
+        scoreboard = _shared_scoreboards.get(key)
+        if scoreboard is None:
+            scoreboard = ProviderScoreboard(path=key, alpha=alpha, min_samples=min_samples)
+            _shared_scoreboards[key] = scoreboard
+        return scoreboard
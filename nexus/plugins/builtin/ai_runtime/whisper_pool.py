@@ -0,0 +1,319 @@
+"""Pre-warmed pool of local Whisper workers for voice transcription.
+
+Each worker process is spawned fresh (never forked from the threaded host),
+loads the model once in its initializer and keeps it for every later request,
+so a voice message never pays the multi-second ``load_model`` stall and
+several messages decode in parallel up to ``max_workers``.  Audio is handed to workers as a file path: paths are
+passed through untouched and streamed sources (file objects or chunk
+iterables) are spooled to a temporary file chunk by chunk.  Every result
+carries the time it spent queued, loading and decoding.
+"""
+
+import concurrent.futures
+import logging
+import multiprocessing
+import os
+import shutil
+import tempfile
+import threading
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import Any, BinaryIO
+
+from nexus.core.latency_metrics import LatencyHistogram
+from nexus.plugins.builtin.ai_runtime.provider_invokers.whisper_invoker import (
+    import_whisper_module,
+    local_whisper_transcribe_kwargs,
+    parse_local_whisper_response,
+)
+
+logger = logging.getLogger(__name__)
+
+AudioSource = str | os.PathLike | bytes | BinaryIO | Iterable[bytes]
+
+# Models loaded in this process, keyed by model name (one per worker process).
+_worker_models: dict[str, Any] = {}
+_worker_models_lock = threading.Lock()
+
+
+def _worker_model(model_name: str, import_whisper: Callable[[], Any]) -> Any:
+    with _worker_models_lock:
+        model = _worker_models.get(model_name)
+        if model is None:
+            logger.info("🔧 Loading local Whisper model: %s (pid=%s)", model_name, os.getpid())
+            model = import_whisper().load_model(model_name)
+            _worker_models[model_name] = model
+        return model
+
+
+def _worker_warm(model_name: str, import_whisper: Callable[[], Any]) -> float:
+    started = time.time()
+    _worker_model(model_name, import_whisper)
+    return time.time() - started
+
+
+def _worker_transcribe(
+    audio_path: str,
+    model_name: str,
+    transcribe_kwargs: dict[str, Any],
+    import_whisper: Callable[[], Any],
+    submitted_at: float,
+) -> dict[str, Any]:
+    started = time.time()
+    cold_start = model_name not in _worker_models
+    model = _worker_model(model_name, import_whisper)
+    loaded = time.time()
+    response = model.transcribe(audio_path, **transcribe_kwargs)
+    return {
+        "response": response,
+        "queue_wait_seconds": max(0.0, started - submitted_at),
+        "load_seconds": loaded - started,
+        "decode_seconds": time.time() - loaded,
+        "cold_start": cold_start,
+    }
+
+
+@dataclass
+class WhisperTranscription:
+    """Transcript plus per-request timing."""
+
+    text: str
+    language: str
+    model_name: str
+    queue_wait_seconds: float
+    load_seconds: float
+    decode_seconds: float
+
+
+class WhisperWorkerPool:
+    """Bounded pool of workers that keep one local Whisper model loaded.
+
+    Args:
+        model_name: Local Whisper model (``base``, ``small``, ...).
+        max_workers: Concurrent transcriptions (one model copy per worker).
+        use_processes: Decode in worker processes; threads share one model otherwise.
+        mp_context: Multiprocessing context for the process pool (default ``spawn``;
+            forking a host with live threads can deadlock the children).
+        import_whisper: Picklable callable returning the ``whisper`` module.
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        *,
+        max_workers: int = 1,
+        use_processes: bool = True,
+        mp_context: Any = None,
+        import_whisper: Callable[[], Any] = import_whisper_module,
+    ) -> None:
+        self.model_name = model_name
+        self.max_workers = max(1, int(max_workers))
+        self.use_processes = use_processes
+        self._mp_context = mp_context
+        self._import_whisper = import_whisper
+        self._executor: concurrent.futures.Executor | None = None
+        self._whisper_available = False
+        self._warmup: list[concurrent.futures.Future[float]] = []
+        self._lock = threading.Lock()
+        self._queue_wait = LatencyHistogram()
+        self._decode = LatencyHistogram()
+        self.stats = {"requests": 0, "failures": 0, "cold_starts": 0, "worker_restarts": 0}
+
+    def start(self, *, wait: bool = False, timeout: float | None = None) -> None:
+        """Spawn every worker and load the model in each; optionally block until done.
+
+        Worker processes load the model in their initializer, so the submitted
+        warm-up tasks only force all of them to start and report readiness.
+
+        Raises:
+            ImportError: If ``openai-whisper`` is not installed.
+        """
+        with self._lock:
+            executor = self._ensure_executor_locked()
+            if not self._warmup:
+                self._warmup = [
+                    executor.submit(_worker_warm, self.model_name, self._import_whisper)
+                    for _ in range(self.max_workers if self.use_processes else 1)
+                ]
+            warmup = list(self._warmup)
+        if wait:
+            concurrent.futures.wait(warmup, timeout=timeout)
+
+    def transcribe(
+        self,
+        audio: AudioSource,
+        *,
+        language: str | None = None,
+        languages: list[str] | None = None,
+        suffix: str = ".ogg",
+        timeout: float | None = None,
+    ) -> WhisperTranscription:
+        """Transcribe *audio* on a pooled worker.
+
+        Raises:
+            ValueError: If an audio path does not exist.
+            ImportError: If ``openai-whisper`` is not installed.
+            Exception: On decode errors, timeouts or rejected transcripts.
+        """
+        allowed = list(languages or [])
+        audio_path, spooled = self._materialize(audio, suffix)
+        self.stats["requests"] += 1
+        try:
+            with self._lock:
+                executor = self._ensure_executor_locked()
+            future = executor.submit(
+                _worker_transcribe,
+                audio_path,
+                self.model_name,
+                local_whisper_transcribe_kwargs(language, allowed),
+                self._import_whisper,
+                time.time(),
+            )
+            try:
+                outcome = future.result(timeout=timeout)
+            except concurrent.futures.TimeoutError as exc:
+                future.cancel()
+                raise Exception(f"Local Whisper timed out after {timeout}s") from exc
+            except concurrent.futures.BrokenExecutor as exc:
+                self._reset_executor(executor)
+                raise Exception(f"Local Whisper worker crashed: {exc}") from exc
+        except BaseException:
+            self.stats["failures"] += 1
+            raise
+        finally:
+            if spooled:
+                try:
+                    os.remove(audio_path)
+                except OSError:
+                    logger.warning("Failed to clean spooled audio file: %s", audio_path)
+
+        self._queue_wait.observe(outcome["queue_wait_seconds"])
+        self._decode.observe(outcome["decode_seconds"])
+        if outcome["cold_start"]:
+            self.stats["cold_starts"] += 1
+        try:
+            text, detected = parse_local_whisper_response(outcome["response"], allowed)
+        except Exception:
+            self.stats["failures"] += 1
+            raise
+        result = WhisperTranscription(
+            text=text,
+            language=detected,
+            model_name=self.model_name,
+            queue_wait_seconds=outcome["queue_wait_seconds"],
+            load_seconds=outcome["load_seconds"],
+            decode_seconds=outcome["decode_seconds"],
+        )
+        logger.info(
+            "🎧 Local Whisper %s: queued %.2fs, load %.2fs, decode %.2fs",
+            self.model_name,
+            result.queue_wait_seconds,
+            result.load_seconds,
+            result.decode_seconds,
+        )
+        return result
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return counters and the queue-wait/decode latency histograms."""
+        return {
+            **self.stats,
+            "model_name": self.model_name,
+            "max_workers": self.max_workers,
+            "warm_workers": sum(
+                1 for future in self._warmup if future.done() and not future.exception()
+            ),
+            "queue_wait_seconds": self._queue_wait.snapshot(),
+            "decode_seconds": self._decode.snapshot(),
+        }
+
+    def close(self, *, wait: bool = False) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+            self._warmup = []
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+
+    def _ensure_executor_locked(self) -> concurrent.futures.Executor:
+        if self._executor is None:
+            if not self._whisper_available:
+                # Fail here rather than in the worker initializer, which would only
+                # surface as a broken pool and respawn one on every request.
+                self._import_whisper()
+                self._whisper_available = True
+            if self.use_processes:
+                self._executor = concurrent.futures.ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=self._mp_context or multiprocessing.get_context("spawn"),
+                    initializer=_worker_warm,
+                    initargs=(self.model_name, self._import_whisper),
+                )
+            else:
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="nexus-whisper"
+                )
+        return self._executor
+
+    def _reset_executor(self, broken: concurrent.futures.Executor) -> None:
+        with self._lock:
+            if self._executor is not broken:
+                return
+            self._executor = None
+            self._warmup = []
+            self.stats["worker_restarts"] += 1
+        broken.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _materialize(audio: AudioSource, suffix: str) -> tuple[str, bool]:
+        """Return ``(path, spooled)``; non-path sources are copied to a temp file in chunks."""
+        if isinstance(audio, (str, os.PathLike)):
+            path = os.fspath(audio)
+            if not os.path.exists(path):
+                raise ValueError(f"Audio file not found: {path}")
+            return path, False
+        fd, path = tempfile.mkstemp(prefix="nexus-whisper-", suffix=suffix)
+        try:
+            with os.fdopen(fd, "wb") as out:
+                if isinstance(audio, (bytes, bytearray, memoryview)):
+                    out.write(audio)
+                elif hasattr(audio, "read"):
+                    shutil.copyfileobj(audio, out)  # type: ignore[arg-type]
+                else:
+                    for chunk in audio:
+                        out.write(chunk)
+        except BaseException:
+            os.remove(path)
+            raise
+        return path, True
+
+
+_shared_pools: dict[tuple[str, int, bool], WhisperWorkerPool] = {}
+_shared_lock = threading.Lock()
+
+
+def get_whisper_pool(
+    model_name: str, *, max_workers: int = 1, use_processes: bool = True
+) -> WhisperWorkerPool:
+    """Return the process-wide pool for *model_name* and worker settings."""
+    key = (model_name, max(1, int(max_workers)), bool(use_processes))
+    with _shared_lock:
+        pool = _shared_pools.get(key)
+        if pool is None:
+            pool = WhisperWorkerPool(
+                model_name, max_workers=max_workers, use_processes=use_processes
+            )
+            _shared_pools[key] = pool
+        return pool
+
+
+def reset_whisper_pools() -> None:
+    """Shut down every shared pool (for tests and reloads)."""
+    with _shared_lock:
+        pools = list(_shared_pools.values())
+        _shared_pools.clear()
+    for pool in pools:
+        pool.close()
@@ -2,7 +2,6 @@
 
 import logging
 import os
-import subprocess
 import time
 from collections.abc import Callable, Mapping
 from enum import Enum
@@ -12,6 +11,7 @@ from nexus.core.prompt_budget import prompt_prefix_fingerprint
 from nexus.plugins.builtin.ai_runtime.agent_invoke_service import (
     invoke_agent_with_fallback as invoke_agent_with_fallback_impl,
 )
+from nexus.plugins.builtin.ai_runtime.analysis_cache import AnalysisCache
 from nexus.plugins.builtin.ai_runtime.analysis_service import (
     build_analysis_prompt as build_analysis_prompt_impl,
     parse_analysis_result as parse_analysis_result_impl,
@@ -23,6 +23,8 @@ from nexus.plugins.builtin.ai_runtime.fallback_policy import (
     fallback_order_from_preferences as fallback_order_from_preferences_impl,
     resolve_analysis_tool_order as resolve_analysis_tool_order_impl,
 )
+from nexus.plugins.builtin.ai_runtime.provider_health import get_provider_health_registry
+from nexus.plugins.builtin.ai_runtime.provider_scoreboard import get_provider_scoreboard
 from nexus.plugins.builtin.ai_runtime.provider_invokers.agent_invokers import (
     invoke_copilot_agent_cli as invoke_copilot_agent_cli_impl,
     invoke_gemini_agent_cli as invoke_gemini_agent_cli_impl,
@@ -48,9 +50,6 @@ from nexus.plugins.builtin.ai_runtime.provider_invokers.transcription_invokers i
     transcribe_with_copilot_cli as transcribe_with_copilot_cli_impl,
     transcribe_with_gemini_cli as transcribe_with_gemini_cli_impl,
 )
-from nexus.plugins.builtin.ai_runtime.provider_invokers.whisper_invoker import (
-    transcribe_with_local_whisper as transcribe_with_local_whisper_impl,
-)
 from nexus.plugins.builtin.ai_runtime.provider_registry import (
     parse_tool_preference as parse_tool_preference_impl,
     parse_provider as parse_provider_impl,
@@ -67,9 +66,15 @@ from nexus.plugins.builtin.ai_runtime.transcription_service import (
     run_transcription_attempts as run_transcription_attempts_impl,
     resolve_transcription_attempts as resolve_transcription_attempts_impl,
 )
+from nexus.plugins.builtin.ai_runtime.whisper_pool import WhisperWorkerPool, get_whisper_pool
 
 logger = logging.getLogger(__name__)
 
+# Deterministic analysis tasks whose results may be reused; chat replies are not.
+_DEFAULT_ANALYSIS_CACHE_TASKS = (
+    "classify,detect_feature_ideation,detect_intent,generate_name,refine_description,route"
+)
+
 
 class AIProvider(Enum):
     """AI provider enumeration."""
@@ -100,13 +105,18 @@ def _default_tasks_logs_dir(workspace: str, project: str | None = None) -> str:
 class AIOrchestrator:
     """Manages AI tool orchestration with fallback support."""
 
-    _rate_limits: dict[str, dict[str, Any]] = {}
-    _tool_available: dict[str, bool | float] = {}
-
     def __init__(self, config: dict[str, Any] | None = None):
-        self._tool_available: dict[str, bool | float] = {}
-        self._rate_limits: dict[str, dict[str, Any]] = {}
         self.config = config or {}
+        self._provider_health = get_provider_health_registry(
+            str(self.config.get("provider_health_file") or "").strip() or None,
+            probe_interval=float(self.config.get("provider_probe_interval", 300) or 300),
+        )
+        self.adaptive_routing = bool(self.config.get("adaptive_routing", False))
+        self._scoreboard = get_provider_scoreboard(
+            str(self.config.get("provider_scoreboard_file") or "").strip() or None,
+            alpha=float(self.config.get("adaptive_routing_alpha", 0.3) or 0.3),
+            min_samples=int(self.config.get("adaptive_routing_min_samples", 3) or 3),
+        )
         self.copilot_cli_path = self.config.get("copilot_cli_path", "copilot")
         self.gemini_cli_path = self.config.get("gemini_cli_path", "gemini")
         self.gemini_model = str(self.config.get("gemini_model", "")).strip()
@@ -164,8 +174,25 @@ class AIOrchestrator:
         self.whisper_languages = [
             value.strip() for value in raw_whisper_languages.split(",") if value.strip()
         ]
-        self._whisper_model_instance = None
-        self._whisper_model_name = ""
+        self.analysis_cache_tasks = frozenset(
+            value.strip()
+            for value in str(
+                self.config.get("analysis_cache_tasks", _DEFAULT_ANALYSIS_CACHE_TASKS) or ""
+            ).split(",")
+            if value.strip()
+        )
+        self._analysis_cache = AnalysisCache(
+            ttl_seconds=float(self.config.get("analysis_cache_ttl", 0) or 0),
+            max_entries=int(self.config.get("analysis_cache_entries", 512) or 512),
+            cache_dir=str(self.config.get("analysis_cache_dir") or "").strip() or None,
+        )
+        self.whisper_pool_workers = int(self.config.get("whisper_pool_workers", 1) or 1)
+        self.whisper_pool_processes = bool(self.config.get("whisper_pool_processes", True))
+        if self.config.get("whisper_preload", False):
+            try:
+                self._whisper_pool().start()
+            except ImportError:
+                logger.warning("Whisper preload skipped: 'openai-whisper' is not installed")
         self._warned_tool_preferences: set[str] = set()
         self.get_tasks_logs_dir: Callable[[str, str | None], str] = self.config.get(
             "tasks_logs_dir_resolver",
@@ -548,59 +575,37 @@ class AIOrchestrator:
             looks_like_bug_issue=self._looks_like_bug_issue,
         )
 
-    def check_tool_available(self, tool: AIProvider) -> bool:
-        if tool.value in self._tool_available:
-            cached_at = float(self._tool_available.get(f"{tool.value}_cached_at", 0.0))
-            if time.time() - cached_at < 300:
-                return bool(self._tool_available[tool.value])
-
-        if tool.value in self._rate_limits:
-            rate_info = self._rate_limits[tool.value]
-            if time.time() < rate_info["until"]:
-                logger.warning(
-                    "⏸️  %s is rate-limited until %s (retries: %s/%s)",
-                    tool.value.upper(),
-                    rate_info["until"],
-                    rate_info["retries"],
-                    self.max_retries,
-                )
-                return False
-            del self._rate_limits[tool.value]
+    @property
+    def _rate_limits(self) -> dict[str, dict[str, Any]]:
+        """Active rate-limit cooldowns, shared with other processes on this host."""
+        return self._provider_health.rate_limits()
 
-        try:
-            if tool == AIProvider.GEMINI:
-                path = self.gemini_cli_path
-            elif tool == AIProvider.CODEX:
-                path = self.codex_cli_path
-            elif tool == AIProvider.CLAUDE:
-                path = self.claude_cli_path
-            elif tool == AIProvider.OLLAMA:
-                path = self.ollama_cli_path
-            else:
-                path = self.copilot_cli_path
-            result = subprocess.run(
-                [path, "--version"],
-                capture_output=True,
-                timeout=5,
-                check=False,
-            )
-            available = result.returncode == 0
-            if available:
-                logger.info("✅ %s available", tool.value.upper())
-            else:
-                logger.warning(
-                    "⚠️  %s unavailable: version check failed (exit=%s)",
-                    tool.value.upper(),
-                    result.returncode,
-                )
-        except Exception as exc:
-            available = False
-            logger.warning("⚠️  %s unavailable: %s", tool.value.upper(), exc)
+    def _cli_path_for(self, tool: AIProvider) -> str:
+        if tool == AIProvider.GEMINI:
+            return self.gemini_cli_path
+        if tool == AIProvider.CODEX:
+            return self.codex_cli_path
+        if tool == AIProvider.CLAUDE:
+            return self.claude_cli_path
+        if tool == AIProvider.OLLAMA:
+            return self.ollama_cli_path
+        return self.copilot_cli_path
 
-        tool_key = str(tool.value)
-        self._tool_available[tool_key] = available
-        self._tool_available[f"{tool_key}_cached_at"] = time.time()
-        return available
+    def check_tool_available(self, tool: AIProvider) -> bool:
+        """Return cached availability; probes run in the background once stale."""
+        health = self._provider_health
+        health.register_probe(tool.value, [self._cli_path_for(tool), "--version"])
+        entry = health.get(tool.value)
+        if entry.rate_limited_until > time.time():
+            logger.warning(
+                "⏸️  %s is rate-limited until %s (retries: %s/%s)",
+                tool.value.upper(),
+                entry.rate_limited_until,
+                entry.retries,
+                self.max_retries,
+            )
+            return False
+        return health.is_available(tool.value)
 
     def get_primary_tool(
         self, agent_name: str | None = None, project_name: str | None = None
@@ -737,6 +742,9 @@ class AIOrchestrator:
         The preferred tool goes first; the rest follow in enum declaration order.
         Adding a new provider (Claude, Codex, …) only requires extending AIProvider
         and implementing _invoke_tool dispatch — no other changes needed.
+
+        With ``adaptive_routing`` enabled the candidates are reordered by observed
+        expected completion time (see :meth:`_adaptive_order`).
         """
         if preferred_tool:
             if isinstance(preferred_tool, str):
@@ -750,7 +758,11 @@ class AIOrchestrator:
 
             if preferred:
                 all_tools = list(AIProvider)
-                return [preferred] + [t for t in all_tools if t != preferred]
+                return self._adaptive_order(
+                    [preferred] + [t for t in all_tools if t != preferred],
+                    agent_name,
+                    keep_first=True,
+                )
 
         spec = self._resolved_tool_spec(agent_name, project_name=project_name)
         spec_valid = bool(getattr(spec, "valid", False))
@@ -765,11 +777,73 @@ class AIOrchestrator:
         )
 
         preferred = self.get_primary_tool(agent_name, project_name=project_name)
+        # An explicitly configured provider always leads; profile/auto picks may be reranked.
+        keep_first = spec_valid and isinstance(getattr(spec, "provider", None), AIProvider)
         if providers_for_profile:
-            return [preferred] + [t for t in providers_for_profile if t != preferred]
+            return self._adaptive_order(
+                [preferred] + [t for t in providers_for_profile if t != preferred],
+                agent_name,
+                keep_first=keep_first,
+            )
 
         all_tools = list(AIProvider)
-        return [preferred] + [t for t in all_tools if t != preferred]
+        return self._adaptive_order(
+            [preferred] + [t for t in all_tools if t != preferred],
+            agent_name,
+            keep_first=keep_first,
+        )
+
+    def _adaptive_order(
+        self, order: list[AIProvider], agent_name: str | None, *, keep_first: bool
+    ) -> list[AIProvider]:
+        """Rerank *order* by the routing scoreboard without adding or dropping tools.
+
+        Profile constraints hold because only the given candidates are permuted.
+        Tools inside a rate-limit window move to the end, since they would only
+        be skipped.
+        """
+        if not self.adaptive_routing or len(order) < 2:
+            return order
+        head = order[:1] if keep_first else []
+        tail = order[len(head) :]
+        ranked = [
+            AIProvider(value)
+            for value in self._scoreboard.rank([tool.value for tool in tail], agent_name)
+        ]
+        limited = self._rate_limits
+        ranked = [t for t in ranked if t.value not in limited] + [
+            t for t in ranked if t.value in limited
+        ]
+        if ranked != tail:
+            logger.debug(
+                "Adaptive routing for %s: %s -> %s",
+                agent_name or "default",
+                [t.value for t in tail],
+                [t.value for t in ranked],
+            )
+        return head + ranked
+
+    def record_agent_outcome(
+        self,
+        tool: AIProvider | str,
+        agent_type: str | None,
+        *,
+        success: bool,
+        duration_seconds: float,
+    ) -> None:
+        """Feed a finished agent run into the adaptive routing scoreboard."""
+        tool_value = str(getattr(tool, "value", tool) or "").strip().lower()
+        self._scoreboard.record(
+            tool_value, agent_type or "*", success=success, duration_seconds=duration_seconds
+        )
+
+    def get_routing_scoreboard(self) -> dict[str, Any]:
+        """Return adaptive routing statistics keyed by ``provider:agent_type``."""
+        return {
+            "enabled": self.adaptive_routing,
+            "min_samples": self._scoreboard.min_samples,
+            "routes": self._scoreboard.snapshot(),
+        }
 
     def _invoke_tool(
         self,
@@ -850,10 +924,9 @@ class AIOrchestrator:
         raise ToolUnavailableError(f"No invoker implemented for tool: {tool.value}")
 
     def record_rate_limit(self, tool: AIProvider, retry_count: int = 1):
-        self._rate_limits[tool.value] = {
-            "until": time.time() + self.rate_limit_ttl,
-            "retries": retry_count,
-        }
+        self._provider_health.record_rate_limit(
+            tool.value, self.rate_limit_ttl, retries=retry_count
+        )
         logger.warning("⏸️  %s rate-limited for %ss", tool.value.upper(), self.rate_limit_ttl)
 
     def _record_rate_limit_with_context(
@@ -877,16 +950,13 @@ class AIOrchestrator:
         )
 
     def record_failure(self, tool: AIProvider):
-        if tool.value not in self._rate_limits:
-            self._tool_available[tool.value] = False
-            logger.error("❌ %s marked unavailable", tool.value.upper())
+        rate_limited = tool.value in self._rate_limits
+        if not self._provider_health.record_failure(tool.value, self.max_retries):
             return
-
-        current = self._rate_limits[tool.value]
-        current["retries"] += 1
-        if current["retries"] >= self.max_retries:
+        if rate_limited:
             logger.error("❌ %s exceeded max retries, marking unavailable", tool.value.upper())
-            self._tool_available[tool.value] = False
+        else:
+            logger.error("❌ %s marked unavailable", tool.value.upper())
 
     def invoke_agent(
         self,
@@ -1131,21 +1201,27 @@ class AIOrchestrator:
             logger=logger,
         )
 
-    def _transcribe_with_whisper_api(self, audio_file_path: str) -> str | None:
-        result = transcribe_with_local_whisper_impl(
-            audio_file_path=audio_file_path,
-            current_model_instance=self._whisper_model_instance,
-            current_model_name=self._whisper_model_name,
-            configured_model=self.whisper_model,
-            whisper_language=self.whisper_language,
-            whisper_languages=self.whisper_languages,
-            normalize_local_whisper_model_name=self._normalize_local_whisper_model_name,
-            tool_unavailable_error=ToolUnavailableError,
-            logger=logger,
+    def _whisper_pool(self) -> WhisperWorkerPool:
+        return get_whisper_pool(
+            self._normalize_local_whisper_model_name(self.whisper_model),
+            max_workers=self.whisper_pool_workers,
+            use_processes=self.whisper_pool_processes,
         )
-        self._whisper_model_instance = result["model_instance"]
-        self._whisper_model_name = str(result["model_name"])
-        return str(result["text"])
+
+    def _transcribe_with_whisper_api(self, audio_file_path: str) -> str | None:
+        try:
+            result = self._whisper_pool().transcribe(
+                audio_file_path,
+                language=self.whisper_language,
+                languages=self.whisper_languages,
+                timeout=self.transcription_timeout,
+            )
+        except ImportError as exc:
+            raise ToolUnavailableError(
+                "Local Whisper requires the 'openai-whisper' package. "
+                "Install with: pip install openai-whisper"
+            ) from exc
+        return result.text
 
     @staticmethod
     def _normalize_local_whisper_model_name(configured_model: str) -> str:
@@ -1284,14 +1360,36 @@ class AIOrchestrator:
             prompt_prefix_fingerprint(text),
             task,
         )
-        return run_analysis_attempts_impl(
+        cache_key = None
+        if self._analysis_cache.enabled and task in self.analysis_cache_tasks:
+            cache_key = AnalysisCache.make_key(
+                task,
+                text,
+                [
+                    f"{name}:{model_overrides.get(name, '') or 'default'}"
+                    for name in (str(getattr(tool, "value", tool)) for tool in tool_order)
+                ],
+                {key: value for key, value in analysis_kwargs.items() if not key.startswith("_")},
+            )
+            cached = self._analysis_cache.get(cache_key)
+            if cached is not None:
+                logger.info("🗃️ Analysis cache hit: task=%s key=%s", task, cache_key)
+                return cached
+
+        answered_by: list[str] = []
+
+        def _invoke_provider(tool, text_arg, task_arg, kw):
+            result = self._run_analysis_with_provider(tool, text_arg, task_arg, **kw)
+            if result:
+                answered_by.append(str(getattr(tool, "value", tool)))
+            return result
+
+        result = run_analysis_attempts_impl(
             tool_order=tool_order,
             text=text,
             task=task,
             kwargs=analysis_kwargs,
-            invoke_provider=lambda tool, text_arg, task_arg, kw: self._run_analysis_with_provider(
-                tool, text_arg, task_arg, **kw
-            ),
+            invoke_provider=_invoke_provider,
             rate_limited_error_type=RateLimitedError,
             record_rate_limit_with_context=lambda tool, exc, retry_count, context: self._record_rate_limit_with_context(
                 tool,
@@ -1302,6 +1400,17 @@ class AIOrchestrator:
             get_default_analysis_result=self._get_default_analysis_result,
             logger=logger,
         )
+        # Defaults returned after every provider failed are never cached.
+        if cache_key is not None and answered_by:
+            self._analysis_cache.put(cache_key, result)
+        return result
+
+    def get_analysis_cache_stats(self) -> dict[str, Any]:
+        """Return hit/miss counters for the analysis result cache."""
+        return {
+            **self._analysis_cache.snapshot(),
+            "tasks": sorted(self.analysis_cache_tasks),
+        }
 
     def _resolve_analysis_provider_env(
         self, requester_context: Mapping[str, Any] | None
@@ -5,10 +5,15 @@ import os
 import re
 import shutil
 import subprocess
+import threading
 from typing import Any
 
+from nexus.core.process_table import ProcessTable, get_process_table
+
 logger = logging.getLogger(__name__)
 
+_ISSUE_REF_RE = re.compile(r"issues/(\d+)(?![0-9])")
+
 
 class RuntimeOpsPlugin:
     """Process discovery and termination helpers for issue-linked agent runtimes."""
@@ -22,6 +27,14 @@ class RuntimeOpsPlugin:
         self.kill_timeout = int(self.config.get("kill_timeout", 5))
         self._pgrep_path = shutil.which("pgrep")
         self._pgrep_missing_logged = False
+        # One shared process-table snapshot answers every issue lookup; pgrep
+        # per issue is only used when the host exposes neither /proc nor ps.
+        self._process_table: ProcessTable | None = (
+            get_process_table() if self.config.get("process_snapshot", True) else None
+        )
+        self._issue_index: dict[str, list[dict[str, Any]]] = {}
+        self._issue_index_generation = -1
+        self._issue_index_lock = threading.Lock()
 
     def build_issue_pattern(self, issue_number: str) -> str:
         """Return pgrep regex pattern for issue-linked process detection."""
@@ -30,6 +43,35 @@ class RuntimeOpsPlugin:
 
     def find_issue_processes(self, issue_number: str) -> list[dict[str, Any]]:
         """Return process matches for an issue number."""
+        table = self._process_table
+        if table is not None and table.available:
+            return [
+                dict(match)
+                for match in self._indexed_issue_processes(table).get(str(issue_number).strip(), [])
+            ]
+        return self._pgrep_issue_processes(issue_number)
+
+    def _indexed_issue_processes(self, table: ProcessTable) -> dict[str, list[dict[str, Any]]]:
+        """Index safe agent commands in the current snapshot by the issue numbers they mention."""
+        snapshot = table.snapshot()
+        with self._issue_index_lock:
+            if snapshot.generation == self._issue_index_generation:
+                return self._issue_index
+            process_re = re.compile(f"(?:{self.process_name})")
+            index: dict[str, list[dict[str, Any]]] = {}
+            for pid, command in snapshot.processes:
+                if "issues/" not in command or not process_re.search(command):
+                    continue
+                if not self._is_safe_agent_match(command):
+                    continue
+                for issue_number in dict.fromkeys(_ISSUE_REF_RE.findall(command)):
+                    if re.search(self.build_issue_pattern(issue_number), command):
+                        index.setdefault(issue_number, []).append({"pid": pid, "command": command})
+            self._issue_index = index
+            self._issue_index_generation = snapshot.generation
+            return index
+
+    def _pgrep_issue_processes(self, issue_number: str) -> list[dict[str, Any]]:
         if not self._pgrep_path:
             if not self._pgrep_missing_logged:
                 logger.warning(
@@ -90,6 +132,8 @@ class RuntimeOpsPlugin:
                 capture_output=True,
                 text=True,
             )
+            if self._process_table is not None:
+                self._process_table.invalidate()
             return True
         except Exception as exc:
             logger.error("Failed to kill pid %s (force=%s): %s", pid, force, exc)
@@ -1,7 +1,7 @@
 """Telegram Event Handler Plugin.
 
 Subscribes to the EventBus and sends Telegram notifications on key
-workflow lifecycle events. Registered as a ``PluginKind.EVENT_HANDLER``
+workflow lifecycle events through the shared notification dispatcher. Registered as a ``PluginKind.EVENT_HANDLER``
 plugin.
 
 Usage::
@@ -29,6 +29,7 @@ from nexus.core.events import (
     SystemAlert,
     WorkflowFailed,
 )
+from nexus.core.integrations.notification_dispatcher import get_dispatcher
 from nexus.plugins.builtin.base_chat_event_handler import BaseChatEventHandler
 
 logger = logging.getLogger(__name__)
@@ -144,11 +145,24 @@ class TelegramEventHandler(BaseChatEventHandler):
 
         text = "\n".join(lines)
 
+        def _deliver(message: str, markup: dict[str, Any] | None) -> bool:
+            return bool(
+                self._telegram.send_message_sync(
+                    message,
+                    parse_mode="Markdown",
+                    reply_markup=markup,
+                )
+            )
+
         try:
-            ok = self._telegram.send_message_sync(
+            # Share the process-wide rate shaping with direct notifications so
+            # bus-delivered alert bursts are coalesced instead of hitting 429s.
+            ok = get_dispatcher().dispatch(
+                self._chat_id,
                 text,
-                parse_mode="Markdown",
+                _deliver,
                 reply_markup=reply_markup,
+                batch_key="alert:Markdown" if isinstance(event, SystemAlert) else "event:Markdown",
             )
             self._last_send_ok = bool(ok)
         except Exception as exc:
@@ -1,16 +1,74 @@
 """Built-in plugin: Telegram notification channel via Bot HTTP API."""
 
+import http.client
 import json
 import logging
+import threading
+import time
 from typing import Any
-from urllib import request
-from urllib.error import HTTPError
+from urllib.parse import urlsplit
 
 from nexus.adapters.notifications.base import Message, NotificationChannel
 from nexus.core.models import Severity
 
 logger = logging.getLogger(__name__)
 
+_DEFAULT_API_BASE_URL = "https://api.telegram.org"
+
+
+class _KeepAliveSession:
+    """Per-thread persistent HTTP(S) connection to the Bot API host."""
+
+    def __init__(self, base_url: str, timeout: float) -> None:
+        parts = urlsplit(base_url)
+        self._scheme = parts.scheme or "https"
+        self._host = parts.hostname or "api.telegram.org"
+        self._port = parts.port
+        self._prefix = parts.path.rstrip("/")
+        self._timeout = timeout
+        self._local = threading.local()
+
+    def _connection(self) -> http.client.HTTPConnection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn_cls = (
+                http.client.HTTPSConnection
+                if self._scheme == "https"
+                else http.client.HTTPConnection
+            )
+            conn = conn_cls(self._host, self._port, timeout=self._timeout)
+            self._local.conn = conn
+        return conn
+
+    def close(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        self._local.conn = None
+        if conn is not None:
+            try:
+                conn.close()
+            except Exception:
+                pass
+
+    def post_json(self, path: str, body: bytes) -> tuple[int, str, dict[str, str], bytes]:
+        """POST *body*; reconnects once if a reused connection was dropped by the server."""
+        headers = {"Content-Type": "application/json", "Connection": "keep-alive"}
+        for attempt in range(2):
+            reused = getattr(self._local, "conn", None) is not None
+            conn = self._connection()
+            try:
+                conn.request("POST", f"{self._prefix}{path}", body=body, headers=headers)
+                resp = conn.getresponse()
+                data = resp.read()
+            except (http.client.HTTPException, ConnectionError, OSError):
+                self.close()
+                if reused and attempt == 0:
+                    continue
+                raise
+            if resp.will_close:
+                self.close()
+            return resp.status, resp.reason, dict(resp.getheaders()), data
+        raise ConnectionError("unreachable")  # pragma: no cover
+
 
 class TelegramNotificationPlugin(NotificationChannel):
     """Telegram notification channel using direct HTTP API calls."""
@@ -20,6 +78,10 @@ class TelegramNotificationPlugin(NotificationChannel):
         self.chat_id = str(config.get("chat_id", ""))
         self.parse_mode = config.get("parse_mode", "Markdown")
         self.timeout = int(config.get("timeout", 10))
+        self.api_base_url = str(config.get("api_base_url") or _DEFAULT_API_BASE_URL)
+        self.max_retries = max(0, int(config.get("max_retries", 2)))
+        self.max_retry_after = float(config.get("max_retry_after_seconds", 30))
+        self._session = _KeepAliveSession(self.api_base_url, self.timeout)
 
     @property
     def name(self) -> str:
@@ -127,52 +189,88 @@ class TelegramNotificationPlugin(NotificationChannel):
         if not self.bot_token:
             return None
 
-        url = f"https://api.telegram.org/bot{self.bot_token}/{method}"
+        path = f"/bot{self.bot_token}/{method}"
         body = json.dumps(payload).encode("utf-8")
-        req = request.Request(
-            url,
-            data=body,
-            headers={"Content-Type": "application/json"},
-            method="POST",
-        )
 
-        try:
-            with request.urlopen(req, timeout=self.timeout) as resp:
-                data = json.loads(resp.read().decode("utf-8"))
-            if not data.get("ok"):
-                logger.warning("Telegram API returned non-ok for %s: %s", method, data)
+        for attempt in range(self.max_retries + 1):
+            try:
+                status, reason, headers, raw = self._session.post_json(path, body)
+            except Exception as exc:
+                logger.error("Telegram API call failed for %s: %s", method, exc)
                 return None
-            return data
-        except HTTPError as exc:
-            body = ""
+
+            text = raw.decode("utf-8", errors="replace")
             try:
-                body = exc.read().decode("utf-8")
-            except Exception:
-                body = ""
-            code = getattr(exc, "code", "?")
-            reason = getattr(exc, "reason", "")
-            lowered = str(body or "").lower()
-            parse_entity_error = int(code) == 400 and "can't parse entities" in lowered
-            if downgrade_parse_entity_error and parse_entity_error:
-                logger.warning(
-                    "Telegram API parse error for %s (recoverable): status=%s reason=%s body=%s",
-                    method,
-                    code,
-                    reason,
-                    body,
-                )
-            else:
-                logger.error(
-                    "Telegram API HTTP error for %s: status=%s reason=%s body=%s",
-                    method,
-                    code,
-                    reason,
-                    body,
-                )
-            return None
-        except Exception as exc:
-            logger.error("Telegram API call failed for %s: %s", method, exc)
+                data = json.loads(text) if text else {}
+            except ValueError:
+                data = {}
+
+            if 200 <= status < 300:
+                if not isinstance(data, dict) or not data.get("ok"):
+                    logger.warning("Telegram API returned non-ok for %s: %s", method, data)
+                    return None
+                return data
+
+            if status == 429 and attempt < self.max_retries:
+                retry_after = self._retry_after_seconds(data, headers)
+                if retry_after <= self.max_retry_after:
+                    logger.warning(
+                        "Telegram API rate limited %s; retrying after %.1fs", method, retry_after
+                    )
+                    time.sleep(retry_after)
+                    continue
+
+            self._log_http_error(
+                method,
+                status,
+                reason,
+                text,
+                downgrade_parse_entity_error=downgrade_parse_entity_error,
+            )
             return None
+        return None
+
+    @staticmethod
+    def _retry_after_seconds(data: Any, headers: dict[str, str]) -> float:
+        parameters = data.get("parameters") if isinstance(data, dict) else None
+        candidates = [
+            parameters.get("retry_after") if isinstance(parameters, dict) else None,
+            {key.lower(): value for key, value in headers.items()}.get("retry-after"),
+        ]
+        for candidate in candidates:
+            try:
+                return max(0.0, float(candidate))
+            except (TypeError, ValueError):
+                continue
+        return 1.0
+
+    @staticmethod
+    def _log_http_error(
+        method: str,
+        code: int,
+        reason: str,
+        body: str,
+        *,
+        downgrade_parse_entity_error: bool,
+    ) -> None:
+        lowered = str(body or "").lower()
+        parse_entity_error = int(code) == 400 and "can't parse entities" in lowered
+        if downgrade_parse_entity_error and parse_entity_error:
+            logger.warning(
+                "Telegram API parse error for %s (recoverable): status=%s reason=%s body=%s",
+                method,
+                code,
+                reason,
+                body,
+            )
+        else:
+            logger.error(
+                "Telegram API HTTP error for %s: status=%s reason=%s body=%s",
+                method,
+                code,
+                reason,
+                body,
+            )
 
 
 def register_plugins(registry) -> None:
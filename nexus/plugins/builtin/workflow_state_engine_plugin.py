@@ -620,7 +620,13 @@ class WorkflowStateEnginePlugin:
                 "idempotency_ledger_path",
                 os.path.join(self.storage_dir or ".", ".nexus_idempotency_ledger.json"),
             )
-            self._idempotency_ledger = IdempotencyLedger(ledger_path)
+            ttl_seconds = self.config.get("idempotency_ttl_seconds")
+            max_entries = self.config.get("idempotency_max_entries")
+            self._idempotency_ledger = IdempotencyLedger(
+                ledger_path,
+                ttl_seconds=int(ttl_seconds) if ttl_seconds is not None else None,
+                max_entries=int(max_entries) if max_entries is not None else None,
+            )
         return self._idempotency_ledger  # type: ignore[return-value]
 
     async def complete_step_for_issue(
@@ -836,7 +842,7 @@ class WorkflowStateEnginePlugin:
                     agent_type=expected_agent or completed_agent_type,
                     event_id=event_id,
                 )
-                if ledger.is_duplicate(idem_key):
+                if not ledger.check_and_record(idem_key):
                     logger.info(
                         "complete_step_for_issue: duplicate event suppressed for issue #%s "
                         "(step=%s, agent=%s, event_id=%s)",
@@ -852,19 +858,24 @@ class WorkflowStateEnginePlugin:
                     )
                     return workflow
 
-            normalized_outputs = self._normalize_completion_outputs(workflow, running_step, outputs)
-            normalized_outputs["workflow_id"] = str(workflow_id)
-            normalized_outputs["step_id"] = running_step.name
-            normalized_outputs["step_num"] = running_step.step_num
-
-            result = await engine.complete_step(
-                workflow_id=workflow_id,
-                step_num=running_step.step_num,
-                outputs=normalized_outputs,
-            )
+            try:
+                normalized_outputs = self._normalize_completion_outputs(
+                    workflow, running_step, outputs
+                )
+                normalized_outputs["workflow_id"] = str(workflow_id)
+                normalized_outputs["step_id"] = running_step.name
+                normalized_outputs["step_num"] = running_step.step_num
 
-            if event_id:
-                ledger.record(idem_key)
+                result = await engine.complete_step(
+                    workflow_id=workflow_id,
+                    step_num=running_step.step_num,
+                    outputs=normalized_outputs,
+                )
+            except BaseException:
+                # Release the event so a redelivery can complete the step.
+                if event_id:
+                    ledger.discard(idem_key)
+                raise
 
             if result is not None:
                 self._mark_completion_outcome(result, applied=True)
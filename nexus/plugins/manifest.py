@@ -0,0 +1,220 @@
+"""Static plugin manifest and import-on-first-use factories.
+
+Built-in plugins are registered from :data:`BUILTIN_PLUGIN_MANIFEST`, which maps
+``(kind, name)`` to a ``"module:attribute"`` target.  Registration only records
+the target; the plugin module (and its transitive dependencies) is imported
+the first time the plugin is instantiated.
+
+Third-party packages can contribute plugins the same way through the
+``nexus_core.plugin_factories`` entry-point group, naming each entry point
+``<kind>/<plugin-name>``::
+
+    [project.entry-points."nexus_core.plugin_factories"]
+    "ai_provider/my-provider" = "my_package.provider:MyProvider"
+
+Such entry points are read from package metadata only; nothing is imported
+until the plugin is created.
+"""
+
+import importlib
+import threading
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from nexus.plugins.base import PluginKind
+
+ENTRYPOINT_FACTORY_GROUP = "nexus_core.plugin_factories"
+
+
+@dataclass(frozen=True)
+class PluginManifestEntry:
+    """Registration metadata for a plugin whose module is imported lazily."""
+
+    kind: PluginKind
+    name: str
+    target: str
+    version: str = "0.1.0"
+    description: str = ""
+
+
+class LazyPluginFactory:
+    """Plugin factory that imports its ``module:attribute`` target on first call."""
+
+    def __init__(self, target: str) -> None:
+        module_name, _, attribute = target.partition(":")
+        if not module_name or not attribute:
+            raise ValueError(f"Plugin target must look like 'module:attribute': {target!r}")
+        self.target = target
+        self._module_name = module_name
+        self._attribute = attribute
+        self._factory: Callable[[dict[str, Any]], Any] | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self._factory is not None
+
+    def resolve(self) -> Callable[[dict[str, Any]], Any]:
+        """Import the target module and return the factory callable."""
+        if self._factory is None:
+            with self._lock:
+                if self._factory is None:
+                    factory: Any = importlib.import_module(self._module_name)
+                    for part in self._attribute.split("."):
+                        factory = getattr(factory, part)
+                    if not callable(factory):
+                        raise TypeError(f"Plugin target is not callable: {self.target}")
+                    self._factory = factory
+        return self._factory
+
+    def __call__(self, config: dict[str, Any]) -> Any:
+        return self.resolve()(config)
+
+    def __repr__(self) -> str:
+        return f"LazyPluginFactory({self.target!r}, loaded={self.loaded})"
+
+
+_BUILTIN = "nexus.plugins.builtin"
+
+BUILTIN_PLUGIN_MANIFEST: tuple[PluginManifestEntry, ...] = (
+    PluginManifestEntry(
+        PluginKind.AI_PROVIDER,
+        "ai-runtime-orchestrator",
+        f"{_BUILTIN}.ai_runtime_plugin:AIOrchestrator",
+        description="Copilot/Gemini/Codex/Ollama orchestration with fallback and cooldown handling",
+    ),
+    PluginManifestEntry(
+        PluginKind.INPUT_ADAPTER,
+        "agent-launch-policy",
+        f"{_BUILTIN}.agent_launch_policy_plugin:AgentLaunchPolicyPlugin",
+        description="Agent launch prompt composition policy",
+    ),
+    PluginManifestEntry(
+        PluginKind.GIT_PLATFORM,
+        "github-issue-api",
+        f"{_BUILTIN}.github_issue_plugin:GitHubIssuePlugin",
+        description="GitHub issue operations via API adapter",
+    ),
+    PluginManifestEntry(
+        PluginKind.GIT_PLATFORM,
+        "github-issue-cli",
+        f"{_BUILTIN}.github_issue_cli_plugin:GitHubIssueCLIPlugin",
+        description="GitHub issue creation via gh CLI with no-label fallback",
+    ),
+    PluginManifestEntry(
+        PluginKind.GIT_PLATFORM,
+        "gitlab-issue-api",
+        f"{_BUILTIN}.gitlab_issue_plugin:GitLabIssuePlugin",
+        description="GitLab issue operations via API adapter",
+    ),
+    PluginManifestEntry(
+        PluginKind.GIT_PLATFORM,
+        "gitlab-issue-cli",
+        f"{_BUILTIN}.gitlab_issue_cli_plugin:GitLabIssueCLIPlugin",
+        description="GitLab issue creation via glab CLI with no-label fallback",
+    ),
+    PluginManifestEntry(
+        PluginKind.NOTIFICATION_CHANNEL,
+        "telegram-notification-http",
+        f"{_BUILTIN}.telegram_notification_plugin:TelegramNotificationPlugin",
+        description="Telegram Bot API notification channel plugin",
+    ),
+    PluginManifestEntry(
+        PluginKind.INTERACTIVE_CLIENT,
+        "telegram-interactive-http",
+        f"{_BUILTIN}.telegram_interactive_plugin:TelegramInteractivePlugin",
+        description="Telegram Interactive Client plugin",
+    ),
+    PluginManifestEntry(
+        PluginKind.EVENT_HANDLER,
+        "telegram-event-handler",
+        f"{_BUILTIN}.telegram_event_handler_plugin:TelegramEventHandler",
+        version="1.0.0",
+        description="Sends Telegram notifications on workflow events via EventBus",
+    ),
+    PluginManifestEntry(
+        PluginKind.INTERACTIVE_CLIENT,
+        "discord-interactive-http",
+        f"{_BUILTIN}.discord_interactive_plugin:DiscordInteractivePlugin",
+        version="1.0.0",
+    ),
+    PluginManifestEntry(
+        PluginKind.EVENT_HANDLER,
+        "discord-event-handler",
+        f"{_BUILTIN}.discord_event_handler_plugin:DiscordEventHandler",
+        version="1.0.0",
+        description="Sends Discord embed notifications on workflow events via EventBus",
+    ),
+    PluginManifestEntry(
+        PluginKind.STORAGE_BACKEND,
+        "json-state-store",
+        f"{_BUILTIN}.json_state_plugin:JsonStateStorePlugin",
+        description="JSON and line-based state storage helper",
+    ),
+    PluginManifestEntry(
+        PluginKind.INPUT_ADAPTER,
+        "runtime-ops-process-guard",
+        f"{_BUILTIN}.runtime_ops_plugin:RuntimeOpsPlugin",
+        description="Process discovery and safe termination helpers for runtime agent operations",
+    ),
+    PluginManifestEntry(
+        PluginKind.INPUT_ADAPTER,
+        "workflow-policy",
+        f"{_BUILTIN}.workflow_policy_plugin:WorkflowPolicyPlugin",
+        description="Workflow policy for notifications and finalization",
+    ),
+    PluginManifestEntry(
+        PluginKind.INPUT_ADAPTER,
+        "workflow-monitor-policy",
+        f"{_BUILTIN}.workflow_monitor_policy_plugin:WorkflowMonitorPolicyPlugin",
+        description="Workflow monitor policy for issue/comments/PR/repo resolution",
+    ),
+    PluginManifestEntry(
+        PluginKind.INPUT_ADAPTER,
+        "git-webhook-policy",
+        f"{_BUILTIN}.git_webhook_policy_plugin:GitWebhookPolicyPlugin",
+        description="GitHub webhook payload normalization and policy helpers",
+    ),
+    PluginManifestEntry(
+        PluginKind.INPUT_ADAPTER,
+        "workflow-state-engine",
+        f"{_BUILTIN}.workflow_state_engine_plugin:WorkflowStateEnginePlugin",
+        description="Workflow state adapter for issue-based pause/resume/status/approval operations",
+    ),
+)
+
+
+def parse_entrypoint_manifest_entry(
+    name: str, value: str, version: str = "0.0.0"
+) -> PluginManifestEntry:
+    """Build a manifest entry from a ``<kind>/<plugin-name> = module:attr`` entry point."""
+    kind_value, separator, plugin_name = name.partition("/")
+    if not separator or not plugin_name.strip():
+        raise ValueError(f"Plugin entry point name must look like '<kind>/<name>': {name!r}")
+    kind_key = kind_value.strip().lower()
+    for kind in PluginKind:
+        if kind_key in (kind.value, kind.name.lower()):
+            return PluginManifestEntry(kind, plugin_name.strip(), value.strip(), version=version)
+    raise ValueError(f"Unknown plugin kind in entry point {name!r}")
+
+
+def register_manifest(
+    registry: Any,
+    entries: Iterable[PluginManifestEntry] = BUILTIN_PLUGIN_MANIFEST,
+    *,
+    force: bool = False,
+) -> int:
+    """Register *entries* with lazy factories; returns the number registered."""
+    count = 0
+    for entry in entries:
+        registry.register_factory(
+            kind=entry.kind,
+            name=entry.name,
+            version=entry.version,
+            factory=LazyPluginFactory(entry.target),
+            description=entry.description,
+            force=force,
+        )
+        count += 1
+    return count
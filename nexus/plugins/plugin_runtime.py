@@ -9,8 +9,12 @@ Requires the ``watchdog`` package (``pip install nexus-arc[hotreload]``).
 
 from __future__ import annotations
 
+import dataclasses
+import heapq
 import importlib.util
+import json
 import logging
+import os
 import threading
 import types
 from datetime import UTC, datetime
@@ -27,6 +31,16 @@ class HandoffManager:
     as an optional dependency — existing code paths are unaffected when
     no ``HandoffManager`` is provided.
 
+    Expiry times are kept in a min-heap (entries for completed or failed
+    delegations are skipped when they surface), and active delegations are
+    indexed by ``(workflow_id, lead_agent)``, so :meth:`expire_stale` and
+    :meth:`pending_for` only touch the delegations they return.
+
+    With *journal_path* set, registrations and resolutions are appended to a
+    JSON-lines journal that is replayed on construction, so active
+    delegations survive restarts.  The journal is rewritten with only the
+    active delegations once it grows well past them.
+
     Example::
 
         from nexus.plugins.plugin_runtime import HandoffManager
@@ -45,10 +59,19 @@ class HandoffManager:
         manager.complete(callback)
     """
 
-    def __init__(self) -> None:
+    def __init__(self, journal_path: str | Path | None = None) -> None:
         # delegation_id → DelegationRequest
         self._active: dict[str, DelegationRequest] = {}  # noqa: F821
+        # (workflow_id, lead_agent) → {delegation_id: DelegationRequest}
+        self._by_lead: dict[tuple[str, str], dict[str, DelegationRequest]] = {}  # noqa: F821
+        # (expires_at, delegation_id); stale entries are dropped lazily
+        self._expiry_heap: list[tuple[datetime, str]] = []
+        self._expires: dict[str, datetime] = {}
         self._lock = threading.Lock()
+        self._journal_path = Path(journal_path) if journal_path else None
+        self._journal_lines = 0
+        if self._journal_path is not None:
+            self._replay_journal()
 
     # ------------------------------------------------------------------
     # Public API
@@ -60,7 +83,8 @@ class HandoffManager:
 
         with self._lock:
             request.status = DelegationStatus.ACTIVE
-            self._active[request.delegation_id] = request
+            self._add(request)
+            self._journal({"op": "register", "request": _delegation_to_dict(request)})
         logger.debug(
             "Delegation registered: %s (%s → %s)",
             request.delegation_id,
@@ -79,7 +103,7 @@ class HandoffManager:
         from nexus.core.models import DelegationStatus
 
         with self._lock:
-            request = self._active.pop(callback.delegation_id, None)
+            request = self._remove(callback.delegation_id, "completed")
         if request is None:
             logger.warning(
                 "complete() called for unknown delegation_id: %s",
@@ -95,30 +119,33 @@ class HandoffManager:
         from nexus.core.models import DelegationStatus
 
         with self._lock:
-            request = self._active.pop(delegation_id, None)
+            request = self._remove(delegation_id, "failed")
         if request is not None:
             request.status = DelegationStatus.FAILED
             logger.debug("Delegation failed: %s — %s", delegation_id, error)
         else:
             logger.warning("fail() called for unknown delegation_id: %s", delegation_id)
 
-    def expire_stale(self) -> list[DelegationRequest]:  # noqa: F821
+    def expire_stale(self, now: datetime | None = None) -> list[DelegationRequest]:  # noqa: F821
         """Expire delegations whose ``expires_at`` timestamp has passed.
 
+        A naive *now* is taken as UTC, like naive ``expires_at`` values.
         Returns the list of newly expired requests.
         """
         from nexus.core.models import DelegationStatus
 
-        now = datetime.now(UTC).isoformat()
+        if now is None:
+            now = datetime.now(UTC)
+        elif now.tzinfo is None:
+            now = now.replace(tzinfo=UTC)
         expired: list = []
         with self._lock:
-            stale_ids = [
-                did
-                for did, req in self._active.items()
-                if req.expires_at is not None and req.expires_at < now
-            ]
-            for did in stale_ids:
-                req = self._active.pop(did)
+            heap = self._expiry_heap
+            while heap and heap[0][0] < now:
+                expires_at, did = heapq.heappop(heap)
+                if self._expires.get(did) != expires_at:
+                    continue  # resolved or re-registered since it was pushed
+                req = self._remove(did, "expired")
                 req.status = DelegationStatus.EXPIRED
                 expired.append(req)
         if expired:
@@ -135,11 +162,113 @@ class HandoffManager:
     ) -> list[DelegationRequest]:  # noqa: F821
         """Return all active delegations for *lead_agent* in *workflow_id*."""
         with self._lock:
-            return [
-                req
-                for req in self._active.values()
-                if req.lead_agent == lead_agent and req.workflow_id == workflow_id
-            ]
+            return list(self._by_lead.get((workflow_id, lead_agent), {}).values())
+
+    # ------------------------------------------------------------------
+    # Internals (caller holds ``self._lock``)
+    # ------------------------------------------------------------------
+
+    def _add(self, request: DelegationRequest) -> None:  # noqa: F821
+        did = request.delegation_id
+        if did in self._active:
+            self._unindex(self._active[did])
+        self._active[did] = request
+        self._by_lead.setdefault((request.workflow_id, request.lead_agent), {})[did] = request
+        expires_at = _parse_expiry(request.expires_at)
+        if expires_at is None:
+            self._expires.pop(did, None)
+        else:
+            self._expires[did] = expires_at
+            heapq.heappush(self._expiry_heap, (expires_at, did))
+            if len(self._expiry_heap) > 2 * len(self._expires) + 64:
+                self._expiry_heap = [(at, key) for key, at in self._expires.items()]
+                heapq.heapify(self._expiry_heap)
+
+    def _remove(self, delegation_id: str, reason: str) -> DelegationRequest | None:  # noqa: F821
+        request = self._active.pop(delegation_id, None)
+        if request is not None:
+            self._unindex(request)
+            self._journal({"op": reason, "delegation_id": delegation_id})
+        return request
+
+    def _unindex(self, request: DelegationRequest) -> None:  # noqa: F821
+        key = (request.workflow_id, request.lead_agent)
+        bucket = self._by_lead.get(key)
+        if bucket is not None:
+            bucket.pop(request.delegation_id, None)
+            if not bucket:
+                del self._by_lead[key]
+        self._expires.pop(request.delegation_id, None)
+
+    def _journal(self, entry: dict) -> None:
+        if self._journal_path is None:
+            return
+        try:
+            self._journal_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self._journal_path, "a", encoding="utf-8") as fh:
+                fh.write(json.dumps(entry, default=str) + "\n")
+            self._journal_lines += 1
+            if self._journal_lines >= max(_JOURNAL_COMPACTION_MIN_LINES, 4 * len(self._active)):
+                self._compact_journal()
+        except OSError as exc:
+            logger.warning("HandoffManager: failed to write %s: %s", self._journal_path, exc)
+
+    def _compact_journal(self) -> None:
+        tmp_path = self._journal_path.with_name(f"{self._journal_path.name}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as fh:
+            for request in self._active.values():
+                entry = {"op": "register", "request": _delegation_to_dict(request)}
+                fh.write(json.dumps(entry, default=str) + "\n")
+        os.replace(tmp_path, self._journal_path)
+        self._journal_lines = len(self._active)
+
+    def _replay_journal(self) -> None:
+        from nexus.core.models import DelegationRequest, DelegationStatus
+
+        try:
+            with open(self._journal_path, encoding="utf-8") as fh:
+                lines = fh.readlines()
+        except FileNotFoundError:
+            return
+        except OSError as exc:
+            logger.warning("HandoffManager: failed to read %s: %s", self._journal_path, exc)
+            return
+        for line in lines:
+            try:
+                entry = json.loads(line)
+                if entry.get("op") == "register":
+                    fields = dict(entry["request"])
+                    fields["status"] = DelegationStatus(fields.get("status", "active"))
+                    self._add(DelegationRequest(**fields))
+                else:
+                    request = self._active.pop(str(entry.get("delegation_id")), None)
+                    if request is not None:
+                        self._unindex(request)
+            except (ValueError, TypeError, KeyError) as exc:
+                logger.warning("HandoffManager: skipping bad journal line: %s", exc)
+        self._journal_lines = len(lines)
+        if self._active:
+            logger.info("Restored %d active delegation(s)", len(self._active))
+
+
+_JOURNAL_COMPACTION_MIN_LINES = 256
+
+
+def _parse_expiry(value: str | None) -> datetime | None:
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        logger.warning("Ignoring unparseable delegation expires_at: %r", value)
+        return None
+    return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=UTC)
+
+
+def _delegation_to_dict(request: DelegationRequest) -> dict:  # noqa: F821
+    data = dataclasses.asdict(request)
+    data["status"] = request.status.value
+    return data
 
 
 # Deferred import so that the rest of nexus-arc stays importable even when
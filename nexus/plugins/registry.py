@@ -15,6 +15,11 @@ from nexus.plugins.base import (
     make_plugin_spec,
     normalize_plugin_name,
 )
+from nexus.plugins.manifest import (
+    ENTRYPOINT_FACTORY_GROUP,
+    parse_entrypoint_manifest_entry,
+    register_manifest,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -176,6 +181,27 @@ class PluginRegistry:
                 logger.warning("Failed loading plugin entry point %s: %s", entry_point.name, exc)
         return loaded
 
+    def register_entrypoint_factories(self, group: str = ENTRYPOINT_FACTORY_GROUP) -> int:
+        """Register ``<kind>/<name> = module:attr`` entry points without importing them.
+
+        The target module is imported the first time the plugin is created.
+        """
+        registered = 0
+        for entry_point in _iter_entry_points(group):
+            try:
+                dist = getattr(entry_point, "dist", None)
+                entry = parse_entrypoint_manifest_entry(
+                    entry_point.name,
+                    entry_point.value,
+                    version=str(getattr(dist, "version", "") or "0.0.0"),
+                )
+                registered += register_manifest(self, [entry])
+            except Exception as exc:
+                logger.warning(
+                    "Failed registering plugin entry point %s: %s", entry_point.name, exc
+                )
+        return registered
+
 
 def _iter_entry_points(group: str):
     """Yield entry points across Python versions."""
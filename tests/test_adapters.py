@@ -1098,7 +1098,7 @@ class TestCodexCLIProvider:
         mock_proc.returncode = 0
 
         with patch(
-            "nexus.adapters.ai.codex_provider.asyncio.create_subprocess_exec",
+            "nexus.core.process_runner.asyncio.create_subprocess_exec",
             return_value=mock_proc,
         ):
             ctx = ExecutionContext(
@@ -1124,11 +1124,11 @@ class TestCodexCLIProvider:
 
         with (
             patch(
-                "nexus.adapters.ai.codex_provider.asyncio.create_subprocess_exec",
+                "nexus.core.process_runner.asyncio.create_subprocess_exec",
                 return_value=mock_proc,
             ),
             patch(
-                "nexus.adapters.ai.codex_provider.asyncio.wait_for",
+                "nexus.core.process_runner.asyncio.wait_for",
                 side_effect=asyncio.TimeoutError,
             ),
         ):
@@ -1162,7 +1162,7 @@ class TestCodexCLIProvider:
         mock_proc.returncode = 0
 
         with patch(
-            "nexus.adapters.ai.codex_provider.asyncio.create_subprocess_exec",
+            "nexus.core.process_runner.asyncio.create_subprocess_exec",
             return_value=mock_proc,
         ):
             ctx = ExecutionContext(
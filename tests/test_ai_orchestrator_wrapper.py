@@ -30,3 +30,30 @@ def test_get_orchestrator_passes_copilot_permissions_keys_from_get_config(monkey
     assert captured["copilot_permissions"] == {"allow_urls": ["http://webhook:8081"]}
     assert callable(captured["copilot_permissions_resolver"])
     wrapper.reset_orchestrator()
+
+
+def test_record_agent_outcome_uses_launch_tracker_once_per_launch(monkeypatch):
+    from nexus.core.state_manager import HostStateManager
+
+    recorded: list[tuple] = []
+
+    class _Orchestrator:
+        def record_agent_outcome(self, tool, agent_type, *, success, duration_seconds):
+            recorded.append((tool, agent_type, success, round(duration_seconds)))
+
+    launched = {
+        "42": {"tool": "codex", "agent_type": "developer", "pid": 4242, "timestamp": 1000.0}
+    }
+    monkeypatch.setattr(
+        HostStateManager, "load_launched_agents", staticmethod(lambda recent_only=True: launched)
+    )
+    monkeypatch.setattr(wrapper, "get_orchestrator", lambda: _Orchestrator())
+    monkeypatch.setattr(wrapper.time, "time", lambda: 1600.0)
+    monkeypatch.setattr(wrapper, "_recorded_outcomes", type(wrapper._recorded_outcomes)())
+
+    wrapper.record_agent_outcome("42", success=True, agent_type="@Developer")
+    wrapper.record_agent_outcome("42", success=True, agent_type="developer")
+    wrapper.record_agent_outcome("42", success=False, agent_type="reviewer")
+    wrapper.record_agent_outcome("7", success=False)
+
+    assert recorded == [("codex", "developer", True, 600)]
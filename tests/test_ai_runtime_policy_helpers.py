@@ -1,6 +1,7 @@
 import io
 import os
 
+from nexus.core.process_runner import ProcessRunner
 from nexus.plugins.builtin.ai_runtime.agent_invoke_service import (
     extract_issue_number,
     invoke_agent_with_fallback,
@@ -32,9 +33,6 @@ from nexus.plugins.builtin.ai_runtime.provider_invokers.transcription_invokers i
     transcribe_with_copilot_cli,
     transcribe_with_gemini_cli,
 )
-from nexus.plugins.builtin.ai_runtime.provider_invokers.whisper_invoker import (
-    transcribe_with_local_whisper,
-)
 from nexus.plugins.builtin.ai_runtime.provider_registry import (
     parse_tool_preference,
     parse_provider,
@@ -366,7 +364,7 @@ def test_gemini_analysis_invoker_rate_limit_and_timeout(monkeypatch):
         stderr = "quota exceeded"
         stdout = ""
 
-    monkeypatch.setattr(invokers_mod.subprocess, "run", lambda *args, **kwargs: _Result())
+    monkeypatch.setattr(ProcessRunner, "run", lambda *args, **kwargs: _Result())
     try:
         run_gemini_analysis_cli(
             check_tool_available=lambda provider: True,
@@ -389,7 +387,7 @@ def test_gemini_analysis_invoker_rate_limit_and_timeout(monkeypatch):
     def _raise_timeout(*args, **kwargs):
         raise invokers_mod.subprocess.TimeoutExpired(cmd="gemini", timeout=5)
 
-    monkeypatch.setattr(invokers_mod.subprocess, "run", _raise_timeout)
+    monkeypatch.setattr(ProcessRunner, "run", _raise_timeout)
     try:
         run_gemini_analysis_cli(
             check_tool_available=lambda provider: True,
@@ -411,14 +409,12 @@ def test_gemini_analysis_invoker_rate_limit_and_timeout(monkeypatch):
 
 
 def test_copilot_analysis_invoker_success_and_unavailable(monkeypatch):
-    import nexus.plugins.builtin.ai_runtime.provider_invokers.analysis_invokers as invokers_mod
-
     class _Result:
         returncode = 0
         stderr = ""
         stdout = '{"ok": true}'
 
-    monkeypatch.setattr(invokers_mod.subprocess, "run", lambda *args, **kwargs: _Result())
+    monkeypatch.setattr(ProcessRunner, "run", lambda *args, **kwargs: _Result())
     out = run_copilot_analysis_cli(
         check_tool_available=lambda provider: True,
         copilot_provider=AIProvider.COPILOT,
@@ -1448,77 +1444,6 @@ def test_copilot_transcription_invoker_stages_and_returns_text(monkeypatch, tmp_
     assert "--add-dir" in captured["cmd"]
 
 
-def test_local_whisper_invoker_loads_model_and_returns_cache_state(tmp_path):
-    audio = tmp_path / "voice.ogg"
-    audio.write_text("x")
-
-    class _Model:
-        def transcribe(self, path, **kwargs):
-            assert path == str(audio)
-            assert kwargs["fp16"] is False
-            assert kwargs["language"] == "en"
-            return {"text": "hello", "language": "en"}
-
-    class _WhisperModule:
-        def load_model(self, model_name):
-            assert model_name == "base"
-            return _Model()
-
-    class _Logger:
-        def info(self, *args, **kwargs):
-            pass
-
-    result = transcribe_with_local_whisper(
-        audio_file_path=str(audio),
-        current_model_instance=None,
-        current_model_name="",
-        configured_model="whisper-1",
-        whisper_language="en",
-        whisper_languages=["en", "it"],
-        normalize_local_whisper_model_name=lambda configured: "base",
-        import_whisper=lambda: _WhisperModule(),
-        tool_unavailable_error=RuntimeError,
-        logger=_Logger(),
-    )
-    assert result["text"] == "hello"
-    assert result["model_name"] == "base"
-    assert result["model_instance"] is not None
-
-
-def test_local_whisper_invoker_rejects_disallowed_language(tmp_path):
-    audio = tmp_path / "voice.ogg"
-    audio.write_text("x")
-
-    class _Model:
-        def transcribe(self, path, **kwargs):
-            return {"text": "ciao", "language": "fr"}
-
-    class _WhisperModule:
-        def load_model(self, model_name):
-            return _Model()
-
-    class _Logger:
-        def info(self, *args, **kwargs):
-            pass
-
-    try:
-        transcribe_with_local_whisper(
-            audio_file_path=str(audio),
-            current_model_instance=None,
-            current_model_name="",
-            configured_model="base",
-            whisper_language=None,
-            whisper_languages=["en", "it"],
-            normalize_local_whisper_model_name=lambda configured: configured,
-            import_whisper=lambda: _WhisperModule(),
-            tool_unavailable_error=RuntimeError,
-            logger=_Logger(),
-        )
-        assert False, "expected language restriction error"
-    except Exception as exc:
-        assert "outside allowed set" in str(exc)
-
-
 def test_run_transcription_attempts_fallback_and_rate_limit_recording():
     class _RateLimited(Exception):
         pass
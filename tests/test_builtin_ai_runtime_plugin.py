@@ -1,10 +1,23 @@
 """Tests for built-in AI runtime plugin."""
 
+import os
 import subprocess
+import threading
+import time
+
+import pytest
 
 import nexus.core.auth.access_domain as access_domain
 import nexus.core.config as config_mod
-from nexus.plugins.builtin.ai_runtime_plugin import AIOrchestrator, AIProvider, RateLimitedError
+from nexus.core.process_runner import ProcessRunner
+from nexus.plugins.builtin.ai_runtime.provider_health import ProviderHealthRegistry
+from nexus.plugins.builtin.ai_runtime.whisper_pool import WhisperWorkerPool
+from nexus.plugins.builtin.ai_runtime_plugin import (
+    AIOrchestrator,
+    AIProvider,
+    RateLimitedError,
+    ToolUnavailableError,
+)
 
 
 class _FakeCompletedProcess:
@@ -98,6 +111,49 @@ def test_analysis_fallback_order_comes_from_tool_preferences(monkeypatch):
     assert call_order == ["copilot", "gemini"]
 
 
+def test_analysis_cache_reuses_provider_results_across_processes(monkeypatch, tmp_path):
+    config = {
+        "tool_preferences": {"triage": {"provider": "gemini", "profile": "small"}},
+        "system_operations": {"default": "triage"},
+        "analysis_cache_ttl": 60,
+        "analysis_cache_dir": str(tmp_path / "analysis_cache"),
+    }
+    orchestrator = AIOrchestrator(config)
+    calls: list[str] = []
+
+    def _gemini(text, task, **_kwargs):
+        calls.append(task)
+        if text == "flaky":
+            raise Exception("gemini down")
+        return {"project": "nexus", "type": "feature", "task_name": f"n{len(calls)}"}
+
+    monkeypatch.setattr(orchestrator, "_run_gemini_cli_analysis", _gemini)
+    monkeypatch.setattr(orchestrator, "_run_copilot_analysis", _gemini)
+
+    first = orchestrator.run_text_to_speech_analysis("Add  dark\nmode", task="classify")
+    first["task_name"] = "mutated"
+    second = orchestrator.run_text_to_speech_analysis("Add dark mode ", task="classify")
+    orchestrator.run_text_to_speech_analysis("Add dark mode", task="chat")
+    orchestrator.run_text_to_speech_analysis("Add dark mode", task="chat")
+    orchestrator.run_text_to_speech_analysis("flaky", task="classify")
+    orchestrator.run_text_to_speech_analysis("flaky", task="classify")
+
+    assert second["task_name"] == "n1"
+    assert calls.count("chat") == 2
+    assert calls.count("classify") == 1 + 2 * 2  # default results are never cached
+
+    restarted = AIOrchestrator(config)
+    monkeypatch.setattr(restarted, "_run_gemini_cli_analysis", _gemini)
+    assert restarted.run_text_to_speech_analysis("Add dark mode", task="classify") == {
+        "project": "nexus",
+        "type": "feature",
+        "task_name": "n1",
+    }
+    stats = restarted.get_analysis_cache_stats()
+    assert stats["disk_hits"] == 1 and stats["misses"] == 0
+    assert orchestrator.get_analysis_cache_stats()["hits"] == 1
+
+
 def test_refine_description_bug_report_prefers_triage_over_designer(monkeypatch):
     orchestrator = AIOrchestrator(
         {
@@ -314,7 +370,7 @@ def test_copilot_analysis_timeout_respects_config(monkeypatch):
         captured["timeout"] = kwargs.get("timeout")
         return _FakeCompletedProcess('{"project": "nexus", "type": "feature", "task_name": "abc"}')
 
-    monkeypatch.setattr(subprocess, "run", _fake_run)
+    monkeypatch.setattr(ProcessRunner, "run", _fake_run)
 
     result = orchestrator._run_copilot_analysis("input", "classify")
 
@@ -333,7 +389,7 @@ def test_copilot_analysis_passes_provider_env_and_cwd(monkeypatch, tmp_path):
         captured["cwd"] = kwargs.get("cwd")
         return _FakeCompletedProcess('{"project": "nexus", "type": "feature", "task_name": "abc"}')
 
-    monkeypatch.setattr(subprocess, "run", _fake_run)
+    monkeypatch.setattr(ProcessRunner, "run", _fake_run)
 
     result = orchestrator._run_copilot_analysis(
         "input",
@@ -365,7 +421,7 @@ def test_analysis_without_project_workspace_does_not_pass_string_none_cwd(monkey
         captured["cwd"] = kwargs.get("cwd")
         return _FakeCompletedProcess('{"project": "nexus", "type": "question", "task_name": "ok"}')
 
-    monkeypatch.setattr(subprocess, "run", _fake_run)
+    monkeypatch.setattr(ProcessRunner, "run", _fake_run)
 
     result = orchestrator.run_text_to_speech_analysis(
         "Which new features could we add to the framework?",
@@ -387,7 +443,7 @@ def test_gemini_analysis_uses_analysis_timeout(monkeypatch):
         captured["timeout"] = kwargs.get("timeout")
         return _FakeCompletedProcess('{"project": "nexus", "type": "feature", "task_name": "abc"}')
 
-    monkeypatch.setattr(subprocess, "run", _fake_run)
+    monkeypatch.setattr(ProcessRunner, "run", _fake_run)
 
     result = orchestrator._run_gemini_cli_analysis("input", "classify")
 
@@ -925,3 +981,238 @@ def test_custom_profile_provider_priority_overrides_default_order(monkeypatch):
     monkeypatch.setattr(orchestrator, "check_tool_available", lambda _tool: True)
     order = orchestrator._get_tool_order(agent_name="triage", project_name=None)
     assert order == [AIProvider.CODEX, AIProvider.COPILOT, AIProvider.GEMINI]
+
+
+def test_rate_limits_are_shared_through_provider_health_file(monkeypatch, tmp_path):
+    health_file = str(tmp_path / "provider_health.json")
+    probes = []
+
+    def _fake_run(command, **_kwargs):
+        probes.append(command)
+        return _FakeCompletedProcess(stdout="1.0.0")
+
+    monkeypatch.setattr(subprocess, "run", _fake_run)
+    bot = AIOrchestrator({"provider_health_file": health_file, "rate_limit_ttl": 600})
+    assert bot.check_tool_available(AIProvider.GEMINI) is True
+    bot.record_rate_limit(AIProvider.GEMINI, retry_count=2)
+
+    # A separate process loads its own registry from the same host state file.
+    processor = AIOrchestrator({"gemini_cli_path": "gemini"})
+    processor._provider_health = ProviderHealthRegistry(path=health_file)
+
+    assert processor.check_tool_available(AIProvider.GEMINI) is False
+    assert processor._rate_limits["gemini"]["retries"] == 2
+    assert probes == [["gemini", "--version"]]
+
+
+def test_stale_provider_health_is_reprobed_off_the_launch_path(monkeypatch):
+    now = [1000.0]
+    probed = threading.Event()
+    results = iter([0, 1])
+
+    def _fake_run(_command, **_kwargs):
+        completed = _FakeCompletedProcess(stdout="1.0.0")
+        completed.returncode = next(results)
+        if completed.returncode:
+            probed.set()
+        return completed
+
+    monkeypatch.setattr(subprocess, "run", _fake_run)
+    orchestrator = AIOrchestrator()
+    orchestrator._provider_health = ProviderHealthRegistry(
+        probe_interval=60, clock=lambda: now[0]
+    )
+    assert orchestrator.check_tool_available(AIProvider.CODEX) is True
+
+    now[0] += 120
+    # Stale entries are served immediately; the refresh happens on the probe thread.
+    assert orchestrator.check_tool_available(AIProvider.CODEX) is True
+    assert probed.wait(5)
+    deadline = time.monotonic() + 5
+    while orchestrator.check_tool_available(AIProvider.CODEX) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert orchestrator.check_tool_available(AIProvider.CODEX) is False
+    assert orchestrator._provider_health.stats["background_probes"] == 1
+    orchestrator._provider_health.close()
+
+
+def test_record_failure_marks_rate_limited_tool_unavailable_after_max_retries(monkeypatch):
+    monkeypatch.setattr(subprocess, "run", lambda *_a, **_k: _FakeCompletedProcess())
+    orchestrator = AIOrchestrator({"max_retries": 2, "rate_limit_ttl": 0.05})
+    orchestrator.record_rate_limit(AIProvider.CLAUDE)
+    orchestrator.record_failure(AIProvider.CLAUDE)
+
+    time.sleep(0.06)
+    assert orchestrator._rate_limits == {}
+    assert orchestrator.check_tool_available(AIProvider.CLAUDE) is False
+
+
+def _record_runs(orchestrator, tool, agent_type, durations, success=True):
+    for duration in durations:
+        orchestrator.record_agent_outcome(
+            tool, agent_type, success=success, duration_seconds=duration
+        )
+
+
+def test_adaptive_routing_orders_fallbacks_by_expected_completion_time():
+    orchestrator = AIOrchestrator(
+        {
+            "adaptive_routing": True,
+            "tool_preferences": {"developer": "copilot"},
+        }
+    )
+    static = AIOrchestrator({"tool_preferences": {"developer": "copilot"}})
+    # Gemini is fast but times out half the time; Claude is slower but reliable.
+    _record_runs(orchestrator, AIProvider.GEMINI, "developer", [100, 100, 100])
+    _record_runs(orchestrator, AIProvider.GEMINI, "developer", [1800, 1800], success=False)
+    _record_runs(orchestrator, AIProvider.CLAUDE, "developer", [400, 420, 380])
+    _record_runs(orchestrator, AIProvider.CODEX, "reviewer", [50, 60, 70])
+
+    order = orchestrator._get_tool_order(agent_name="developer")
+
+    # The explicit preference keeps its place; codex falls back to its all-agent aggregate.
+    assert order[0] == AIProvider.COPILOT
+    assert order[1:4] == [AIProvider.CODEX, AIProvider.CLAUDE, AIProvider.GEMINI]
+    assert sorted(order, key=lambda t: t.value) == sorted(AIProvider, key=lambda t: t.value)
+    assert static._get_tool_order(agent_name="developer")[1] == AIProvider.GEMINI
+
+    scoreboard = orchestrator.get_routing_scoreboard()
+    assert scoreboard["enabled"] is True
+    gemini = scoreboard["routes"]["gemini:developer"]
+    assert gemini["samples"] == 5 and gemini["failures"] == 2
+    assert gemini["expected_seconds"] > scoreboard["routes"]["claude:developer"]["expected_seconds"]
+
+
+def test_adaptive_routing_reranks_only_within_profile_candidates(monkeypatch, tmp_path):
+    config = {
+        "adaptive_routing": True,
+        "provider_scoreboard_file": str(tmp_path / "scoreboard.json"),
+        "tool_preferences": {"triage": {"provider": "auto", "profile": "fast"}},
+        "model_profiles": {
+            "fast": {"gemini": "gemini-2.0-flash", "copilot": "gpt-4o-mini", "codex": "gpt-5"}
+        },
+        "profile_provider_priority": {"fast": ["gemini", "copilot", "codex"]},
+    }
+    writer = AIOrchestrator(config)
+    _record_runs(writer, AIProvider.CODEX, "triage", [30, 30, 30])
+    _record_runs(writer, AIProvider.GEMINI, "triage", [300, 300, 300])
+    _record_runs(writer, AIProvider.CLAUDE, "triage", [1, 1, 1])
+
+    # Another process sees the same statistics through the shared scoreboard file.
+    from nexus.plugins.builtin.ai_runtime.provider_scoreboard import ProviderScoreboard
+
+    reader = AIOrchestrator(config)
+    reader._scoreboard = ProviderScoreboard(path=config["provider_scoreboard_file"])
+    monkeypatch.setattr(reader, "check_tool_available", lambda _tool: True)
+
+    assert reader._get_tool_order(agent_name="triage") == [
+        AIProvider.CODEX,
+        AIProvider.COPILOT,
+        AIProvider.GEMINI,
+    ]
+
+
+class _FakeWhisperModel:
+    def transcribe(self, path, **kwargs):
+        with open(path, "rb") as fh:
+            audio = fh.read().decode()
+        return {"text": f"{audio} from {os.getpid()}", "language": kwargs.get("language", "en")}
+
+
+class _FakeWhisperModule:
+    loads = 0
+
+    def load_model(self, model_name):
+        type(self).loads += 1
+        return _FakeWhisperModel()
+
+
+def _import_fake_whisper():
+    return _FakeWhisperModule()
+
+
+def _import_missing_whisper():
+    raise ImportError("No module named 'whisper'")
+
+
+def test_whisper_pool_preloads_model_once_and_spools_streamed_chunks(tmp_path):
+    _FakeWhisperModule.loads = 0
+    pool = WhisperWorkerPool("tiny-test", use_processes=False, import_whisper=_import_fake_whisper)
+    pool.start(wait=True, timeout=5)
+    assert _FakeWhisperModule.loads == 1
+
+    audio = tmp_path / "voice.ogg"
+    audio.write_bytes(b"from-path")
+    from_path = pool.transcribe(str(audio), languages=["en", "it"])
+    from_chunks = pool.transcribe(iter([b"stream", b"ed"]), language="it", languages=["en", "it"])
+    pool.close(wait=True)
+
+    assert from_path.text.startswith("from-path")
+    assert from_chunks.text.startswith("streamed") and from_chunks.language == "it"
+    assert _FakeWhisperModule.loads == 1
+    assert from_path.queue_wait_seconds >= 0 and from_path.decode_seconds >= 0
+    snapshot = pool.snapshot()
+    assert snapshot["requests"] == 2 and snapshot["cold_starts"] == 0
+    assert snapshot["decode_seconds"]["count"] == 2
+    assert not [name for name in os.listdir(tmp_path) if name != "voice.ogg"]
+
+
+def test_whisper_pool_decodes_in_warm_worker_processes(tmp_path):
+    audio = tmp_path / "voice.ogg"
+    audio.write_bytes(b"hello")
+    pool = WhisperWorkerPool("tiny-test", max_workers=2, import_whisper=_import_fake_whisper)
+    try:
+        pool.start(wait=True, timeout=30)
+        assert pool._executor._mp_context.get_start_method() == "spawn"
+        results = [pool.transcribe(audio, timeout=30) for _ in range(3)]
+    finally:
+        pool.close(wait=True)
+
+    pids = {result.text.split()[-1] for result in results}
+    assert str(os.getpid()) not in pids and len(pids) <= 2
+    assert pool.snapshot()["cold_starts"] == 0
+    assert pool.stats["failures"] == 0
+
+
+def test_whisper_pool_reports_missing_whisper_as_tool_unavailable(monkeypatch, tmp_path):
+    audio = tmp_path / "voice.ogg"
+    audio.write_bytes(b"hello")
+    pool = WhisperWorkerPool("tiny-test", import_whisper=_import_missing_whisper)
+
+    with pytest.raises(ImportError):
+        pool.transcribe(audio, timeout=30)
+    assert pool._executor is None and pool.stats["failures"] == 1
+
+    monkeypatch.setattr(
+        "nexus.plugins.builtin.ai_runtime_plugin.get_whisper_pool", lambda *_a, **_k: pool
+    )
+    orchestrator = AIOrchestrator({"whisper_preload": True})
+    with pytest.raises(ToolUnavailableError, match="openai-whisper"):
+        orchestrator._transcribe_with_whisper_api(str(audio))
+
+
+def test_whisper_transcriber_uses_shared_pool(monkeypatch, tmp_path):
+    import nexus.plugins.builtin.ai_runtime.whisper_pool as whisper_pool
+
+    monkeypatch.setattr(whisper_pool, "_shared_pools", {})
+    captured = {}
+
+    class _Pool:
+        def transcribe(self, audio, **kwargs):
+            captured.update(kwargs, audio=audio)
+            return whisper_pool.WhisperTranscription("ciao", "it", "small", 0.0, 0.0, 0.1)
+
+    def _get_pool(model_name, **kwargs):
+        captured.update(kwargs, model_name=model_name)
+        return _Pool()
+
+    monkeypatch.setattr(
+        "nexus.plugins.builtin.ai_runtime_plugin.get_whisper_pool", _get_pool
+    )
+    orchestrator = AIOrchestrator(
+        {"whisper_model": "small", "whisper_languages": "it,en", "whisper_pool_workers": 2}
+    )
+
+    assert orchestrator._transcribe_with_whisper_api(str(tmp_path / "a.ogg")) == "ciao"
+    assert captured["model_name"] == "small" and captured["max_workers"] == 2
+    assert captured["languages"] == ["it", "en"]
@@ -1,11 +1,21 @@
 """Tests for built-in runtime ops/process guard plugin."""
 
+import os
 import re
 import subprocess
 
+import pytest
+
+from nexus.core.process_table import ProcessTable
 from nexus.plugins.builtin.runtime_ops_plugin import RuntimeOpsPlugin
 
 
+@pytest.fixture(autouse=True)
+def _pgrep_fallback(monkeypatch):
+    """Exercise the per-issue pgrep path unless a test installs a process table."""
+    monkeypatch.setattr(ProcessTable, "available", property(lambda _self: False))
+
+
 class _Result:
     def __init__(self, stdout: str = "", returncode: int = 0):
         self.stdout = stdout
@@ -152,3 +162,42 @@ def test_find_issue_processes_does_not_match_unrelated_issue_with_alternation(mo
     matches = plugin.find_issue_processes("42")
 
     assert matches == []
+
+
+def _fake_proc(root, processes):
+    (root / "self").mkdir(parents=True)
+    for pid, argv in processes.items():
+        (root / str(pid)).mkdir()
+        (root / str(pid) / "cmdline").write_bytes(b"\0".join(arg.encode() for arg in argv))
+
+
+def test_find_issue_processes_uses_one_proc_snapshot_for_all_issues(monkeypatch, tmp_path):
+    monkeypatch.setattr(ProcessTable, "available", property(lambda self: self.source is not None))
+    _fake_proc(
+        tmp_path,
+        {
+            101: ["codex", "exec", "--issue", "https://github.com/acme/repo/issues/42"],
+            102: ["bash", "-lc", "copilot -p 'fix issues/7 and issues/42'"],
+            103: ["code", "--ms-enable-electron-run-as-node", "extensionHost", "codex", "issues/7"],
+            104: ["codex", "exec", "issues/420"],
+            os.getpid(): ["python", "codex", "issues/42"],
+        },
+    )
+
+    def _no_subprocess(*_args, **_kwargs):
+        raise AssertionError("snapshot lookups must not fork")
+
+    monkeypatch.setattr(subprocess, "run", _no_subprocess)
+    plugin = RuntimeOpsPlugin({"process_name": "copilot|codex"})
+    plugin._process_table = ProcessTable(ttl=60, proc_root=str(tmp_path))
+
+    assert [m["pid"] for m in plugin.find_issue_processes("42")] == [101, 102]
+    assert [m["pid"] for m in plugin.find_issue_processes("7")] == [102]
+    assert plugin.find_issue_processes("4") == []
+    assert plugin.find_agent_pid_for_issue("420") == 104
+    assert plugin._process_table.stats["refreshes"] == 1
+
+    (tmp_path / "101" / "cmdline").unlink()
+    (tmp_path / "101").rmdir()
+    plugin._process_table.invalidate()
+    assert [m["pid"] for m in plugin.find_issue_processes("42")] == [102]
@@ -1,116 +1,161 @@
-"""Tests for built-in Telegram notification plugin."""
+"""Tests for built-in Telegram notification plugin (against a local stub Bot API)."""
 
 import json
-from io import BytesIO
-from urllib.error import HTTPError
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
 
 from nexus.plugins.builtin.telegram_notification_plugin import TelegramNotificationPlugin
 
 
-class _Response:
-    def __init__(self, payload):
-        self._payload = payload
+class _StubBotApi:
+    """Minimal Bot API server: records requests and replays scripted responses."""
+
+    def __init__(self):
+        self.requests: list[dict] = []
+        self.client_ports: set[int] = set()
+        self.responses: list[tuple[int, dict, dict]] = []
+        stub = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):  # noqa: N802 - http.server naming
+                length = int(self.headers.get("Content-Length", "0"))
+                body = json.loads(self.rfile.read(length).decode("utf-8"))
+                stub.requests.append({"path": self.path, "body": body})
+                stub.client_ports.add(self.client_address[1])
+                if stub.responses:
+                    status, payload, headers = stub.responses.pop(0)
+                else:
+                    status, payload, headers = 200, {"ok": True, "result": {"message_id": 1}}, {}
+                raw = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(raw)))
+                for key, value in headers.items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(raw)
+
+            def log_message(self, *_args):
+                return None
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self.url = f"http://127.0.0.1:{self._server.server_address[1]}"
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        )
+        self._thread.start()
 
-    def read(self):
-        return json.dumps(self._payload).encode("utf-8")
+    def close(self):
+        self._server.shutdown()
+        self._server.server_close()
 
-    def __enter__(self):
-        return self
 
-    def __exit__(self, exc_type, exc, tb):
-        return False
+@pytest.fixture
+def bot_api():
+    stub = _StubBotApi()
+    yield stub
+    stub.close()
 
 
-def test_send_alert_sync_posts_to_telegram(monkeypatch):
-    captured = {"url": "", "body": {}}
+def _plugin(bot_api, **overrides):
+    config = {
+        "bot_token": "token123",
+        "chat_id": "999",
+        "parse_mode": "Markdown",
+        "api_base_url": bot_api.url,
+    }
+    config.update(overrides)
+    return TelegramNotificationPlugin(config)
 
-    def _fake_urlopen(req, timeout):
-        captured["url"] = req.full_url
-        captured["body"] = json.loads(req.data.decode("utf-8"))
-        return _Response({"ok": True, "result": {"message_id": 123}})
 
-    monkeypatch.setattr(
-        "nexus.plugins.builtin.telegram_notification_plugin.request.urlopen",
-        _fake_urlopen,
-    )
-
-    plugin = TelegramNotificationPlugin(
-        {"bot_token": "token123", "chat_id": "999", "parse_mode": "Markdown"}
-    )
+def test_send_alert_sync_posts_to_telegram(bot_api):
+    plugin = _plugin(bot_api)
     sent = plugin.send_alert_sync("System ready", severity="info")
 
     assert sent is True
-    assert "bottoken123/sendMessage" in captured["url"]
-    assert captured["body"]["chat_id"] == "999"
-    assert "System ready" in captured["body"]["text"]
-
-
-def test_send_message_sync_retries_without_parse_mode_on_parse_error(monkeypatch, caplog):
-    captured_bodies: list[dict] = []
-    calls = {"count": 0}
-
-    def _fake_urlopen(req, timeout):
-        del timeout
-        calls["count"] += 1
-        payload = json.loads(req.data.decode("utf-8"))
-        captured_bodies.append(payload)
-        if calls["count"] == 1:
-            raise HTTPError(
-                req.full_url,
-                400,
-                "Bad Request",
-                hdrs=None,
-                fp=BytesIO(
-                    (
-                        '{"ok":false,"error_code":400,'
-                        '"description":"Bad Request: can\'t parse entities: '
-                        'Can\'t find end of the entity"}'
-                    ).encode("utf-8")
-                ),
-            )
-        return _Response({"ok": True, "result": {"message_id": 456}})
-
-    monkeypatch.setattr(
-        "nexus.plugins.builtin.telegram_notification_plugin.request.urlopen",
-        _fake_urlopen,
-    )
-
-    plugin = TelegramNotificationPlugin(
-        {"bot_token": "token123", "chat_id": "999", "parse_mode": "Markdown"}
+    assert bot_api.requests[0]["path"] == "/bottoken123/sendMessage"
+    assert bot_api.requests[0]["body"]["chat_id"] == "999"
+    assert "System ready" in bot_api.requests[0]["body"]["text"]
+
+
+def test_send_message_sync_retries_without_parse_mode_on_parse_error(bot_api, caplog):
+    bot_api.responses.append(
+        (
+            400,
+            {
+                "ok": False,
+                "error_code": 400,
+                "description": "Bad Request: can't parse entities: Can't find end of the entity",
+            },
+            {},
+        )
     )
+    plugin = _plugin(bot_api)
     sent = plugin.send_message_sync("⚠️ **Alert** with _broken markdown")
 
     assert sent is True
-    assert calls["count"] == 2
-    assert captured_bodies[0].get("parse_mode") == "Markdown"
-    assert "parse_mode" not in captured_bodies[1]
+    assert len(bot_api.requests) == 2
+    assert bot_api.requests[0]["body"].get("parse_mode") == "Markdown"
+    assert "parse_mode" not in bot_api.requests[1]["body"]
     assert "retrying without parse_mode after initial failure" in caplog.text
     assert "Telegram API HTTP error for sendMessage" not in caplog.text
 
 
-def test_send_message_sync_without_parse_mode_does_not_retry(monkeypatch):
-    calls = {"count": 0}
+def test_send_message_sync_without_parse_mode_does_not_retry(bot_api):
+    bot_api.responses.append(
+        (500, {"ok": False, "error_code": 500, "description": "Internal Error"}, {})
+    )
+    plugin = _plugin(bot_api, parse_mode="")
+    sent = plugin.send_message_sync("plain text", parse_mode=None)
+
+    assert sent is False
+    assert len(bot_api.requests) == 1
+
+
+def test_messages_reuse_one_keep_alive_connection(bot_api):
+    plugin = _plugin(bot_api)
+
+    for idx in range(5):
+        assert plugin.send_message_sync(f"message {idx}") is True
+
+    assert len(bot_api.requests) == 5
+    assert len(bot_api.client_ports) == 1
 
-    def _fake_urlopen(req, timeout):
-        del req, timeout
-        calls["count"] += 1
-        raise HTTPError(
-            "https://api.telegram.org/fake",
-            500,
-            "Server Error",
-            hdrs=None,
-            fp=BytesIO(b'{"ok":false,"error_code":500,"description":"Internal Error"}'),
-        )
+
+def test_rate_limited_send_honours_retry_after(bot_api, monkeypatch):
+    sleeps: list[float] = []
+    test_thread = threading.current_thread()
+    real_sleep = time.sleep
+
+    def _record_sleep(seconds):
+        # ``time`` is shared: background threads from other tests must still sleep.
+        if threading.current_thread() is test_thread:
+            sleeps.append(seconds)
+        else:
+            real_sleep(seconds)
 
     monkeypatch.setattr(
-        "nexus.plugins.builtin.telegram_notification_plugin.request.urlopen",
-        _fake_urlopen,
+        "nexus.plugins.builtin.telegram_notification_plugin.time.sleep", _record_sleep
     )
-
-    plugin = TelegramNotificationPlugin(
-        {"bot_token": "token123", "chat_id": "999", "parse_mode": ""}
+    bot_api.responses.append(
+        (
+            429,
+            {
+                "ok": False,
+                "error_code": 429,
+                "description": "Too Many Requests: retry after 3",
+                "parameters": {"retry_after": 3},
+            },
+            {"Retry-After": "3"},
+        )
     )
-    sent = plugin.send_message_sync("plain text", parse_mode=None)
+    plugin = _plugin(bot_api)
 
-    assert sent is False
-    assert calls["count"] == 1
+    assert plugin.send_message_sync("burst") is True
+    assert sleeps == [3.0]
+    assert len(bot_api.requests) == 2
@@ -6,6 +6,7 @@ from typing import Any
 import pytest
 
 from nexus.adapters.storage.base import StorageBackend
+from nexus.core.idempotency import IdempotencyKey, IdempotencyLedger
 from nexus.core.models import (
     Agent,
     AuditEvent,
@@ -688,6 +689,37 @@ async def test_complete_step_for_issue_idempotency_duplicate_suppressed(tmp_path
     assert updated2 is not None
 
 
+@pytest.mark.asyncio
+async def test_complete_step_for_issue_releases_event_when_completion_fails(tmp_path, monkeypatch):
+    """A failed completion must not burn the event_id: the redelivery has to apply."""
+    step1 = _step(1, "triage", "triage")
+    step2 = _step(2, "dev", "developer")
+    wf = _make_workflow("wf-idem-fail", [step1, step2])
+    plugin, _ = await _plugin_with_workflow(wf, "idem-fail")
+    ledger_path = str(tmp_path / "ledger.json")
+    plugin.config["idempotency_ledger_path"] = ledger_path
+    monkeypatch.delenv("NEXUS_STORAGE_BACKEND", raising=False)
+    engine = plugin._get_engine()
+    real_complete_step = engine.complete_step
+
+    async def _failing_complete_step(**kwargs):
+        raise RuntimeError("storage unavailable")
+
+    monkeypatch.setattr(engine, "complete_step", _failing_complete_step)
+    with pytest.raises(RuntimeError, match="storage unavailable"):
+        await _complete(plugin, "idem-fail", "triage", {}, event_id="ev-001")
+
+    monkeypatch.setattr(engine, "complete_step", real_complete_step)
+    updated = await _complete(plugin, "idem-fail", "triage", {}, event_id="ev-001")
+    assert updated is not None
+    assert updated.active_agent_type == "developer"
+
+    # The applied event is now claimed in the shared journal for every process.
+    other = IdempotencyLedger(ledger_path)
+    key = IdempotencyKey(issue_id="idem-fail", step_num=1, agent_type="triage", event_id="ev-001")
+    assert other.check_and_record(key) is False
+
+
 @pytest.mark.asyncio
 async def test_complete_step_for_issue_different_event_ids_advance_independently(tmp_path, monkeypatch):
     """Two distinct event_ids for different steps should both advance normally."""
@@ -0,0 +1,77 @@
+"""Tests for HandoffManager delegation tracking."""
+
+from datetime import UTC, datetime, timedelta
+
+from nexus.core.models import DelegationCallback, DelegationRequest, DelegationStatus
+from nexus.plugins.plugin_runtime import HandoffManager
+
+_NOW = datetime(2026, 1, 1, 12, 0, tzinfo=UTC)
+
+
+def _request(delegation_id: str, lead: str = "developer", workflow: str = "wf-1", ttl=None):
+    return DelegationRequest(
+        lead_agent=lead,
+        sub_agent="reviewer",
+        issue_number="42",
+        workflow_id=workflow,
+        task_description="Review the PR",
+        delegation_id=delegation_id,
+        expires_at=(_NOW + timedelta(minutes=ttl)).isoformat() if ttl is not None else None,
+    )
+
+
+def _callback(delegation_id: str) -> DelegationCallback:
+    return DelegationCallback(
+        delegation_id=delegation_id,
+        sub_agent="reviewer",
+        lead_agent="developer",
+        issue_number="42",
+        workflow_id="wf-1",
+        result={},
+        success=True,
+    )
+
+
+def test_expiry_heap_and_lead_index():
+    manager = HandoffManager()
+    for request in (
+        _request("a", ttl=5),
+        _request("b", ttl=1),
+        _request("c", ttl=10),
+        _request("d", lead="designer", ttl=None),
+        _request("e", workflow="wf-2", ttl=2),
+    ):
+        manager.register(request)
+
+    assert [r.delegation_id for r in manager.pending_for("developer", "wf-1")] == ["a", "b", "c"]
+    assert [r.delegation_id for r in manager.pending_for("designer", "wf-1")] == ["d"]
+
+    manager.complete(_callback("b"))
+    manager.fail("e", "boom")
+    manager.register(_request("a", ttl=30))  # re-registered with a later expiry
+
+    expired = manager.expire_stale(_NOW + timedelta(minutes=15))
+    assert [r.delegation_id for r in expired] == ["c"]
+    assert expired[0].status == DelegationStatus.EXPIRED
+    assert [r.delegation_id for r in manager.pending_for("developer", "wf-1")] == ["a"]
+    assert manager.expire_stale((_NOW + timedelta(minutes=15)).replace(tzinfo=None)) == []
+    assert [r.delegation_id for r in manager.expire_stale(_NOW + timedelta(hours=1))] == ["a"]
+    assert manager.get("d") is not None and manager.pending_for("developer", "wf-1") == []
+
+
+def test_journal_restores_active_delegations(tmp_path):
+    journal = tmp_path / "delegations.jsonl"
+    manager = HandoffManager(journal_path=journal)
+    manager.register(_request("a", ttl=5))
+    manager.register(_request("b"))
+    manager.complete(_callback("a"))
+
+    restored = HandoffManager(journal_path=journal)
+
+    assert restored.get("a") is None
+    request = restored.get("b")
+    assert request is not None and request.status == DelegationStatus.ACTIVE
+    assert [r.delegation_id for r in restored.pending_for("developer", "wf-1")] == ["b"]
+
+    restored._compact_journal()
+    assert len(journal.read_text().splitlines()) == 1
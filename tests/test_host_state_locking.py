@@ -0,0 +1,37 @@
+"""Tests for locked read-modify-write cycles on host state files."""
+
+import threading
+
+import nexus.core.state_manager as state_manager
+from nexus.core.state_manager import HostStateManager
+
+
+def test_concurrent_merge_queue_writers_do_not_lose_entries(tmp_path, monkeypatch):
+    monkeypatch.setattr(state_manager, "MERGE_QUEUE_FILE", str(tmp_path / "merge_queue.json"))
+    monkeypatch.setattr(state_manager, "_get_host_state_backend", lambda: "filesystem")
+    monkeypatch.setattr(state_manager, "ensure_state_dir", lambda: None)
+    start = threading.Barrier(8)
+
+    def writer(n):
+        start.wait()
+        for i in range(5):
+            pr_url = f"https://github.com/acme/app/pull/{n * 10 + i}"
+            HostStateManager.enqueue_merge_candidate(
+                issue_num=str(n),
+                project="app",
+                repo="acme/app",
+                pr_url=pr_url,
+                review_mode="auto",
+            )
+            HostStateManager.update_merge_candidates({pr_url: {"status": "merged"}})
+
+    threads = [threading.Thread(target=writer, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    queue = HostStateManager.load_merge_queue()
+    assert len(queue) == 40
+    assert {item["status"] for item in queue.values()} == {"merged"}
+    assert (tmp_path / "merge_queue.json.lock").exists()
@@ -0,0 +1,207 @@
+"""Tests for the bounded, TTL-indexed IdempotencyLedger."""
+
+import json
+import os
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+import nexus.core.idempotency as idempotency
+from nexus.core.idempotency import IdempotencyKey, IdempotencyLedger
+
+
+def _key(event_id: str, step_num: int = 1) -> IdempotencyKey:
+    return IdempotencyKey(
+        issue_id="42", step_num=step_num, agent_type="developer", event_id=event_id
+    )
+
+
+@pytest.fixture(autouse=True)
+def _filesystem_backend(monkeypatch):
+    monkeypatch.delenv("NEXUS_HOST_STATE_BACKEND", raising=False)
+    monkeypatch.setenv("NEXUS_STORAGE_BACKEND", "filesystem")
+
+
+class _FakeClock:
+    def __init__(self, start: float = 1_000_000.0) -> None:
+        self.now = start
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = _FakeClock()
+    monkeypatch.setattr(idempotency.time, "time", fake)
+    return fake
+
+
+def test_record_appends_one_journal_line_per_key(tmp_path):
+    ledger = IdempotencyLedger(str(tmp_path / "ledger.json"))
+
+    ledger.record(_key("a"))
+    ledger.record(_key("b"))
+    ledger.record(_key("a"))
+
+    lines = (tmp_path / "ledger.journal").read_text().splitlines()
+    assert len(lines) == 2
+    assert ledger.is_duplicate(_key("a"))
+    assert not ledger.is_duplicate(_key("c"))
+
+
+def test_check_and_record_reports_duplicates(tmp_path):
+    ledger = IdempotencyLedger(str(tmp_path / "ledger.json"))
+
+    assert ledger.check_and_record(_key("a")) is True
+    assert ledger.check_and_record(_key("a")) is False
+
+
+def test_entries_expire_after_ttl(tmp_path, clock):
+    ledger = IdempotencyLedger(str(tmp_path / "ledger.json"), ttl_seconds=60)
+    ledger.record(_key("a"))
+
+    clock.now += 59
+    assert ledger.is_duplicate(_key("a"))
+
+    clock.now += 2
+    assert not ledger.is_duplicate(_key("a"))
+    assert ledger.check_and_record(_key("a")) is True
+
+
+def test_max_entries_evicts_oldest(tmp_path):
+    ledger = IdempotencyLedger(str(tmp_path / "ledger.json"), max_entries=3)
+    for event_id in ("a", "b", "c", "d"):
+        ledger.record(_key(event_id))
+
+    assert len(ledger) == 3
+    assert not ledger.is_duplicate(_key("a"))
+    assert ledger.is_duplicate(_key("d"))
+
+
+def test_journal_is_shared_across_instances(tmp_path):
+    path = str(tmp_path / "ledger.json")
+    first = IdempotencyLedger(path)
+    second = IdempotencyLedger(path)
+
+    first.record(_key("a"))
+
+    assert second.is_duplicate(_key("a"))
+    assert second.check_and_record(_key("a")) is False
+
+
+def test_discard_releases_a_key_for_every_instance(tmp_path):
+    path = str(tmp_path / "ledger.json")
+    first = IdempotencyLedger(path)
+    second = IdempotencyLedger(path)
+    assert first.check_and_record(_key("a")) is True
+    assert second.check_and_record(_key("a")) is False
+
+    first.discard(_key("a"))
+
+    assert second.check_and_record(_key("a")) is True
+    assert first.check_and_record(_key("a")) is False
+    assert IdempotencyLedger(path).is_duplicate(_key("a"))
+
+
+def test_journal_reloads_after_restart(tmp_path, clock):
+    path = str(tmp_path / "ledger.json")
+    IdempotencyLedger(path, ttl_seconds=60).record(_key("a"))
+
+    assert IdempotencyLedger(path, ttl_seconds=60).is_duplicate(_key("a"))
+    clock.now += 120
+    assert not IdempotencyLedger(path, ttl_seconds=60).is_duplicate(_key("a"))
+
+
+def test_journal_compaction_drops_dead_lines(tmp_path, clock, monkeypatch):
+    monkeypatch.setattr(idempotency, "_COMPACTION_MIN_LINES", 4)
+    path = str(tmp_path / "ledger.json")
+    ledger = IdempotencyLedger(path, max_entries=2)
+    other = IdempotencyLedger(path, max_entries=2)
+
+    for event_id in ("a", "b", "c", "d"):
+        clock.now += 1
+        ledger.record(_key(event_id))
+
+    lines = (tmp_path / "ledger.journal").read_text().splitlines()
+    assert len(lines) == 2
+    assert other.is_duplicate(_key("d"))
+    assert not other.is_duplicate(_key("a"))
+
+    # Appends after another instance compacted land in the live journal.
+    other.record(_key("e"))
+    assert IdempotencyLedger(path, max_entries=2).is_duplicate(_key("e"))
+    assert (tmp_path / "ledger.journal.lock").exists()
+
+
+def test_legacy_json_ledger_is_migrated(tmp_path):
+    path = tmp_path / "ledger.json"
+    digest = _key("legacy").as_string()
+    path.write_text(json.dumps([digest]))
+
+    ledger = IdempotencyLedger(str(path))
+
+    assert ledger.is_duplicate(_key("legacy"))
+    assert not os.path.exists(path)
+    assert (tmp_path / "ledger.journal").read_text().startswith(digest)
+
+
+class TestDatabaseRows:
+    @pytest.fixture
+    def backend(self, monkeypatch):
+        pytest.importorskip("sqlalchemy")
+        from nexus.adapters.storage.postgres import PostgreSQLStorageBackend
+
+        instance = PostgreSQLStorageBackend("sqlite:///:memory:")
+        monkeypatch.setattr(idempotency, "_get_host_state_backend", lambda _logger: instance)
+        try:
+            yield instance
+        finally:
+            instance.close()
+
+    def test_record_inserts_one_row_per_key(self, tmp_path, backend):
+        path = str(tmp_path / "ledger.json")
+        first = IdempotencyLedger(path, storage_backend="postgres")
+        second = IdempotencyLedger(path, storage_backend="postgres")
+
+        assert first.check_and_record(_key("a")) is True
+        assert second.is_duplicate(_key("a"))
+        assert second.check_and_record(_key("a")) is False
+        assert not (tmp_path / "ledger.journal").exists()
+
+    def test_expired_row_can_be_recorded_again(self, tmp_path, backend):
+        import sqlalchemy as sa
+
+        from nexus.adapters.storage.postgres import _IdempotencyKeyRow
+
+        digest = _key("a").as_string()
+        backend._sync_record_idempotency_key(digest, 60)
+        table = _IdempotencyKeyRow.__table__
+        with backend._engine.begin() as conn:
+            conn.execute(
+                sa.update(table).values(expires_at=datetime.now(tz=UTC) - timedelta(seconds=1))
+            )
+
+        ledger = IdempotencyLedger(
+            str(tmp_path / "ledger.json"), storage_backend="postgres", ttl_seconds=60
+        )
+        assert not ledger.is_duplicate(_key("a"))
+        assert ledger.check_and_record(_key("a")) is True
+        assert ledger.check_and_record(_key("a")) is False
+
+    def test_prune_enforces_cap(self, backend):
+        for index in range(5):
+            backend._sync_record_idempotency_key(f"d{index}", 3600)
+
+        assert backend._sync_prune_idempotency_keys(2) == 3
+        assert backend._sync_has_idempotency_key("d4")
+        assert not backend._sync_has_idempotency_key("d0")
+
+    def test_legacy_blob_is_migrated_to_rows(self, tmp_path, backend):
+        digest = _key("legacy").as_string()
+        backend._sync_save_host_state("ledger", {"seen": [digest]})
+
+        ledger = IdempotencyLedger(str(tmp_path / "ledger.json"), storage_backend="postgres")
+
+        assert ledger.is_duplicate(_key("legacy"))
+        assert backend._sync_load_host_state("ledger") == {"seen": [], "migrated_to_rows": True}
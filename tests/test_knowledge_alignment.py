@@ -1,5 +1,8 @@
 """Tests for repository-native knowledge alignment service."""
 
+import os
+
+import nexus.core.knowledge_alignment as knowledge_alignment
 from nexus.core.knowledge_alignment import KnowledgeAlignmentService
 
 
@@ -42,3 +45,97 @@ def test_evaluate_fails_open_when_no_docs(tmp_path):
     assert result.alignment_score == 0
     assert result.matched_artifacts == []
     assert result.recommended_next_actions
+
+
+def _count_reads(monkeypatch):
+    reads = []
+    real_read_text = knowledge_alignment._read_text
+
+    def _read_text(path):
+        reads.append(os.path.basename(path))
+        return real_read_text(path)
+
+    monkeypatch.setattr(knowledge_alignment, "_read_text", _read_text)
+    return reads
+
+
+def test_index_refreshes_only_changed_files_and_persists(tmp_path, monkeypatch):
+    repo = tmp_path / "repo"
+    docs_dir = repo / "docs"
+    docs_dir.mkdir(parents=True)
+    (docs_dir / "billing.md").write_text("# Billing\n\nInvoice export pipeline.\n")
+    (docs_dir / "alerts.md").write_text("# Alerts\n\nPager escalation policy.\n")
+    (repo / "README.md").write_text("# Project\n\nOverview of services.\n")
+    index_dir = tmp_path / "index"
+    reads = _count_reads(monkeypatch)
+
+    clock = [0.0]
+    service = KnowledgeAlignmentService(
+        index_dir=str(index_dir), refresh_interval=30, clock=lambda: clock[0]
+    )
+    first = service.evaluate("Invoice export", "full", str(repo))
+    assert first.artifact_paths[0] == os.path.join("docs", "billing.md")
+    assert sorted(reads) == ["README.md", "alerts.md", "billing.md"]
+
+    reads.clear()
+    clock[0] = 60.0
+    service.evaluate("Invoice export", "full", str(repo))
+    assert reads == []
+
+    (docs_dir / "alerts.md").write_text("# Alerts\n\nPager escalation and invoice reminders.\n")
+    (docs_dir / "billing.md").unlink()
+    walks = []
+    monkeypatch.setattr(
+        knowledge_alignment,
+        "_discover_sources",
+        lambda base, real=knowledge_alignment._discover_sources: walks.append(base) or real(base),
+    )
+    assert service.evaluate("Invoice export", "full", str(repo)) == first
+    assert walks == [] and reads == []
+
+    clock[0] = 90.0
+    updated = service.evaluate("Invoice export", "full", str(repo))
+    assert len(walks) == 1
+    assert reads == ["alerts.md"]
+    assert updated.artifact_paths == [os.path.join("docs", "alerts.md")]
+
+    reads.clear()
+    warm = KnowledgeAlignmentService(index_dir=str(index_dir))
+    assert warm.evaluate("Invoice export", "full", str(repo)) == updated
+    assert reads == []
+
+
+def test_bm25_ranks_rare_term_matches_above_common_ones(tmp_path):
+    docs_dir = tmp_path / "docs"
+    docs_dir.mkdir()
+    for name in ("one", "two", "three"):
+        (docs_dir / f"{name}.md").write_text(f"# {name.title()}\n\nDeployment runbook notes.\n")
+    (docs_dir / "sso.md").write_text("# Single sign-on\n\nSAML deployment guide.\n")
+
+    result = KnowledgeAlignmentService().evaluate(
+        "SAML deployment", "full", str(tmp_path), max_hits=2
+    )
+
+    assert result.artifact_paths[0] == os.path.join("docs", "sso.md")
+    assert 0 < result.alignment_score <= 1
+
+
+def test_scoring_reads_the_index_under_the_service_lock(tmp_path, monkeypatch):
+    docs_dir = tmp_path / "docs"
+    docs_dir.mkdir()
+    (docs_dir / "sso.md").write_text("# Single sign-on\n\nSAML deployment guide.\n")
+    service = KnowledgeAlignmentService(refresh_interval=0)
+    held = []
+    real_score = knowledge_alignment._score_bm25
+
+    def _score(index, query_tokens):
+        # A refresh on another thread mutates index.postings in place.
+        held.append(service._lock.locked())
+        return real_score(index, query_tokens)
+
+    monkeypatch.setattr(knowledge_alignment, "_score_bm25", _score)
+
+    result = service.evaluate("SAML deployment", "full", str(tmp_path))
+
+    assert held == [True]
+    assert result.artifact_paths == [os.path.join("docs", "sso.md")]
@@ -0,0 +1,83 @@
+"""Tests for the shared /tail log followers."""
+
+import asyncio
+
+from nexus.core.monitoring import log_tail_service
+from nexus.core.monitoring.log_tail_service import LogTailHub, read_last_lines
+
+
+def test_read_last_lines_seeks_from_the_end(tmp_path):
+    log = tmp_path / "copilot_1_20260101_120000.log"
+    log.write_text("".join(f"line {i}\n" for i in range(20000)) + "partial")
+
+    lines, offset = read_last_lines(str(log), 3)
+
+    assert lines == ["line 19997", "line 19998", "line 19999"]
+    assert offset == log.stat().st_size - len("partial")
+
+
+async def test_sessions_share_one_follower_and_receive_deltas(tmp_path):
+    first = tmp_path / "codex_42_20260101_120000.log"
+    first.write_text("a\nb\nc\n")
+    current = {"path": str(first)}
+    hub = LogTailHub(poll_interval=60, resolve_interval=60)
+
+    one = hub.subscribe("42", lambda: current["path"], max_lines=2)
+    two = hub.subscribe("42", lambda: current["path"], max_lines=5)
+    follower = hub.follower("42")
+
+    assert follower.subscriber_count == 2
+    assert one.render() == [f"[{first.name}] b", f"[{first.name}] c"]
+    assert list(two.lines) == ["a", "b", "c"]
+
+    with first.open("a") as handle:
+        handle.write("d\ne")
+    follower.refresh()
+    assert list(one.lines) == ["c", "d"] and list(two.lines) == ["a", "b", "c", "d"]
+    assert await one.wait_for_update(0.1) is True
+    assert await one.wait_for_update(0.01) is False
+
+    with first.open("a") as handle:
+        handle.write("\n")
+    follower.refresh()
+    assert list(one.lines) == ["d", "e"]
+    assert follower.stats["bytes_read"] == len("d\ne\n")
+
+    second = tmp_path / "codex_42_20260101_130000.log"
+    second.write_text("next run\n")
+    current["path"] = str(second)
+    follower.refresh(resolve=True)
+    assert one.render() == [f"[{second.name}] next run"]
+
+    second.write_text("")
+    follower.refresh()
+    assert list(two.lines) == []
+
+    one.close()
+    two.close()
+    await asyncio.sleep(0)
+    assert hub.follower("42") is None
+
+
+async def test_large_bursts_are_read_up_to_a_cap(tmp_path, monkeypatch):
+    monkeypatch.setattr(log_tail_service, "_MAX_POLL_READ", 64)
+    log = tmp_path / "codex_7_20260101_120000.log"
+    log.write_text("start\n")
+    hub = LogTailHub(poll_interval=60, resolve_interval=60)
+    session = hub.subscribe("7", lambda: str(log), max_lines=5)
+    follower = hub.follower("7")
+
+    with log.open("a") as handle:
+        handle.write("".join(f"burst line {i:03d}\n" for i in range(100)))
+    follower.refresh()
+
+    assert follower.stats["bytes_read"] == 64
+    assert list(session.lines)[-1] == "burst line 099"
+    assert all(line.startswith(("start", "burst line")) for line in session.lines)
+
+    with log.open("a") as handle:
+        handle.write("x" * 200 + "\nafter\n")
+    follower.refresh()
+    assert list(session.lines)[-1] == "after"
+    assert "x" * 10 not in "".join(session.lines)
+    session.close()
@@ -0,0 +1,168 @@
+"""Tests for the concurrent merge-queue worker."""
+
+import threading
+import time
+
+import pytest
+
+import nexus.core.merge_queue as merge_queue
+
+
+class _FakeStateManager:
+    def __init__(self, queue):
+        self.queue = queue
+        self.batch_writes = []
+
+    def load_merge_queue(self):
+        return self.queue
+
+    def update_merge_candidates(self, updates):
+        self.batch_writes.append(updates)
+        for pr_url, changes in updates.items():
+            self.queue[pr_url].update(changes)
+        return list(updates)
+
+    def update_merge_candidate(self, *_args, **_kwargs):
+        raise AssertionError("per-candidate writes should be batched")
+
+
+class _FakePlatform:
+    def __init__(self, repo, log, barrier):
+        self.repo = repo
+        self.log = log
+        self.barrier = barrier
+
+    async def merge_pull_request(self, pr_number, **_kwargs):
+        self.log.append((self.repo, pr_number, threading.get_ident()))
+        if pr_number == "1":
+            # Both repos must be merging at once for the barrier to release.
+            self.barrier.wait(timeout=5)
+        if pr_number == "3":
+            raise RuntimeError("Required status check is failing")
+        time.sleep(0.01)
+        return f"merged {self.repo}#{pr_number}"
+
+
+def _item(repo, number, created_at):
+    return {
+        "pr_url": f"https://github.com/{repo}/pull/{number}",
+        "issue": str(number),
+        "project": "nexus",
+        "repo": repo,
+        "review_mode": "auto",
+        "status": "pending_auto_merge",
+        "created_at": created_at,
+    }
+
+
+@pytest.fixture
+def merge_env(monkeypatch):
+    queue = {}
+    for item in (
+        _item("acme/api", 1, 1.0),
+        _item("acme/web", 1, 2.0),
+        _item("acme/api", 2, 3.0),
+        _item("acme/web", 3, 4.0),
+    ):
+        queue[item["pr_url"]] = item
+    state = _FakeStateManager(queue)
+    log = []
+    alerts = []
+    barrier = threading.Barrier(2)
+
+    monkeypatch.setattr(merge_queue, "_last_merge_queue_run_at", 0.0)
+    monkeypatch.setattr(merge_queue, "_state_manager", lambda: state)
+    monkeypatch.setattr(merge_queue, "_get_project_platform", lambda _project: "github")
+    monkeypatch.setattr(
+        merge_queue,
+        "_get_git_platform",
+        lambda repo, **_kwargs: _FakePlatform(repo, log, barrier),
+    )
+    monkeypatch.setattr(merge_queue, "_emit_alert", lambda text, **kw: alerts.append((text, kw)))
+    merge_queue._METRICS.reset()
+    return state, log, alerts
+
+
+def test_merges_repos_in_parallel_and_keeps_fifo_within_repo(merge_env):
+    state, log, alerts = merge_env
+
+    merge_queue.merge_queue_auto_merge_once_with_token_resolver()
+
+    api_order = [number for repo, number, _ in log if repo == "acme/api"]
+    web_order = [number for repo, number, _ in log if repo == "acme/web"]
+    assert api_order == ["1", "2"]
+    assert web_order == ["1", "3"]
+
+    assert len(state.batch_writes) == 1
+    statuses = {url: item["status"] for url, item in state.queue.items()}
+    assert statuses["https://github.com/acme/web/pull/3"] == "blocked"
+    assert list(statuses.values()).count("merged") == 3
+    assert len(alerts) == 4
+    assert [kw["severity"] for _text, kw in alerts].count("warning") == 1
+
+
+def test_failed_batch_write_falls_back_and_retries_unpersisted_results(merge_env, monkeypatch):
+    state, log, _alerts = merge_env
+    monkeypatch.setattr(merge_queue, "_UNPERSISTED_RESULTS", {})
+    failing_url = "https://github.com/acme/web/pull/3"
+    batch_write = state.update_merge_candidates
+
+    def _fail_batch(_updates):
+        raise OSError("disk full")
+
+    def _update_one(pr_url, **changes):
+        if pr_url == failing_url:
+            raise OSError("disk full")
+        state.queue[pr_url].update(changes)
+
+    monkeypatch.setattr(state, "update_merge_candidates", _fail_batch)
+    monkeypatch.setattr(state, "update_merge_candidate", _update_one)
+
+    merge_queue.merge_queue_auto_merge_once_with_token_resolver()
+
+    statuses = {url: item["status"] for url, item in state.queue.items()}
+    assert list(statuses.values()).count("merged") == 3
+    assert statuses[failing_url] == "pending_auto_merge"
+    assert set(merge_queue._UNPERSISTED_RESULTS) == {failing_url}
+
+    # The next cycle writes the kept result first and does not retry the merge.
+    monkeypatch.setattr(state, "update_merge_candidates", batch_write)
+    monkeypatch.setattr(merge_queue, "_last_merge_queue_run_at", 0.0)
+    attempts = len(log)
+    merge_queue.merge_queue_auto_merge_once_with_token_resolver()
+
+    assert state.queue[failing_url]["status"] == "blocked"
+    assert merge_queue._UNPERSISTED_RESULTS == {}
+    assert len(log) == attempts
+
+
+def test_merge_queue_metrics_report_outcomes_and_latency(merge_env):
+    merge_queue.merge_queue_auto_merge_once_with_token_resolver()
+
+    metrics = merge_queue.get_merge_queue_metrics()
+
+    assert metrics["cycles"] == 1
+    assert metrics["outcomes"] == {"merged": 3, "blocked": 1}
+    assert metrics["merge_latency_seconds"]["count"] == 4
+    assert metrics["last_cycle"]["repos"] == 2
+    assert metrics["last_cycle"]["candidates"] == 4
+
+
+def test_unsupported_pr_url_is_blocked_without_merging(merge_env, monkeypatch):
+    state, log, _alerts = merge_env
+    state.queue.clear()
+    state.queue["https://example.com/not-a-pr"] = {
+        "pr_url": "https://example.com/not-a-pr",
+        "issue": "9",
+        "project": "nexus",
+        "repo": "",
+        "review_mode": "auto",
+        "status": "pending_auto_merge",
+        "created_at": 1.0,
+    }
+
+    merge_queue.merge_queue_auto_merge_once_with_token_resolver()
+
+    assert log == []
+    assert state.queue["https://example.com/not-a-pr"]["status"] == "blocked"
+    assert state.queue["https://example.com/not-a-pr"]["last_error"] == "unsupported_pr_url"
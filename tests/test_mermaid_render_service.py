@@ -0,0 +1,114 @@
+"""Tests for the cached, concurrency-bounded Mermaid PNG renderer."""
+
+import asyncio
+import sys
+import textwrap
+
+import pytest
+
+from nexus.core import mermaid_render_service
+from nexus.core.mermaid_render_service import MermaidRenderService
+
+# Speaks the warm-renderer JSON-line protocol; "PNG" is the diagram text echoed back.
+_FAKE_WORKER = textwrap.dedent("""
+    import base64, json, sys
+    print(json.dumps({"ready": True}), flush=True)
+    for line in sys.stdin:
+        request = json.loads(line)
+        if "invalid" in request["diagram"]:
+            reply = {"id": request["id"], "error": "Parse error"}
+        else:
+            png = ("warm:" + request["diagram"]).encode()
+            reply = {"id": request["id"], "png": base64.b64encode(png).decode()}
+        print(json.dumps(reply), flush=True)
+    """)
+
+
+@pytest.fixture
+def fake_cli(monkeypatch):
+    calls: list[str] = []
+    state = {"active": 0, "peak": 0}
+
+    async def _render(diagram_text, *, timeout=15):
+        calls.append(diagram_text)
+        state["active"] += 1
+        state["peak"] = max(state["peak"], state["active"])
+        await asyncio.sleep(0.01)
+        state["active"] -= 1
+        return f"cli:{diagram_text}".encode()
+
+    monkeypatch.setattr(mermaid_render_service, "_render_with_cli", _render)
+    return calls, state
+
+
+async def test_render_is_cached_in_memory_and_on_disk(tmp_path, fake_cli):
+    calls, _state = fake_cli
+    service = MermaidRenderService(cache_dir=str(tmp_path), warm_renderer=False)
+
+    first = await service.render("flowchart TD\n A --> B")
+    second = await service.render("flowchart TD\n A --> B")
+
+    assert first == second == b"cli:flowchart TD\n A --> B"
+    assert len(calls) == 1
+    assert service.stats["memory_hits"] == 1
+
+    restarted = MermaidRenderService(cache_dir=str(tmp_path), warm_renderer=False)
+    assert await restarted.render("flowchart TD\n A --> B") == first
+    assert len(calls) == 1
+    assert restarted.stats["disk_hits"] == 1
+
+
+async def test_concurrent_renders_are_coalesced_and_capped(fake_cli):
+    calls, state = fake_cli
+    service = MermaidRenderService(max_concurrency=2, warm_renderer=False)
+
+    same = await asyncio.gather(*(service.render("graph LR\n X") for _ in range(5)))
+    distinct = await asyncio.gather(*(service.render(f"graph LR\n N{i}") for i in range(6)))
+
+    assert set(same) == {b"cli:graph LR\n X"}
+    assert len(distinct) == 6
+    assert len(calls) == 7
+    assert service.stats["coalesced"] == 4
+    assert state["peak"] == 2
+
+
+async def test_memory_lru_evicts_least_recently_used(fake_cli):
+    calls, _state = fake_cli
+    service = MermaidRenderService(max_entries=2, warm_renderer=False)
+
+    for diagram in ("a", "b", "a", "c", "a", "b"):
+        await service.render(diagram)
+
+    assert calls == ["a", "b", "c", "b"]
+    assert service.snapshot()["memory_entries"] == 2
+
+
+async def test_warm_renderer_is_started_once_and_reused(fake_cli):
+    calls, _state = fake_cli
+    service = MermaidRenderService(worker_command=[sys.executable, "-c", _FAKE_WORKER])
+    try:
+        results = await asyncio.gather(*(service.render(f"graph TD\n W{i}") for i in range(4)))
+        failed = await service.render("invalid diagram")
+    finally:
+        await service.close()
+
+    assert results == [f"warm:graph TD\n W{i}".encode() for i in range(4)]
+    assert failed is None
+    assert calls == []
+    snapshot = service.snapshot()
+    assert snapshot["warm_renderer_starts"] == 1
+    assert snapshot["warm_renders"] == 4
+    assert snapshot["failures"] == 1
+
+
+async def test_unavailable_warm_renderer_falls_back_to_mmdc(fake_cli):
+    calls, _state = fake_cli
+    broken = "import json; print(json.dumps({'ready': False, 'error': 'no chromium'}))"
+    service = MermaidRenderService(worker_command=[sys.executable, "-c", broken])
+
+    for idx in range(4):
+        assert await service.render(f"graph TD\n F{idx}") == f"cli:graph TD\n F{idx}".encode()
+
+    assert len(calls) == 4
+    assert service.stats["cli_renders"] == 4
+    assert service._warm is not None and service._warm.disabled
@@ -0,0 +1,30 @@
+"""Tests for the core workflow models."""
+
+from nexus.adapters.storage._workflow_serde import dict_to_workflow, workflow_to_dict
+from nexus.core.models import Agent, Workflow, WorkflowStep, shared_agent
+
+
+def test_loaded_workflows_share_agents_and_use_slots():
+    developer = Agent(name="developer", display_name="Developer", description="Writes code")
+    reviewer = Agent(name="reviewer", display_name="Reviewer", description="Reviews", timeout=30)
+    document = workflow_to_dict(
+        Workflow(
+            id="wf-1",
+            name="Feature",
+            version="1.0",
+            steps=[
+                WorkflowStep(step_num=1, name="develop", agent=developer, prompt_template="p"),
+                WorkflowStep(step_num=2, name="review", agent=reviewer, prompt_template="p"),
+                WorkflowStep(step_num=3, name="fix", agent=developer, prompt_template="p"),
+            ],
+        )
+    )
+
+    first = dict_to_workflow(document)
+    second = dict_to_workflow({**document, "id": "wf-2"})
+
+    assert first.steps[0].agent is first.steps[2].agent is second.steps[0].agent
+    assert first.steps[1].agent == reviewer and first.steps[1].agent is not first.steps[0].agent
+    assert shared_agent("developer", "Developer", "Writes code", timeout=60) != developer
+    for model in (first, first.steps[0], first.steps[0].agent):
+        assert not hasattr(model, "__dict__")
@@ -0,0 +1,151 @@
+"""Tests for outbound notification rate shaping and coalescing."""
+
+import threading
+
+from nexus.core.integrations.notification_dispatcher import (
+    NotificationDispatcher,
+    TokenBucket,
+    _build_digests,
+)
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_token_bucket_refills_at_rate():
+    clock = _FakeClock()
+    bucket = TokenBucket(rate=1.0, capacity=2, clock=clock)
+
+    assert bucket.try_take() and bucket.try_take()
+    assert not bucket.try_take()
+    assert bucket.seconds_until_available() == 1.0
+
+    clock.now = 1.5
+    assert bucket.try_take()
+    assert not bucket.try_take()
+
+
+def test_burst_coalesces_plain_messages_and_sends_buttons_alone():
+    clock = _FakeClock()
+    delivered: list[tuple[str, object]] = []
+    done = threading.Event()
+
+    def _deliver(text, markup):
+        delivered.append((text, markup))
+        if clock.now:
+            clock.now += 1.0  # let the chat bucket refill between queued sends
+        if len(delivered) == 5:
+            done.set()
+        return True
+
+    dispatcher = NotificationDispatcher(
+        per_chat_rate=1.0, per_chat_burst=2, global_rate=30, coalesce_window=2.0, clock=clock
+    )
+    buttons = {idx: {"inline_keyboard": [[{"callback_data": f"logs:{idx}"}]]} for idx in (3, 6)}
+    results = [
+        dispatcher.dispatch(
+            "chat-1", f"agent {idx} timed out", _deliver, reply_markup=buttons.get(idx)
+        )
+        for idx in range(7)
+    ]
+
+    assert results == [True] * 7
+    assert [text for text, _ in delivered] == ["agent 0 timed out", "agent 1 timed out"]
+
+    clock.now = 10.0
+    with dispatcher._cond:
+        dispatcher._cond.notify_all()
+    assert done.wait(5)
+    dispatcher.close()
+
+    digest = next(text for text, _ in delivered if text.startswith("📬"))
+    assert digest.startswith("📬 3 notifications")
+    assert all(f"agent {idx} timed out" in digest for idx in (2, 4, 5))
+    assert ("agent 3 timed out", buttons[3]) in delivered
+    assert ("agent 6 timed out", buttons[6]) in delivered
+    assert dispatcher.stats == {"sent": 5, "queued": 5, "digests": 1, "failed": 0}
+
+
+def test_oversized_digests_split_on_message_boundaries():
+    items = [(f"*alert {idx}* " + "x" * 900, None) for idx in range(9)]
+
+    digests = _build_digests(items)
+
+    assert len(digests) == 3
+    assert all(len(text) <= 4000 for text, _markup in digests)
+    assert [text.split("\n\n", 1)[0] for text, _ in digests[:2]] == ["📬 4 notifications"] * 2
+    assert digests[2] == items[8]
+    joined = "\n\n".join(text for text, _markup in digests)
+    assert all(text in joined for text, _markup in items)
+
+
+def test_chats_are_shaped_independently_and_flush_drains_queue():
+    clock = _FakeClock()
+    delivered: list[tuple[str, str]] = []
+    dispatcher = NotificationDispatcher(
+        per_chat_rate=1.0, per_chat_burst=1, global_rate=30, coalesce_window=60.0, clock=clock
+    )
+
+    for chat in ("a", "b"):
+        for idx in range(2):
+            dispatcher.dispatch(
+                chat,
+                f"{chat}{idx}",
+                lambda text, _markup, chat=chat: delivered.append((chat, text)) or True,
+            )
+
+    assert delivered == [("a", "a0"), ("b", "b0")]
+
+    clock.now = 1.0
+    dispatcher.flush(timeout=0)
+    dispatcher.close()
+
+    assert sorted(delivered[2:]) == [("a", "a1"), ("b", "b1")]
+
+
+def test_global_bucket_limits_total_rate():
+    clock = _FakeClock()
+    delivered: list[str] = []
+    dispatcher = NotificationDispatcher(
+        per_chat_rate=10, per_chat_burst=10, global_rate=2, coalesce_window=60.0, clock=clock
+    )
+
+    for idx in range(4):
+        dispatcher.dispatch(f"chat-{idx}", str(idx), lambda text, _m: delivered.append(text) or 1)
+    dispatcher.close()
+
+    assert delivered == ["0", "1"]
+    assert dispatcher.stats["queued"] == 2
+
+
+async def test_event_bus_alerts_share_the_dispatcher(monkeypatch):
+    from nexus.core.events import SystemAlert
+    from nexus.core.integrations import notification_dispatcher
+    from nexus.plugins.builtin.telegram_event_handler_plugin import TelegramEventHandler
+
+    dispatcher = NotificationDispatcher(
+        per_chat_rate=1.0,
+        per_chat_burst=1,
+        global_rate=30,
+        coalesce_window=60.0,
+        clock=_FakeClock(),
+    )
+    monkeypatch.setattr(notification_dispatcher, "_dispatcher", dispatcher)
+    sent: list[str] = []
+    handler = TelegramEventHandler({"bot_token": "123:ABC", "chat_id": "chat-1"})
+    monkeypatch.setattr(
+        handler._telegram, "send_message_sync", lambda text, **_kw: sent.append(text) or True
+    )
+
+    for idx in range(3):
+        await handler._handle(SystemAlert(message=f"disk {idx} full", severity="warning"))
+    dispatcher.flush(timeout=0)
+    dispatcher.close()
+
+    assert sent[0] == "⚠️ disk 0 full"
+    assert len(sent) == 2 and sent[1].startswith("📬 2 notifications")
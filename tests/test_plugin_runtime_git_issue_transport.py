@@ -38,6 +38,6 @@ def test_profiled_plugin_uses_cli_names_when_transport_cli(monkeypatch):
     assert captured == ["github-issue-cli", "gitlab-issue-cli"]
 
 
-def test_builtin_register_modules_include_cli_issue_plugins():
-    assert "nexus.plugins.builtin.github_issue_cli_plugin" in plugin_runtime._BUILTIN_REGISTER_MODULES
-    assert "nexus.plugins.builtin.gitlab_issue_cli_plugin" in plugin_runtime._BUILTIN_REGISTER_MODULES
+def test_builtin_manifest_includes_cli_issue_plugins():
+    names = {entry.name for entry in plugin_runtime.BUILTIN_PLUGIN_MANIFEST}
+    assert {"github-issue-cli", "gitlab-issue-cli"} <= names
@@ -1,7 +1,13 @@
 """Tests for plugin registry and plugin spec behavior."""
 
+import importlib
+import subprocess
+import sys
+from types import SimpleNamespace
+
 import pytest
 
+import nexus.plugins.registry as registry_module
 from nexus.plugins import (
     PluginKind,
     PluginNotFoundError,
@@ -9,6 +15,7 @@ from nexus.plugins import (
     PluginRegistry,
     make_plugin_spec,
 )
+from nexus.plugins.manifest import BUILTIN_PLUGIN_MANIFEST, LazyPluginFactory, register_manifest
 
 
 def test_register_and_create_plugin():
@@ -77,3 +84,73 @@ def test_list_specs_can_filter_by_kind():
 
     assert len(ai_specs) == 1
     assert ai_specs[0].name == "copilot"
+
+
+def test_builtin_manifest_matches_module_registrations():
+    for entry in BUILTIN_PLUGIN_MANIFEST:
+        module_name = entry.target.split(":", 1)[0]
+        eager = PluginRegistry()
+        importlib.import_module(module_name).register_plugins(eager)
+        spec = eager.get_spec(entry.kind, entry.name)
+
+        assert spec is not None, entry.name
+        assert (spec.version, spec.description) == (entry.version, entry.description)
+        assert isinstance(LazyPluginFactory(entry.target).resolve(), type)
+
+
+def test_entrypoint_factories_are_registered_without_importing(monkeypatch):
+    entry_points = [
+        SimpleNamespace(
+            name="storage_backend/demo-store",
+            value="collections:OrderedDict",
+            dist=SimpleNamespace(version="2.1.0"),
+        ),
+        SimpleNamespace(name="not-a-kind/oops", value="collections:OrderedDict", dist=None),
+    ]
+    monkeypatch.setattr(registry_module, "_iter_entry_points", lambda _group: entry_points)
+    registry = PluginRegistry()
+
+    assert registry.register_entrypoint_factories() == 1
+    spec = registry.get_spec(PluginKind.STORAGE_BACKEND, "demo-store")
+    assert spec.version == "2.1.0"
+    assert spec.factory.loaded is False
+    assert registry.create(PluginKind.STORAGE_BACKEND, "demo-store", {"a": 1}) == {"a": 1}
+    assert spec.factory.loaded is True
+
+
+def test_plugin_runtime_imports_only_the_plugins_it_creates():
+    script = (
+        "import sys\n"
+        "from nexus.core.orchestration import plugin_runtime\n"
+        "registry = plugin_runtime._get_registry()\n"
+        "assert registry.has_plugin(plugin_runtime.PluginKind.INPUT_ADAPTER, 'workflow-state-engine')\n"
+        "before = sorted(m for m in sys.modules if m.startswith('nexus.plugins.builtin.'))\n"
+        "plugin_runtime.get_builtin_plugin(kind='STORAGE_BACKEND', name='json-state-store')\n"
+        "after = sorted(m for m in sys.modules if m.startswith('nexus.plugins.builtin.'))\n"
+        "print(before, after, file=sys.stderr)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", script],
+        capture_output=True,
+        text=True,
+        timeout=60,
+        check=True,
+    )
+    imported = [
+        line.rsplit("|", 1)[-1].strip()
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:")
+    ]
+
+    assert "nexus.core.orchestration.plugin_runtime" in imported
+    assert not [name for name in imported if name.startswith("nexus.plugins.builtin.")]
+    assert "[] ['nexus.plugins.builtin.json_state_plugin']" in result.stderr.splitlines()
+
+
+def test_register_manifest_defers_import_until_create():
+    registry = PluginRegistry()
+    register_manifest(registry, BUILTIN_PLUGIN_MANIFEST)
+
+    spec = registry.get_spec(PluginKind.INPUT_ADAPTER, "workflow-state-engine")
+    assert isinstance(spec.factory, LazyPluginFactory)
+    assert len(registry.list_specs()) == len(BUILTIN_PLUGIN_MANIFEST)
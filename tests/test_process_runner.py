@@ -0,0 +1,170 @@
+"""Tests for the shared AI CLI process runner."""
+
+import asyncio
+import os
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from nexus.core.process_runner import (
+    PRIORITY_AGENT,
+    PRIORITY_ANALYSIS,
+    PRIORITY_INTERACTIVE,
+    ProcessAdmissionError,
+    ProcessRunner,
+    parse_provider_limits,
+)
+
+
+def _acquire_in_thread(runner, order, name, priority):
+    def _run():
+        slot = runner.acquire(name, priority=priority, timeout=5)
+        order.append(name)
+        runner.release(slot)
+
+    thread = threading.Thread(target=_run)
+    thread.start()
+    return thread
+
+
+def test_waiters_are_admitted_by_priority():
+    runner = ProcessRunner(max_concurrent=1, interactive_reserve=0, sample_interval=0.05)
+    held = runner.acquire("codex", priority=PRIORITY_AGENT)
+    order: list[str] = []
+
+    threads = [_acquire_in_thread(runner, order, "agent", PRIORITY_AGENT)]
+    time.sleep(0.1)
+    threads.append(_acquire_in_thread(runner, order, "analysis", PRIORITY_ANALYSIS))
+    threads.append(_acquire_in_thread(runner, order, "chat", PRIORITY_INTERACTIVE))
+    time.sleep(0.1)
+    assert runner.snapshot()["waiting"] == 3
+
+    runner.release(held)
+    for thread in threads:
+        thread.join(5)
+
+    assert order == ["chat", "analysis", "agent"]
+    snapshot = runner.snapshot()
+    assert snapshot["running"] == 0 and snapshot["waiting"] == 0
+
+
+def test_provider_caps_and_interactive_reserve():
+    runner = ProcessRunner(
+        max_concurrent=3, provider_limits=parse_provider_limits("codex=1, bad, gemini=x")
+    )
+    assert runner.provider_limits == {"codex": 1}
+
+    codex = runner.acquire("codex", priority=PRIORITY_AGENT)
+    with pytest.raises(ProcessAdmissionError):
+        runner.acquire("codex", priority=PRIORITY_AGENT, timeout=0.1)
+    gemini = runner.acquire("gemini", priority=PRIORITY_AGENT, timeout=0.1)
+
+    # The last slot is kept for interactive work.
+    with pytest.raises(ProcessAdmissionError):
+        runner.acquire("claude", priority=PRIORITY_ANALYSIS, timeout=0.1)
+    chat = runner.acquire("claude", priority=PRIORITY_INTERACTIVE, timeout=0.1)
+
+    assert runner.snapshot()["running_by_provider"] == {"codex": 1, "gemini": 1, "claude": 1}
+    assert runner.stats["rejected"] == 2
+    for slot in (codex, gemini, chat):
+        runner.release(slot)
+
+
+def _live_group_members(pgid: int) -> list[int]:
+    # Orphaned children may linger as zombies until init reaps them; only
+    # processes that are still running count as survivors.
+    members = []
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat", encoding="utf-8") as fh:
+                fields = fh.read().rsplit(")", 1)[1].split()
+        except OSError:
+            continue
+        if int(fields[2]) == pgid and fields[0] != "Z":
+            members.append(int(entry))
+    return members
+
+
+def test_run_kills_the_whole_process_group_on_timeout(tmp_path):
+    runner = ProcessRunner(kill_grace=0.2)
+    pid_file = tmp_path / "pid"
+    script = f"echo $$ > {pid_file}; sleep 30 & sleep 30"
+
+    started = time.monotonic()
+    with pytest.raises(subprocess.TimeoutExpired):
+        runner.run(["sh", "-c", script], provider="gemini", timeout=2)
+
+    assert time.monotonic() - started < 10
+    pgid = int(pid_file.read_text().strip())
+    deadline = time.monotonic() + 2
+    while time.monotonic() < deadline:
+        if not _live_group_members(pgid):
+            break
+        time.sleep(0.05)
+    else:
+        pytest.fail("background child survived the timeout kill")
+    assert runner.stats["timeouts"] == 1
+
+
+def test_run_captures_output_and_samples_usage():
+    runner = ProcessRunner(sample_interval=0.05)
+    script = "import time; data = bytearray(8 * 1024 * 1024); time.sleep(0.3); print('done')"
+
+    result = runner.run([sys.executable, "-c", script], provider="copilot", timeout=10)
+
+    assert result.returncode == 0
+    assert result.stdout.strip() == "done"
+    assert result.usage is not None and result.usage.samples >= 1
+    assert result.usage.peak_rss_bytes > 8 * 1024 * 1024
+    assert runner.snapshot()["peak_rss_bytes"] == result.usage.peak_rss_bytes
+
+
+def test_launched_process_holds_its_slot_until_exit():
+    runner = ProcessRunner(max_concurrent=1, interactive_reserve=0, sample_interval=0.05)
+    process = runner.launch(
+        lambda: subprocess.Popen([sys.executable, "-c", "import time; time.sleep(0.3)"]),
+        provider="claude",
+    )
+
+    assert runner.snapshot()["running"] == 1
+    slot = runner.acquire("codex", priority=PRIORITY_AGENT, timeout=5)
+
+    assert process.poll() == 0
+    assert runner.stats["launched"] == 1 and runner.stats["completed"] == 1
+    runner.release(slot)
+
+
+async def test_run_async_returns_bytes_and_times_out():
+    runner = ProcessRunner(kill_grace=0.2)
+
+    ok = await runner.run_async([sys.executable, "-c", "print('hi')"], timeout=10)
+    with pytest.raises(subprocess.TimeoutExpired):
+        await runner.run_async([sys.executable, "-c", "import time; time.sleep(30)"], timeout=0.3)
+
+    assert ok.returncode == 0 and ok.stdout.strip() == b"hi"
+    assert runner.stats["timeouts"] == 1
+
+
+async def test_cancelled_run_async_does_not_leak_its_slot():
+    runner = ProcessRunner(max_concurrent=1, interactive_reserve=0, sample_interval=0.05)
+    held = runner.acquire("codex", priority=PRIORITY_AGENT)
+
+    waiting = asyncio.ensure_future(
+        runner.run_async([sys.executable, "-c", "pass"], provider="codex", timeout=30)
+    )
+    await asyncio.sleep(0.2)
+    waiting.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiting
+    runner.release(held)
+    await asyncio.sleep(0.3)
+
+    snapshot = runner.snapshot()
+    assert snapshot["running"] == 0 and snapshot["waiting"] == 0
+    slot = await asyncio.to_thread(runner.acquire, "codex", priority=PRIORITY_AGENT, timeout=1)
+    runner.release(slot)
@@ -0,0 +1,176 @@
+"""Tests for the concurrent processor job scheduler."""
+
+import threading
+
+from nexus.core.latency_metrics import LatencyHistogram
+from nexus.core.processor_loops import build_processor_jobs, run_scheduled_processor_loop
+from nexus.core.processor_scheduler import ProcessorScheduler, ScheduledJob
+
+
+class _FakeTime:
+    def __init__(self):
+        self.now = 0.0
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += float(seconds)
+
+
+class _InlineExecutor:
+    def submit(self, fn, *args):
+        fn(*args)
+
+    def shutdown(self, wait=True):
+        return None
+
+
+def test_latency_histogram_snapshot_reports_buckets_and_percentiles():
+    histogram = LatencyHistogram(buckets=(0.1, 1.0, 10.0))
+    for value in (0.05, 0.5, 0.5, 5.0):
+        histogram.observe(value)
+
+    snapshot = histogram.snapshot()
+
+    assert snapshot["count"] == 4
+    assert snapshot["buckets"] == {"0.1": 1, "1": 3, "10": 4, "+Inf": 4}
+    assert snapshot["p50"] == 1.0
+    assert snapshot["max"] == 5.0
+
+
+def test_scheduler_runs_jobs_on_their_own_intervals():
+    fake_time = _FakeTime()
+    calls = {"fast": 0, "slow": 0}
+    scheduler = ProcessorScheduler(
+        [
+            ScheduledJob("fast", lambda: calls.__setitem__("fast", calls["fast"] + 1), 1),
+            ScheduledJob(
+                "slow",
+                lambda: calls.__setitem__("slow", calls["slow"] + 1),
+                10,
+                run_immediately=False,
+            ),
+        ],
+        time_module=fake_time,
+        executor=_InlineExecutor(),
+    )
+
+    for _ in range(11):
+        fake_time.sleep(scheduler.run_pending())
+
+    assert calls == {"fast": 11, "slow": 1}
+    stats = scheduler.stats()
+    assert stats["fast"]["runs"] == 11
+    assert stats["fast"]["duration_seconds"]["count"] == 11
+    assert stats["slow"]["lag_seconds"]["count"] == 1
+
+
+def test_scheduler_skips_overlapping_runs_and_counts_failures():
+    fake_time = _FakeTime()
+    release = threading.Event()
+    started = threading.Event()
+
+    def _blocking():
+        started.set()
+        release.wait(5)
+
+    failed = threading.Semaphore(0)
+
+    def _failing():
+        failed.release()
+        raise RuntimeError("boom")
+
+    scheduler = ProcessorScheduler(
+        [ScheduledJob("blocking", _blocking, 1), ScheduledJob("failing", _failing, 1)],
+        time_module=fake_time,
+    )
+    try:
+        scheduler.run_pending()
+        assert started.wait(5)
+        assert failed.acquire(timeout=5)
+        while scheduler.stats()["failing"]["running"]:
+            threading.Event().wait(0.01)
+        fake_time.now += 1
+        scheduler.run_pending()
+    finally:
+        release.set()
+        scheduler.shutdown(wait=True)
+
+    stats = scheduler.stats()
+    assert stats["blocking"]["skipped_overlaps"] == 1
+    assert stats["blocking"]["runs"] == 1
+    assert stats["failing"]["failures"] == 2
+    assert stats["failing"]["last_error"] == "boom"
+
+
+def test_slow_comment_polling_does_not_delay_completion_processing():
+    release = threading.Event()
+    completed = threading.Event()
+    order = []
+
+    jobs = build_processor_jobs(
+        base_dir="/tmp/base",
+        sleep_interval=1,
+        check_interval=60,
+        get_inbox_storage_backend=lambda: "filesystem",
+        drain_postgres_inbox_queue=lambda: None,
+        process_filesystem_inbox_once=lambda _base: None,
+        check_stuck_agents=lambda: (order.append("stuck"), completed.set()),
+        check_agent_comments=lambda: release.wait(5),
+        check_completed_agents=lambda: order.append("completed"),
+        merge_queue_auto_merge_once=lambda: None,
+        job_overrides={
+            "agent_comments": {"interval": 0},
+            "agent_lifecycle": {"interval": 0},
+        },
+    )
+    for job in jobs:
+        job.run_immediately = True
+    scheduler = ProcessorScheduler(jobs)
+    try:
+        scheduler.run_pending()
+        assert completed.wait(5)
+    finally:
+        release.set()
+        scheduler.shutdown(wait=True)
+
+    assert order == ["completed", "stuck"]
+
+
+def test_run_scheduled_processor_loop_triggers_inbox_on_notification():
+    fake_time = _FakeTime()
+    drains = []
+    waits = []
+
+    def _wait(timeout):
+        waits.append(timeout)
+        if len(waits) >= 3:
+            raise RuntimeError("stop-loop")
+        return True
+
+    jobs = [ScheduledJob("inbox", lambda: drains.append(fake_time.now), 30)]
+    scheduler = ProcessorScheduler(jobs, time_module=fake_time, executor=_InlineExecutor())
+
+    try:
+        run_scheduled_processor_loop(
+            logger=None,
+            base_dir="/tmp/base",
+            sleep_interval=30,
+            check_interval=60,
+            get_inbox_storage_backend=lambda: "postgres",
+            drain_postgres_inbox_queue=lambda: None,
+            process_filesystem_inbox_once=lambda _base: None,
+            check_stuck_agents=lambda: None,
+            check_agent_comments=lambda: None,
+            check_completed_agents=lambda: None,
+            merge_queue_auto_merge_once=lambda: None,
+            wait_for_inbox_tasks=_wait,
+            time_module=fake_time,
+            scheduler=scheduler,
+        )
+    except RuntimeError as exc:
+        assert str(exc) == "stop-loop"
+
+    assert len(drains) == 3
+    assert waits == [30.0, 30.0, 30.0]
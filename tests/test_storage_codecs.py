@@ -0,0 +1,100 @@
+"""Tests for storage codecs and the format-2 workflow documents."""
+
+import json
+
+import pytest
+
+from nexus.adapters.storage._workflow_serde import (
+    WORKFLOW_FORMAT_VERSION,
+    LazyStepOutputs,
+    workflow_to_dict,
+)
+from nexus.adapters.storage.codecs import (
+    available_storage_codecs,
+    get_storage_codec,
+)
+from nexus.adapters.storage.file import FileStorage
+from nexus.core.models import Agent, Workflow, WorkflowState, WorkflowStep
+
+
+def _workflow() -> Workflow:
+    agent = Agent(name="dev", display_name="Developer", description="Writes code")
+    return Workflow(
+        id="wf-1",
+        name="Feature",
+        version="1.0",
+        state=WorkflowState.RUNNING,
+        steps=[
+            WorkflowStep(
+                step_num=1,
+                name="develop",
+                agent=agent,
+                prompt_template="Implement",
+                outputs={"summary": "done ✓", "files": ["a.py", "b.py"]},
+            ),
+            WorkflowStep(step_num=2, name="review", agent=agent, prompt_template="Review"),
+        ],
+    )
+
+
+@pytest.mark.parametrize("name", available_storage_codecs())
+async def test_file_storage_round_trips_with_each_codec(tmp_path, name):
+    storage = FileStorage(tmp_path, codec=name)
+    workflow = _workflow()
+    await storage.save_workflow(workflow)
+
+    workflow_file = tmp_path / "workflows" / f"wf-1{storage.codec.suffix}"
+    document = storage.codec.decode(workflow_file.read_bytes())
+    assert document["format_version"] == WORKFLOW_FORMAT_VERSION
+    assert "outputs_packed" in document["steps"][0]
+
+    loaded = await storage.load_workflow("wf-1")
+    assert workflow_to_dict(loaded) == workflow_to_dict(workflow)
+    assert [w.id for w in await storage.list_workflows()] == ["wf-1"]
+    assert await storage.delete_workflow("wf-1") is True
+    assert list((tmp_path / "workflows").iterdir()) == []
+
+
+async def test_lazy_outputs_are_written_back_without_decoding(tmp_path):
+    storage = FileStorage(tmp_path, codec="json")
+    await storage.save_workflow(_workflow())
+
+    loaded = await storage.load_workflow("wf-1")
+    outputs = loaded.steps[0].outputs
+    assert isinstance(outputs, LazyStepOutputs) and outputs.packed is not None
+
+    loaded.steps[1].status = loaded.steps[1].status.RUNNING
+    await storage.save_workflow(loaded)
+    assert outputs.packed is not None
+
+    outputs["reviewed"] = True
+    assert outputs.packed is None
+    await storage.save_workflow(loaded)
+    reloaded = await storage.load_workflow("wf-1")
+    assert reloaded.steps[0].outputs == {
+        "summary": "done ✓",
+        "files": ["a.py", "b.py"],
+        "reviewed": True,
+    }
+    assert reloaded.steps[1].status.value == "running"
+
+
+async def test_file_storage_reads_format_1_documents(tmp_path):
+    workflows_dir = tmp_path / "workflows"
+    workflows_dir.mkdir()
+    (workflows_dir / "wf-1.json").write_text(
+        json.dumps(workflow_to_dict(_workflow()), indent=2, default=str)
+    )
+
+    loaded = await FileStorage(tmp_path).load_workflow("wf-1")
+
+    assert loaded.steps[0].outputs == {"summary": "done ✓", "files": ["a.py", "b.py"]}
+
+
+def test_get_storage_codec_resolves_env_and_rejects_unknown(monkeypatch):
+    monkeypatch.setenv("NEXUS_STORAGE_CODEC", "json")
+    assert get_storage_codec().name == "json"
+    monkeypatch.delenv("NEXUS_STORAGE_CODEC")
+    assert get_storage_codec().name in {"json", "orjson"}
+    with pytest.raises(ValueError, match="Unknown storage codec"):
+        get_storage_codec("yaml")
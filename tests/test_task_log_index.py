@@ -0,0 +1,85 @@
+"""Tests for the issue → agent log index."""
+
+import os
+
+from nexus.core.runtime.task_log_index import (
+    TaskLogIndex,
+    legacy_task_log_paths,
+    parse_task_log_name,
+)
+
+
+def _write_log(directory, name, mtime, body="x"):
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / name
+    path.write_text(body)
+    os.utime(path, (mtime, mtime))
+    return str(path)
+
+
+def test_parse_task_log_name():
+    assert parse_task_log_name("/l/copilot_42_20260101_120000.log") == ("copilot", "42")
+    assert parse_task_log_name("/l/codex_7_20260101_120000.log.retry1") is None
+    assert parse_task_log_name("/l/notes.log") is None
+
+
+def test_latest_log_lookup_filters_by_tool_and_directory(tmp_path):
+    logs = tmp_path / "repo" / ".nexus" / "tasks" / "acme" / "logs"
+    other = tmp_path / "other" / ".nexus" / "tasks" / "beta" / "logs"
+    old = _write_log(logs, "copilot_42_20260101_120000.log", 1_000)
+    new = _write_log(logs, "codex_42_20260101_130000.log", 2_000)
+    foreign = _write_log(other, "copilot_42_20260101_140000.log", 3_000)
+    _write_log(logs, "copilot_420_20260101_150000.log", 4_000)
+
+    index = TaskLogIndex(refresh_interval=0)
+    index.register_directories([str(logs), str(other)])
+
+    assert [entry.path for entry in index.issue_logs("42")] == [foreign, new, old]
+    assert index.latest("#42", tool="copilot", directory=str(logs)) == old
+    assert index.latest("42", tool="gemini") is None
+    assert index.issue_logs("42")[0].size == 1
+
+    scans = index.stats["dir_scans"]
+    index.latest("42")
+    assert index.stats["dir_scans"] == scans  # unchanged directories are not re-listed
+
+
+def test_registry_is_shared_and_directory_changes_are_picked_up(tmp_path):
+    registry = str(tmp_path / "state" / "task_log_dirs.json")
+    logs = tmp_path / "ws" / ".nexus" / "tasks" / "acme" / "logs"
+    writer = TaskLogIndex(registry, refresh_interval=0)
+    first = _write_log(logs, "gemini_9_20260101_120000.log", 1_000)
+    writer.record(first)
+
+    reader = TaskLogIndex(registry, refresh_interval=0)
+    assert reader.directories == [str(logs)]
+    assert reader.latest("9") == first
+
+    second = _write_log(logs, "gemini_9_20260101_130000.log", 2_000)
+    os.utime(logs, (5_000, 5_000))
+    assert reader.latest("9") == second
+
+    os.remove(second)
+    assert reader.latest("9") == first
+    assert [entry.path for entry in reader.all_logs()] == [first]
+
+
+def test_legacy_scan_finds_project_and_worktree_logs(tmp_path):
+    project = _write_log(
+        tmp_path / "repo" / ".nexus" / "tasks" / "acme" / "logs",
+        "copilot_1_20260101_120000.log",
+        1_000,
+    )
+    worktree = _write_log(
+        tmp_path / "repo" / ".nexus" / "worktrees" / "w1" / ".nexus" / "tasks" / "acme" / "logs",
+        "codex_2_20260101_120000.log",
+        1_000,
+    )
+
+    index = TaskLogIndex(str(tmp_path / "registry.json"), refresh_interval=0)
+    assert not index.has_registry
+    index.seed_from_paths(legacy_task_log_paths(str(tmp_path), ".nexus"))
+
+    assert index.has_registry
+    assert index.latest("1") == project
+    assert index.latest("2") == worktree
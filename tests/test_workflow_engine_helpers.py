@@ -1,13 +1,20 @@
+import pytest
+
 from nexus.core.models import Agent, StepStatus, Workflow, WorkflowState, WorkflowStep
 from nexus.core.workflow_engine.completion_service import (
     apply_step_completion_result,
     apply_retry_transition,
     compute_retry_backoff_seconds,
 )
-from nexus.core.workflow_engine.condition_eval import evaluate_condition
+from nexus.core.workflow_engine.condition_eval import (
+    ConditionSyntaxError,
+    compile_condition,
+    evaluate_condition,
+)
 from nexus.core.workflow_engine.transition_service import reset_step_for_goto, resolve_route_target
 from nexus.core.workflow_engine.workflow_definition_loader import (
     build_dry_run_report_fields,
+    build_workflow_steps,
     build_prompt_context_text,
     canonicalize_next_agent_from_steps,
     resolve_next_agent_types_from_steps,
@@ -46,6 +53,29 @@ def test_evaluate_condition_defaults_on_error():
     assert evaluate_condition("missing + 1", {}, default_on_error=False) is False
 
 
+def test_compile_condition_caches_and_rejects_unsafe_syntax():
+    assert compile_condition("x == 1") is compile_condition("x == 1")
+    for bad in ("x ==", "().__class__", "(lambda: 1)()", "(y := 1)"):
+        with pytest.raises(ConditionSyntaxError):
+            compile_condition(bad)
+    assert evaluate_condition("().__class__", {}, default_on_error=False) is False
+
+
+def test_evaluate_condition_reads_context_without_copying():
+    context = {"result": {"tier": "high"}, "true": "shadowed"}
+    assert evaluate_condition("result['tier'] == 'high' and true == 'shadowed'", context)
+    assert evaluate_condition("null is None and false is False", context)
+    assert context == {"result": {"tier": "high"}, "true": "shadowed"}
+
+
+def test_build_workflow_steps_rejects_malformed_route_conditions_at_load():
+    steps = [
+        {"id": "route", "agent_type": "router", "routes": [{"when": "tier ==", "goto": "a"}]},
+    ]
+    with pytest.raises(ValueError, match="Step 1: malformed condition"):
+        build_workflow_steps(data={}, steps_data=steps, slugify=lambda value: value)
+
+
 def test_compute_retry_backoff_seconds_strategies():
     assert (
         compute_retry_backoff_seconds(
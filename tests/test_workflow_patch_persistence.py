@@ -0,0 +1,128 @@
+"""Tests for step-level (patch) workflow persistence."""
+
+import gc
+
+import pytest
+
+from nexus.adapters.storage.file import FileStorage
+from nexus.core.models import Agent, StepStatus, Workflow, WorkflowState, WorkflowStep
+from nexus.core.workflow import WorkflowEngine
+from nexus.core.workflow_engine.step_change_tracker import StepChangeTracker
+
+try:
+    import sqlalchemy  # noqa: F401
+
+    _SA = True
+except ImportError:
+    _SA = False
+
+
+def _workflow(steps: int = 3) -> Workflow:
+    agent = Agent(name="dev", display_name="Developer", description="Writes code")
+    return Workflow(
+        id="wf-1",
+        name="Feature",
+        version="1.0",
+        steps=[
+            WorkflowStep(
+                step_num=n, name=f"step-{n}", agent=agent, prompt_template="Work on {issue}"
+            )
+            for n in range(1, steps + 1)
+        ],
+    )
+
+
+class _RecordingStorage(FileStorage):
+    def __init__(self, base_path):
+        super().__init__(base_path)
+        self.calls: list[tuple[str, list[int] | None]] = []
+
+    async def save_workflow(self, workflow):
+        self.calls.append(("save", None))
+        await super().save_workflow(workflow)
+
+    async def patch_workflow(self, workflow, step_nums):
+        step_nums = list(step_nums)
+        self.calls.append(("patch", step_nums))
+        await super().patch_workflow(workflow, step_nums)
+
+
+async def test_engine_patches_only_changed_steps(tmp_path):
+    storage = _RecordingStorage(tmp_path)
+    engine = WorkflowEngine(storage)
+    await engine.create_workflow(_workflow())
+    await engine.start_workflow("wf-1")
+    await engine.pause_workflow("wf-1")
+    await engine.resume_workflow("wf-1")
+    await engine.complete_step("wf-1", 1, {"summary": "done"})
+
+    patches = [call for call in storage.calls if call[0] == "patch"]
+    assert storage.calls[0] == ("save", None)
+    assert patches == [("patch", [1]), ("patch", []), ("patch", []), ("patch", [1, 2])]
+
+    loaded = await storage.load_workflow("wf-1")
+    assert loaded.steps[0].outputs == {"summary": "done"}
+    assert [s.status for s in loaded.steps] == [
+        StepStatus.COMPLETED,
+        StepStatus.RUNNING,
+        StepStatus.PENDING,
+    ]
+
+
+@pytest.mark.skipif(not _SA, reason="sqlalchemy not installed")
+async def test_postgres_backend_merges_step_patches_and_compacts():
+    from nexus.adapters.storage.postgres import PostgreSQLStorageBackend, _WorkflowPatchRow
+
+    storage = PostgreSQLStorageBackend("sqlite://", compact_every=2)
+
+    def patch_keys():
+        with storage._session_factory() as session:
+            return sorted(row.key for row in session.query(_WorkflowPatchRow).all())
+
+    workflow = _workflow()
+    await storage.save_workflow(workflow)
+
+    workflow.state = WorkflowState.RUNNING
+    workflow.steps[0].status = StepStatus.COMPLETED
+    workflow.steps[0].outputs = {"summary": "done"}
+    await storage.update_step(workflow, 1)
+    workflow.steps[1].status = StepStatus.RUNNING
+    await storage.patch_workflow(workflow, [2])
+    assert patch_keys() == ["step:1", "step:2", "workflow"]
+
+    loaded = await storage.load_workflow("wf-1")
+    assert loaded.state == WorkflowState.RUNNING
+    assert loaded.steps[0].outputs == {"summary": "done"}
+    assert [s.status for s in loaded.steps][:2] == [StepStatus.COMPLETED, StepStatus.RUNNING]
+    assert [w.id for w in await storage.list_workflows(state=WorkflowState.RUNNING)] == ["wf-1"]
+
+    workflow.steps[2].status = StepStatus.SKIPPED
+    await storage.patch_workflow(workflow, [3])
+    assert patch_keys() == []
+    compacted = await storage.load_workflow("wf-1")
+    assert [s.status for s in compacted.steps] == [
+        StepStatus.COMPLETED,
+        StepStatus.RUNNING,
+        StepStatus.SKIPPED,
+    ]
+
+    assert await storage.delete_workflow("wf-1") is True
+    storage.close()
+
+
+async def test_step_change_tracker_does_not_keep_workflows_alive(tmp_path):
+    tracker = StepChangeTracker()
+    workflow = _workflow()
+    tracker.remember(workflow)
+    workflow.steps[0].status = StepStatus.RUNNING
+    assert tracker.changed_steps(workflow) == [1]
+
+    del workflow
+    gc.collect()
+    assert len(tracker) == 0
+
+    engine = WorkflowEngine(_RecordingStorage(tmp_path))
+    await engine.create_workflow(_workflow())
+    await engine.start_workflow("wf-1")
+    gc.collect()
+    assert len(engine._step_changes) == 0